@@ -0,0 +1,36 @@
+"""Add person_stories table for materialized Story timelines
+
+Revision ID: 005_person_stories
+Revises: 004_multilingual_source_tracking
+Create Date: 2026-10-18
+
+Adds:
+- person_stories: precomputed nodes/node types/map view per person
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_person_stories'
+down_revision: Union[str, None] = '004_multilingual_source_tracking'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'person_stories',
+        sa.Column('person_id', sa.Integer(), sa.ForeignKey('persons.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('payload', JSONB(), nullable=False),
+        sa.Column('node_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('chain_signature', sa.String(128), nullable=False),
+        sa.Column('built_at', sa.DateTime(), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('person_stories')
@@ -0,0 +1,87 @@
+"""Add binary-quantized HNSW indexes next to the full-precision embedding indexes
+
+Revision ID: 006_quantized_embedding_indexes
+Revises: 005_person_stories
+Create Date: 2026-10-18
+
+EntityMatcher can take embedding candidates from a binary-quantized HNSW
+expression index (1 bit per dim, ~1/32 of the size) and re-rank them
+with the stored full vectors (BOOK_EXTRACTOR_EMBEDDING_CANDIDATES=binary).
+The default is still full-precision search, so the ivfflat index is kept.
+
+Once binary candidates have been checked for recall on the real data,
+the full-precision index can be dropped as a separate, opt-in step:
+
+    alembic -x drop_full_precision_index=true upgrade head
+
+(re-running a revision: downgrade 005_person_stories first). downgrade
+recreates the ivfflat index if it was dropped.
+
+Requires pgvector >= 0.7 (binary_quantize, bit_hamming_ops).
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_quantized_embedding_indexes'
+down_revision: Union[str, None] = '005_person_stories'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables with a vector(1536) embedding column
+EMBEDDING_TABLES = ['persons', 'polities']
+
+
+def _drop_full_precision_index() -> bool:
+    return context.get_x_argument(as_dictionary=True).get(
+        'drop_full_precision_index', ''
+    ).lower() in ('1', 'true', 'yes')
+
+
+def upgrade() -> None:
+    drop_full = _drop_full_precision_index()
+    for table in EMBEDDING_TABLES:
+        if drop_full:
+            full_sql = f"DROP INDEX IF EXISTS idx_{table}_embedding;"
+        else:
+            full_sql = (f"CREATE INDEX IF NOT EXISTS idx_{table}_embedding ON {table} "
+                        f"USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);")
+        op.execute(f"""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = '{table}' AND column_name = 'embedding'
+                ) THEN
+                    CREATE INDEX IF NOT EXISTS idx_{table}_embedding_bq
+                    ON {table} USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops);
+                    {full_sql}
+                END IF;
+            EXCEPTION WHEN OTHERS THEN
+                RAISE NOTICE 'Could not create binary index on {table}.embedding: %', SQLERRM;
+            END
+            $$;
+        """)
+
+
+def downgrade() -> None:
+    for table in EMBEDDING_TABLES:
+        op.execute(f"""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = '{table}' AND column_name = 'embedding'
+                ) THEN
+                    CREATE INDEX IF NOT EXISTS idx_{table}_embedding
+                    ON {table} USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+                END IF;
+            EXCEPTION WHEN OTHERS THEN
+                RAISE NOTICE 'Could not create IVFFlat index on {table}.embedding: %', SQLERRM;
+            END
+            $$;
+        """)
+        op.execute(f'DROP INDEX IF EXISTS idx_{table}_embedding_bq')
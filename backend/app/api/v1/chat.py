@@ -6,7 +6,9 @@ This is where SHEBA (observation) + LOGOS (proposal) + LAPLACE (explanation)
 come together.
 """
 import os
+import json
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
@@ -59,6 +61,29 @@ def get_history_agent():
     return _history_agent
 
 
+def _sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def _sse_stream(events):
+    """(event, data) iterator → SSE frames; errors become an `error` event."""
+    try:
+        for event, data in events:
+            yield _sse(event, data)
+    except Exception as e:
+        yield _sse("error", {"detail": str(e)})
+    yield _sse("end", {})
+
+
+def _streaming_response(events) -> StreamingResponse:
+    return StreamingResponse(
+        _sse_stream(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 class RAGFilters(BaseModel):
     """Filters for RAG search."""
     category: Optional[str] = None  # battle, treaty, discovery, etc.
@@ -175,6 +200,37 @@ async def rag_chat(request: RAGRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/rag/stream")
+async def rag_chat_stream(request: RAGRequest):
+    """
+    Streaming RAG chat (Server-Sent Events).
+
+    Events:
+    - sources: retrieved sources/related events (sent before generation)
+    - token: {"text": ...} answer tokens as they arrive
+    - done: {"answer": ...} full answer
+    - error: {"detail": ...} if the pipeline fails mid-stream
+    - end: stream closed
+    """
+    rag_service = get_rag_service()
+
+    if rag_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="RAG service not available. Check if pgvector is running and events are indexed."
+        )
+
+    filters_dict = None
+    if request.filters:
+        filters_dict = request.filters.model_dump(exclude_none=True)
+
+    return _streaming_response(rag_service.stream_query(
+        query=request.query,
+        context_limit=request.context_limit,
+        filters=filters_dict
+    ))
+
+
 # ============================================================
 # Agent API - Intelligent Query Processing
 # ============================================================
@@ -233,6 +289,21 @@ class AgentResponse(BaseModel):
     analysis: AgentAnalysis
     search_results: List[AgentSearchResult]
     response: AgentResponseData
+    trace: Optional[List[Dict[str, Any]]] = None  # Stage timings (ms)
+
+
+def _resolve_agent_api_key(api_key: Optional[str]) -> Optional[str]:
+    """User key, or the server's key in local development."""
+    # In development, fallback to server's env var if no user key provided
+    if not api_key:
+        is_dev = os.getenv("CHALDEAS_ENV", "development") == "development"
+        server_key = os.getenv("OPENAI_API_KEY")
+
+        if is_dev and server_key:
+            # Local development: use server's key
+            api_key = server_key
+            print("[SHEBA] Using server API key (development mode)")
+    return api_key
 
 
 @router.post("/agent", response_model=AgentResponse)
@@ -256,17 +327,7 @@ async def agent_chat(request: AgentRequest):
         {"query": "마라톤 전투"}  # BM25 fallback or local dev with env var
     """
     # Determine which API key to use
-    api_key = request.api_key
-
-    # In development, fallback to server's env var if no user key provided
-    if not api_key:
-        is_dev = os.getenv("CHALDEAS_ENV", "development") == "development"
-        server_key = os.getenv("OPENAI_API_KEY")
-
-        if is_dev and server_key:
-            # Local development: use server's key
-            api_key = server_key
-            print("[SHEBA] Using server API key (development mode)")
+    api_key = _resolve_agent_api_key(request.api_key)
 
     # If still no API key, use BM25 search fallback
     if not api_key:
@@ -339,12 +400,13 @@ async def agent_chat(request: AgentRequest):
             api_key=api_key
         )
 
-        result = user_agent.process(request.query, language=request.language)
+        result = await user_agent.aprocess(request.query, language=request.language)
 
         return AgentResponse(
             analysis=AgentAnalysis(**result["analysis"]),
             search_results=[AgentSearchResult(**sr) for sr in result["search_results"]],
-            response=AgentResponseData(**result["response"])
+            response=AgentResponseData(**result["response"]),
+            trace=result.get("trace")
         )
     except Exception as e:
         # Check for API key errors
@@ -355,3 +417,41 @@ async def agent_chat(request: AgentRequest):
                 detail="Invalid OpenAI API key. Please check your API key and try again."
             )
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/agent/stream")
+async def agent_chat_stream(request: AgentRequest):
+    """
+    Streaming agent chat (Server-Sent Events).
+
+    Same pipeline as /agent; requires an API key (no BM25 fallback).
+
+    Events:
+    - analysis: query analysis (intent, entities, ...)
+    - sources: filtered search results and sources (sent before generation)
+    - token: {"text": ...} answer tokens as they arrive
+    - response: final structured response (answer, structured_data, ...)
+    - error / end
+    """
+    api_key = _resolve_agent_api_key(request.api_key)
+
+    if not api_key:
+        raise HTTPException(
+            status_code=401,
+            detail="Streaming requires an OpenAI API key."
+        )
+    if not api_key.startswith("sk-"):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid API key format. OpenAI API keys start with 'sk-'."
+        )
+
+    from app.core.sheba.history_agent import HistoryAgent
+    from app.services.rag_service import RAGService
+
+    user_agent = HistoryAgent(
+        rag_service=RAGService(api_key=api_key),
+        api_key=api_key
+    )
+
+    return _streaming_response(user_agent.stream_process(request.query, language=request.language))
@@ -41,6 +41,7 @@ class AdvancedSearchResponse(BaseModel):
     ai_response: Optional[Dict[str, Any]]
     is_public: bool
     total: int
+    timings_ms: Optional[Dict[str, float]] = None
 
 
 # ============================================================
@@ -147,12 +148,13 @@ async def advanced_search(
         from app.services.rag_service import RAGService
         rag_service = RAGService(api_key=request.openai_api_key)
 
-        hybrid_service = get_hybrid_search_service(rag_service=rag_service)
+        hybrid_service = get_hybrid_search_service()
 
         results = await hybrid_service.advanced_search(
             query=request.query,
             limit=request.limit,
-            use_ai=request.use_ai
+            use_ai=request.use_ai,
+            rag_service=rag_service
         )
     except Exception as e:
         raise HTTPException(
@@ -184,7 +186,8 @@ async def advanced_search(
         results=results.get("results", []),
         ai_response=results.get("ai_response"),
         is_public=True,
-        total=results.get("total", 0)
+        total=results.get("total", 0),
+        timings_ms=results.get("timings_ms")
     )
 
 
@@ -9,7 +9,10 @@ from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from app.config import get_settings
 from app.db.session import get_db
+from app.services import static_data
+from app.services.response_cache import cached_response
 from app.models.person import Person
 from app.models.v1.text_mention import TextMention
 from app.models.source import Source
@@ -21,30 +24,45 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
 MAPPING_PATH = PROJECT_ROOT / "data/raw/atlas_academy/servant_db_mapping.json"
 FGO_DATA_PATH = PROJECT_ROOT / "data/raw/atlas_academy/fgo_historical_figures.json"
 
-_servant_mapping = None
-_fgo_data = None
+
+def _load_servant_data() -> dict:
+    """Load servant mapping + FGO data and build lookups (static data registry loader)."""
+    if MAPPING_PATH.exists():
+        with open(MAPPING_PATH, encoding='utf-8') as f:
+            mapping = json.load(f)
+    else:
+        mapping = {"mapped": [], "fgo_original": [], "not_found": []}
+
+    if FGO_DATA_PATH.exists():
+        with open(FGO_DATA_PATH, encoding='utf-8') as f:
+            fgo_data = json.load(f)
+    else:
+        fgo_data = []
+
+    mapped_by_person = {}
+    for m in mapping.get('mapped', []):
+        if m.get('person_id'):
+            mapped_by_person.setdefault(m['person_id'], []).append(m)
+
+    return {
+        "items": fgo_data,
+        "mapping": mapping,
+        "fgo_lookup": {s['fgo_name']: s for s in fgo_data},
+        "mapped_by_name": {m['fgo_name']: m for m in reversed(mapping.get('mapped', []))},
+        "mapped_by_person": mapped_by_person,
+        "fgo_original": set(mapping.get('fgo_original', [])),
+    }
+
+
+static_data.register("servants", _load_servant_data)
 
 
 def get_servant_mapping():
-    global _servant_mapping
-    if _servant_mapping is None:
-        if MAPPING_PATH.exists():
-            with open(MAPPING_PATH, encoding='utf-8') as f:
-                _servant_mapping = json.load(f)
-        else:
-            _servant_mapping = {"mapped": [], "fgo_original": [], "not_found": []}
-    return _servant_mapping
+    return static_data.get("servants")["mapping"]
 
 
 def get_fgo_data():
-    global _fgo_data
-    if _fgo_data is None:
-        if FGO_DATA_PATH.exists():
-            with open(FGO_DATA_PATH, encoding='utf-8') as f:
-                _fgo_data = json.load(f)
-        else:
-            _fgo_data = []
-    return _fgo_data
+    return static_data.get("servants")["items"]
 
 
 class ServantSummary(BaseModel):
@@ -97,10 +115,9 @@ def list_servants(
     List all FGO servants with their historical counterparts
     """
     mapping = get_servant_mapping()
-    fgo_data = get_fgo_data()
 
-    # Create FGO name -> data lookup
-    fgo_lookup = {s['fgo_name']: s for s in fgo_data}
+    # FGO name -> data lookup
+    fgo_lookup = static_data.get("servants")["fgo_lookup"]
 
     # Build result list
     results = []
@@ -204,7 +221,16 @@ def get_servant_stats(db: Session = Depends(get_db)):
     }
 
 
+def _servant_cache_tags(params: dict, result) -> list[str]:
+    tags = [f"servant:{params['fgo_name']}"]
+    if result.person_id:
+        tags.append(f"person:{result.person_id}")
+    return tags
+
+
 @router.get("/{fgo_name}", response_model=ServantDetail)
+# Mentions come from import scripts (no in-process invalidation) → short TTL
+@cached_response("servants.detail", tags=_servant_cache_tags, ttl=get_settings().response_cache_import_ttl)
 def get_servant_detail(
     fgo_name: str,
     db: Session = Depends(get_db)
@@ -212,15 +238,13 @@ def get_servant_detail(
     """
     Get detailed information about a servant including book mentions
     """
-    mapping = get_servant_mapping()
-    fgo_data = get_fgo_data()
+    servants = static_data.get("servants")
 
     # Find servant in mapping
-    fgo_lookup = {s['fgo_name']: s for s in fgo_data}
-    fgo_info = fgo_lookup.get(fgo_name, {})
+    fgo_info = servants["fgo_lookup"].get(fgo_name, {})
 
     # Check if FGO original
-    if fgo_name in mapping.get('fgo_original', []):
+    if fgo_name in servants["fgo_original"]:
         return ServantDetail(
             fgo_name=fgo_name,
             fgo_class=fgo_info.get('fgo_class'),
@@ -230,11 +254,7 @@ def get_servant_detail(
         )
 
     # Find in mapped
-    servant_map = None
-    for m in mapping.get('mapped', []):
-        if m['fgo_name'] == fgo_name:
-            servant_map = m
-            break
+    servant_map = servants["mapped_by_name"].get(fgo_name)
 
     if not servant_map:
         raise HTTPException(status_code=404, detail="Servant not found")
@@ -309,9 +329,8 @@ def get_servants_by_person(
     """
     Get all servants connected to a specific historical person
     """
-    mapping = get_servant_mapping()
-    fgo_data = get_fgo_data()
-    fgo_lookup = {s['fgo_name']: s for s in fgo_data}
+    servants = static_data.get("servants")
+    fgo_lookup = servants["fgo_lookup"]
 
     # Get mention count for this person
     mention_count = db.query(func.count(TextMention.id)).filter(
@@ -320,19 +339,18 @@ def get_servants_by_person(
     ).scalar() or 0
 
     results = []
-    for m in mapping.get('mapped', []):
-        if m.get('person_id') == person_id:
-            fgo_info = fgo_lookup.get(m['fgo_name'], {})
-            results.append(ServantSummary(
-                fgo_name=m['fgo_name'],
-                fgo_class=fgo_info.get('fgo_class'),
-                rarity=fgo_info.get('rarity'),
-                origin=fgo_info.get('origin'),
-                person_id=m.get('person_id'),
-                person_name=m.get('person_name'),
-                wikidata_id=m.get('qid'),
-                mention_count=mention_count,
-                is_fgo_original=False
-            ))
+    for m in servants["mapped_by_person"].get(person_id, []):
+        fgo_info = fgo_lookup.get(m['fgo_name'], {})
+        results.append(ServantSummary(
+            fgo_name=m['fgo_name'],
+            fgo_class=fgo_info.get('fgo_class'),
+            rarity=fgo_info.get('rarity'),
+            origin=fgo_info.get('origin'),
+            person_id=m.get('person_id'),
+            person_name=m.get('person_name'),
+            wikidata_id=m.get('qid'),
+            mention_count=mention_count,
+            is_fgo_original=False
+        ))
 
     return results
@@ -9,6 +9,8 @@ from typing import List, Optional, Literal
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from app.services import static_data
+
 router = APIRouter()
 
 # Data directory
@@ -113,18 +115,42 @@ def parse_showcase_item(data: dict) -> ShowcaseItem:
     )
 
 
-def get_all_showcases() -> List[ShowcaseItem]:
-    """Load all showcase items from all files."""
-    all_items = []
-    files = ["singularities.json", "lostbelts.json", "servants.json",
-             "history.json", "literature.json", "music.json"]
+SHOWCASE_FILES = ["singularities.json", "lostbelts.json", "servants.json",
+                  "history.json", "literature.json", "music.json"]
+
+
+def _load_showcases() -> dict:
+    """Parse all showcase files once and index them (static data registry loader)."""
+    by_file = {}
+    items = []
+    for filename in SHOWCASE_FILES:
+        parsed = [parse_showcase_item(i) for i in load_showcase_file(filename)]
+        by_file[filename] = parsed
+        items.extend(parsed)
+
+    by_type = {}
+    for item in items:
+        by_type.setdefault(item.type, []).append(item)
+
+    return {
+        "items": items,
+        "by_file": by_file,
+        "by_id": {item.id: item for item in reversed(items)},  # first occurrence wins
+        "by_type": by_type,
+    }
 
-    for filename in files:
-        raw_items = load_showcase_file(filename)
-        for item in raw_items:
-            all_items.append(parse_showcase_item(item))
 
-    return all_items
+static_data.register("showcases", _load_showcases)
+
+
+def get_showcase_file(filename: str) -> List[ShowcaseItem]:
+    """Parsed items of one showcase file."""
+    return static_data.get("showcases")["by_file"].get(filename, [])
+
+
+def get_all_showcases() -> List[ShowcaseItem]:
+    """Load all showcase items from all files."""
+    return static_data.get("showcases")["items"]
 
 
 # === FGO Content ===
@@ -132,21 +158,21 @@ def get_all_showcases() -> List[ShowcaseItem]:
 @router.get("/fgo/singularities", response_model=ShowcaseListResponse)
 def list_singularities():
     """List all FGO Singularities."""
-    items = [parse_showcase_item(i) for i in load_showcase_file("singularities.json")]
+    items = get_showcase_file("singularities.json")
     return ShowcaseListResponse(items=items, total=len(items), category="singularity")
 
 
 @router.get("/fgo/lostbelts", response_model=ShowcaseListResponse)
 def list_lostbelts():
     """List all FGO Lostbelts."""
-    items = [parse_showcase_item(i) for i in load_showcase_file("lostbelts.json")]
+    items = get_showcase_file("lostbelts.json")
     return ShowcaseListResponse(items=items, total=len(items), category="lostbelt")
 
 
 @router.get("/fgo/servants", response_model=ShowcaseListResponse)
 def list_servant_articles():
     """List all Servant column articles."""
-    items = [parse_showcase_item(i) for i in load_showcase_file("servants.json")]
+    items = get_showcase_file("servants.json")
     return ShowcaseListResponse(items=items, total=len(items), category="servant")
 
 
@@ -155,21 +181,21 @@ def list_servant_articles():
 @router.get("/history", response_model=ShowcaseListResponse)
 def list_history_articles():
     """List all historical articles."""
-    items = [parse_showcase_item(i) for i in load_showcase_file("history.json")]
+    items = get_showcase_file("history.json")
     return ShowcaseListResponse(items=items, total=len(items), category="history")
 
 
 @router.get("/literature", response_model=ShowcaseListResponse)
 def list_literature_articles():
     """List all literature articles."""
-    items = [parse_showcase_item(i) for i in load_showcase_file("literature.json")]
+    items = get_showcase_file("literature.json")
     return ShowcaseListResponse(items=items, total=len(items), category="literature")
 
 
 @router.get("/music", response_model=ShowcaseListResponse)
 def list_music_articles():
     """List all music articles."""
-    items = [parse_showcase_item(i) for i in load_showcase_file("music.json")]
+    items = get_showcase_file("music.json")
     return ShowcaseListResponse(items=items, total=len(items), category="music")
 
 
@@ -182,10 +208,10 @@ def list_all_showcases(
     offset: int = Query(0, ge=0)
 ):
     """List all showcase items with optional filtering."""
-    all_items = get_all_showcases()
-
     if type:
-        all_items = [i for i in all_items if i.type == type]
+        all_items = static_data.get("showcases")["by_type"].get(type, [])
+    else:
+        all_items = get_all_showcases()
 
     total = len(all_items)
     items = all_items[offset:offset + limit]
@@ -196,11 +222,9 @@ def list_all_showcases(
 @router.get("/{showcase_id}", response_model=ShowcaseItem)
 def get_showcase_by_id(showcase_id: str):
     """Get a specific showcase item by ID."""
-    all_items = get_all_showcases()
-
-    for item in all_items:
-        if item.id == showcase_id:
-            return item
+    item = static_data.get("showcases")["by_id"].get(showcase_id)
+    if item:
+        return item
 
     raise HTTPException(status_code=404, detail=f"Showcase '{showcase_id}' not found")
 
@@ -212,13 +236,13 @@ def get_showcase_stats():
     """Get summary statistics of all showcases."""
     return {
         "fgo": {
-            "singularities": len(load_showcase_file("singularities.json")),
-            "lostbelts": len(load_showcase_file("lostbelts.json")),
-            "servants": len(load_showcase_file("servants.json"))
+            "singularities": len(get_showcase_file("singularities.json")),
+            "lostbelts": len(get_showcase_file("lostbelts.json")),
+            "servants": len(get_showcase_file("servants.json"))
         },
         "pan_human_history": {
-            "history": len(load_showcase_file("history.json")),
-            "literature": len(load_showcase_file("literature.json")),
-            "music": len(load_showcase_file("music.json"))
+            "history": len(get_showcase_file("history.json")),
+            "literature": len(get_showcase_file("literature.json")),
+            "music": len(get_showcase_file("music.json"))
         }
     }
@@ -15,6 +15,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 
 from app.db.session import get_db
+from app.services import response_cache, story_service
+from app.services.response_cache import cached_response
 
 router = APIRouter(prefix="/chains", tags=["chains"])
 
@@ -140,6 +142,44 @@ def row_to_connection(row, event_a=None, event_b=None) -> ConnectionResponse:
     )
 
 
+def connection_cache_tags(
+    event_a_id: int,
+    event_b_id: int,
+    layer_type: Optional[str],
+    layer_entity_id: Optional[int],
+) -> List[str]:
+    """Response cache tags affected by a change to one connection."""
+    tags = [f"event:{event_a_id}", f"event:{event_b_id}"]
+    if layer_type in ("person", "location") and layer_entity_id:
+        tags.append(f"{layer_type}:{layer_entity_id}")
+    return tags
+
+
+def on_connection_changed(
+    db: Session,
+    event_a_id: int,
+    event_b_id: int,
+    layer_type: Optional[str],
+    layer_entity_id: Optional[int],
+) -> None:
+    """Invalidate cached responses and materialized stories using a connection."""
+    response_cache.invalidate_tags(connection_cache_tags(
+        event_a_id, event_b_id, layer_type, layer_entity_id
+    ))
+    if layer_type == "person" and layer_entity_id:
+        story_service.discard_stories(db, [layer_entity_id])
+
+
+def invalidate_connection_cache(db: Session, connection_id: int) -> None:
+    """Invalidate cached responses that include an existing connection."""
+    row = db.execute(text("""
+        SELECT event_a_id, event_b_id, layer_type, layer_entity_id
+        FROM event_connections WHERE id = :id
+    """), {"id": connection_id}).fetchone()
+    if row:
+        on_connection_changed(db, *row)
+
+
 # ============== CRUD Endpoints ==============
 
 @router.get("/", response_model=ConnectionListResponse)
@@ -328,6 +368,10 @@ async def create_connection(
     })
     db.commit()
 
+    on_connection_changed(
+        db, data.event_a_id, data.event_b_id, data.layer_type, data.layer_entity_id
+    )
+
     new_id = result.fetchone()[0]
     return await get_connection(new_id, db)
 
@@ -377,16 +421,24 @@ async def update_connection(
     db.execute(text(f"UPDATE event_connections SET {update_clause} WHERE id = :id"), params)
     db.commit()
 
+    invalidate_connection_cache(db, connection_id)
+
     return await get_connection(connection_id, db)
 
 
 @router.delete("/{connection_id}", status_code=204)
 async def delete_connection(connection_id: int, db: Session = Depends(get_db)):
     """Delete an event connection."""
-    result = db.execute(text("DELETE FROM event_connections WHERE id = :id RETURNING id"), {"id": connection_id})
-    if not result.fetchone():
+    result = db.execute(text("""
+        DELETE FROM event_connections WHERE id = :id
+        RETURNING event_a_id, event_b_id, layer_type, layer_entity_id
+    """), {"id": connection_id})
+    row = result.fetchone()
+    if not row:
         raise HTTPException(status_code=404, detail="Connection not found")
     db.commit()
+
+    on_connection_changed(db, *row)
     return None
 
 
@@ -457,6 +509,7 @@ async def get_event_connections(
 # ============== Entity Chains ==============
 
 @router.get("/person/{person_id}")
+@cached_response("chains.person", tags=lambda params, result: [f"person:{params['person_id']}"])
 async def get_person_chain(
     person_id: int,
     min_strength: float = Query(5.0),
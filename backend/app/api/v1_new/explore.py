@@ -14,7 +14,10 @@ from typing import Optional, List
 from pydantic import BaseModel
 from datetime import datetime
 
+from app.config import get_settings
 from app.db.session import get_db
+from app.services import source_service
+from app.services.response_cache import cached_response
 
 router = APIRouter(prefix="/explore", tags=["explore"])
 
@@ -426,6 +429,12 @@ async def explore_periods(
 
 
 @router.get("/top-mentioned")
+# mention_count is written by import scripts (no in-process invalidation) → short TTL
+@cached_response(
+    "explore.top_mentioned",
+    tags=lambda params, result: [f"top-mentioned:{params['entity_type']}"],
+    ttl=get_settings().response_cache_import_ttl,
+)
 async def get_top_mentioned(
     entity_type: str = Query("persons", description="persons, locations"),
     limit: int = Query(20, ge=1, le=100),
@@ -515,26 +524,19 @@ async def get_entity_sources(
     if entity_type not in ['person', 'location', 'event', 'polity', 'period']:
         raise HTTPException(status_code=400, detail="Invalid entity_type")
 
-    result = db.execute(text("""
-        SELECT
-            s.id, s.name, s.title, s.author, s.archive_type, s.original_year,
-            COUNT(tm.id) as mention_count,
-            AVG(tm.confidence) as avg_confidence
-        FROM sources s
-        JOIN text_mentions tm ON s.id = tm.source_id
-        WHERE tm.entity_type = :entity_type AND tm.entity_id = :entity_id
-        GROUP BY s.id, s.name, s.title, s.author, s.archive_type, s.original_year
-        ORDER BY mention_count DESC
-        LIMIT :limit
-    """), {"entity_type": entity_type, "entity_id": entity_id, "limit": limit})
+    by_entity = source_service.get_top_mentions_by_source(
+        db, entity_type, [entity_id], source_limit=limit, max_mentions=0
+    )
+    entry = by_entity.get(entity_id, {"sources": []})
 
     items = [
         SourceSummary(
-            id=row[0], name=row[1], title=row[2], author=row[3],
-            archive_type=row[4], original_year=row[5],
-            mention_count=row[6], confidence=float(row[7]) if row[7] else 0.0
+            id=source["id"], name=source["name"], title=source["title"],
+            author=source["author"], archive_type=source["archive_type"],
+            original_year=source["original_year"],
+            mention_count=source["mention_count"], confidence=source["avg_confidence"]
         )
-        for row in result
+        for source in entry["sources"]
     ]
 
     return {"entity_type": entity_type, "entity_id": entity_id, "sources": items}
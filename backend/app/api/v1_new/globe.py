@@ -15,6 +15,7 @@ from pydantic import BaseModel
 from datetime import datetime
 
 from app.db.session import get_db
+from app.services.response_cache import cached_response
 
 router = APIRouter(prefix="/globe", tags=["globe"])
 
@@ -473,6 +474,7 @@ class GlobeArc(BaseModel):
 
 
 @router.get("/arcs/{event_id}", response_model=List[GlobeArc])
+@cached_response("globe.arcs", tags=lambda params, result: [f"event:{params['event_id']}"])
 async def get_event_arcs(
     event_id: int,
     layer_type: Optional[str] = Query(None, description="Filter by layer: person, location, causal"),
@@ -12,8 +12,11 @@ from sqlalchemy import text
 from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime
+from dataclasses import asdict
 
 from app.db.session import get_db
+from app.services import response_cache, static_data
+from app.services.semantic_cache import get_semantic_cache_stats
 
 router = APIRouter(prefix="/stats", tags=["statistics"])
 
@@ -283,3 +286,34 @@ async def get_enrichment_stats(db: Session = Depends(get_db)):
             "total_enriched": sum(row[1] for row in locations_by_source)
         }
     }
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """
+    Get response cache metrics.
+
+    Returns hit/miss/store/invalidation counts and hit rate per cached route.
+    """
+    return response_cache.get_cache_stats()
+
+
+@router.get("/semantic-cache")
+async def get_semantic_cache_metrics():
+    """
+    Get semantic answer cache metrics (RAG / agent).
+
+    Returns hit rate, evictions (LRU/TTL/data version) and the generation
+    latency saved by hits, per namespace.
+    """
+    return get_semantic_cache_stats()
+
+
+@router.get("/static-data")
+async def get_static_data_stats():
+    """
+    Get preloaded static dataset metrics.
+
+    Returns record count, load time and last error per registered dataset.
+    """
+    return {"datasets": [asdict(stats) for stats in static_data.get_stats()]}
@@ -23,6 +23,30 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     anthropic_api_key: str = ""
 
+    # Response cache (read endpoints)
+    response_cache_enabled: bool = True
+    response_cache_backend: str = "memory"  # memory, redis (requires `redis` package)
+    response_cache_redis_url: str = ""
+    response_cache_ttl: int = 600  # seconds
+    response_cache_import_ttl: int = 120  # seconds; routes over data written only by import scripts
+    response_cache_max_entries: int = 2048
+
+    # Semantic answer cache (RAG / agent)
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.95  # cosine similarity
+    semantic_cache_max_entries: int = 1000
+    semantic_cache_ttl: int = 3600  # seconds
+
+    # Vector store backend
+    vector_store_backend: str = "pgvector"  # pgvector, local (in-process export)
+    vector_store_local_path: str = "../data/vector_index"  # export dir for the local backend
+    vector_store_nprobe: int = 8  # local backend: IVF lists probed per query
+    vector_store_encoding: str = "vector"  # pgvector index: vector, halfvec, binary, halfvec@512, ...
+    vector_store_rerank_factor: int = 4  # candidates fetched per result for full-precision re-rank
+
+    # Orchestrator: worker threads for blocking SQLAlchemy calls
+    orchestrator_db_workers: int = 8
+
     # CORS - CHALDEAS fixed ports
     backend_cors_origins: list[str] = [
         "*",  # Allow all in dev
@@ -14,13 +14,19 @@ World-Centric Principle:
 "Every value must be able to answer 'Why?'"
 """
 from dataclasses import dataclass
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.core.logos.actor import Proposal
 from app.core.sheba.observer import Observation
 from app.schemas.chat import ExplanationSource
 from app.schemas.source import Source as SourceSchema
-from app.models.source import Source
+from app.models.source import build_archive_url
+from app.services import source_service
+
+# Mention-based sources attached per related entity (ranked by mention count;
+# curated sources are always attached)
+MAX_SOURCES_PER_ENTITY = 3
 
 
 @dataclass
@@ -48,6 +54,7 @@ class LaplaceExplainer:
         self,
         proposal: Proposal,
         observation: Observation,
+        sources: Optional[list[ExplanationSource]] = None,
     ) -> Explanation:
         """
         Generate explanation for a proposal.
@@ -56,8 +63,12 @@ class LaplaceExplainer:
         1. Sources from related events/persons
         2. Causality chain showing connections
         3. Suggested follow-up queries
+
+        Sources depend only on the observation; pass them in when they
+        were looked up concurrently with the proposal (see find_sources).
         """
-        sources = await self._find_sources(observation)
+        if sources is None:
+            sources = await self._find_sources(observation)
         causality = await self._trace_causality(observation)
         suggestions = await self._generate_suggestions(observation)
 
@@ -69,43 +80,51 @@ class LaplaceExplainer:
 
     async def _find_sources(self, observation: Observation) -> list[ExplanationSource]:
         """Find relevant sources for the observation."""
-        sources = []
+        return self.find_sources(observation)
 
-        # Get sources from related events
-        for event in observation.related_events[:5]:
-            if hasattr(event, 'sources') and event.sources:
-                for source in event.sources:
-                    sources.append(ExplanationSource(
-                        source=SourceSchema(
-                            id=source.id,
-                            name=source.name,
-                            type=source.type,
-                            url=source.archive_url,
-                            author=source.author,
-                            archive_type=source.archive_type,
-                            reliability=source.reliability,
-                        ),
-                        relevance=0.8,
-                        excerpt=None,
-                    ))
+    def find_sources(self, observation: Observation) -> list[ExplanationSource]:
+        """
+        Find relevant sources for the observation (blocking DB queries).
 
-        # Get sources from related persons
-        for person in observation.related_persons[:3]:
-            if hasattr(person, 'sources') and person.sources:
-                for source in person.sources:
-                    sources.append(ExplanationSource(
-                        source=SourceSchema(
-                            id=source.id,
-                            name=source.name,
-                            type=source.type,
-                            url=source.archive_url,
-                            author=source.author,
-                            archive_type=source.archive_type,
-                            reliability=source.reliability,
-                        ),
-                        relevance=0.7,
-                        excerpt=None,
+        Independent of the proposal, so it can run alongside LOGOS.
+        """
+        sources = []
+
+        # Curated sources (event_sources / person_sources) first, then the
+        # top mentioning sources not already listed; two batched queries
+        # per entity type
+        lookups = [
+            ("event", observation.related_events[:5], 0.8),
+            ("person", observation.related_persons[:3], 0.7),
+        ]
+        for entity_type, entities, relevance in lookups:
+            entity_ids = [entity.id for entity in entities]
+            curated = source_service.get_curated_sources(self.db, entity_type, entity_ids)
+            mentioned = source_service.get_top_mentions_by_source(
+                self.db,
+                entity_type,
+                entity_ids,
+                source_limit=MAX_SOURCES_PER_ENTITY,
+                max_mentions=1,
+            )
+            for entity in entities:
+                mention_sources = mentioned.get(entity.id, {}).get("sources", [])
+                excerpts = {
+                    source["id"]: source["mentions"][0]["context_text"] if source["mentions"] else None
+                    for source in mention_sources
+                }
+
+                listed = set()
+                for source in curated.get(entity.id, []):
+                    listed.add(source["id"])
+                    sources.append(self._explanation_source(
+                        source, relevance, source["quote"] or excerpts.get(source["id"])
                     ))
+                for source in mention_sources:
+                    if source["id"] not in listed:
+                        sources.append(self._explanation_source(
+                            source, relevance, excerpts[source["id"]]
+                        ))
 
         # If no sources found, return reference to digital archives
         if not sources:
@@ -130,6 +149,23 @@ class LaplaceExplainer:
 
         return sources[:10]  # Limit to 10 sources
 
+    @staticmethod
+    def _explanation_source(source: dict, relevance: float, excerpt: Optional[str]) -> ExplanationSource:
+        """source_service row → ExplanationSource"""
+        return ExplanationSource(
+            source=SourceSchema(
+                id=source["id"],
+                name=source["name"],
+                type=source["type"],
+                url=build_archive_url(source["archive_type"], source["url"]),
+                author=source["author"],
+                archive_type=source["archive_type"],
+                reliability=source["reliability"],
+            ),
+            relevance=relevance,
+            excerpt=excerpt,
+        )
+
     async def _trace_causality(self, observation: Observation) -> list[str]:
         """Trace causal connections between events/persons."""
         chain = []
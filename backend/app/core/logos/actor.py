@@ -12,6 +12,7 @@ Responsibilities:
 World-Centric Principle:
 "Intelligence proposes, never executes"
 """
+import asyncio
 import uuid
 from dataclasses import dataclass
 from typing import Optional
@@ -171,15 +172,18 @@ Provide a concise, factual answer. If the context doesn't contain enough informa
 """
 
         try:
+            # Sync clients: run in a worker thread so the event loop stays free
             if self._llm_type == "anthropic":
-                response = self._llm.messages.create(
+                response = await asyncio.to_thread(
+                    self._llm.messages.create,
                     model="claude-3-haiku-20240307",
                     max_tokens=500,
                     messages=[{"role": "user", "content": prompt}]
                 )
                 answer = response.content[0].text
             else:  # openai
-                response = self._llm.chat.completions.create(
+                response = await asyncio.to_thread(
+                    self._llm.chat.completions.create,
                     model="gpt-3.5-turbo",
                     max_tokens=500,
                     messages=[{"role": "user", "content": prompt}]
@@ -0,0 +1,298 @@
+"""
+SHEBA Gazetteer - In-memory entity name matcher.
+
+Finds every known location/person name inside a query in a single pass
+using an Aho-Corasick automaton, instead of loading all rows and doing
+per-row substring checks.
+
+Names come from the entity tables (English, Korean, original-language and
+modern names) plus `entity_aliases`, so multilingual queries such as
+"마라톤 전투" or "Battle of Marathon" resolve to the same entity.
+
+The automaton is built once per process and rebuilt when the underlying
+tables change (row count / last update / alias count signature), checked
+at most every REFRESH_CHECK_SECONDS. Writers can force a rebuild with
+invalidate_gazetteer().
+"""
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Names shorter than this (after normalization) are too ambiguous to match.
+# Hangul/CJK names are denser, so two characters (e.g. "로마") are allowed.
+MIN_NAME_LENGTH = 3
+MIN_NAME_LENGTH_NON_ASCII = 2
+
+# How often to compare the table signature against the built automaton
+REFRESH_CHECK_SECONDS = 60
+
+# Name columns indexed per entity type: (table, [(column, field_label)])
+ENTITY_NAME_COLUMNS = {
+    "location": ("locations", [
+        ("name", "name"),
+        ("name_ko", "name_ko"),
+        ("name_original", "name_original"),
+        ("modern_name", "modern_name"),
+    ]),
+    "person": ("persons", [
+        ("name", "name"),
+        ("name_ko", "name_ko"),
+    ]),
+}
+
+
+def normalize_name(value: str) -> str:
+    """NFKC + casefold so full-width, accented-case and Korean text compare equal."""
+    return unicodedata.normalize("NFKC", value).casefold().strip()
+
+
+def _is_word_char(ch: str) -> bool:
+    """ASCII letters/digits form words; Hangul/CJK may carry attached particles."""
+    return ch.isascii() and ch.isalnum()
+
+
+class AhoCorasick:
+    """
+    Character-level Aho-Corasick automaton.
+
+    Transitions are kept in one flat dict keyed by (state << 21) | codepoint
+    rather than a dict per node, which keeps ~1M-node automata compact.
+    """
+
+    def __init__(self):
+        self._goto: dict[int, int] = {}
+        self._fail: list[int] = [0]
+        self._out: list[tuple] = [()]
+        self._out_link: list[int] = [0]
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._fail)
+
+    def add(self, pattern: str, payload) -> None:
+        """Add a pattern; payload is returned with every match."""
+        state = 0
+        for ch in pattern:
+            key = (state << 21) | ord(ch)
+            nxt = self._goto.get(key)
+            if nxt is None:
+                nxt = len(self._fail)
+                self._goto[key] = nxt
+                self._fail.append(0)
+                self._out.append(())
+                self._out_link.append(0)
+            state = nxt
+        self._out[state] = self._out[state] + ((len(pattern), payload),)
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure and output links (BFS over the trie)."""
+        children: dict[int, list[tuple[int, int]]] = {}
+        for key, child in self._goto.items():
+            children.setdefault(key >> 21, []).append((key & 0x1FFFFF, child))
+
+        queue = []
+        for _, child in children.get(0, ()):
+            self._fail[child] = 0
+            self._out_link[child] = 0
+            queue.append(child)
+
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for code, child in children.get(state, ()):
+                fail = self._fail[state]
+                while fail and ((fail << 21) | code) not in self._goto:
+                    fail = self._fail[fail]
+                fail = self._goto.get((fail << 21) | code, 0)
+                if fail == child:
+                    fail = 0
+                self._fail[child] = fail
+                self._out_link[child] = fail if self._out[fail] else self._out_link[fail]
+                queue.append(child)
+
+        self._built = True
+
+    def iter_matches(self, haystack: str):
+        """Yield (start, end, payload) for every pattern occurrence."""
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        out_link = self._out_link
+        state = 0
+
+        for end, ch in enumerate(haystack, start=1):
+            code = ord(ch)
+            while state and ((state << 21) | code) not in goto:
+                state = fail[state]
+            state = goto.get((state << 21) | code, 0)
+
+            node = state
+            while node:
+                for length, payload in out[node]:
+                    yield end - length, end, payload
+                node = out_link[node]
+
+
+@dataclass
+class GazetteerHit:
+    """A name found in a query."""
+    entity_id: int
+    field: str  # which column/alias produced the match
+    surface: str  # matched text as it appears in the query
+    start: int
+    end: int
+
+
+class Gazetteer:
+    """Name → entity matcher for one entity type."""
+
+    def __init__(self, entity_type: str, signature: tuple = ()):
+        self.entity_type = entity_type
+        self.signature = signature
+        self.name_count = 0
+        self.build_seconds = 0.0
+        self.checked_at = 0.0
+        self._automaton = AhoCorasick()
+
+    def add_names(self, rows: Iterable[tuple[int, Optional[str], str]]) -> None:
+        """Add (entity_id, name, field) rows."""
+        for entity_id, name, field in rows:
+            if not name:
+                continue
+            normalized = normalize_name(name)
+            min_length = MIN_NAME_LENGTH if normalized.isascii() else MIN_NAME_LENGTH_NON_ASCII
+            if len(normalized) < min_length:
+                continue
+            self._automaton.add(normalized, (entity_id, field))
+            self.name_count += 1
+
+    def build(self) -> None:
+        started = time.perf_counter()
+        self._automaton.build()
+        self.build_seconds = time.perf_counter() - started
+
+    def find(self, query: str) -> list[GazetteerHit]:
+        """
+        Find entity names in the query.
+
+        Overlapping matches are resolved leftmost-longest ("New York" wins
+        over "York"); an ASCII name must not be glued to ASCII letters on
+        either side ("Rome" does not match inside "Romeo").
+        """
+        haystack = normalize_name(query)
+        candidates = []
+        for start, end, (entity_id, field) in self._automaton.iter_matches(haystack):
+            if start > 0 and _is_word_char(haystack[start]) and _is_word_char(haystack[start - 1]):
+                continue
+            if end < len(haystack) and _is_word_char(haystack[end - 1]) and _is_word_char(haystack[end]):
+                continue
+            candidates.append((start, end, entity_id, field))
+
+        candidates.sort(key=lambda c: (c[0], -(c[1] - c[0])))
+
+        hits = []
+        covered_until = 0
+        span = None
+        for start, end, entity_id, field in candidates:
+            if span == (start, end):
+                # Same surface shared by several entities - keep them all
+                hits.append(GazetteerHit(entity_id, field, haystack[start:end], start, end))
+                continue
+            if start < covered_until:
+                continue
+            span = (start, end)
+            covered_until = end
+            hits.append(GazetteerHit(entity_id, field, haystack[start:end], start, end))
+
+        return hits
+
+
+_gazetteers: dict[str, Gazetteer] = {}
+_lock = threading.Lock()
+
+
+def _table_signature(db: Session, entity_type: str) -> tuple:
+    """Cheap change detector: row counts and latest modification times."""
+    table, _ = ENTITY_NAME_COLUMNS[entity_type]
+    entity_row = db.execute(text(
+        f"SELECT COUNT(*), MAX(updated_at) FROM {table}"
+    )).fetchone()
+    alias_row = db.execute(text("""
+        SELECT COUNT(*), MAX(created_at) FROM entity_aliases WHERE entity_type = :entity_type
+    """), {"entity_type": entity_type}).fetchone()
+    return tuple(entity_row) + tuple(alias_row)
+
+
+def _load_names(db: Session, entity_type: str, exclude_patterns: Iterable[str] = ()):
+    """Stream (entity_id, name, field) rows for an entity type."""
+    table, columns = ENTITY_NAME_COLUMNS[entity_type]
+    select_cols = ", ".join(col for col, _ in columns)
+
+    params = {}
+    conditions = []
+    for i, pattern in enumerate(exclude_patterns):
+        conditions.append(f"name NOT ILIKE :exclude_{i}")
+        params[f"exclude_{i}"] = pattern
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+    result = db.execute(text(
+        f"SELECT id, {select_cols} FROM {table} WHERE {where_clause}"
+    ), params)
+    for row in result:
+        for offset, (_, field) in enumerate(columns, start=1):
+            yield row[0], row[offset], field
+
+    result = db.execute(text("""
+        SELECT entity_id, alias FROM entity_aliases WHERE entity_type = :entity_type
+    """), {"entity_type": entity_type})
+    for entity_id, alias in result:
+        yield entity_id, alias, "alias"
+
+
+def get_gazetteer(
+    db: Session,
+    entity_type: str,
+    exclude_patterns: Iterable[str] = (),
+) -> Gazetteer:
+    """
+    Get the process-wide gazetteer for an entity type, building or
+    rebuilding it if the underlying tables changed.
+    """
+    now = time.monotonic()
+    gazetteer = _gazetteers.get(entity_type)
+    if gazetteer and now - gazetteer.checked_at < REFRESH_CHECK_SECONDS:
+        return gazetteer
+
+    with _lock:
+        gazetteer = _gazetteers.get(entity_type)
+        if gazetteer and now - gazetteer.checked_at < REFRESH_CHECK_SECONDS:
+            return gazetteer
+
+        signature = _table_signature(db, entity_type)
+        if gazetteer is None or gazetteer.signature != signature:
+            gazetteer = Gazetteer(entity_type, signature)
+            gazetteer.add_names(_load_names(db, entity_type, exclude_patterns))
+            gazetteer.build()
+            _gazetteers[entity_type] = gazetteer
+
+        gazetteer.checked_at = time.monotonic()
+        return gazetteer
+
+
+def invalidate_gazetteer(entity_type: Optional[str] = None) -> None:
+    """Force a rebuild on next use (all types if entity_type is None)."""
+    with _lock:
+        if entity_type is None:
+            _gazetteers.clear()
+        else:
+            _gazetteers.pop(entity_type, None)
@@ -9,13 +9,17 @@ SHEBA History Agent - 역사 질의 처리 에이전트
 5. 정합성 검증
 """
 
+import asyncio
 import json
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 from openai import OpenAI
 import os
 
+from app.core.sheba.stage_dag import StageDAG
+
 
 class QueryIntent(str, Enum):
     """쿼리 의도 분류"""
@@ -229,6 +233,12 @@ class HistoryAgent:
 }"""
     }
 
+    # Relevance filter heuristics (similarity scores)
+    FILTER_MIN_RESULTS = 3          # 이하이면 필터링 생략
+    FILTER_ACCEPT_SIMILARITY = 0.6  # 이상이면 확실히 관련
+    FILTER_REJECT_SIMILARITY = 0.4  # 미만이면 확실히 무관
+    FILTER_MAX_KEPT = 7
+
     def __init__(
         self,
         rag_service=None,
@@ -274,13 +284,8 @@ class HistoryAgent:
             requires_multiple_searches=result.get("requires_multiple_searches", False)
         )
 
-    def execute_search(self, analysis: QueryAnalysis) -> List[SearchResult]:
-        """2단계: 검색 실행"""
-        if not self.rag_service:
-            return []
-
-        results = []
-
+    def plan_search(self, analysis: QueryAnalysis) -> List[Dict[str, Any]]:
+        """2단계 준비: 검색 전략 수립 (독립적으로 실행 가능한 검색 목록)"""
         # 기본 검색
         filters = {}
 
@@ -298,34 +303,102 @@ class HistoryAgent:
 
         # 비교 의도일 때: 각 항목별 검색
         if analysis.intent == QueryIntent.COMPARISON and analysis.entities.events:
-            for event in analysis.entities.events[:2]:  # 최대 2개
-                context = self.rag_service.retrieve_context(
-                    event,
-                    limit=10,  # 3 → 10 (더 많이 가져온 후 필터링)
-                    filters=filters if filters else None
-                )
-                results.append(SearchResult(
-                    query_used=event,
-                    filters_applied=filters,
+            return [
+                {
+                    "query": event,
+                    "filters": filters,
+                    "limit": 10,  # 3 → 10 (더 많이 가져온 후 필터링)
+                    "translate": True,
+                }
+                for event in analysis.entities.events[:2]  # 최대 2개
+            ]
+
+        # 일반 검색 - 분석 단계에서 이미 영어로 변환됨
+        return [{
+            "query": analysis.english_query,
+            "filters": filters,
+            "limit": 20,  # 5 → 20 (더 많이 가져온 후 필터링)
+            "translate": False,
+        }]
+
+    def run_search_step(self, step: Dict[str, Any]) -> SearchResult:
+        """검색 1건 실행"""
+        context = self.rag_service.retrieve_context(
+            step["query"],
+            limit=step["limit"],
+            filters=step["filters"] if step["filters"] else None,
+            translate=step["translate"],
+            query_embedding=step.get("embedding")
+        )
+        return SearchResult(
+            query_used=step["query"],
+            filters_applied=step["filters"],
+            results=context,
+            result_count=len(context)
+        )
+
+    def run_search_steps(self, steps: List[Dict[str, Any]]) -> List[SearchResult]:
+        """
+        검색 여러 건 실행 - 같은 필터/limit 의 검색(비교 항목별 검색)은
+        임베딩 API 1회 + SQL 1회로 묶어서 실행
+        """
+        if len(steps) == 1:
+            return [self.run_search_step(steps[0])]
+
+        groups: Dict[Tuple, List[int]] = {}
+        for i, step in enumerate(steps):
+            key = (json.dumps(step["filters"], sort_keys=True), step["limit"], step["translate"])
+            groups.setdefault(key, []).append(i)
+
+        results: List[Optional[SearchResult]] = [None] * len(steps)
+        for indices in groups.values():
+            group = [steps[i] for i in indices]
+            contexts = self.rag_service.retrieve_context_batch(
+                [step["query"] for step in group],
+                limit=group[0]["limit"],
+                filters=group[0]["filters"] or None,
+                translate=group[0]["translate"],
+                query_embeddings=[step.get("embedding") for step in group]
+            )
+            for i, step, context in zip(indices, group, contexts):
+                results[i] = SearchResult(
+                    query_used=step["query"],
+                    filters_applied=step["filters"],
                     results=context,
                     result_count=len(context)
-                ))
-        else:
-            # 일반 검색
-            context = self.rag_service.retrieve_context(
-                analysis.english_query,
-                limit=20,  # 5 → 20 (더 많이 가져온 후 필터링)
-                filters=filters if filters else None
-            )
-            results.append(SearchResult(
-                query_used=analysis.english_query,
-                filters_applied=filters,
-                results=context,
-                result_count=len(context)
-            ))
-
+                )
         return results
 
+    def execute_search(self, analysis: QueryAnalysis) -> List[SearchResult]:
+        """2단계: 검색 실행 (항목별 검색은 일괄 실행)"""
+        if not self.rag_service:
+            return []
+
+        return self.run_search_steps(self.plan_search(analysis))
+
+    def _heuristic_filter(self, all_results: List[Dict]) -> Optional[List[Dict]]:
+        """
+        Decide relevance from similarity scores when they are decisive.
+
+        Returns the kept documents, or None when the scores are ambiguous
+        and the LLM filter is needed:
+        - few results: nothing worth filtering, keep all
+        - every score is clearly high or clearly low: keep the high ones
+        """
+        docs = [r["doc"] for r in all_results]
+        if len(docs) <= self.FILTER_MIN_RESULTS:
+            return docs
+
+        scores = [doc.get("similarity", 0) or 0 for doc in docs]
+        if any(self.FILTER_REJECT_SIMILARITY <= score < self.FILTER_ACCEPT_SIMILARITY for score in scores):
+            return None
+
+        kept = [doc for doc, score in zip(docs, scores) if score >= self.FILTER_ACCEPT_SIMILARITY]
+        if not kept:
+            return None
+        kept.sort(key=lambda doc: doc.get("similarity", 0) or 0, reverse=True)
+        return kept[:self.FILTER_MAX_KEPT]
+
     def filter_relevant_results(self, query: str, search_results: List[SearchResult]) -> List[SearchResult]:
         """에이전트가 검색 결과를 읽고 관련있는 것만 필터링 (수치만으로 판단X)"""
         if not search_results or not search_results[0].results:
@@ -346,6 +419,16 @@ class HistoryAgent:
         if not all_results:
             return search_results
 
+        decisive = self._heuristic_filter(all_results)
+        if decisive is not None:
+            print(f"[SHEBA] Filtered (heuristic): {len(decisive)}/{len(all_results)}")
+            return [SearchResult(
+                query_used=search_results[0].query_used,
+                filters_applied=search_results[0].filters_applied,
+                results=decisive,
+                result_count=len(decisive)
+            )]
+
         filter_prompt = f"""검색 결과 관련성 판단. 질문: {query}
 
 관련있는 것만 선택 (최대 5~7개). 키워드만 포함되어도 관련없을 수 있음.
@@ -382,12 +465,12 @@ class HistoryAgent:
             print(f"[SHEBA] Filter error: {e}")
             return search_results
 
-    def generate_response(
+    def _prepare_response(
         self,
         analysis: QueryAnalysis,
         search_results: List[SearchResult]
-    ) -> StructuredResponse:
-        """3단계: 응답 생성"""
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """응답 생성 준비: (LLM 메시지, 출처 목록)"""
 
         # 컨텍스트 구성
         context_parts = []
@@ -439,17 +522,18 @@ class HistoryAgent:
             structured_data_template=structured_templates.get(format_key, "{}")
         )
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": f"{prompt}\n\n{lang_instruction}"}
-            ],
-            temperature=0.7,
-            response_format={"type": "json_object"}
-        )
-
-        result = json.loads(response.choices[0].message.content)
+        messages = [
+            {"role": "system", "content": f"{prompt}\n\n{lang_instruction}"}
+        ]
+        return messages, all_sources
 
+    def _build_structured_response(
+        self,
+        analysis: QueryAnalysis,
+        result: Dict[str, Any],
+        all_sources: List[Dict]
+    ) -> StructuredResponse:
+        """LLM JSON 결과 + 출처 → StructuredResponse"""
         # confidence 계산
         max_sim = max([s["similarity"] for s in all_sources]) if all_sources else 0
 
@@ -478,9 +562,74 @@ class HistoryAgent:
             navigation=navigation if navigation else None
         )
 
-    def process(self, query: str, language: str = "en") -> Dict[str, Any]:
+    def generate_response(
+        self,
+        analysis: QueryAnalysis,
+        search_results: List[SearchResult]
+    ) -> StructuredResponse:
+        """3단계: 응답 생성"""
+        messages, all_sources = self._prepare_response(analysis, search_results)
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            response_format={"type": "json_object"}
+        )
+
+        result = json.loads(response.choices[0].message.content)
+        return self._build_structured_response(analysis, result, all_sources)
+
+    def stream_response(
+        self,
+        analysis: QueryAnalysis,
+        search_results: List[SearchResult]
+    ) -> Iterator[Tuple[str, Any]]:
         """
-        전체 파이프라인 실행
+        3단계 (스트리밍): 응답 생성
+
+        The LLM output is a JSON object, so the "answer" field is decoded
+        incrementally and emitted as tokens; the full StructuredResponse
+        follows once the object is complete.
+
+        Yields:
+            ("token", str) - answer text as it arrives
+            ("response", StructuredResponse) - final structured response
+        """
+        messages, all_sources = self._prepare_response(analysis, search_results)
+
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            response_format={"type": "json_object"},
+            stream=True
+        )
+
+        raw_parts = []
+        answer_stream = JSONFieldStreamer("answer")
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            raw_parts.append(delta)
+            text = answer_stream.feed(delta)
+            if text:
+                yield "token", text
+
+        result = json.loads("".join(raw_parts))
+        yield "response", self._build_structured_response(analysis, result, all_sources)
+
+    async def aprocess(self, query: str, language: str = "en") -> Dict[str, Any]:
+        """
+        전체 파이프라인 실행 (async, 단계 DAG)
+
+        analyze → embed → (semantic cache) → retrieve (항목별 검색 일괄) → filter → generate
+
+        Near-duplicate queries with the same intent/format/language are
+        answered from the semantic answer cache after the embed stage.
 
         Args:
             query: User's question
@@ -490,25 +639,190 @@ class HistoryAgent:
             {
                 "analysis": QueryAnalysis,
                 "search_results": [SearchResult],
-                "response": StructuredResponse
+                "response": StructuredResponse,
+                "trace": [{"stage", "start_ms", "duration_ms", "status"}]
             }
         """
         self.language = language  # Store for response generation
 
-        # 1. 분석
-        analysis = self.analyze_query(query)
+        dag = StageDAG()
 
-        # 2. 검색
-        search_results = self.execute_search(analysis)
+        # 1. 분석
+        dag.add("analyze", lambda: self.analyze_query(query))
+        await dag.run()
+        analysis = dag.results["analyze"]
+
+        # 의미 캐시 조회 (영어 쿼리 임베딩 - 일반 검색에 재사용)
+        query_embedding = None
+        cache = self.rag_service.answer_cache if self.rag_service else None
+        cache_scope = {
+            "intent": analysis.intent.value,
+            "format": analysis.response_format.value,
+            "language": language,
+            "model": self.model,
+        }
+        if cache is not None:
+            dag.add("embed", lambda: self.rag_service.embed_query(analysis.english_query, translate=False))
+            await dag.run()
+            query_embedding = dag.results["embed"]
+            cache_scope["embedding_model"] = self.rag_service.embedding_service.model
+
+            cached = cache.lookup("agent", query_embedding, cache_scope)
+            if cached is not None:
+                return {
+                    "analysis": asdict(analysis),
+                    "search_results": cached["search_results"],
+                    "response": cached["response"],
+                    "trace": dag.trace + [{"stage": "semantic_cache", "status": "hit"}]
+                }
+
+        started = time.perf_counter()
+
+        # 2. 검색 - 항목별 검색은 일괄 실행 (임베딩 1회 + SQL 1회)
+        steps = self.plan_search(analysis) if self.rag_service else []
+        for step in steps:
+            if query_embedding is not None and not step["translate"] and step["query"] == analysis.english_query:
+                step["embedding"] = query_embedding
+        dag.add("retrieve", lambda: self.run_search_steps(steps) if steps else [])
 
         # 3. 에이전트 필터링 (관련성 판단)
-        filtered_results = self.filter_relevant_results(analysis.original_query, search_results)
+        dag.add(
+            "filter",
+            lambda results: self.filter_relevant_results(analysis.original_query, results),
+            deps=["retrieve"]
+        )
 
         # 4. 응답 생성
-        response = self.generate_response(analysis, filtered_results)
+        dag.add("generate", lambda filtered: self.generate_response(analysis, filtered), deps=["filter"])
+        await dag.run()
+
+        filtered_results = dag.results["filter"]
+        response = dag.results["generate"]
+
+        search_results = [asdict(sr) for sr in filtered_results]
+        response = asdict(response)
+        if cache is not None:
+            cache.store(
+                "agent", query_embedding, cache_scope,
+                {"search_results": search_results, "response": response},
+                latency_ms=(time.perf_counter() - started) * 1000
+            )
 
         return {
             "analysis": asdict(analysis),
+            "search_results": search_results,
+            "response": response,
+            "trace": dag.trace
+        }
+
+    def process(self, query: str, language: str = "en") -> Dict[str, Any]:
+        """전체 파이프라인 실행 (sync wrapper of aprocess, for scripts)"""
+        return asyncio.run(self.aprocess(query, language=language))
+
+    def stream_process(self, query: str, language: str = "en") -> Iterator[Tuple[str, Any]]:
+        """
+        스트리밍 파이프라인 - process()와 같은 단계, 단계별 이벤트 전송
+
+        Yields (event, data) pairs:
+            ("analysis", dict) - query analysis
+            ("sources", {"search_results": [...], "sources": [...]}) - before generation
+            ("token", {"text": ...}) - answer tokens
+            ("response", dict) - final StructuredResponse
+        """
+        self.language = language
+
+        analysis = self.analyze_query(query)
+        yield "analysis", asdict(analysis)
+
+        search_results = self.execute_search(analysis)
+        filtered_results = self.filter_relevant_results(analysis.original_query, search_results)
+        _, sources = self._prepare_response(analysis, filtered_results)
+        yield "sources", {
             "search_results": [asdict(sr) for sr in filtered_results],
-            "response": asdict(response)
+            "sources": sources,
         }
+
+        for event, data in self.stream_response(analysis, filtered_results):
+            if event == "token":
+                yield "token", {"text": data}
+            else:
+                yield "response", asdict(data)
+
+
+class JSONFieldStreamer:
+    """
+    Incrementally extract a string field (first occurrence) from streamed JSON.
+
+    feed() takes raw chunks of the JSON text and returns the newly decoded
+    part of the field's value (escape sequences resolved), so a streamed
+    {"answer": "..."} object can be shown to users as plain text.
+    """
+
+    _ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+    def __init__(self, field_name: str):
+        self._key = f'"{field_name}"'
+        self._buffer = ""
+        self._state = "search"  # search → value → done
+        self._pos = 0
+
+    def feed(self, chunk: str) -> str:
+        if self._state == "done":
+            return ""
+        self._buffer += chunk
+
+        if self._state == "search":
+            key_at = self._buffer.find(self._key)
+            if key_at < 0:
+                return ""
+            # Opening quote of the value: after the key and a colon
+            rest = self._buffer[key_at + len(self._key):]
+            stripped = rest.lstrip()
+            if not stripped.startswith(":"):
+                return ""
+            value = stripped[1:].lstrip()
+            if not value:
+                return ""
+            if value[0] != '"':
+                self._state = "done"
+                return ""
+            self._buffer = value[1:]
+            self._pos = 0
+            self._state = "value"
+
+        out = []
+        buf = self._buffer
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._state = "done"
+                i += 1
+                break
+            if ch == '\\':
+                if i + 1 >= len(buf):
+                    break  # Incomplete escape, wait for more
+                esc = buf[i + 1]
+                if esc == 'u':
+                    if i + 6 > len(buf):
+                        break
+                    code = int(buf[i + 2:i + 6], 16)
+                    if 0xD800 <= code < 0xDC00:
+                        # Surrogate pair: need the low half too
+                        if i + 12 > len(buf):
+                            break
+                        low = int(buf[i + 8:i + 12], 16)
+                        out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                        i += 12
+                    else:
+                        out.append(chr(code))
+                        i += 6
+                    continue
+                out.append(self._ESCAPES.get(esc, esc))
+                i += 2
+                continue
+            out.append(ch)
+            i += 1
+
+        self._pos = i
+        return "".join(out)
@@ -19,6 +19,7 @@ from app.models.event import Event
 from app.models.person import Person
 from app.models.location import Location
 from app.schemas.chat import ChatContext
+from app.core.sheba.gazetteer import get_gazetteer, GazetteerHit
 
 # Noise patterns to exclude
 NOISE_PATTERNS = [
@@ -73,6 +74,14 @@ class ShebaObserver:
         self,
         query: str,
         context: Optional[ChatContext] = None,
+    ) -> Observation:
+        """Async observe_sync (runs on the caller's loop; DB calls block)."""
+        return self.observe_sync(query, context)
+
+    def observe_sync(
+        self,
+        query: str,
+        context: Optional[ChatContext] = None,
     ) -> Observation:
         """
         Observe and interpret a user query.
@@ -87,13 +96,16 @@ class ShebaObserver:
         # Extract temporal context
         time_context = self._extract_time(query)
 
+        # Single gazetteer pass for all location mentions
+        location_hits = self._match_names(query, "location")
+        related_locations = self._find_related_locations(location_hits)
+
         # Extract location context
-        location_context = self._extract_location(query)
+        location_context = self._extract_location(location_hits, related_locations)
 
         # Find related entities
         related_events = self._find_related_events(query_lower, time_context)
-        related_persons = self._find_related_persons(query_lower)
-        related_locations = self._find_related_locations(query_lower)
+        related_persons = self._find_related_persons(query)
 
         # Generate interpretation
         interpretation = self._generate_interpretation(
@@ -128,27 +140,34 @@ class ShebaObserver:
 
         return None
 
-    def _extract_location(self, query: str) -> Optional[dict]:
-        """Extract location references from query."""
-        # Search for known locations in the query
-        locations = self.db.query(Location).all()
-
-        for loc in locations:
-            if loc.name.lower() in query.lower():
-                return {
-                    "id": loc.id,
-                    "name": loc.name,
-                    "latitude": float(loc.latitude),
-                    "longitude": float(loc.longitude),
-                }
-            if loc.modern_name and loc.modern_name.lower() in query.lower():
-                return {
-                    "id": loc.id,
-                    "name": loc.name,
-                    "modern_name": loc.modern_name,
-                    "latitude": float(loc.latitude),
-                    "longitude": float(loc.longitude),
-                }
+    def _match_names(self, query: str, entity_type: str) -> list[GazetteerHit]:
+        """Find all known names of an entity type in the query (single pass)."""
+        exclude = NOISE_PATTERNS if entity_type == "person" else ()
+        return get_gazetteer(self.db, entity_type, exclude).find(query)
+
+    def _extract_location(
+        self,
+        location_hits: list[GazetteerHit],
+        locations: list[Location],
+    ) -> Optional[dict]:
+        """Extract the primary location reference (first mention in the query)."""
+        if not location_hits or not locations:
+            return None
+
+        by_id = {loc.id: loc for loc in locations}
+        for hit in location_hits:
+            loc = by_id.get(hit.entity_id)
+            if loc is None:
+                continue
+            location = {
+                "id": loc.id,
+                "name": loc.name,
+                "latitude": float(loc.latitude),
+                "longitude": float(loc.longitude),
+            }
+            if hit.field == "modern_name":
+                location["modern_name"] = loc.modern_name
+            return location
 
         return None
 
@@ -180,47 +199,49 @@ class ShebaObserver:
 
     def _find_related_persons(self, query: str) -> list[Person]:
         """Find persons mentioned in the query."""
-        # Exclude noise data
-        noise_filters = [Person.name.ilike(p) for p in NOISE_PATTERNS]
-        base_query = self.db.query(Person).filter(not_(or_(*noise_filters)))
+        # Full names (any language/alias) found by the gazetteer come first
+        hit_ids = []
+        for hit in self._match_names(query, "person"):
+            if hit.entity_id not in hit_ids:
+                hit_ids.append(hit.entity_id)
+
+        related = self._load_in_order(Person, hit_ids[:20])
+
+        # Partial names ("Caesar" -> "Julius Caesar") in one query for all words
+        words = [w for w in query.lower().split() if len(w) > 2]
+        if words and len(related) < 20:
+            noise_filters = [Person.name.ilike(p) for p in NOISE_PATTERNS]
+            word_filters = []
+            for word in words:
+                word_filters.append(Person.name.ilike(f"%{word}%"))
+                word_filters.append(Person.name_ko.ilike(f"%{word}%"))
+
+            partial_query = self.db.query(Person).filter(
+                not_(or_(*noise_filters)),
+                or_(*word_filters),
+            )
+            if related:
+                partial_query = partial_query.filter(Person.id.notin_([p.id for p in related]))
+            related.extend(partial_query.limit(20 - len(related)).all())
 
-        # Search by name match instead of loading all
-        words = query.lower().split()
-        if not words:
-            return []
+        return related[:20]
 
-        # Try to find persons whose name appears in query
-        related = []
-        for word in words:
-            if len(word) > 2:
-                matches = base_query.filter(
-                    or_(
-                        Person.name.ilike(f"%{word}%"),
-                        Person.name_ko.ilike(f"%{word}%") if Person.name_ko else False
-                    )
-                ).limit(10).all()
-                related.extend(matches)
-
-        # Deduplicate
-        seen = set()
-        unique = []
-        for p in related:
-            if p.id not in seen:
-                seen.add(p.id)
-                unique.append(p)
-
-        return unique[:20]
-
-    def _find_related_locations(self, query: str) -> list[Location]:
-        """Find locations mentioned in the query."""
-        locations = self.db.query(Location).all()
-
-        related = []
-        for loc in locations:
-            if loc.name.lower() in query:
-                related.append(loc)
-
-        return related
+    def _find_related_locations(self, location_hits: list[GazetteerHit]) -> list[Location]:
+        """Find locations mentioned in the query, in mention order."""
+        ids = []
+        for hit in location_hits:
+            if hit.entity_id not in ids:
+                ids.append(hit.entity_id)
+
+        return self._load_in_order(Location, ids)
+
+    def _load_in_order(self, model, ids: list[int]) -> list:
+        """Load rows by id, preserving the order of ids."""
+        if not ids:
+            return []
+        rows = self.db.query(model).filter(model.id.in_(ids)).all()
+        by_id = {row.id: row for row in rows}
+        return [by_id[i] for i in ids if i in by_id]
 
     def _generate_interpretation(
         self,
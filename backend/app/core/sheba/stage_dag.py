@@ -0,0 +1,123 @@
+"""
+SHEBA Stage DAG - 에이전트 파이프라인 단계 실행기
+
+Stages are nodes with dependencies; a stage starts as soon as all of its
+dependencies have finished, so independent stages (e.g. per-item
+retrievals) run concurrently. Sync stage functions (blocking OpenAI /
+DB calls) run in worker threads.
+
+Nodes can be added between run() calls, for graphs whose shape depends
+on an earlier stage's result (the retrieval plan depends on the query
+analysis).
+
+Usage:
+    dag = StageDAG()
+    dag.add("analyze", lambda: agent.analyze_query(query))
+    await dag.run()
+    dag.add("retrieve:0", lambda analysis: ..., deps=["analyze"])
+    dag.add("generate", lambda analysis, ctx: ..., deps=["analyze", "retrieve:0"])
+    await dag.run()
+    dag.results["generate"], dag.trace
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Sequence
+
+
+@dataclass
+class _Stage:
+    name: str
+    func: Callable[..., Any]
+    deps: List[str] = field(default_factory=list)
+
+
+class StageDAG:
+    """Dependency-ordered concurrent stage runner with a timing trace."""
+
+    def __init__(self):
+        self._pending: Dict[str, _Stage] = {}
+        self.results: Dict[str, Any] = {}
+        self.trace: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+
+    def add(self, name: str, func: Callable[..., Any], deps: Sequence[str] = ()) -> None:
+        """
+        Add a stage. func receives the results of deps, in order.
+        """
+        if name in self._pending or name in self.results:
+            raise ValueError(f"Duplicate stage: {name}")
+        self._pending[name] = _Stage(name=name, func=func, deps=list(deps))
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._origin) * 1000, 1)
+
+    async def _run_stage(self, stage: _Stage, waits: Dict[str, asyncio.Task]) -> Any:
+        for dep in stage.deps:
+            if dep in waits:
+                await waits[dep]
+        args = [self.results[dep] for dep in stage.deps]
+
+        start_ms = self._elapsed_ms()
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            if asyncio.iscoroutinefunction(stage.func):
+                result = await stage.func(*args)
+            else:
+                result = await asyncio.to_thread(stage.func, *args)
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            self.trace.append({
+                "stage": stage.name,
+                "start_ms": start_ms,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                "status": status,
+            })
+
+        self.results[stage.name] = result
+        return result
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every pending stage; the first failure cancels the rest and is raised."""
+        stages, self._pending = self._pending, {}
+
+        for stage in stages.values():
+            for dep in stage.deps:
+                if dep not in stages and dep not in self.results:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+
+        waits: Dict[str, asyncio.Task] = {}
+        for name in self._topological_order(stages):
+            waits[name] = asyncio.ensure_future(self._run_stage(stages[name], waits))
+
+        try:
+            await asyncio.gather(*waits.values())
+        except Exception:
+            for task in waits.values():
+                task.cancel()
+            raise
+
+        return self.results
+
+    @staticmethod
+    def _topological_order(stages: Dict[str, _Stage]) -> List[str]:
+        order, visiting, done = [], set(), set()
+
+        def visit(name: str):
+            if name in done or name not in stages:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle in stage graph at {name}")
+            visiting.add(name)
+            for dep in stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in stages:
+            visit(name)
+        return order
@@ -7,6 +7,9 @@ FGO 세계관 기반 큐레이션된 역사 시대 분류
 from typing import List, Dict, Any
 from dataclasses import dataclass, asdict
 
+from app.services import static_data
+from app.services.static_data import IntervalTree
+
 
 @dataclass
 class HistoricalEra:
@@ -507,39 +510,60 @@ SPECIAL_EPISODES: List[HistoricalEra] = [
 ]
 
 
+def _load_eras() -> Dict[str, Any]:
+    """Build era lists and id/type/year-interval indexes (static data registry loader)."""
+    items = SINGULARITIES + [SOLOMON_ERA] + LOSTBELTS + SPECIAL_EPISODES
+
+    by_type: Dict[str, List[HistoricalEra]] = {}
+    for era in items:
+        by_type.setdefault(era.era_type, []).append(era)
+
+    return {
+        "items": items,
+        "order": {era.id: i for i, era in enumerate(items)},
+        "by_id": {era.id: era for era in items},
+        "by_type": by_type,
+        "years": IntervalTree([(era.year_start, era.year_end, era) for era in items]),
+    }
+
+
+static_data.register("singularities", _load_eras)
+
+
 def get_all_eras() -> List[HistoricalEra]:
     """모든 역사 시대 반환"""
-    return SINGULARITIES + [SOLOMON_ERA] + LOSTBELTS + SPECIAL_EPISODES
+    return list(static_data.get("singularities")["items"])
 
 
 def get_era_by_id(era_id: str) -> HistoricalEra:
     """ID로 역사 시대 조회"""
-    for era in get_all_eras():
-        if era.id == era_id:
-            return era
-    return None
+    return static_data.get("singularities")["by_id"].get(era_id)
 
 
 def get_eras_by_type(era_type: str) -> List[HistoricalEra]:
     """타입별 역사 시대 조회"""
-    return [era for era in get_all_eras() if era.era_type == era_type]
+    return list(static_data.get("singularities")["by_type"].get(era_type, []))
 
 
 def find_matching_era(year: int, location: str = None) -> List[HistoricalEra]:
     """연도/위치로 관련 시대 찾기"""
-    matches = []
-    for era in get_all_eras():
-        # 연도가 시대 범위 내에 있는지 확인
-        if era.year_start <= year <= era.year_end:
-            matches.append(era)
-        # 위치 키워드 매칭
-        elif location:
-            location_lower = location.lower()
-            if location_lower in era.location.lower() or any(
-                location_lower in kw for kw in era.keywords
+    eras = static_data.get("singularities")
+
+    # 연도가 시대 범위 내에 있는지 확인 (interval tree)
+    matched = {era.id for era in eras["years"].query(year)}
+
+    # 위치 키워드 매칭
+    if location:
+        location_lower = location.lower()
+        for era in eras["items"]:
+            if era.id not in matched and (
+                location_lower in era.location.lower()
+                or any(location_lower in kw for kw in era.keywords)
             ):
-                matches.append(era)
+                matched.add(era.id)
 
+    order = eras["order"]
+    matches = sorted((eras["by_id"][era_id] for era_id in matched), key=lambda x: order[x.id])
     return sorted(matches, key=lambda x: abs(x.year_start - year))
 
 
@@ -10,15 +10,32 @@ Responsibilities:
 3. Attach LAPLACE explanations
 4. Manage the query lifecycle
 """
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.schemas.chat import ChatContext, ChatResponse, ExplanationSource
 from app.core.sheba.observer import ShebaObserver
 from app.core.logos.actor import LogosActor
 from app.core.laplace.explain import LaplaceExplainer
 from app.core.papermoon.authority import PapermoonAuthority
 
+# Shared, bounded pool for blocking SQLAlchemy work (keeps it off the event loop)
+_db_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(
+            max_workers=get_settings().orchestrator_db_workers,
+            thread_name_prefix="trismegistus-db",
+        )
+    return _db_executor
+
 
 class Orchestrator:
     """
@@ -27,8 +44,12 @@ class Orchestrator:
     Query flow:
     1. SHEBA observes query → identifies relevant context
     2. LOGOS proposes response → generates answer
+       (LAPLACE source lookup runs concurrently - it only needs the observation)
     3. PAPERMOON verifies → checks factual accuracy
     4. LAPLACE explains → attaches sources
+
+    Blocking DB calls run in a bounded thread pool. A request never runs
+    two DB stages at once, so its Session is only used by one thread at a time.
     """
 
     def __init__(self, db: Session):
@@ -38,6 +59,19 @@ class Orchestrator:
         self.papermoon = PapermoonAuthority(db)
         self.laplace = LaplaceExplainer(db)
 
+    async def _run_db(self, func, *args):
+        """Run a blocking SQLAlchemy call in the DB thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_db_executor(), func, *args)
+
+    @staticmethod
+    async def _timed(latency: dict, system: str, awaitable):
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            latency[system] = round((time.perf_counter() - started) * 1000, 1)
+
     async def process_query(
         self,
         query: str,
@@ -48,19 +82,33 @@ class Orchestrator:
 
         1. SHEBA: Observe and understand the query
         2. LOGOS: Generate a proposed response
+           ∥ LAPLACE: Look up sources for the observation
         3. PAPERMOON: Verify the proposal
         4. LAPLACE: Attach explanations and sources
+
+        Per-system latency (ms) is reported in reasoning_trace["latency_ms"].
         """
+        latency = {}
+        started = time.perf_counter()
+
         # Step 1: SHEBA observation
-        observation = await self.sheba.observe(query, context)
+        observation = await self._timed(
+            latency, "sheba", self._run_db(self.sheba.observe_sync, query, context)
+        )
 
-        # Step 2: LOGOS proposal
-        proposal = await self.logos.propose(query, observation)
+        # Step 2: LOGOS proposal ∥ LAPLACE source lookup
+        proposal, sources = await asyncio.gather(
+            self._timed(latency, "logos", self.logos.propose(query, observation)),
+            self._timed(latency, "laplace_sources", self._run_db(self.laplace.find_sources, observation)),
+        )
 
         # Step 3: PAPERMOON verification
-        verification = await self.papermoon.verify(proposal, observation)
+        verification = await self._timed(
+            latency, "papermoon", self.papermoon.verify(proposal, observation)
+        )
 
         if not verification.approved:
+            latency["total"] = round((time.perf_counter() - started) * 1000, 1)
             # If rejected, return with low confidence
             return ChatResponse(
                 answer=proposal.answer,
@@ -68,11 +116,18 @@ class Orchestrator:
                 sources=[],
                 related_events=observation.related_events,
                 suggested_queries=[],
-                reasoning_trace={"verification": "rejected", "reason": verification.reason}
+                reasoning_trace={
+                    "verification": "rejected",
+                    "reason": verification.reason,
+                    "latency_ms": latency,
+                }
             )
 
         # Step 4: LAPLACE explanation
-        explanation = await self.laplace.explain(proposal, observation)
+        explanation = await self._timed(
+            latency, "laplace", self.laplace.explain(proposal, observation, sources=sources)
+        )
+        latency["total"] = round((time.perf_counter() - started) * 1000, 1)
 
         return ChatResponse(
             answer=proposal.answer,
@@ -85,6 +140,7 @@ class Orchestrator:
                 "observation": observation.summary,
                 "verification": "approved",
                 "source_count": len(explanation.sources),
+                "latency_ms": latency,
             }
         )
 
@@ -94,7 +150,7 @@ class Orchestrator:
 
         Useful for exploring what data is available.
         """
-        observation = await self.sheba.observe(query, None)
+        observation = await self._run_db(self.sheba.observe_sync, query, None)
         return {
             "query": query,
             "interpreted_as": observation.interpretation,
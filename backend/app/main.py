@@ -39,6 +39,8 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 from app.api.v1.router import api_router
 from app.api.v1_new import router as v1_new_router
+from app.services import static_data
+from app.core import singularities  # noqa: F401  (registers the singularities dataset)
 
 settings = get_settings()
 
@@ -78,6 +80,12 @@ app.include_router(api_router, prefix=settings.api_v1_prefix)
 app.include_router(v1_new_router)  # V1 New (Historical Chain) - already has /api/v1 prefix
 
 
+@app.on_event("startup")
+def preload_static_data():
+    """Load and index showcases, servant mappings and eras before the first request."""
+    static_data.preload()
+
+
 # ============== Global Exception Handlers ==============
 
 @app.exception_handler(SQLAlchemyError)
@@ -100,6 +108,15 @@ async def integrity_exception_handler(request: Request, exc: IntegrityError):
     )
 
 
+@app.exception_handler(static_data.StaticDataUnavailable)
+async def static_data_exception_handler(request: Request, exc: static_data.StaticDataUnavailable):
+    """Handle static datasets (showcases, servants, eras) that failed to load."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc), "type": "static_data_unavailable"}
+    )
+
+
 @app.exception_handler(ValidationError)
 async def validation_exception_handler(request: Request, exc: ValidationError):
     """Handle Pydantic validation errors."""
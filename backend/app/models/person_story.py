@@ -0,0 +1,32 @@
+"""
+Person Story model - materialized person story timelines.
+
+One row per person with a person-layer chain in event_connections.
+The payload holds ordered nodes (compact positional arrays), node types
+and the map view, so the Story API is a single key lookup.
+
+Refreshed by `python -m app.scripts.materialize_stories`; only persons
+whose chain_signature changed are rebuilt.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+
+class PersonStory(Base):
+    __tablename__ = "person_stories"
+
+    person_id = Column(Integer, ForeignKey("persons.id", ondelete="CASCADE"), primary_key=True)
+
+    # {"person": {...}, "nodes": [[event_id, title, ...], ...], "map_view": {...}}
+    payload = Column(JSONB, nullable=False)
+    node_count = Column(Integer, nullable=False, default=0)
+
+    # Fingerprint of the person's chain when the payload was built
+    chain_signature = Column(String(128), nullable=False)
+    built_at = Column(DateTime, server_default=func.now())
+
+    def __repr__(self):
+        return f"<PersonStory(person_id={self.person_id}, nodes={self.node_count})>"
@@ -84,19 +84,25 @@ class Source(Base, TimestampMixin):
     @property
     def archive_url(self) -> str | None:
         """Generate URL for known archives."""
-        if not self.archive_type:
-            return self.url
-
-        archive_bases = {
-            "perseus": "https://www.perseus.tufts.edu/hopper/text?doc=",
-            "ctext": "https://ctext.org/",
-            "gutenberg": "https://www.gutenberg.org/ebooks/",
-            "latin_library": "https://thelatinlibrary.com/",
-            "augustana": "https://www.hs-augsburg.de/~harsch/augustana.html",
-            "internet_classics": "http://classics.mit.edu/",
-        }
-
-        base = archive_bases.get(self.archive_type)
-        if base and self.url:
-            return f"{base}{self.url}"
-        return self.url
+        return build_archive_url(self.archive_type, self.url)
+
+
+ARCHIVE_URL_BASES = {
+    "perseus": "https://www.perseus.tufts.edu/hopper/text?doc=",
+    "ctext": "https://ctext.org/",
+    "gutenberg": "https://www.gutenberg.org/ebooks/",
+    "latin_library": "https://thelatinlibrary.com/",
+    "augustana": "https://www.hs-augsburg.de/~harsch/augustana.html",
+    "internet_classics": "http://classics.mit.edu/",
+}
+
+
+def build_archive_url(archive_type: str | None, url: str | None) -> str | None:
+    """Generate URL for known archives from raw column values."""
+    if not archive_type:
+        return url
+
+    base = ARCHIVE_URL_BASES.get(archive_type)
+    if base and url:
+        return f"{base}{url}"
+    return url
@@ -0,0 +1,140 @@
+"""
+Benchmark vector index encodings: index size, latency and recall@k.
+
+For each encoding (full vector, halfvec, binary, Matryoshka-truncated
+variants) builds the matching HNSW expression index on the embeddings
+table, then runs sampled queries through VectorStore.search_similar
+(compact-index candidates + full-precision re-rank) and compares them
+with exact top-k ground truth.
+
+Indexes built for the benchmark are kept unless --drop is given (the
+serving encoding is chosen with VECTOR_STORE_ENCODING).
+
+int8 is not a pgvector type; measure it on the local backend instead:
+    python -m app.scripts.export_embeddings --dtype int8
+    python -m app.scripts.benchmark_vector_search --local ../data/vector_index
+
+Usage:
+    python -m app.scripts.benchmark_vector_quantization
+    python -m app.scripts.benchmark_vector_quantization --encodings vector binary binary@512 --rerank 4 8
+    python -m app.scripts.benchmark_vector_quantization --queries 200 --drop
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.services.embeddings import VectorStore
+from app.scripts.benchmark_vector_search import sample_queries, exact_top_k, run_case
+
+DEFAULT_ENCODINGS = [
+    "vector", "halfvec", "binary",
+    "halfvec@512", "binary@512", "halfvec@256",
+]
+
+
+def build_index(store: VectorStore) -> float:
+    """Create the encoding's index if needed; returns build seconds."""
+    started = time.perf_counter()
+    with store.get_connection() as conn:
+        with conn.cursor() as cur:
+            store._create_vector_index(cur)
+            conn.commit()
+    return time.perf_counter() - started
+
+
+def index_size_mb(store: VectorStore) -> float:
+    with store.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT pg_relation_size(to_regclass(%s))",
+                (store.index_name,)
+            )
+            size = cur.fetchone()[0] or 0
+            return size / (1024 * 1024)
+
+
+def table_size_mb(store: VectorStore) -> float:
+    with store.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_table_size('embeddings')")
+            return cur.fetchone()[0] / (1024 * 1024)
+
+
+def drop_index(store: VectorStore) -> None:
+    with store.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP INDEX IF EXISTS {store.index_name}")
+            conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector index encodings")
+    parser.add_argument("--encodings", nargs="+", default=DEFAULT_ENCODINGS)
+    parser.add_argument("--rerank", type=int, nargs="+", default=[4],
+                        help="Re-rank factors (candidates per result)")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef", type=int, default=40, help="hnsw.ef_search")
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--drop", action="store_true", help="Drop benchmark indexes afterwards")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("CHALDEAS Vector Quantization Benchmark")
+    print("=" * 50)
+
+    baseline = VectorStore(embedding_dimension=args.dimension)
+    queries = sample_queries(baseline, args.queries)
+    if not queries:
+        print("No embeddings found. Run index_events first.")
+        return 1
+
+    print(f"Queries: {len(queries)}, k={args.k}, ef_search={args.ef}")
+    print(f"Table (heap + TOAST): {table_size_mb(baseline):.1f} MB")
+    print("Computing exact ground truth...")
+    truth = [exact_top_k(baseline, q, args.k, {}) for q in queries]
+
+    print(f"\n{'encoding':<14} {'rerank':>6} {'index MB':>9} {'build s':>8} "
+          f"{'recall@k':>9} {'p50 ms':>8} {'p95 ms':>8}")
+
+    built = []
+    for spec in args.encodings:
+        for factor in args.rerank:
+            store = VectorStore(
+                embedding_dimension=args.dimension,
+                encoding=spec,
+                rerank_factor=factor
+            )
+            build_s = build_index(store)
+            if store.index_name not in [s.index_name for s in built]:
+                built.append(store)
+
+            result = run_case(store, queries, truth, args.k, args.ef, {})
+            print(
+                f"{store.encoding.spec:<14} {store.rerank_factor:>6} "
+                f"{index_size_mb(store):>9.1f} {build_s:>8.1f} "
+                f"{result['recall']:>9.3f} {result['p50']:>8.1f} {result['p95']:>8.1f}"
+            )
+            if store.encoding.is_exact:
+                break  # re-rank factor has no effect
+
+    if args.drop:
+        for store in built:
+            if store.index_name != baseline.index_name:
+                drop_index(store)
+        print("\nDropped benchmark indexes")
+
+    print("\n" + "=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Benchmark VectorStore similarity search: recall and latency vs ef_search.
+
+Samples stored embeddings as queries, computes exact top-k ground truth
+(sequential scan, no index), then measures recall@k and p50/p95 latency of
+the ANN search for each ef_search value - unfiltered and with a category
+filter, so the pre-filter / post-filter planner choices show up as well.
+
+With --local, the in-process backend (export_embeddings output) is
+measured against the same pgvector ground truth - a recall parity check
+(--ef values are then also used as IVF nprobe).
+
+Usage:
+    python -m app.scripts.benchmark_vector_search
+    python -m app.scripts.benchmark_vector_search --queries 200 --k 10 --ef 20 40 80 160 320
+    python -m app.scripts.benchmark_vector_search --category battle
+    python -m app.scripts.benchmark_vector_search --local ../data/vector_index --min-recall 0.9
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import numpy as np
+from psycopg2.extras import RealDictCursor
+
+from app.services.embeddings import VectorStore, LocalVectorStore
+
+
+def sample_queries(store: VectorStore, count: int) -> list:
+    """Random stored embeddings to use as queries."""
+    with store.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT embedding FROM embeddings ORDER BY random() LIMIT %s",
+                (count,)
+            )
+            return [np.asarray(row[0], dtype=np.float32) for row in cur.fetchall()]
+
+
+def most_common_category(store: VectorStore) -> str:
+    with store.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT category FROM embeddings
+                WHERE category IS NOT NULL
+                GROUP BY category ORDER BY COUNT(*) DESC LIMIT 1
+            """)
+            row = cur.fetchone()
+            return row[0] if row else None
+
+
+def exact_top_k(store: VectorStore, query_vec, k: int, filters: dict) -> list:
+    """Ground truth: exact cosine top-k with index scans disabled."""
+    conditions, params = store._filter_conditions(None, filters)
+    where_clause = " AND ".join(conditions) or "TRUE"
+    params = {**params, "vec": query_vec, "k": k}
+
+    with store.get_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("SET LOCAL enable_indexscan = off")
+            cur.execute("SET LOCAL enable_bitmapscan = off")
+            cur.execute(f"""
+                SELECT content_type, content_id
+                FROM embeddings
+                WHERE {where_clause}
+                ORDER BY embedding <=> %(vec)s::vector
+                LIMIT %(k)s
+            """, params)
+            rows = [(r["content_type"], r["content_id"]) for r in cur.fetchall()]
+            conn.commit()
+            return rows
+
+
+def run_case(store, queries: list, truth: list, k: int, ef: int, filters: dict) -> dict:
+    latencies = []
+    recalls = []
+    strategies = {}
+
+    for query_vec, expected in zip(queries, truth):
+        started = time.perf_counter()
+        results = store.search_similar(
+            query_vec.tolist(),
+            limit=k,
+            min_similarity=-1.0,
+            filters=filters,
+            ef_search=ef
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+
+        found = {(r["content_type"], r["content_id"]) for r in results}
+        if expected:
+            recalls.append(len(found & set(expected)) / len(expected))
+
+        strategy = (store.last_plan or {}).get("strategy", "?")
+        strategies[strategy] = strategies.get(strategy, 0) + 1
+
+    latencies.sort()
+    return {
+        "recall": statistics.mean(recalls) if recalls else 0.0,
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "strategies": strategies,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vector search recall/latency")
+    parser.add_argument("--queries", type=int, default=100, help="Number of sampled queries")
+    parser.add_argument("--k", type=int, default=10, help="Top-k")
+    parser.add_argument("--ef", type=int, nargs="+", default=[20, 40, 80, 160, 320],
+                        help="hnsw.ef_search values")
+    parser.add_argument("--category", help="Category filter (default: most common)")
+    parser.add_argument("--local", help="Also benchmark a local vector store export (recall parity)")
+    parser.add_argument("--min-recall", type=float, default=0.0,
+                        help="Exit non-zero if the local backend's best recall is below this")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("CHALDEAS Vector Search Benchmark")
+    print("=" * 50)
+
+    store = VectorStore()
+    queries = sample_queries(store, args.queries)
+    if not queries:
+        print("No embeddings found. Run index_events first.")
+        return 1
+
+    category = args.category or most_common_category(store)
+    cases = [("unfiltered", {})]
+    if category:
+        cases.append((f"category={category}", {"category": category}))
+
+    backends = [("pgvector", store)]
+    if args.local:
+        backends.append(("local", LocalVectorStore(args.local)))
+
+    print(f"Queries: {len(queries)}, k={args.k}, index={store.index_type}")
+
+    parity_ok = True
+    for label, filters in cases:
+        print(f"\n[{label}] computing exact ground truth...")
+        truth = [exact_top_k(store, q, args.k, filters) for q in queries]
+
+        for backend_name, backend in backends:
+            knob = "ef_search" if backend_name == "pgvector" else "nprobe"
+            print(f"\n  {backend_name}")
+            print(f"{knob:>10} {'recall@k':>10} {'p50 ms':>10} {'p95 ms':>10}  plans")
+            best_recall = 0.0
+            for ef in args.ef:
+                result = run_case(backend, queries, truth, args.k, ef, filters)
+                best_recall = max(best_recall, result["recall"])
+                plans = ", ".join(f"{s}:{n}" for s, n in sorted(result["strategies"].items()))
+                print(
+                    f"{ef:>10} {result['recall']:>10.3f} "
+                    f"{result['p50']:>10.1f} {result['p95']:>10.1f}  {plans}"
+                )
+            if backend_name == "local" and best_recall < args.min_recall:
+                print(f"  ✗ local recall {best_recall:.3f} < {args.min_recall}")
+                parity_ok = False
+
+    print("\n" + "=" * 50)
+    return 0 if parity_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
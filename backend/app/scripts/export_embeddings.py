@@ -0,0 +1,143 @@
+"""
+Export the pgvector embeddings table for the local (in-process) vector store.
+
+Streams rows with a server-side cursor, writes L2-normalized float16 or
+int8 vectors into a memory-mappable .npy file plus rows.jsonl, then
+trains the IVF index. Point the backend at the export with:
+
+    VECTOR_STORE_BACKEND=local VECTOR_STORE_LOCAL_PATH=../data/vector_index
+
+Usage:
+    python -m app.scripts.export_embeddings
+    python -m app.scripts.export_embeddings --out ../data/vector_index --dtype int8 --nlist 256
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+import numpy as np
+
+from app.services.embeddings import VectorStore, LocalVectorStore
+from app.services.embeddings.local_store import (
+    quantize, MANIFEST_FILE, VECTORS_FILE, SCALES_FILE, ROWS_FILE, IVF_FILE
+)
+
+BATCH_SIZE = 2000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export embeddings for the local vector store")
+    parser.add_argument("--out", default=str(Path(__file__).parent.parent.parent.parent / "data" / "vector_index"))
+    parser.add_argument("--dtype", choices=["float16", "int8"], default="float16")
+    parser.add_argument("--nlist", type=int, help="IVF lists (default: 4*sqrt(n))")
+    parser.add_argument("--no-index", action="store_true", help="Skip IVF training (exact scan only)")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("CHALDEAS Embedding Export")
+    print("=" * 50)
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    for name in (SCALES_FILE, IVF_FILE):
+        (out / name).unlink(missing_ok=True)
+
+    store = VectorStore()
+    source_version = store.get_data_version()
+    started = time.perf_counter()
+
+    with store.get_connection() as conn:
+        # One snapshot for COUNT(*) and the row scan. register_vector() already
+        # ran a SELECT, so end that transaction before changing the session.
+        conn.rollback()
+        conn.set_session(isolation_level="REPEATABLE READ", readonly=True)
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*), (SELECT vector_dims(embedding) FROM embeddings LIMIT 1) FROM embeddings")
+            count, dim = cur.fetchone()
+        if not count:
+            print("No embeddings found. Run index_events first.")
+            return 1
+
+        print(f"Exporting {count} embeddings ({dim} dims, {args.dtype}) → {out}")
+
+        vectors = np.lib.format.open_memmap(
+            out / VECTORS_FILE, mode="w+",
+            dtype=np.float16 if args.dtype == "float16" else np.int8,
+            shape=(count, dim)
+        )
+        scales = np.ones(count, dtype=np.float32) if args.dtype == "int8" else None
+
+        written = 0
+        with open(out / ROWS_FILE, "w", encoding="utf-8") as rows_file:
+            # Named cursor = server-side, streams instead of loading everything
+            with conn.cursor(name="export_embeddings") as cur:
+                cur.itersize = BATCH_SIZE
+                cur.execute("""
+                    SELECT content_type, content_id, content_text, metadata,
+                           category, date_start, embedding
+                    FROM embeddings
+                    ORDER BY id
+                """)
+                while True:
+                    batch = cur.fetchmany(BATCH_SIZE)
+                    if not batch:
+                        break
+
+                    matrix = np.stack([np.asarray(r[6], dtype=np.float32) for r in batch])
+                    codes, batch_scales = quantize(matrix, args.dtype)
+                    vectors[written:written + len(batch)] = codes
+                    if scales is not None:
+                        scales[written:written + len(batch)] = batch_scales
+
+                    for content_type, content_id, text, metadata, category, date_start, _ in batch:
+                        rows_file.write(json.dumps({
+                            "content_type": content_type,
+                            "content_id": content_id,
+                            "content_text": text,
+                            "metadata": metadata or {},
+                            "category": category,
+                            "date_start": date_start,
+                        }, ensure_ascii=False) + "\n")
+
+                    written += len(batch)
+                    print(f"  {written}/{count}")
+
+        vectors.flush()
+        del vectors
+
+    if scales is not None:
+        np.save(out / SCALES_FILE, scales)
+
+    with open(out / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump({
+            "dim": dim,
+            "count": written,
+            "dtype": args.dtype,
+            "source_version": source_version,
+            "exported_at": datetime.now(timezone.utc).isoformat(),
+        }, f, indent=2)
+
+    print(f"Exported in {time.perf_counter() - started:.1f}s")
+
+    if not args.no_index:
+        index_started = time.perf_counter()
+        nlist = LocalVectorStore.build_ivf_index(str(out), nlist=args.nlist)
+        print(f"IVF index: {nlist} lists in {time.perf_counter() - index_started:.1f}s")
+
+    print("\n" + "=" * 50)
+    print(f"Done. Verify recall with: python -m app.scripts.benchmark_vector_search --local {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Local fake OpenAI-compatible LLM server for testing streaming endpoints.
+
+Serves /v1/chat/completions (plain and `stream: true` chunked SSE, with
+configurable time-to-first-token and per-token delay) and /v1/embeddings
+(deterministic pseudo-random vectors), so /chat/rag/stream and
+/chat/agent/stream can be exercised without an API key or network.
+
+The OpenAI client honours OPENAI_BASE_URL, so point the backend at it:
+
+    python -m app.scripts.fake_llm_server --port 8900 --ttft 0.5 --token-delay 0.05
+    OPENAI_BASE_URL=http://localhost:8900/v1 OPENAI_API_KEY=sk-fake uvicorn app.main:app
+
+Then compare time-to-first-byte of the blocking and streaming endpoints:
+
+    curl -N -X POST localhost:8100/api/v1/chat/rag/stream \\
+         -H 'Content-Type: application/json' -d '{"query": "Battle of Marathon"}'
+
+Usage:
+    python -m app.scripts.fake_llm_server
+    python -m app.scripts.fake_llm_server --port 8900 --ttft 1.0 --token-delay 0.02
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_DIMENSIONS = 1536
+
+FAKE_ANSWER = (
+    "The Battle of Marathon (490 BCE) was fought between Athens and the "
+    "Persian Empire. The Athenian victory showed that the Persians could be "
+    "beaten, which mattered a lot ten years later at Salamis."
+)
+
+
+def _tokens(text: str):
+    """Split text into small chunks, roughly like LLM tokens."""
+    chunk = ""
+    for ch in text:
+        chunk += ch
+        if ch in " ,.\n" or len(chunk) >= 4:
+            yield chunk
+            chunk = ""
+    if chunk:
+        yield chunk
+
+
+def _completion_text(body: dict) -> str:
+    """Pick a canned completion that matches what the caller expects."""
+    prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+    wants_json = (body.get("response_format") or {}).get("type") == "json_object"
+
+    if "relevant_indices" in prompt:
+        return json.dumps({"relevant_indices": [0, 1, 2], "reasoning": "fake"})
+
+    if wants_json and '"english_query"' in prompt:
+        # HistoryAgent.analyze_query
+        user = body["messages"][-1].get("content", "")
+        return json.dumps({
+            "english_query": user,
+            "intent": "overview",
+            "intent_confidence": "high",
+            "entities": {"events": [], "persons": [], "locations": [],
+                         "time_periods": [], "categories": [], "keywords": [user]},
+            "response_format": "narrative",
+            "search_strategy": "single vector search",
+            "requires_multiple_searches": False,
+        }, ensure_ascii=False)
+
+    if wants_json:
+        return json.dumps({
+            "answer": FAKE_ANSWER,
+            "structured_data": {},
+            "suggested_followups": ["What happened at Salamis?"],
+        }, ensure_ascii=False)
+
+    if prompt.startswith("Translate the following query"):
+        return body["messages"][-1].get("content", "")
+
+    return FAKE_ANSWER
+
+
+def _fake_embedding(text: str, dimensions: int) -> list:
+    """Deterministic unit vector seeded by the text."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    rng = random.Random(seed)
+    vec = [rng.gauss(0, 1) for _ in range(dimensions)]
+    norm = sum(v * v for v in vec) ** 0.5 or 1.0
+    return [v / norm for v in vec]
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    ttft = 0.0
+    token_delay = 0.0
+
+    def log_message(self, format, *args):
+        print(f"[FakeLLM] {self.address_string()} {format % args}")
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send_json(self, payload: dict, status: int = 200):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        body = self._read_body()
+        path = self.path.rstrip("/")
+
+        if path.endswith("/embeddings"):
+            self._handle_embeddings(body)
+        elif path.endswith("/chat/completions"):
+            self._handle_chat(body)
+        else:
+            self._send_json({"error": {"message": f"Unknown path {self.path}"}}, status=404)
+
+    def _handle_embeddings(self, body: dict):
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = body.get("dimensions") or DEFAULT_DIMENSIONS
+        self._send_json({
+            "object": "list",
+            "model": body.get("model", "fake-embedding"),
+            "data": [
+                {"object": "embedding", "index": i, "embedding": _fake_embedding(text, dimensions)}
+                for i, text in enumerate(inputs)
+            ],
+            "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        })
+
+    def _handle_chat(self, body: dict):
+        text = _completion_text(body)
+        model = body.get("model", "fake-llm")
+        created = int(time.time())
+        completion_id = f"chatcmpl-fake-{created}"
+
+        time.sleep(self.ttft)
+
+        if not body.get("stream"):
+            self._send_json({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def event(delta: dict, finish_reason=None) -> bytes:
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8")
+
+        self._write_chunk(event({"role": "assistant", "content": ""}))
+        for token in _tokens(text):
+            self._write_chunk(event({"content": token}))
+            time.sleep(self.token_delay)
+        self._write_chunk(event({}, finish_reason="stop"))
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI-compatible LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--ttft", type=float, default=0.5, help="Seconds before the first token")
+    parser.add_argument("--token-delay", type=float, default=0.03, help="Seconds between tokens")
+    args = parser.parse_args()
+
+    FakeLLMHandler.ttft = args.ttft
+    FakeLLMHandler.token_delay = args.token_delay
+
+    print("=" * 50)
+    print("CHALDEAS Fake LLM Server")
+    print("=" * 50)
+    print(f"Listening:   http://{args.host}:{args.port}/v1")
+    print(f"TTFT:        {args.ttft}s")
+    print(f"Token delay: {args.token_delay}s")
+
+    server = ThreadingHTTPServer((args.host, args.port), FakeLLMHandler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
+from app.config import get_settings
 from app.services.embeddings import EmbeddingService, VectorStore
 
 
@@ -68,6 +69,15 @@ def load_events_from_json() -> list:
     return events
 
 
+def event_year(event: dict):
+    """date_start (or year) of an event; year 0 is a valid value, not missing."""
+    for field in ('date_start', 'year'):
+        value = event.get(field)
+        if value is not None and value != '':
+            return value
+    return None
+
+
 def build_event_text(event: dict) -> str:
     """Build searchable text from event."""
     parts = []
@@ -81,8 +91,8 @@ def build_event_text(event: dict) -> str:
         parts.append(f"설명: {description}")
 
     # Date
-    date_start = event.get('date_start') or event.get('year')
-    if date_start:
+    date_start = event_year(event)
+    if date_start is not None:
         year = int(date_start)
         era = "BCE" if year < 0 else "CE"
         parts.append(f"시기: {abs(year)} {era}")
@@ -107,10 +117,10 @@ def build_event_text(event: dict) -> str:
 def build_event_metadata(event: dict) -> dict:
     """Extract metadata from event."""
     title = event.get('title') or event.get('label') or ''
-    date_start = event.get('date_start') or event.get('year')
+    date_start = event_year(event)
 
     date_str = ""
-    if date_start:
+    if date_start is not None:
         year = int(date_start)
         era = "BCE" if year < 0 else "CE"
         date_str = f"{abs(year)} {era}"
@@ -118,6 +128,7 @@ def build_event_metadata(event: dict) -> dict:
     return {
         "title": title,
         "date": date_str,
+        "date_start": int(date_start) if date_start is not None else None,  # typed filter column
         "category": event.get('category'),
         "latitude": event.get('latitude') or event.get('lat'),
         "longitude": event.get('longitude') or event.get('lng'),
@@ -147,9 +158,13 @@ def main():
     print(f"Embedding dimension: {embedding_service.embedding_dimension}")
 
     print("\nInitializing vector store...")
+    # Same index encoding as the serving store (VECTOR_STORE_ENCODING)
+    settings = get_settings()
     vector_store = VectorStore(
-        embedding_dimension=embedding_service.embedding_dimension
+        embedding_dimension=embedding_service.embedding_dimension,
+        encoding=settings.vector_store_encoding
     )
+    print(f"Index encoding: {vector_store.encoding.spec}")
 
     # Initialize database
     print("\nInitializing database (creating tables if needed)...")
@@ -0,0 +1,58 @@
+"""
+Script to materialize person story timelines into person_stories.
+
+Rebuilds only persons whose person-layer chain (or person row) changed
+since the last run, and removes stories of persons without a chain.
+Run after chain building / connection imports.
+
+Usage:
+    python -m app.scripts.materialize_stories
+    python -m app.scripts.materialize_stories --force
+    python -m app.scripts.materialize_stories --person-id 123 --person-id 456
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from app.db.session import SessionLocal
+from app.services import story_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Materialize person story timelines")
+    parser.add_argument("--force", action="store_true", help="Rebuild every story")
+    parser.add_argument("--person-id", type=int, action="append", help="Only refresh these persons")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("CHALDEAS Story Materializer")
+    print("=" * 50)
+
+    db = SessionLocal()
+    started = time.time()
+    try:
+        stats = story_service.materialize_person_stories(
+            db,
+            person_ids=args.person_id,
+            force=args.force,
+        )
+    finally:
+        db.close()
+
+    print(f"Checked:   {stats['checked']}")
+    print(f"Rebuilt:   {stats['rebuilt']}")
+    print(f"Unchanged: {stats['unchanged']}")
+    print(f"Removed:   {stats['removed']}")
+    print(f"Elapsed:   {time.time() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Handles vector embeddings for semantic search.
 """
 
 from .embedding_service import EmbeddingService
-from .vector_store import VectorStore
+from .vector_store import VectorStore, create_vector_store
+from .local_store import LocalVectorStore, ReadOnlyStoreError
 
-__all__ = ["EmbeddingService", "VectorStore"]
+__all__ = ["EmbeddingService", "VectorStore", "LocalVectorStore", "ReadOnlyStoreError", "create_vector_store"]
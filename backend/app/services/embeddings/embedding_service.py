@@ -137,6 +137,29 @@ class EmbeddingService:
         text = "\n".join(parts)
         return self.embed_text(text)
 
+    # Max inputs per embeddings API request
+    MAX_BATCH_INPUTS = 2048
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Create embeddings for many search queries with one API call.
+
+        Duplicate queries are embedded once; batches above the API input
+        limit are split.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            Embedding vectors in input order
+        """
+        unique = list(dict.fromkeys(queries))
+        vectors = {}
+        for start in range(0, len(unique), self.MAX_BATCH_INPUTS):
+            batch = unique[start:start + self.MAX_BATCH_INPUTS]
+            vectors.update(zip(batch, self.embed_texts(batch)))
+        return [vectors[q] for q in queries]
+
     def embed_query(self, query: str) -> List[float]:
         """
         Create embedding for a search query.
@@ -0,0 +1,411 @@
+"""
+In-process vector store backend (no Postgres round trips).
+
+Loads an export of the pgvector `embeddings` table (see
+app/scripts/export_embeddings.py) and serves the same search API as
+VectorStore from memory:
+
+- Vectors: L2-normalized, stored as float16 or int8 (per-row scale) in a
+  .npy file that is memory-mapped, so loading is instant and pages are
+  shared between worker processes
+- Index: IVF (k-means coarse quantizer, inverted lists). A query scores
+  the centroids, probes the nprobe closest lists and ranks their rows.
+  Small stores and selective filters skip the index and scan exactly.
+- Filters: content_type / category / date_start are kept as numpy
+  columns and evaluated as boolean masks
+
+Export layout (directory):
+    manifest.json   dim, count, dtype, source data version
+    vectors.npy     (count, dim) float16 | int8
+    scales.npy      (count,) float32, int8 only
+    rows.jsonl      content_type, content_id, content_text, metadata, category, date_start
+    ivf.npz         centroids + list offsets/ids (built by build_ivf_index)
+
+The store is read-only; re-export after re-indexing.
+"""
+import os
+import json
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .vector_store import _normalize_category
+
+# Sentinel for missing date_start in the int32 column
+NO_DATE = np.iinfo(np.int32).min
+
+MANIFEST_FILE = "manifest.json"
+VECTORS_FILE = "vectors.npy"
+SCALES_FILE = "scales.npy"
+ROWS_FILE = "rows.jsonl"
+IVF_FILE = "ivf.npz"
+
+
+class ReadOnlyStoreError(RuntimeError):
+    """Write attempted on the read-only local vector store."""
+
+
+def quantize(vectors: np.ndarray, dtype: str):
+    """
+    Normalized float32 vectors → (stored matrix, per-row scales or None).
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors = vectors / norms
+
+    if dtype == "float16":
+        return vectors.astype(np.float16), None
+    if dtype == "int8":
+        max_abs = np.abs(vectors).max(axis=1)
+        max_abs[max_abs == 0] = 1.0
+        scales = (max_abs / 127.0).astype(np.float32)
+        codes = np.round(vectors / scales[:, None]).astype(np.int8)
+        return codes, scales
+    raise ValueError("dtype must be 'float16' or 'int8'")
+
+
+def kmeans(data: np.ndarray, k: int, iterations: int = 10, seed: int = 42) -> np.ndarray:
+    """Spherical k-means (cosine) on normalized float32 rows → centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(len(data), size=k, replace=False)].copy()
+
+    for _ in range(iterations):
+        assign = _assign(data, centroids)
+        for c in range(k):
+            members = data[assign == c]
+            if len(members):
+                centroid = members.sum(axis=0)
+            else:
+                # Re-seed empty clusters
+                centroid = data[rng.integers(len(data))]
+            norm = np.linalg.norm(centroid)
+            centroids[c] = centroid / norm if norm else centroid
+    return centroids
+
+
+def _assign(data: np.ndarray, centroids: np.ndarray, batch: int = 8192) -> np.ndarray:
+    out = np.empty(len(data), dtype=np.int32)
+    for start in range(0, len(data), batch):
+        out[start:start + batch] = np.argmax(data[start:start + batch] @ centroids.T, axis=1)
+    return out
+
+
+class LocalVectorStore:
+    """
+    Memory-mapped, quantized in-process vector store with an IVF index.
+
+    Drop-in for VectorStore.search_similar(); selected with
+    VECTOR_STORE_BACKEND=local (see create_vector_store()).
+    """
+
+    # Exact scan is cheaper than probing below these sizes
+    EXACT_MAX_ROWS = 5000
+    DEFAULT_NPROBE = 8
+    SCORE_BATCH = 65536
+
+    def __init__(self, path: str, nprobe: Optional[int] = None):
+        self.path = Path(path)
+        manifest_path = self.path / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise FileNotFoundError(
+                f"No vector export at {self.path} (run app.scripts.export_embeddings)"
+            )
+
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+        self.embedding_dimension = int(self.manifest["dim"])
+        self.dtype = self.manifest["dtype"]
+        self.nprobe = nprobe or self.DEFAULT_NPROBE
+        self.last_plan: Optional[dict] = None
+
+        self._vectors = np.load(self.path / VECTORS_FILE, mmap_mode="r")
+        self._scales = (
+            np.load(self.path / SCALES_FILE) if self.dtype == "int8" else None
+        )
+        self._load_rows()
+        self._load_ivf()
+
+    # ----- loading -----
+
+    def _load_rows(self) -> None:
+        self._rows: List[dict] = []
+        content_types, categories, dates = [], [], []
+
+        with open(self.path / ROWS_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                row = json.loads(line)
+                self._rows.append(row)
+                content_types.append(row.get("content_type") or "")
+                categories.append(row.get("category") or "")
+                date_start = row.get("date_start")
+                dates.append(NO_DATE if date_start is None else int(date_start))
+
+        if len(self._rows) != len(self._vectors):
+            raise ValueError(
+                f"{ROWS_FILE} has {len(self._rows)} rows but {VECTORS_FILE} has {len(self._vectors)}"
+            )
+
+        # Categorical columns as small-int codes
+        self._type_vocab = {v: i for i, v in enumerate(sorted(set(content_types)))}
+        self._category_vocab = {v: i for i, v in enumerate(sorted(set(categories)))}
+        self._content_type = np.array([self._type_vocab[v] for v in content_types], dtype=np.int32)
+        self._category = np.array([self._category_vocab[v] for v in categories], dtype=np.int32)
+        self._date_start = np.array(dates, dtype=np.int32)
+
+    def _load_ivf(self) -> None:
+        ivf_path = self.path / IVF_FILE
+        if not ivf_path.exists():
+            self._centroids = None
+            return
+        ivf = np.load(ivf_path)
+        self._centroids = ivf["centroids"].astype(np.float32)
+        self._list_offsets = ivf["offsets"]
+        self._list_ids = ivf["ids"]
+
+    # ----- index build -----
+
+    @classmethod
+    def build_ivf_index(
+        cls,
+        path: str,
+        nlist: Optional[int] = None,
+        sample_size: int = 50000,
+        iterations: int = 10
+    ) -> int:
+        """
+        Train the coarse quantizer on a sample and write ivf.npz.
+        Returns the number of lists.
+        """
+        path = Path(path)
+        vectors = np.load(path / VECTORS_FILE, mmap_mode="r")
+        scales = np.load(path / SCALES_FILE) if (path / SCALES_FILE).exists() else None
+        count = len(vectors)
+        if count == 0:
+            return 0
+
+        nlist = nlist or max(1, min(4096, int(4 * math.sqrt(count))))
+        nlist = min(nlist, count)
+
+        rng = np.random.default_rng(42)
+        sample_ids = np.sort(rng.choice(count, size=min(sample_size, count), replace=False))
+        sample = cls._dequantize(vectors, scales, sample_ids)
+        centroids = kmeans(sample, nlist, iterations=iterations)
+
+        assign = np.empty(count, dtype=np.int32)
+        for start in range(0, count, cls.SCORE_BATCH):
+            ids = np.arange(start, min(count, start + cls.SCORE_BATCH))
+            assign[ids] = _assign(cls._dequantize(vectors, scales, ids), centroids)
+
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        offsets = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=nlist), out=offsets[1:])
+
+        np.savez(path / IVF_FILE, centroids=centroids.astype(np.float32), offsets=offsets, ids=order)
+        return nlist
+
+    @staticmethod
+    def _dequantize(vectors, scales, ids: np.ndarray) -> np.ndarray:
+        block = np.asarray(vectors[ids], dtype=np.float32)
+        if scales is not None:
+            block *= scales[ids][:, None]
+        return block
+
+    # ----- search -----
+
+    def _filter_mask(self, content_type: Optional[str], filters: Optional[dict]) -> Optional[np.ndarray]:
+        mask = None
+
+        def combine(current, condition):
+            return condition if current is None else current & condition
+
+        if content_type:
+            code = self._type_vocab.get(content_type, -1)
+            mask = combine(mask, self._content_type == code)
+
+        if filters:
+            if filters.get("category"):
+                code = self._category_vocab.get(_normalize_category(filters["category"]), -1)
+                mask = combine(mask, self._category == code)
+            if filters.get("date_from") is not None:
+                mask = combine(mask, (self._date_start != NO_DATE) & (self._date_start >= int(filters["date_from"])))
+            if filters.get("date_to") is not None:
+                mask = combine(mask, (self._date_start != NO_DATE) & (self._date_start <= int(filters["date_to"])))
+
+        return mask
+
+    def _score(self, ids: np.ndarray, query: np.ndarray) -> np.ndarray:
+        scores = np.empty(len(ids), dtype=np.float32)
+        for start in range(0, len(ids), self.SCORE_BATCH):
+            batch = ids[start:start + self.SCORE_BATCH]
+            scores[start:start + len(batch)] = np.asarray(self._vectors[batch], dtype=np.float32) @ query
+        if self._scales is not None:
+            scores *= self._scales[ids]
+        return scores
+
+    def _probe_ids(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        centroid_scores = self._centroids @ query
+        nprobe = min(nprobe, len(centroid_scores))
+        lists = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        return np.concatenate([
+            self._list_ids[self._list_offsets[l]:self._list_offsets[l + 1]] for l in lists
+        ])
+
+    @staticmethod
+    def _top_k(ids: np.ndarray, scores: np.ndarray, k: int):
+        if len(ids) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[part], scores[part]
+        order = np.argsort(-scores, kind="stable")
+        return ids[order], scores[order]
+
+    def search_similar(
+        self,
+        query_embedding: List[float],
+        content_type: Optional[str] = None,
+        limit: int = 10,
+        min_similarity: float = 0.5,
+        filters: Optional[dict] = None,
+        ef_search: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Same contract as VectorStore.search_similar().
+
+        ef_search is the search-breadth knob here too: the number of IVF
+        lists probed (defaults to nprobe).
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if not norm or len(self._rows) == 0:
+            return []
+        query = query / norm
+
+        mask = self._filter_mask(content_type, filters)
+        matching = len(self._rows) if mask is None else int(mask.sum())
+        nprobe = ef_search or self.nprobe
+
+        if self._centroids is None or matching <= self.EXACT_MAX_ROWS:
+            strategy = "exact" if mask is None else "prefilter"
+            ids = np.arange(len(self._rows)) if mask is None else np.flatnonzero(mask)
+        else:
+            strategy = "ivf"
+            ids = self._probe_ids(query, nprobe)
+            if mask is not None:
+                ids = ids[mask[ids]]
+            if len(ids) < limit:
+                # Probed lists hold too few matching rows - scan all matches
+                strategy = "prefilter"
+                ids = np.flatnonzero(mask) if mask is not None else np.arange(len(self._rows))
+
+        self.last_plan = {
+            "strategy": strategy,
+            "estimated_rows": matching,
+            "scanned": len(ids),
+            "nprobe": nprobe if strategy == "ivf" else None,
+        }
+
+        scores = self._score(ids, query)
+        ids, scores = self._top_k(ids, scores, limit)
+
+        results = []
+        for idx, score in zip(ids.tolist(), scores.tolist()):
+            if score < min_similarity:
+                break
+            row = self._rows[idx]
+            results.append({
+                "content_type": row["content_type"],
+                "content_id": row["content_id"],
+                "content_text": row.get("content_text"),
+                "metadata": row.get("metadata") or {},
+                "similarity": score,
+            })
+        return results
+
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        content_type: Optional[str] = None,
+        limit: int = 10,
+        min_similarity: float = 0.5,
+        filters: Optional[dict] = None,
+        ef_search: Optional[int] = None
+    ) -> List[List[dict]]:
+        """Same contract as VectorStore.search_similar_batch() (no round trips to save here)."""
+        return [
+            self.search_similar(
+                embedding,
+                content_type=content_type,
+                limit=limit,
+                min_similarity=min_similarity,
+                filters=filters,
+                ef_search=ef_search
+            )
+            for embedding in query_embeddings
+        ]
+
+    def search_by_text(
+        self,
+        query_text: str,
+        embedding_service: Any,
+        content_type: Optional[str] = None,
+        limit: int = 10
+    ) -> List[dict]:
+        """Search using text query (embeds the query first)."""
+        query_embedding = embedding_service.embed_query(query_text)
+        return self.search_similar(query_embedding, content_type=content_type, limit=limit)
+
+    # ----- info -----
+
+    def get_stats(self) -> dict:
+        by_type: Dict[str, int] = {}
+        codes, counts = np.unique(self._content_type, return_counts=True)
+        names = {code: name for name, code in self._type_vocab.items()}
+        for code, count in zip(codes.tolist(), counts.tolist()):
+            by_type[names[code]] = count
+        return {
+            "total": len(self._rows),
+            "by_type": by_type,
+            "backend": "local",
+            "dtype": self.dtype,
+            "ivf_lists": 0 if self._centroids is None else len(self._centroids),
+        }
+
+    def get_data_version(self) -> str:
+        return f"local:{self.manifest.get('source_version', '')}:{self.manifest.get('exported_at', '')}"
+
+    def _read_only(self, *args, **kwargs):
+        raise ReadOnlyStoreError(
+            "LocalVectorStore is read-only; index into pgvector and re-export"
+        )
+
+    initialize = _read_only
+    upsert_embedding = _read_only
+    upsert_embeddings_batch = _read_only
+    delete_embedding = _read_only
+    clear_all = _read_only
+
+
+_local_stores: Dict[str, LocalVectorStore] = {}
+_local_lock = threading.Lock()
+
+
+def get_local_vector_store(path: str, nprobe: Optional[int] = None) -> LocalVectorStore:
+    """Shared LocalVectorStore per export directory (mmap + rows loaded once)."""
+    key = os.path.abspath(path)
+    store = _local_stores.get(key)
+    if store is None:
+        with _local_lock:
+            store = _local_stores.get(key)
+            if store is None:
+                started = time.perf_counter()
+                store = LocalVectorStore(key, nprobe=nprobe)
+                print(
+                    f"[LocalVectorStore] Loaded {len(store._rows)} vectors ({store.dtype}) "
+                    f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+                )
+                _local_stores[key] = store
+    return store
@@ -0,0 +1,108 @@
+"""
+Vector index encodings: Matryoshka truncation and quantization.
+
+The embeddings table keeps full-precision vectors; an encoding only
+changes what the ANN index stores and searches. Coarse candidates come
+from the compact index and are re-ranked with the full vectors, so
+results keep full-precision similarities.
+
+Spec strings: "<kind>[@<dims>]"
+    vector        full float32 (no re-rank needed)
+    halfvec       float16 (half the index size)
+    binary        1 bit per dim, hamming distance (1/32 of the size)
+    halfvec@512   first 512 dims (text-embedding-3 vectors are
+                  Matryoshka-trained, so prefixes remain meaningful)
+    binary@512    ...
+
+pgvector has no int8 vector type; int8 storage is provided by the local
+backend (export_embeddings --dtype int8).
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+# pgvector index dimension limits per type
+INDEX_DIM_LIMITS = {"vector": 2000, "halfvec": 4000, "binary": 64000}
+
+
+@dataclass(frozen=True)
+class VectorEncoding:
+    """How a vector column is encoded for the ANN index."""
+    kind: str  # vector, halfvec, binary
+    dim: int  # full embedding dimension
+    truncate_dim: Optional[int] = None
+
+    @classmethod
+    def parse(cls, spec: Optional[str], dim: int) -> "VectorEncoding":
+        spec = (spec or "vector").strip().lower()
+        kind, _, truncate = spec.partition("@")
+        if kind not in INDEX_DIM_LIMITS:
+            raise ValueError(f"Unknown vector encoding: {spec}")
+
+        truncate_dim = int(truncate) if truncate else None
+        if truncate_dim is not None and not 0 < truncate_dim <= dim:
+            raise ValueError(f"Truncation {truncate_dim} must be in 1..{dim}")
+        if truncate_dim == dim:
+            truncate_dim = None
+
+        encoding = cls(kind=kind, dim=dim, truncate_dim=truncate_dim)
+
+        # Full-size vectors above the vector index limit: index as halfvec
+        if kind == "vector" and encoding.index_dim > INDEX_DIM_LIMITS["vector"]:
+            encoding = cls(kind="halfvec", dim=dim, truncate_dim=truncate_dim)
+        return encoding
+
+    @property
+    def index_dim(self) -> int:
+        return self.truncate_dim or self.dim
+
+    @property
+    def indexable(self) -> bool:
+        return self.index_dim <= INDEX_DIM_LIMITS[self.kind]
+
+    @property
+    def is_exact(self) -> bool:
+        """Index distances equal full-precision distances (no re-rank)."""
+        return self.kind == "vector" and self.truncate_dim is None
+
+    @property
+    def name(self) -> str:
+        """Short identifier, e.g. "vector", "halfvec512", "binary"."""
+        return f"{self.kind}{self.truncate_dim or ''}"
+
+    @property
+    def spec(self) -> str:
+        return f"{self.kind}@{self.truncate_dim}" if self.truncate_dim else self.kind
+
+    @property
+    def opclass(self) -> str:
+        return {
+            "vector": "vector_cosine_ops",
+            "halfvec": "halfvec_cosine_ops",
+            "binary": "bit_hamming_ops",
+        }[self.kind]
+
+    @property
+    def operator(self) -> str:
+        return "<~>" if self.kind == "binary" else "<=>"
+
+    def _encode(self, expr: str) -> str:
+        d = self.index_dim
+        if self.truncate_dim:
+            expr = f"subvector({expr}, 1, {d})"
+        if self.kind == "binary":
+            return f"binary_quantize({expr})::bit({d})"
+        if self.kind == "halfvec":
+            return f"({expr})::halfvec({d})"
+        return f"({expr})::vector({d})" if self.truncate_dim else expr
+
+    def column_expression(self, column: str = "embedding") -> str:
+        """Indexed expression over the stored column."""
+        return self._encode(column)
+
+    def query_expression(self, placeholder: str) -> str:
+        """Same encoding applied to a query vector placeholder."""
+        return self._encode(f"{placeholder}::vector")
+
+    def distance(self, column: str, placeholder: str) -> str:
+        """Index-order distance between the column and a query vector."""
+        return f"({self.column_expression(column)} {self.operator} {self.query_expression(placeholder)})"
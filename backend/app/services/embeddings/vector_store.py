@@ -4,6 +4,9 @@ Part of SHEBA (Observer) system.
 """
 
 import os
+import json
+import math
+import time
 from typing import List, Optional, Tuple, Any
 from contextlib import contextmanager
 
@@ -11,6 +14,22 @@ import psycopg2
 from psycopg2.extras import execute_values, RealDictCursor
 from pgvector.psycopg2 import register_vector
 
+from .quantization import VectorEncoding
+
+
+def _normalize_category(category: Any) -> Optional[str]:
+    """metadata category (str or {"slug"/"name"}) → typed column value."""
+    if isinstance(category, dict):
+        category = category.get("slug") or category.get("name")
+    return str(category)[:100] if category else None
+
+
+def _normalize_year(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
 
 class VectorStore:
     """
@@ -20,12 +39,38 @@ class VectorStore:
     - Storing embeddings with metadata
     - Semantic similarity search
     - Hybrid search (vector + keyword)
+
+    Filterable fields (category, date_start) are promoted from metadata to
+    typed, B-tree indexed columns. Filtered searches are planned:
+    selective filters pre-filter through the B-tree indexes and rank the
+    few matching rows exactly; broad filters run the ANN index with an
+    enlarged candidate pool and filter afterwards.
+
+    The ANN index can use a compact encoding (halfvec, binary, Matryoshka
+    truncation - see quantization.py); candidates are then re-ranked with
+    the stored full-precision vectors.
     """
 
+    # Index modes
+    INDEX_TYPES = ("hnsw", "ivfflat", "none")
+
+    # Planner thresholds
+    PREFILTER_MAX_ROWS = 5000        # exact scan is cheap up to this many rows
+    PREFILTER_MAX_SELECTIVITY = 0.05  # ... or when filters keep <5% of rows
+    POSTFILTER_OVERSAMPLE = 2.0      # candidates = limit / selectivity * oversample
+    MAX_CANDIDATES = 1000
+    ESTIMATE_CACHE_SECONDS = 300
+
     def __init__(
         self,
         connection_string: Optional[str] = None,
-        embedding_dimension: int = 1536  # text-embedding-3-small
+        embedding_dimension: int = 1536,  # text-embedding-3-small
+        index_type: str = "hnsw",
+        hnsw_m: int = 16,
+        hnsw_ef_construction: int = 64,
+        ef_search: int = 40,
+        encoding: Optional[str] = None,
+        rerank_factor: int = 4
     ):
         self.connection_string = connection_string or os.getenv("DATABASE_URL")
         self.embedding_dimension = embedding_dimension
@@ -33,6 +78,22 @@ class VectorStore:
         if not self.connection_string:
             raise ValueError("DATABASE_URL is required")
 
+        if index_type not in self.INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {self.INDEX_TYPES}")
+        self.index_type = index_type
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.ef_search = ef_search
+
+        # Index encoding; queries must use the same expression to hit the index.
+        # (Above 2000 dims plain vectors fall back to halfvec.)
+        self.encoding = VectorEncoding.parse(encoding, embedding_dimension)
+        # Non-exact encodings fetch rerank_factor x candidates for re-ranking
+        self.rerank_factor = 1 if self.encoding.is_exact else max(1, rerank_factor)
+
+        self._estimate_cache: dict = {}
+        self.last_plan: Optional[dict] = None
+
     @contextmanager
     def get_connection(self):
         """Get a database connection with pgvector registered."""
@@ -46,7 +107,8 @@ class VectorStore:
     def initialize(self):
         """
         Initialize the database with pgvector extension and tables.
-        Should be called once during setup.
+        Should be called once during setup; safe to re-run (adds the typed
+        filter columns and indexes to existing tables and backfills them).
         """
         with self.get_connection() as conn:
             with conn.cursor() as cur:
@@ -62,21 +124,36 @@ class VectorStore:
                         content_text TEXT,
                         embedding vector({self.embedding_dimension}),
                         metadata JSONB DEFAULT '{{}}',
+                        category VARCHAR(100),
+                        date_start INTEGER,
                         created_at TIMESTAMPTZ DEFAULT NOW(),
                         UNIQUE(content_type, content_id)
                     )
                 """)
 
-                # Skip vector index for high-dimensional embeddings (>2000)
-                # For datasets under 100k rows, brute force search is fast enough
-                # For larger datasets, consider using text-embedding-3-small (1536 dim)
-                if self.embedding_dimension <= 2000:
-                    cur.execute(f"""
-                        CREATE INDEX IF NOT EXISTS embeddings_vector_idx
-                        ON embeddings
-                        USING ivfflat (embedding vector_cosine_ops)
-                        WITH (lists = 100)
-                    """)
+                # Typed filter columns (promoted from metadata)
+                cur.execute("ALTER TABLE embeddings ADD COLUMN IF NOT EXISTS category VARCHAR(100)")
+                cur.execute("ALTER TABLE embeddings ADD COLUMN IF NOT EXISTS date_start INTEGER")
+                cur.execute("""
+                    UPDATE embeddings SET
+                        category = COALESCE(
+                            CASE WHEN jsonb_typeof(metadata->'category') = 'object'
+                                 THEN COALESCE(metadata->'category'->>'slug', metadata->'category'->>'name')
+                                 ELSE metadata->>'category' END,
+                            category),
+                        date_start = COALESCE(
+                            CASE WHEN metadata->>'date_start' ~ '^-?[0-9]+$'
+                                 THEN (metadata->>'date_start')::int END,
+                            date_start)
+                    WHERE category IS NULL AND date_start IS NULL
+                      AND (metadata ? 'category' OR metadata ? 'date_start')
+                """)
+
+                cur.execute("CREATE INDEX IF NOT EXISTS embeddings_category_idx ON embeddings (category)")
+                cur.execute("CREATE INDEX IF NOT EXISTS embeddings_date_start_idx ON embeddings (date_start)")
+
+                # Vector index
+                self._create_vector_index(cur)
 
                 # Create index for content lookup
                 cur.execute("""
@@ -84,8 +161,40 @@ class VectorStore:
                     ON embeddings (content_type, content_id)
                 """)
 
+                cur.execute("ANALYZE embeddings")
                 conn.commit()
 
+    def _create_vector_index(self, cur):
+        """Create the ANN index for the configured index_type."""
+        if self.index_type == "none":
+            return
+
+        if not self.encoding.indexable:
+            print(f"[VectorStore] {self.encoding.spec} exceeds index dimension limit, exact search only")
+            return
+
+        expression = self.encoding.column_expression()
+        if self.index_type == "hnsw":
+            cur.execute(f"""
+                CREATE INDEX IF NOT EXISTS {self.index_name}
+                ON embeddings
+                USING hnsw (({expression}) {self.encoding.opclass})
+                WITH (m = {int(self.hnsw_m)}, ef_construction = {int(self.hnsw_ef_construction)})
+            """)
+        else:
+            cur.execute(f"""
+                CREATE INDEX IF NOT EXISTS {self.index_name}
+                ON embeddings
+                USING ivfflat (({expression}) {self.encoding.opclass})
+                WITH (lists = 100)
+            """)
+
+    @property
+    def index_name(self) -> str:
+        """ANN index name (one per index type + encoding, so they can coexist)."""
+        suffix = "hnsw_idx" if self.index_type == "hnsw" else "idx"
+        return f"embeddings_{self.encoding.name}_{suffix}"
+
     def upsert_embedding(
         self,
         content_type: str,
@@ -104,25 +213,29 @@ class VectorStore:
             content_text: Original text used for embedding
             metadata: Additional metadata (JSON)
         """
-        import json
-
         with self.get_connection() as conn:
             with conn.cursor() as cur:
+                metadata = metadata or {}
                 cur.execute("""
-                    INSERT INTO embeddings (content_type, content_id, embedding, content_text, metadata)
-                    VALUES (%s, %s, %s, %s, %s)
+                    INSERT INTO embeddings (content_type, content_id, embedding, content_text, metadata,
+                                            category, date_start)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT (content_type, content_id)
                     DO UPDATE SET
                         embedding = EXCLUDED.embedding,
                         content_text = EXCLUDED.content_text,
                         metadata = EXCLUDED.metadata,
+                        category = EXCLUDED.category,
+                        date_start = EXCLUDED.date_start,
                         created_at = NOW()
                 """, (
                     content_type,
                     content_id,
                     embedding,
                     content_text,
-                    json.dumps(metadata or {})
+                    json.dumps(metadata),
+                    _normalize_category(metadata.get("category")),
+                    _normalize_year(metadata.get("date_start"))
                 ))
                 conn.commit()
 
@@ -136,40 +249,263 @@ class VectorStore:
         Args:
             items: List of tuples (content_type, content_id, embedding, content_text, metadata)
         """
-        import json
-
         with self.get_connection() as conn:
             with conn.cursor() as cur:
                 # Prepare data
                 values = [
-                    (ct, cid, emb, txt, json.dumps(meta or {}))
+                    (
+                        ct, cid, emb, txt, json.dumps(meta or {}),
+                        _normalize_category((meta or {}).get("category")),
+                        _normalize_year((meta or {}).get("date_start")),
+                    )
                     for ct, cid, emb, txt, meta in items
                 ]
 
                 execute_values(
                     cur,
                     """
-                    INSERT INTO embeddings (content_type, content_id, embedding, content_text, metadata)
+                    INSERT INTO embeddings (content_type, content_id, embedding, content_text, metadata,
+                                            category, date_start)
                     VALUES %s
                     ON CONFLICT (content_type, content_id)
                     DO UPDATE SET
                         embedding = EXCLUDED.embedding,
                         content_text = EXCLUDED.content_text,
                         metadata = EXCLUDED.metadata,
+                        category = EXCLUDED.category,
+                        date_start = EXCLUDED.date_start,
                         created_at = NOW()
                     """,
                     values,
-                    template="(%s, %s, %s, %s, %s)"
+                    template="(%s, %s, %s, %s, %s, %s, %s)"
                 )
                 conn.commit()
 
+    def _filter_conditions(
+        self,
+        content_type: Optional[str],
+        filters: Optional[dict]
+    ) -> Tuple[List[str], dict]:
+        """WHERE conditions on typed columns + their params."""
+        conditions = []
+        params = {}
+
+        if content_type:
+            conditions.append("content_type = %(content_type)s")
+            params["content_type"] = content_type
+
+        if filters:
+            if filters.get("category"):
+                conditions.append("category = %(category)s")
+                params["category"] = _normalize_category(filters["category"])
+
+            if filters.get("date_from") is not None:
+                conditions.append("date_start >= %(date_from)s")
+                params["date_from"] = filters["date_from"]
+
+            if filters.get("date_to") is not None:
+                conditions.append("date_start <= %(date_to)s")
+                params["date_to"] = filters["date_to"]
+
+        return conditions, params
+
+    def _estimate_rows(self, cur, conditions: List[str], params: dict) -> Tuple[float, float]:
+        """
+        (estimated matching rows, total rows) from planner statistics.
+
+        Uses EXPLAIN (no execution) over the B-tree indexed columns;
+        cached per filter combination.
+        """
+        cache_key = json.dumps(params, sort_keys=True, default=str)
+        cached = self._estimate_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.ESTIMATE_CACHE_SECONDS:
+            return cached[1], cached[2]
+
+        cur.execute("SELECT GREATEST(reltuples, 0) FROM pg_class WHERE relname = 'embeddings'")
+        row = cur.fetchone()
+        total = float(list(row.values())[0] if isinstance(row, dict) else row[0]) if row else 0.0
+
+        cur.execute(
+            f"EXPLAIN (FORMAT JSON) SELECT 1 FROM embeddings WHERE {' AND '.join(conditions)}",
+            params
+        )
+        row = cur.fetchone()
+        plan = list(row.values())[0] if isinstance(row, dict) else row[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimated = float(plan[0]["Plan"]["Plan Rows"])
+
+        self._estimate_cache[cache_key] = (time.monotonic(), estimated, total)
+        return estimated, total
+
+    def plan_search(
+        self,
+        cur,
+        limit: int,
+        content_type: Optional[str] = None,
+        filters: Optional[dict] = None,
+        ef_search: Optional[int] = None
+    ) -> dict:
+        """
+        Choose how to run a (filtered) similarity search.
+
+        Strategies:
+            ann        - no filters: ANN index top-k
+            prefilter  - selective filters: B-tree filter, then exact ranking
+            postfilter - broad filters: ANN top-N candidates, then filter
+            exact      - no vector index configured
+        """
+        conditions, params = self._filter_conditions(content_type, filters)
+        ef_search = ef_search or self.ef_search
+
+        if self.index_type == "none":
+            return {"strategy": "exact", "conditions": conditions, "params": params}
+
+        if not conditions:
+            return {
+                "strategy": "ann",
+                "conditions": conditions,
+                "params": params,
+                "candidates": limit,
+                "ef_search": max(ef_search, limit),
+            }
+
+        estimated, total = self._estimate_rows(cur, conditions, params)
+        selectivity = estimated / total if total else 1.0
+
+        if (
+            estimated <= self.PREFILTER_MAX_ROWS
+            or selectivity <= self.PREFILTER_MAX_SELECTIVITY
+        ):
+            return {
+                "strategy": "prefilter",
+                "conditions": conditions,
+                "params": params,
+                "estimated_rows": estimated,
+                "selectivity": round(selectivity, 4),
+            }
+
+        candidates = min(
+            self.MAX_CANDIDATES,
+            max(limit, math.ceil(limit / max(selectivity, 1e-6) * self.POSTFILTER_OVERSAMPLE))
+        )
+        return {
+            "strategy": "postfilter",
+            "conditions": conditions,
+            "params": params,
+            "estimated_rows": estimated,
+            "selectivity": round(selectivity, 4),
+            "candidates": candidates,
+            "ef_search": max(ef_search, candidates),
+        }
+
+    def _apply_search_settings(self, cur, plan: dict) -> None:
+        """Index scan breadth for ANN plans (SET LOCAL → this transaction only)."""
+        if plan["strategy"] not in ("ann", "postfilter"):
+            return
+        if self.index_type == "hnsw":
+            # hnsw.ef_search must cover the candidate pool
+            ef_search = max(plan["ef_search"], self._candidate_pool(plan))
+            cur.execute(f"SET LOCAL hnsw.ef_search = {int(min(ef_search, 1000))}")
+        else:
+            cur.execute("SET LOCAL ivfflat.probes = 10")
+
+    def _candidate_pool(self, plan: dict) -> int:
+        # Compact encodings over-fetch and re-rank with the full vectors
+        return min(self.MAX_CANDIDATES, plan["candidates"] * self.rerank_factor)
+
+    def _plan_query(self, plan: dict, vec: str) -> str:
+        """
+        SQL for one query vector under a plan.
+
+        vec is the SQL reference to the query vector - a placeholder
+        ("%(vec)s") or a column of an outer query ("q.vec", batch search).
+        Returns rows (content_type, content_id, content_text, metadata,
+        similarity), best first.
+        """
+        # Similarities are always full precision; the encoded distance only orders the index scan
+        distance = f"(embedding <=> {vec}::vector)"
+        index_distance = self.encoding.distance("embedding", vec)
+        where_clause = " AND ".join(plan["conditions"]) or "TRUE"
+        columns = "content_type, content_id, content_text, metadata"
+
+        if plan["strategy"] in ("ann", "postfilter"):
+            return f"""
+                SELECT {columns}, 1 - distance as similarity
+                FROM (
+                    SELECT {columns}, {distance} as distance
+                    FROM (
+                        SELECT {columns}, category, date_start, embedding
+                        FROM embeddings
+                        ORDER BY {index_distance}
+                        LIMIT %(candidates)s
+                    ) pool
+                    WHERE {where_clause}
+                ) candidates
+                WHERE 1 - distance >= %(min_sim)s
+                ORDER BY distance
+                LIMIT %(limit)s
+            """
+
+        # prefilter / exact: filter first (B-tree), rank the matches exactly.
+        # OFFSET 0 keeps the planner from ordering through the ANN index.
+        return f"""
+            SELECT {columns}, 1 - distance as similarity
+            FROM (
+                SELECT {columns}, {distance} as distance
+                FROM embeddings
+                WHERE {where_clause}
+                OFFSET 0
+            ) filtered
+            WHERE 1 - distance >= %(min_sim)s
+            ORDER BY distance
+            LIMIT %(limit)s
+        """
+
+    def _plan_params(self, plan: dict, limit: int, min_similarity: float) -> dict:
+        params = {**plan["params"], "min_sim": min_similarity, "limit": limit}
+        if plan["strategy"] in ("ann", "postfilter"):
+            params["candidates"] = self._candidate_pool(plan)
+        return params
+
+    def _run_plan(self, cur, plan: dict, query_vec, limit: int, min_similarity: float) -> List[dict]:
+        self._apply_search_settings(cur, plan)
+        params = {**self._plan_params(plan, limit, min_similarity), "vec": query_vec}
+        cur.execute(self._plan_query(plan, "%(vec)s"), params)
+        return [dict(r) for r in cur.fetchall()]
+
+    def _run_plan_batch(
+        self, cur, plan: dict, query_vecs: list, limit: int, min_similarity: float
+    ) -> List[List[dict]]:
+        """All query vectors in one statement: VALUES list + LATERAL top-k."""
+        self._apply_search_settings(cur, plan)
+        params = self._plan_params(plan, limit, min_similarity)
+        values = []
+        for i, query_vec in enumerate(query_vecs):
+            params[f"vec_{i}"] = query_vec
+            values.append(f"({i}, %(vec_{i})s::vector)")
+
+        cur.execute(f"""
+            SELECT q.idx, r.*
+            FROM (VALUES {", ".join(values)}) AS q(idx, vec)
+            CROSS JOIN LATERAL ({self._plan_query(plan, "q.vec")}) r
+            ORDER BY q.idx, r.similarity DESC
+        """, params)
+
+        results: List[List[dict]] = [[] for _ in query_vecs]
+        for row in cur.fetchall():
+            row = dict(row)
+            results[row.pop("idx")].append(row)
+        return results
+
     def search_similar(
         self,
         query_embedding: List[float],
         content_type: Optional[str] = None,
         limit: int = 10,
         min_similarity: float = 0.5,
-        filters: Optional[dict] = None
+        filters: Optional[dict] = None,
+        ef_search: Optional[int] = None
     ) -> List[dict]:
         """
         Search for similar content using cosine similarity.
@@ -183,70 +519,75 @@ class VectorStore:
                 - category: str (e.g., "battle", "treaty")
                 - date_from: int (e.g., -500 for 500 BCE)
                 - date_to: int (e.g., 1500 for 1500 CE)
+            ef_search: HNSW search breadth (defaults to the store's ef_search)
 
         Returns:
-            List of results with similarity scores
+            List of results with similarity scores.
+            The chosen plan is kept in self.last_plan.
         """
-        import numpy as np
-
-        # Convert to numpy array for pgvector
-        query_vec = np.array(query_embedding, dtype=np.float32)
-
-        # Build WHERE clauses dynamically
-        conditions = []
-        params = []
-
-        # Base similarity condition
-        conditions.append("1 - (embedding <=> %(vec)s::vector) >= %(min_sim)s")
-
-        if content_type:
-            conditions.append("content_type = %(content_type)s")
+        return self.search_similar_batch(
+            [query_embedding],
+            content_type=content_type,
+            limit=limit,
+            min_similarity=min_similarity,
+            filters=filters,
+            ef_search=ef_search
+        )[0]
 
-        if filters:
-            if filters.get("category"):
-                conditions.append("metadata->>'category' = %(category)s")
+    def search_similar_batch(
+        self,
+        query_embeddings: List[List[float]],
+        content_type: Optional[str] = None,
+        limit: int = 10,
+        min_similarity: float = 0.5,
+        filters: Optional[dict] = None,
+        ef_search: Optional[int] = None
+    ) -> List[List[dict]]:
+        """
+        search_similar for many query vectors sharing the same filters,
+        in one round trip (a single statement for all queries).
 
-            if filters.get("date_from") is not None:
-                conditions.append("(metadata->>'date_start')::int >= %(date_from)s")
+        Returns:
+            One result list per query embedding, in input order.
+        """
+        import numpy as np
 
-            if filters.get("date_to") is not None:
-                conditions.append("(metadata->>'date_start')::int <= %(date_to)s")
+        if not query_embeddings:
+            return []
 
-        where_clause = " AND ".join(conditions)
+        # Convert to numpy arrays for pgvector
+        query_vecs = [np.array(e, dtype=np.float32) for e in query_embeddings]
 
-        # Build params dict
-        query_params = {
-            "vec": query_vec,
-            "min_sim": min_similarity,
-            "limit": limit,
-        }
-        if content_type:
-            query_params["content_type"] = content_type
-        if filters:
-            if filters.get("category"):
-                query_params["category"] = filters["category"]
-            if filters.get("date_from") is not None:
-                query_params["date_from"] = filters["date_from"]
-            if filters.get("date_to") is not None:
-                query_params["date_to"] = filters["date_to"]
+        def run(cur, plan, vecs, threshold):
+            if len(vecs) == 1:
+                return [self._run_plan(cur, plan, vecs[0], limit, threshold)]
+            return self._run_plan_batch(cur, plan, vecs, limit, threshold)
 
         with self.get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(f"""
-                    SELECT
-                        content_type,
-                        content_id,
-                        content_text,
-                        metadata,
-                        1 - (embedding <=> %(vec)s::vector) as similarity
-                    FROM embeddings
-                    WHERE {where_clause}
-                    ORDER BY embedding <=> %(vec)s::vector
-                    LIMIT %(limit)s
-                """, query_params)
+                plan = self.plan_search(cur, limit, content_type, filters, ef_search)
+
+                if plan["strategy"] == "postfilter":
+                    # Post-filtering comes up short when matching rows sit outside
+                    # the candidate pool - fall back to exact pre-filtering.
+                    # (min_similarity is applied afterwards so that a high
+                    # threshold alone doesn't trigger the fallback.)
+                    results = run(cur, plan, query_vecs, -1.0)
+                    short = [i for i, rows in enumerate(results) if len(rows) < limit]
+                    for i, rows in enumerate(results):
+                        results[i] = [r for r in rows if r["similarity"] >= min_similarity]
+                    if short:
+                        plan = {**plan, "strategy": "prefilter", "fallback": len(short)}
+                        retried = run(cur, plan, [query_vecs[i] for i in short], min_similarity)
+                        for i, rows in zip(short, retried):
+                            results[i] = rows
+                else:
+                    results = run(cur, plan, query_vecs, min_similarity)
 
-                results = cur.fetchall()
-                return [dict(r) for r in results]
+                conn.commit()
+
+        self.last_plan = {k: v for k, v in plan.items() if k not in ("conditions", "params")}
+        return results
 
     def search_by_text(
         self,
@@ -295,6 +636,14 @@ class VectorStore:
                     "by_type": type_counts
                 }
 
+    def get_data_version(self) -> str:
+        """Signature of the embeddings table (changes on insert/update/delete)."""
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*), MAX(created_at) FROM embeddings")
+                count, latest = cur.fetchone()
+                return f"{count}:{latest.isoformat() if latest else ''}"
+
     def delete_embedding(self, content_type: str, content_id: int):
         """Delete an embedding."""
         with self.get_connection() as conn:
@@ -311,3 +660,35 @@ class VectorStore:
             with conn.cursor() as cur:
                 cur.execute("TRUNCATE TABLE embeddings")
                 conn.commit()
+
+
+def create_vector_store(embedding_dimension: int = 1536):
+    """
+    Vector store for the configured backend.
+
+    VECTOR_STORE_BACKEND=local serves searches in-process from an export
+    of the embeddings table (no DATABASE_URL needed); anything else uses
+    pgvector.
+    """
+    from app.config import get_settings
+
+    settings = get_settings()
+    if settings.vector_store_backend == "local":
+        from .local_store import get_local_vector_store
+
+        store = get_local_vector_store(
+            settings.vector_store_local_path,
+            nprobe=settings.vector_store_nprobe
+        )
+        if store.embedding_dimension != embedding_dimension:
+            raise ValueError(
+                f"Local vector export has {store.embedding_dimension} dims, "
+                f"embedding model produces {embedding_dimension}"
+            )
+        return store
+
+    return VectorStore(
+        embedding_dimension=embedding_dimension,
+        encoding=settings.vector_store_encoding,
+        rerank_factor=settings.vector_store_rerank_factor
+    )
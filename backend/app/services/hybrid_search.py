@@ -6,6 +6,8 @@ Hybrid Search Service - BM25 + Vector Search
 """
 import re
 import math
+import time
+import asyncio
 from collections import Counter
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
@@ -275,36 +277,68 @@ class HybridSearchService:
         self,
         query: str,
         limit: int = 10,
-        use_ai: bool = True
+        use_ai: bool = True,
+        rag_service=None
     ) -> Dict[str, Any]:
         """
         고급검색 - BM25 + Vector + AI
 
         마스터 기록 공개, AI 응답 생성
+
+        Retrieval runs once: BM25 and vector retrieval run concurrently,
+        results are fused with RRF, and the AI answer is generated from the
+        fused context (no second RAG round trip). Per-stage timings are
+        returned in "timings_ms".
+
+        Args:
+            rag_service: Per-request RAG service (e.g. built with the user's
+                API key); defaults to the one given at construction
         """
+        rag_service = rag_service or self.rag_service
+        timings = {}
+        started = time.perf_counter()
+
         self._load_and_index()
 
-        # 1단계: BM25로 후보 추출
-        bm25_results = self.basic_search(query, limit=limit * 2)
+        async def timed(stage: str, func, *args):
+            stage_started = time.perf_counter()
+            try:
+                return await asyncio.to_thread(func, *args)
+            finally:
+                timings[stage] = round((time.perf_counter() - stage_started) * 1000, 1)
+
+        # 1단계: BM25 후보 추출 + Vector 검색 (동시 실행)
+        retrieval_started = time.perf_counter()
+        bm25_task = timed("bm25", self.basic_search, query, limit * 2, "event")
+        if rag_service:
+            vector_task = timed("vector", rag_service.retrieve_context, query, limit)
+            bm25_results, vector_context = await asyncio.gather(
+                bm25_task, vector_task, return_exceptions=True
+            )
+        else:
+            bm25_results, vector_context = await bm25_task, []
+
+        if isinstance(bm25_results, Exception):
+            raise bm25_results
+        if isinstance(vector_context, Exception):
+            print(f"[HybridSearch] Vector search failed: {vector_context}")
+            vector_context = []
+        timings["retrieval"] = round((time.perf_counter() - retrieval_started) * 1000, 1)
 
-        # 2단계: Vector 검색 (RAG 서비스 사용)
         vector_results = []
-        if self.rag_service:
-            try:
-                rag_response = await self.rag_service.aquery(
-                    query=query,
-                    context_limit=limit
-                )
-                vector_results = rag_response.sources if hasattr(rag_response, 'sources') else []
-            except Exception as e:
-                print(f"[HybridSearch] Vector search failed: {e}")
+        related_events = []
+        confidence = 0.0
+        if vector_context:
+            vector_results, related_events, confidence = rag_service.build_sources(vector_context)
 
-        # 3단계: RRF (Reciprocal Rank Fusion) 점수 결합
+        # 2단계: RRF (Reciprocal Rank Fusion) 점수 결합
+        fusion_started = time.perf_counter()
         combined_results = self._fuse_results(
             bm25_results["events"],
             vector_results,
             limit=limit
         )
+        timings["fusion"] = round((time.perf_counter() - fusion_started) * 1000, 1)
 
         result = {
             "query": query,
@@ -315,23 +349,63 @@ class HybridSearchService:
             "total": len(combined_results)
         }
 
-        # 4단계: AI 응답 (선택적)
-        if use_ai and self.rag_service:
+        # 3단계: AI 응답 (선택적) - 결합된 컨텍스트 사용
+        if use_ai and rag_service:
+            generation_started = time.perf_counter()
             try:
-                rag_response = await self.rag_service.aquery(
-                    query=query,
-                    context_limit=limit
-                )
+                fused_context = self._build_generation_context(combined_results, vector_context)
+                answer = await rag_service.agenerate_response(query, fused_context)
                 result["ai_response"] = {
-                    "answer": rag_response.answer,
-                    "confidence": rag_response.confidence,
-                    "related_events": rag_response.related_events
+                    "answer": answer,
+                    "confidence": confidence,
+                    "related_events": related_events
                 }
             except Exception as e:
                 result["ai_response"] = {"error": str(e)}
+            timings["generation"] = round((time.perf_counter() - generation_started) * 1000, 1)
+
+        timings["total"] = round((time.perf_counter() - started) * 1000, 1)
+        result["timings_ms"] = timings
 
         return result
 
+    @staticmethod
+    def _build_generation_context(
+        fused_results: List[Dict],
+        vector_context: List[Dict]
+    ) -> List[Dict]:
+        """
+        Fused results → RAG context documents (content_text + metadata).
+
+        Vector hits keep their full embedded text; BM25-only events are
+        described by their title, date and description.
+        """
+        # Keyed by (type, id): a person and an event can share an id
+        vector_docs = {
+            (doc.get("content_type"), doc.get("content_id")): doc
+            for doc in vector_context
+        }
+
+        context = []
+        for doc in fused_results:
+            doc_id = doc.get("id")
+            doc_type = doc.get("source_type") or doc.get("type")
+            vector_doc = vector_docs.get((doc_type, doc_id))
+            if vector_doc:
+                context.append(vector_doc)
+                continue
+
+            context.append({
+                "content_type": doc.get("source_type", "event"),
+                "content_id": doc_id,
+                "content_text": doc.get("description") or "",
+                "metadata": {
+                    "title": doc.get("title") or doc.get("name", ""),
+                    "date": doc.get("date_start", ""),
+                },
+            })
+        return context
+
     def _fuse_results(
         self,
         bm25_results: List[Dict],
@@ -7,12 +7,16 @@ Integrates:
 - LAPLACE (Explainer): Source citation
 """
 
+import asyncio
 import os
-from typing import List, Optional
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+from dataclasses import dataclass, asdict
 from openai import OpenAI
 
-from app.services.embeddings import EmbeddingService, VectorStore
+from app.services.embeddings import EmbeddingService, VectorStore, create_vector_store
+from app.services.semantic_cache import get_semantic_cache
 
 
 @dataclass
@@ -81,10 +85,15 @@ class RAGService:
         )
 
         # Initialize vector store with matching dimensions
-        self.vector_store = vector_store or VectorStore(
+        self.vector_store = vector_store or create_vector_store(
             embedding_dimension=self.embedding_service.embedding_dimension
         )
 
+        # Semantic answer cache - entries are dropped when embeddings change
+        self.answer_cache = get_semantic_cache()
+        if self.answer_cache is not None:
+            self.answer_cache.set_version_provider(self.vector_store.get_data_version)
+
     def translate_to_english(self, query: str) -> str:
         """
         전처리: 쿼리를 영어로 변환.
@@ -101,11 +110,27 @@ class RAGService:
         )
         return response.choices[0].message.content.strip()
 
+    def embed_query(self, query: str, translate: bool = True) -> List[float]:
+        """
+        Query → embedding (translated to English first unless translate=False
+        or the query is ASCII-only).
+        """
+        # 전처리: 영어로 변환 (이미 영어면 생략)
+        if translate and not query.isascii():
+            english_query = self.translate_to_english(query)
+        else:
+            english_query = query
+
+        # 영어 쿼리로 임베딩
+        return self.embedding_service.embed_query(english_query)
+
     def retrieve_context(
         self,
         query: str,
         limit: int = 5,
-        filters: Optional[dict] = None
+        filters: Optional[dict] = None,
+        translate: bool = True,
+        query_embedding: Optional[List[float]] = None
     ) -> List[dict]:
         """
         SHEBA: Retrieve relevant context using vector search.
@@ -117,15 +142,17 @@ class RAGService:
                 - category: str (battle, treaty, discovery, etc.)
                 - date_from: int (e.g., -500 for 500 BCE)
                 - date_to: int (e.g., 1500 for 1500 CE)
+            translate: Translate the query to English first. Pass False when
+                the caller already has an English query; ASCII-only
+                queries are never sent for translation.
+            query_embedding: Precomputed embedding of the query (skips
+                translation and embedding)
 
         Returns:
             List of relevant documents with metadata
         """
-        # 전처리: 영어로 변환
-        english_query = self.translate_to_english(query)
-
-        # 영어 쿼리로 임베딩 검색
-        query_embedding = self.embedding_service.embed_query(english_query)
+        if query_embedding is None:
+            query_embedding = self.embed_query(query, translate=translate)
 
         results = self.vector_store.search_similar(
             query_embedding,
@@ -136,23 +163,65 @@ class RAGService:
 
         return results
 
-    def generate_response(
+    def retrieve_context_batch(
         self,
-        query: str,
-        context: List[dict],
-        language: str = "en"
-    ) -> str:
+        queries: List[str],
+        limit: int = 5,
+        filters: Optional[dict] = None,
+        translate: bool = True,
+        query_embeddings: Optional[List[Optional[List[float]]]] = None
+    ) -> List[List[dict]]:
         """
-        LOGOS: Generate response using LLM with retrieved context.
+        retrieve_context for several queries sharing the same filters.
 
-        Args:
-            query: User's question
-            context: Retrieved documents
-            language: Response language (en, ko, ja)
+        Non-English queries are translated concurrently, then all queries
+        are embedded with one API call and searched with one SQL statement.
 
         Returns:
-            Generated answer
+            One context list per query, in input order.
         """
+        if not queries:
+            return []
+
+        embeddings = list(query_embeddings or [None] * len(queries))
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+
+        if missing:
+            texts = [queries[i] for i in missing]
+            to_translate = [i for i, text in enumerate(texts) if translate and not text.isascii()]
+            if to_translate:
+                with ThreadPoolExecutor(max_workers=len(to_translate)) as pool:
+                    translated = pool.map(self.translate_to_english, [texts[i] for i in to_translate])
+                    for i, english in zip(to_translate, translated):
+                        texts[i] = english
+
+            for i, embedding in zip(missing, self.embedding_service.embed_queries(texts)):
+                embeddings[i] = embedding
+
+        return self.vector_store.search_similar_batch(
+            embeddings,
+            limit=limit,
+            min_similarity=0.3,
+            filters=filters
+        )
+
+    async def aretrieve_context(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[dict] = None,
+        translate: bool = True
+    ) -> List[dict]:
+        """Async retrieve_context (blocking client calls run in a worker thread)."""
+        return await asyncio.to_thread(self.retrieve_context, query, limit, filters, translate)
+
+    def _build_messages(
+        self,
+        query: str,
+        context: List[dict],
+        language: str = "en"
+    ) -> List[dict]:
+        """Build chat messages (system prompt + retrieved context + question)."""
         # Language-specific labels
         labels = {
             "ko": {"title": "제목", "date": "시기", "no_data": "관련 데이터가 없습니다."},
@@ -184,8 +253,7 @@ class RAGService:
             "en": "Please respond in English.",
         }.get(language, "Please respond in English.")
 
-        # Generate response
-        messages = [
+        return [
             {"role": "system", "content": f"{self.SYSTEM_PROMPT}\n\n{lang_instruction}"},
             {"role": "user", "content": f"""Based on the following historical data, answer the question.
 
@@ -198,6 +266,25 @@ class RAGService:
 ## Answer:"""}
         ]
 
+    def generate_response(
+        self,
+        query: str,
+        context: List[dict],
+        language: str = "en"
+    ) -> str:
+        """
+        LOGOS: Generate response using LLM with retrieved context.
+
+        Args:
+            query: User's question
+            context: Retrieved documents
+            language: Response language (en, ko, ja)
+
+        Returns:
+            Generated answer
+        """
+        messages = self._build_messages(query, context, language)
+
         response = self.client.chat.completions.create(
             model=self.chat_model,
             messages=messages,
@@ -207,33 +294,49 @@ class RAGService:
 
         return response.choices[0].message.content
 
-    def query(
+    def stream_response(
         self,
         query: str,
-        context_limit: int = 5,
-        filters: Optional[dict] = None
-    ) -> RAGResponse:
+        context: List[dict],
+        language: str = "en"
+    ) -> Iterator[str]:
         """
-        Full RAG pipeline: SHEBA → LOGOS → LAPLACE.
+        LOGOS: Streaming generate_response - yields answer tokens as they arrive.
+        """
+        messages = self._build_messages(query, context, language)
 
-        Args:
-            query: User's question
-            context_limit: Max context documents
-            filters: Optional metadata filters
-                - category: str (battle, treaty, discovery, etc.)
-                - date_from: int (e.g., -500 for 500 BCE)
-                - date_to: int (e.g., 1500 for 1500 CE)
+        stream = self.client.chat.completions.create(
+            model=self.chat_model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=1000,
+            stream=True
+        )
 
-        Returns:
-            RAGResponse with answer, sources, and metadata
-        """
-        # 1. SHEBA: Retrieve context (with filters)
-        context = self.retrieve_context(query, limit=context_limit, filters=filters)
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            token = chunk.choices[0].delta.content
+            if token:
+                yield token
 
-        # 2. LOGOS: Generate response
-        answer = self.generate_response(query, context)
+    async def agenerate_response(
+        self,
+        query: str,
+        context: List[dict],
+        language: str = "en"
+    ) -> str:
+        """Async generate_response (blocking client call runs in a worker thread)."""
+        return await asyncio.to_thread(self.generate_response, query, context, language)
 
-        # 3. LAPLACE: Prepare sources
+    @staticmethod
+    def build_sources(context: List[dict]) -> Tuple[List[dict], List[dict], float]:
+        """
+        LAPLACE: Turn retrieved documents into sources and related events.
+
+        Returns:
+            (sources, related_events, confidence) - confidence is the best similarity
+        """
         sources = []
         related_events = []
 
@@ -256,7 +359,61 @@ class RAGService:
         # Calculate confidence based on best similarity
         confidence = max([s["similarity"] for s in sources]) if sources else 0.0
 
-        return RAGResponse(
+        return sources, related_events, confidence
+
+    def _cache_scope(self, context_limit: int, filters: Optional[dict]) -> dict:
+        return {
+            "filters": filters or {},
+            "context_limit": context_limit,
+            "chat_model": self.chat_model,
+            "embedding_model": self.embedding_service.model,
+        }
+
+    def query(
+        self,
+        query: str,
+        context_limit: int = 5,
+        filters: Optional[dict] = None
+    ) -> RAGResponse:
+        """
+        Full RAG pipeline: SHEBA → LOGOS → LAPLACE.
+
+        Answers to near-duplicate queries (same filters) are served from
+        the semantic answer cache.
+
+        Args:
+            query: User's question
+            context_limit: Max context documents
+            filters: Optional metadata filters
+                - category: str (battle, treaty, discovery, etc.)
+                - date_from: int (e.g., -500 for 500 BCE)
+                - date_to: int (e.g., 1500 for 1500 CE)
+
+        Returns:
+            RAGResponse with answer, sources, and metadata
+        """
+        query_embedding = self.embed_query(query)
+        scope = self._cache_scope(context_limit, filters)
+
+        if self.answer_cache is not None:
+            cached = self.answer_cache.lookup("rag", query_embedding, scope)
+            if cached is not None:
+                return RAGResponse(**{**cached, "query_interpretation": f"검색어: {query}"})
+
+        started = time.perf_counter()
+
+        # 1. SHEBA: Retrieve context (with filters)
+        context = self.retrieve_context(
+            query, limit=context_limit, filters=filters, query_embedding=query_embedding
+        )
+
+        # 2. LOGOS: Generate response
+        answer = self.generate_response(query, context)
+
+        # 3. LAPLACE: Prepare sources
+        sources, related_events, confidence = self.build_sources(context)
+
+        response = RAGResponse(
             answer=answer,
             sources=sources,
             confidence=confidence,
@@ -264,6 +421,76 @@ class RAGService:
             query_interpretation=f"검색어: {query}"
         )
 
+        if self.answer_cache is not None:
+            self.answer_cache.store(
+                "rag", query_embedding, scope, asdict(response),
+                latency_ms=(time.perf_counter() - started) * 1000
+            )
+
+        return response
+
+    def stream_query(
+        self,
+        query: str,
+        context_limit: int = 5,
+        filters: Optional[dict] = None
+    ) -> Iterator[Tuple[str, dict]]:
+        """
+        Streaming RAG pipeline.
+
+        Yields (event, data) pairs:
+            ("sources", {sources, related_events, confidence, query_interpretation})
+                - right after retrieval, before generation starts
+            ("token", {"text": ...}) - answer tokens as they arrive
+            ("done", {"answer": full answer})
+        """
+        query_embedding = self.embed_query(query)
+        scope = self._cache_scope(context_limit, filters)
+
+        if self.answer_cache is not None:
+            cached = self.answer_cache.lookup("rag", query_embedding, scope)
+            if cached is not None:
+                yield "sources", {
+                    "sources": cached["sources"],
+                    "related_events": cached["related_events"],
+                    "confidence": cached["confidence"],
+                    "query_interpretation": f"검색어: {query}",
+                    "cached": True,
+                }
+                yield "token", {"text": cached["answer"]}
+                yield "done", {"answer": cached["answer"], "cached": True}
+                return
+
+        started = time.perf_counter()
+        context = self.retrieve_context(
+            query, limit=context_limit, filters=filters, query_embedding=query_embedding
+        )
+
+        sources, related_events, confidence = self.build_sources(context)
+        yield "sources", {
+            "sources": sources,
+            "related_events": related_events,
+            "confidence": confidence,
+            "query_interpretation": f"검색어: {query}",
+        }
+
+        answer_parts = []
+        for token in self.stream_response(query, context):
+            answer_parts.append(token)
+            yield "token", {"text": token}
+
+        answer = "".join(answer_parts)
+        if self.answer_cache is not None:
+            self.answer_cache.store("rag", query_embedding, scope, {
+                "answer": answer,
+                "sources": sources,
+                "confidence": confidence,
+                "related_events": related_events,
+                "query_interpretation": f"검색어: {query}",
+            }, latency_ms=(time.perf_counter() - started) * 1000)
+
+        yield "done", {"answer": answer}
+
     async def aquery(
         self,
         query: str,
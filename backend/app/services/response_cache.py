@@ -0,0 +1,318 @@
+"""
+Response cache for expensive read endpoints.
+
+Endpoints such as globe arcs, person stories and person chains return the
+same result for a given DB state but re-run multi-join queries on every
+request. This module caches their (JSON-encoded) responses and invalidates
+them by entity tag when the underlying data is written.
+
+- Keys: route name + sorted request parameters (DB session excluded)
+- Tags: per-entity strings like "event:12", "person:34"; writes call
+  invalidate_tags() so only the affected keys are dropped
+- TTL: routes whose data is only written by out-of-process import scripts
+  (mention counts, servant book mentions) have no write path here to
+  invalidate them, so they use the shorter response_cache_import_ttl
+- Backends: in-process LRU (default) or a shared Redis backend
+  (optional dependency). Any object implementing CacheBackend can be
+  swapped in with set_backend(), e.g. a local stand-in for Redis.
+- Metrics: hits/misses/stores/invalidations per route
+
+Usage:
+    @router.get("/person/{person_id}")
+    @cached_response("story.person", tags=lambda params, result: [f"person:{params['person_id']}"])
+    async def get_person_story(person_id: int, db: Session = Depends(get_db)):
+        ...
+"""
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Protocol
+
+from fastapi.encoders import jsonable_encoder
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Parameters never included in cache keys
+EXCLUDED_PARAMS = {"db"}
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached responses and their tag index."""
+
+    def get(self, key: str) -> Optional[Any]: ...
+
+    def set(self, key: str, value: Any, ttl: int, tags: Iterable[str]) -> None: ...
+
+    def invalidate_tags(self, tags: Iterable[str]) -> list[str]: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryLRUBackend:
+    """Process-local LRU cache with TTL and tag index."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._key_tags: dict[str, set[str]] = {}
+        self._tag_keys: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: int, tags: Iterable[str]) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            tag_set = set(tags)
+            self._key_tags[key] = tag_set
+            for tag in tag_set:
+                self._tag_keys.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> list[str]:
+        removed = []
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tag_keys.get(tag, ())):
+                    self._remove(key)
+                    removed.append(key)
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._key_tags.clear()
+            self._tag_keys.clear()
+
+    def _remove(self, key: str) -> None:
+        self._entries.pop(key, None)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+
+
+class RedisBackend:
+    """Shared cache across workers/instances. Requires the `redis` package."""
+
+    PREFIX = "chaldeas:cache:"
+
+    def __init__(self, url: str):
+        import redis  # Optional dependency
+        self._client = redis.Redis.from_url(url)
+        self._client.ping()
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self.PREFIX + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: int, tags: Iterable[str]) -> None:
+        pipe = self._client.pipeline()
+        pipe.set(self.PREFIX + key, json.dumps(value), ex=ttl)
+        for tag in tags:
+            tag_key = f"{self.PREFIX}tag:{tag}"
+            pipe.sadd(tag_key, key)
+            pipe.expire(tag_key, ttl)
+        pipe.execute()
+
+    def invalidate_tags(self, tags: Iterable[str]) -> list[str]:
+        removed = []
+        for tag in tags:
+            tag_key = f"{self.PREFIX}tag:{tag}"
+            keys = [k.decode() for k in self._client.smembers(tag_key)]
+            if keys:
+                self._client.delete(*[self.PREFIX + k for k in keys])
+                removed.extend(keys)
+            self._client.delete(tag_key)
+        return removed
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(f"{self.PREFIX}*"):
+            self._client.delete(key)
+
+
+@dataclass
+class RouteStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_backend: Optional[CacheBackend] = None
+_route_stats: dict[str, RouteStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _create_backend() -> CacheBackend:
+    settings = get_settings()
+    if settings.response_cache_backend == "redis" and settings.response_cache_redis_url:
+        try:
+            return RedisBackend(settings.response_cache_redis_url)
+        except Exception as e:
+            logger.warning(f"Redis response cache unavailable, using in-process LRU: {e}")
+    return InMemoryLRUBackend(max_entries=settings.response_cache_max_entries)
+
+
+def get_backend() -> CacheBackend:
+    global _backend
+    if _backend is None:
+        _backend = _create_backend()
+    return _backend
+
+
+def set_backend(backend: CacheBackend) -> None:
+    """Replace the cache backend (e.g. with a local stand-in)."""
+    global _backend
+    _backend = backend
+
+
+def _stats(route: str) -> RouteStats:
+    with _stats_lock:
+        return _route_stats.setdefault(route, RouteStats())
+
+
+def make_key(route: str, params: dict) -> str:
+    """Deterministic key from route name and request parameters."""
+    payload = json.dumps(
+        {k: v for k, v in sorted(params.items()) if k not in EXCLUDED_PARAMS},
+        default=str,
+        sort_keys=True,
+    )
+    digest = hashlib.sha1(payload.encode()).hexdigest()[:20]
+    return f"{route}:{digest}"
+
+
+def invalidate_tags(tags: Iterable[str]) -> int:
+    """Drop every cached response carrying any of the given tags."""
+    tags = list(tags)
+    if not tags:
+        return 0
+    removed = get_backend().invalidate_tags(tags)
+    for key in removed:
+        _stats(key.rsplit(":", 1)[0]).invalidations += 1
+    if removed:
+        logger.debug(f"[ResponseCache] Invalidated {len(removed)} entries for tags {tags}")
+    return len(removed)
+
+
+def clear() -> None:
+    get_backend().clear()
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss metrics per route."""
+    with _stats_lock:
+        routes = {route: stats.as_dict() for route, stats in _route_stats.items()}
+    return {
+        "enabled": get_settings().response_cache_enabled,
+        "backend": type(get_backend()).__name__,
+        "routes": routes,
+    }
+
+
+def cached_response(
+    route: str,
+    tags: Optional[Callable[[dict, Any], Iterable[str]]] = None,
+    ttl: Optional[int] = None,
+):
+    """
+    Cache an endpoint's response.
+
+    Args:
+        route: Stable route name used for keys and metrics
+        tags: fn(params, result) -> tags; used for targeted invalidation
+        ttl: Seconds to keep the entry (defaults to settings.response_cache_ttl)
+
+    Exceptions (e.g. 404 HTTPException) are never cached.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def lookup(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            return params, make_key(route, params)
+
+        def store(key: str, params: dict, result: Any) -> Any:
+            encoded = jsonable_encoder(result)
+            entry_tags = list(tags(params, result)) if tags else []
+            entry_tags.append(f"route:{route}")
+            get_backend().set(
+                key,
+                encoded,
+                ttl or get_settings().response_cache_ttl,
+                entry_tags,
+            )
+            _stats(route).stores += 1
+            return encoded
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not get_settings().response_cache_enabled:
+                    return await func(*args, **kwargs)
+                params, key = lookup(args, kwargs)
+                cached = get_backend().get(key)
+                if cached is not None:
+                    _stats(route).hits += 1
+                    return cached
+                _stats(route).misses += 1
+                result = await func(*args, **kwargs)
+                return store(key, params, result)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            if not get_settings().response_cache_enabled:
+                return func(*args, **kwargs)
+            params, key = lookup(args, kwargs)
+            cached = get_backend().get(key)
+            if cached is not None:
+                _stats(route).hits += 1
+                return cached
+            _stats(route).misses += 1
+            result = func(*args, **kwargs)
+            return store(key, params, result)
+
+        return sync_wrapper
+
+    return decorator
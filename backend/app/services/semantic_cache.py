@@ -0,0 +1,303 @@
+"""
+Semantic answer cache for RAG and agent responses.
+
+Near-duplicate questions ("마라톤 전투 알려줘", "Battle of Marathon?") hit
+the same retrieval and generation. This cache stores the final structured
+response under the query embedding and returns it for later queries whose
+embedding is close enough (cosine similarity >= threshold).
+
+- Scope: entries only match within the same namespace ("rag", "agent")
+  and scope (filters, language, embedding model, ...)
+- Eviction: LRU (max_entries), TTL, and a data version - when the
+  embeddings table changes, every entry built on the old data is dropped
+- Metrics: hits/misses/stores/evictions, hit rate and the generation
+  latency saved by hits
+
+Query embeddings are computed by the pipelines anyway (after
+translation), so a lookup costs one matrix-vector product.
+
+Usage:
+    cache = get_semantic_cache()
+    hit = cache.lookup("rag", embedding, scope)
+    if hit is None:
+        ...
+        cache.store("rag", embedding, scope, response, latency_ms)
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.config import get_settings
+
+# Seconds between data version checks (version lookup hits the DB)
+VERSION_CHECK_SECONDS = 30
+
+
+@dataclass
+class _Entry:
+    key: int
+    scope_key: str
+    vector: np.ndarray
+    response: Any
+    latency_ms: float
+    data_version: Optional[str]
+    expires_at: float
+
+
+@dataclass
+class CacheStats:
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evicted_lru: int = 0
+    evicted_ttl: int = 0
+    evicted_version: int = 0
+    saved_latency_ms: float = 0.0
+    hit_similarities: List[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+            "evictions": {
+                "lru": self.evicted_lru,
+                "ttl": self.evicted_ttl,
+                "data_version": self.evicted_version,
+            },
+            "saved_latency_ms": round(self.saved_latency_ms, 1),
+            "avg_hit_similarity": (
+                round(sum(self.hit_similarities) / len(self.hit_similarities), 4)
+                if self.hit_similarities else None
+            ),
+        }
+
+
+class SemanticCache:
+    """In-process embedding-similarity cache with LRU/TTL/data-version eviction."""
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl: int = 3600,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()  # LRU order
+        self._scopes: Dict[str, Dict[int, _Entry]] = {}
+        self._matrices: Dict[str, tuple] = {}  # scope_key -> (keys, matrix), rebuilt lazily
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+        self._version_provider: Optional[Callable[[], Optional[str]]] = None
+        self._data_version: Optional[str] = None
+        self._version_checked_at = 0.0
+
+        self.stats: Dict[str, CacheStats] = {}
+
+    # ----- data version -----
+
+    def set_version_provider(self, provider: Callable[[], Optional[str]], replace: bool = False) -> None:
+        """Register a function returning the current data version (e.g. embeddings signature)."""
+        if self._version_provider is not None and not replace:
+            return
+        self._version_provider = provider
+        self._version_checked_at = 0.0
+
+    def bump_data_version(self, version: Optional[str] = None) -> None:
+        """Drop every entry (data changed in-process)."""
+        with self._lock:
+            self._data_version = version if version is not None else f"local:{time.time()}"
+            self._version_checked_at = time.monotonic()
+            self._drop_stale_versions()
+
+    def _refresh_version(self) -> None:
+        if self._version_provider is None:
+            return
+        now = time.monotonic()
+        if now - self._version_checked_at < VERSION_CHECK_SECONDS:
+            return
+        self._version_checked_at = now
+        try:
+            version = self._version_provider()
+        except Exception as e:
+            print(f"[SemanticCache] Data version check failed: {e}")
+            return
+        if version != self._data_version:
+            with self._lock:
+                self._data_version = version
+                self._drop_stale_versions()
+
+    def _drop_stale_versions(self) -> None:
+        for key, entry in list(self._entries.items()):
+            if entry.data_version != self._data_version:
+                self._remove(key)
+                self._stats(entry.scope_key).evicted_version += 1
+
+    # ----- lookup / store -----
+
+    @staticmethod
+    def scope_key(namespace: str, scope: Optional[dict]) -> str:
+        return f"{namespace}:{json.dumps(scope or {}, sort_keys=True, default=str)}"
+
+    @staticmethod
+    def _normalize(embedding) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if not norm:
+            return None
+        return vector / norm
+
+    def _stats(self, scope_key: str) -> CacheStats:
+        namespace = scope_key.split(":", 1)[0]
+        return self.stats.setdefault(namespace, CacheStats())
+
+    def lookup(self, namespace: str, embedding, scope: Optional[dict] = None) -> Optional[Any]:
+        """Cached response for the most similar query in scope, if above threshold."""
+        self._refresh_version()
+        scope_key = self.scope_key(namespace, scope)
+        vector = self._normalize(embedding)
+
+        with self._lock:
+            stats = self._stats(scope_key)
+            stats.lookups += 1
+
+            if vector is None or scope_key not in self._scopes:
+                stats.misses += 1
+                return None
+
+            keys, matrix = self._matrix(scope_key)
+            if matrix is None or matrix.shape[1] != vector.shape[0]:
+                stats.misses += 1
+                return None
+
+            similarities = matrix @ vector
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            entry = self._entries.get(keys[best])
+
+            if entry is None or similarity < self.threshold:
+                stats.misses += 1
+                return None
+
+            if entry.expires_at < time.monotonic():
+                self._remove(entry.key)
+                stats.evicted_ttl += 1
+                stats.misses += 1
+                return None
+
+            self._entries.move_to_end(entry.key)
+            stats.hits += 1
+            stats.saved_latency_ms += entry.latency_ms
+            stats.hit_similarities.append(similarity)
+            if len(stats.hit_similarities) > 1000:
+                del stats.hit_similarities[:500]
+            return entry.response
+
+    def store(
+        self,
+        namespace: str,
+        embedding,
+        scope: Optional[dict],
+        response: Any,
+        latency_ms: float = 0.0,
+    ) -> None:
+        """Cache a final response under the query embedding."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        scope_key = self.scope_key(namespace, scope)
+
+        with self._lock:
+            entry = _Entry(
+                key=self._next_key,
+                scope_key=scope_key,
+                vector=vector,
+                response=response,
+                latency_ms=latency_ms,
+                data_version=self._data_version,
+                expires_at=time.monotonic() + self.ttl,
+            )
+            self._next_key += 1
+            self._entries[entry.key] = entry
+            self._scopes.setdefault(scope_key, {})[entry.key] = entry
+            self._matrices.pop(scope_key, None)
+            self._stats(scope_key).stores += 1
+
+            while len(self._entries) > self.max_entries:
+                oldest_key, oldest = next(iter(self._entries.items()))
+                self._remove(oldest_key)
+                self._stats(oldest.scope_key).evicted_lru += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._scopes.clear()
+            self._matrices.clear()
+
+    def _matrix(self, scope_key: str):
+        cached = self._matrices.get(scope_key)
+        if cached is None:
+            entries = self._scopes.get(scope_key, {})
+            keys = list(entries)
+            matrix = np.stack([entries[k].vector for k in keys]) if keys else None
+            cached = (keys, matrix)
+            self._matrices[scope_key] = cached
+        return cached
+
+    def _remove(self, key: int) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        scope_entries = self._scopes.get(entry.scope_key)
+        if scope_entries is not None:
+            scope_entries.pop(key, None)
+            if not scope_entries:
+                del self._scopes[entry.scope_key]
+        self._matrices.pop(entry.scope_key, None)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": get_settings().semantic_cache_enabled,
+                "entries": len(self._entries),
+                "threshold": self.threshold,
+                "data_version": self._data_version,
+                "namespaces": {name: stats.as_dict() for name, stats in self.stats.items()},
+            }
+
+
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Shared cache instance, or None when disabled in settings."""
+    global _semantic_cache
+    settings = get_settings()
+    if not settings.semantic_cache_enabled:
+        return None
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache(
+            threshold=settings.semantic_cache_threshold,
+            max_entries=settings.semantic_cache_max_entries,
+            ttl=settings.semantic_cache_ttl,
+        )
+    return _semantic_cache
+
+
+def get_semantic_cache_stats() -> dict:
+    cache = get_semantic_cache()
+    if cache is None:
+        return {"enabled": False}
+    return cache.get_stats()
@@ -6,8 +6,10 @@ Provides:
 - Source details
 - Person-source relationships via text_mentions
 - Source-person relationships
+- Batched top-k mentions per source (shared with LAPLACE)
+- Batched curated sources (event_sources / person_sources)
 """
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
 
@@ -143,80 +145,235 @@ def get_source_persons(
     return items, total
 
 
-def get_person_sources(
+def get_top_mentions_by_source(
     db: Session,
-    person_id: int,
-    limit: int = 20,
-    include_contexts: bool = True,
-    max_contexts: int = 3,
-) -> Tuple[List[dict], int]:
+    entity_type: str,
+    entity_ids: List[int],
+    source_limit: int = 20,
+    max_mentions: int = 3,
+) -> Dict[int, dict]:
     """
-    Get sources that mention a person.
-    Includes mention contexts if requested.
+    Get the most-mentioning sources for a batch of entities, with their
+    top-k mentions per source, in a single windowed query.
+
+    Returns {entity_id: {"sources": [...], "total": int}} where each source
+    carries mention_count, avg_confidence and a "mentions" list ordered by
+    confidence. Entities without mentions are absent from the result.
     """
-    # Get sources with mention counts
-    query = db.execute(text("""
+    if not entity_ids:
+        return {}
+
+    params = {
+        "entity_type": entity_type,
+        "entity_ids": list(entity_ids),
+        "source_limit": source_limit,
+        "max_mentions": max_mentions,
+    }
+
+    if max_mentions > 0:
+        mention_cte = """,
+        ranked_mentions AS (
+            SELECT
+                tm.entity_id,
+                tm.source_id,
+                tm.mention_text,
+                tm.context_text,
+                tm.confidence,
+                tm.chunk_index,
+                ROW_NUMBER() OVER (
+                    PARTITION BY tm.entity_id, tm.source_id
+                    ORDER BY tm.confidence DESC, tm.id
+                ) as mention_rank
+            FROM text_mentions tm
+            JOIN top_sources ts
+              ON ts.entity_id = tm.entity_id AND ts.source_id = tm.source_id
+            WHERE tm.entity_type = :entity_type
+        )"""
+        mention_columns = """,
+            rm.mention_rank,
+            rm.mention_text,
+            rm.context_text,
+            rm.confidence,
+            rm.chunk_index"""
+        mention_join = """
+        LEFT JOIN ranked_mentions rm
+          ON rm.entity_id = ts.entity_id
+         AND rm.source_id = ts.source_id
+         AND rm.mention_rank <= :max_mentions"""
+        mention_order = ", rm.mention_rank"
+    else:
+        mention_cte = mention_columns = mention_join = mention_order = ""
+
+    result = db.execute(text(f"""
+        WITH source_stats AS (
+            SELECT
+                tm.entity_id,
+                tm.source_id,
+                COUNT(*) as mention_count,
+                AVG(tm.confidence) as avg_confidence,
+                ROW_NUMBER() OVER (
+                    PARTITION BY tm.entity_id
+                    ORDER BY COUNT(*) DESC, tm.source_id
+                ) as source_rank,
+                COUNT(*) OVER (PARTITION BY tm.entity_id) as source_total
+            FROM text_mentions tm
+            WHERE tm.entity_type = :entity_type
+              AND tm.entity_id = ANY(:entity_ids)
+            GROUP BY tm.entity_id, tm.source_id
+        ),
+        top_sources AS (
+            SELECT * FROM source_stats WHERE source_rank <= :source_limit
+        ){mention_cte}
         SELECT
+            ts.entity_id,
+            ts.source_total,
             s.id,
             s.name,
             s.title,
             s.type,
             s.author,
-            COUNT(tm.id) as mention_count
-        FROM sources s
-        JOIN text_mentions tm ON tm.source_id = s.id
-        WHERE tm.entity_type = 'person' AND tm.entity_id = :person_id
-        GROUP BY s.id
-        ORDER BY mention_count DESC
-        LIMIT :limit
-    """), {"person_id": person_id, "limit": limit})
+            s.url,
+            s.archive_type,
+            s.original_year,
+            COALESCE(s.reliability, 3) as reliability,
+            ts.mention_count,
+            ts.avg_confidence{mention_columns}
+        FROM top_sources ts
+        JOIN sources s ON s.id = ts.source_id{mention_join}
+        ORDER BY ts.entity_id, ts.source_rank{mention_order}
+    """), params)
+
+    by_entity: Dict[int, dict] = {}
+    for row in result.fetchall():
+        entry = by_entity.setdefault(row.entity_id, {"sources": [], "total": row.source_total})
+        sources = entry["sources"]
+
+        if not sources or sources[-1]["id"] != row.id:
+            sources.append({
+                "id": row.id,
+                "name": row.name,
+                "title": row.title,
+                "type": row.type,
+                "author": row.author,
+                "url": row.url,
+                "archive_type": row.archive_type,
+                "original_year": row.original_year,
+                "reliability": row.reliability,
+                "mention_count": row.mention_count,
+                "avg_confidence": float(row.avg_confidence) if row.avg_confidence is not None else 0.0,
+                "mentions": [],
+            })
 
-    sources = []
-    for row in query.fetchall():
-        source_data = dict(row._mapping)
-        source_data["person_count"] = 0  # Not needed for this view
-
-        # Get contexts if requested
-        if include_contexts:
-            context_query = db.execute(text("""
-                SELECT mention_text, context_text, confidence, chunk_index
-                FROM text_mentions
-                WHERE source_id = :source_id
-                  AND entity_type = 'person'
-                  AND entity_id = :person_id
-                ORDER BY confidence DESC
-                LIMIT :max_contexts
-            """), {
-                "source_id": source_data["id"],
-                "person_id": person_id,
-                "max_contexts": max_contexts
+        if max_mentions > 0 and row.mention_rank is not None:
+            sources[-1]["mentions"].append({
+                "mention_text": row.mention_text or "",
+                "context_text": row.context_text,
+                "confidence": row.confidence,
+                "chunk_index": row.chunk_index,
             })
 
-            source_data["mentions"] = [
-                {
-                    "mention_text": ctx.mention_text or "",
-                    "context_text": ctx.context_text,
-                    "confidence": ctx.confidence,
-                    "chunk_index": ctx.chunk_index
-                }
-                for ctx in context_query.fetchall()
-            ]
-        else:
-            source_data["mentions"] = []
+    return by_entity
 
-        sources.append(source_data)
 
-    # Get total count
-    count_result = db.execute(text("""
-        SELECT COUNT(DISTINCT s.id)
-        FROM sources s
-        JOIN text_mentions tm ON tm.source_id = s.id
-        WHERE tm.entity_type = 'person' AND tm.entity_id = :person_id
-    """), {"person_id": person_id})
+# Curated entity → source link tables (quote column where the table has one)
+CURATED_SOURCE_TABLES = {
+    "event": ("event_sources", "event_id", "es.quote"),
+    "person": ("person_sources", "person_id", "NULL"),
+}
 
-    total = count_result.scalar() or 0
 
-    return sources, total
+def get_curated_sources(
+    db: Session,
+    entity_type: str,
+    entity_ids: List[int],
+) -> Dict[int, List[dict]]:
+    """
+    Get the curated sources (event_sources / person_sources) for a batch
+    of entities in one query.
+
+    Returns {entity_id: [source, ...]} with the same source fields as
+    get_top_mentions_by_source plus page_reference and quote. Entities
+    without curated sources are absent from the result.
+    """
+    if not entity_ids or entity_type not in CURATED_SOURCE_TABLES:
+        return {}
+
+    table, id_column, quote = CURATED_SOURCE_TABLES[entity_type]
+    result = db.execute(text(f"""
+        SELECT
+            es.{id_column} as entity_id,
+            s.id,
+            s.name,
+            s.title,
+            s.type,
+            s.author,
+            s.url,
+            s.archive_type,
+            s.original_year,
+            COALESCE(s.reliability, 3) as reliability,
+            es.page_reference,
+            {quote} as quote
+        FROM {table} es
+        JOIN sources s ON s.id = es.source_id
+        WHERE es.{id_column} = ANY(:entity_ids)
+        ORDER BY es.{id_column}, COALESCE(s.reliability, 3) DESC, s.id
+    """), {"entity_ids": list(entity_ids)})
+
+    by_entity: Dict[int, List[dict]] = {}
+    for row in result.fetchall():
+        by_entity.setdefault(row.entity_id, []).append({
+            "id": row.id,
+            "name": row.name,
+            "title": row.title,
+            "type": row.type,
+            "author": row.author,
+            "url": row.url,
+            "archive_type": row.archive_type,
+            "original_year": row.original_year,
+            "reliability": row.reliability,
+            "page_reference": row.page_reference,
+            "quote": row.quote,
+        })
+
+    return by_entity
+
+
+def get_person_sources(
+    db: Session,
+    person_id: int,
+    limit: int = 20,
+    include_contexts: bool = True,
+    max_contexts: int = 3,
+) -> Tuple[List[dict], int]:
+    """
+    Get sources that mention a person.
+    Includes mention contexts if requested.
+    """
+    by_entity = get_top_mentions_by_source(
+        db,
+        "person",
+        [person_id],
+        source_limit=limit,
+        max_mentions=max_contexts if include_contexts else 0,
+    )
+    entry = by_entity.get(person_id)
+    if not entry:
+        return [], 0
+
+    sources = []
+    for source in entry["sources"]:
+        sources.append({
+            "id": source["id"],
+            "name": source["name"],
+            "title": source["title"],
+            "type": source["type"],
+            "author": source["author"],
+            "mention_count": source["mention_count"],
+            "person_count": 0,  # Not needed for this view
+            "mentions": source["mentions"],
+        })
+
+    return sources, entry["total"]
 
 
 def get_source_mentions(
@@ -0,0 +1,211 @@
+"""
+Static dataset registry - preload and index read-only data at startup.
+
+Showcase JSON files, FGO servant mappings and the singularity/lostbelt
+eras never change while the server runs, but were loaded lazily on the
+first request (or rebuilt on every call). Modules register their datasets
+here; main.py preloads everything on startup so the first request after a
+cold start doesn't pay for file I/O and index building.
+
+Each dataset is a loader returning a dict of named structures
+(e.g. {"items": [...], "by_id": {...}}). Datasets that were not
+preloaded are loaded on first access, so scripts and tests that never run
+startup still work.
+
+A dataset that fails to load is left unloaded (a failed reload keeps the
+previous data): get() retries the loader and raises StaticDataUnavailable,
+which main.py turns into a 503, instead of handing out an empty dict.
+
+Usage:
+    static_data.register("showcases", load_showcases)
+    items = static_data.get("showcases")["items"]
+"""
+import bisect
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StaticDataUnavailable(RuntimeError):
+    """A registered dataset could not be loaded."""
+
+    def __init__(self, name: str, error: Optional[str]):
+        super().__init__(f"Static dataset '{name}' is unavailable: {error}")
+        self.name = name
+        self.error = error
+
+
+@dataclass
+class DatasetStats:
+    """Load statistics for one dataset."""
+    name: str
+    records: int = 0
+    load_ms: float = 0.0
+    loaded_at: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _Dataset:
+    loader: Callable[[], Dict[str, Any]]
+    data: Optional[Dict[str, Any]] = None
+    stats: DatasetStats = field(default_factory=lambda: DatasetStats(name=""))
+
+
+_datasets: Dict[str, _Dataset] = {}
+_lock = threading.Lock()
+
+
+def register(name: str, loader: Callable[[], Dict[str, Any]]) -> None:
+    """Register a dataset loader. Re-registering replaces the loader and drops loaded data."""
+    with _lock:
+        _datasets[name] = _Dataset(loader=loader, stats=DatasetStats(name=name))
+
+
+def _load(name: str, dataset: _Dataset) -> None:
+    """Run the loader. On failure, record the error, keep any previous data and raise."""
+    started = time.perf_counter()
+    try:
+        data = dataset.loader()
+    except Exception as e:
+        logger.error(f"[StaticData] Failed to load {name}: {e}")
+        dataset.stats.error = str(e)
+        dataset.stats.load_ms = round((time.perf_counter() - started) * 1000, 2)
+        raise StaticDataUnavailable(name, str(e)) from e
+
+    dataset.data = data
+    dataset.stats.error = None
+    dataset.stats.load_ms = round((time.perf_counter() - started) * 1000, 2)
+    dataset.stats.loaded_at = time.time()
+    dataset.stats.records = len(data.get("items", ())) if isinstance(data, dict) else 0
+
+
+def get(name: str) -> Dict[str, Any]:
+    """
+    Get a dataset, loading it on first access if it was not preloaded.
+
+    Raises StaticDataUnavailable if the dataset cannot be loaded.
+    """
+    dataset = _datasets.get(name)
+    if dataset is None:
+        raise KeyError(f"Unknown static dataset: {name}")
+    if dataset.data is None:
+        with _lock:
+            if dataset.data is None:
+                _load(name, dataset)
+    return dataset.data
+
+
+def preload() -> List[DatasetStats]:
+    """
+    Load every registered dataset (called once at startup).
+
+    Failures are logged and recorded in the stats; the server still starts
+    and requests for that dataset get StaticDataUnavailable (503).
+    """
+    started = time.perf_counter()
+    with _lock:
+        for name, dataset in _datasets.items():
+            try:
+                _load(name, dataset)
+            except StaticDataUnavailable:
+                continue
+            logger.info(
+                f"[StaticData] {name}: {dataset.stats.records} records "
+                f"in {dataset.stats.load_ms}ms"
+            )
+    total_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"[StaticData] Preloaded {len(_datasets)} datasets in {total_ms:.1f}ms")
+    return get_stats()
+
+
+def reload(name: Optional[str] = None) -> None:
+    """
+    Reload one dataset (or all) from disk.
+
+    A dataset that fails keeps its previous data; the first failure is
+    raised after the others have been reloaded.
+    """
+    failure: Optional[StaticDataUnavailable] = None
+    with _lock:
+        for dataset_name, dataset in _datasets.items():
+            if name is None or dataset_name == name:
+                try:
+                    _load(dataset_name, dataset)
+                except StaticDataUnavailable as e:
+                    failure = failure or e
+    if failure is not None:
+        raise failure
+
+
+def get_stats() -> List[DatasetStats]:
+    """Per-dataset record counts and load times."""
+    return [dataset.stats for dataset in _datasets.values()]
+
+
+class IntervalTree(Generic[T]):
+    """
+    Static centered interval tree for closed integer intervals.
+
+    Point queries return every value whose [start, end] contains the
+    point in O(log n + k), instead of scanning all intervals.
+    """
+
+    def __init__(self, intervals: List[Tuple[int, int, T]]):
+        self._root = self._build(list(intervals))
+
+    def _build(self, intervals):
+        if not intervals:
+            return None
+
+        endpoints = sorted(p for start, end, _ in intervals for p in (start, end))
+        center = endpoints[len(endpoints) // 2]
+
+        left, right, overlapping = [], [], []
+        for interval in intervals:
+            start, end, _ = interval
+            if end < center:
+                left.append(interval)
+            elif start > center:
+                right.append(interval)
+            else:
+                overlapping.append(interval)
+
+        by_start = sorted(overlapping, key=lambda i: i[0])
+        by_end = sorted(overlapping, key=lambda i: -i[1])
+        return (
+            center,
+            by_start,
+            [i[0] for i in by_start],
+            by_end,
+            [-i[1] for i in by_end],
+            self._build(left),
+            self._build(right),
+        )
+
+    def query(self, point: int) -> List[T]:
+        """Values of all intervals containing point."""
+        results = []
+        node = self._root
+        while node is not None:
+            center, by_start, starts, by_end, neg_ends, left, right = node
+            if point < center:
+                # Overlapping intervals with start <= point
+                count = bisect.bisect_right(starts, point)
+                results.extend(i[2] for i in by_start[:count])
+                node = left
+            elif point > center:
+                # Overlapping intervals with end >= point
+                count = bisect.bisect_right(neg_ends, -point)
+                results.extend(i[2] for i in by_end[:count])
+                node = right
+            else:
+                results.extend(i[2] for i in by_start)
+                break
+        return results
@@ -0,0 +1,343 @@
+"""
+Story service - Person story timelines.
+
+Provides:
+- Person story building (ordered nodes, node types, map view)
+- Materialization into `person_stories` for every person with a
+  person-layer chain, refreshing only persons whose chains changed
+- Single-row lookup of materialized stories
+
+Stored payloads are compact: nodes are positional arrays (see NODE_FIELDS)
+rather than dicts, and are expanded back on read.
+"""
+import json
+from typing import Optional, List, Dict, Iterable
+
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+# Positional layout of a stored node
+NODE_FIELDS = (
+    "event_id", "title", "title_ko", "year", "year_end",
+    "loc_name", "loc_name_ko", "lat", "lng", "node_type", "description",
+)
+
+# Persons rebuilt per batched query
+MATERIALIZE_BATCH_SIZE = 500
+
+DEFAULT_MAP_VIEW = {"center_lat": 48.0, "center_lng": 2.0, "zoom": 5}
+
+NODE_TYPE_KEYWORDS = [
+    ("birth", ["birth", "born", "출생", "탄생"]),
+    ("death", ["death", "died", "execution", "화형", "사망", "처형", "순교"]),
+    ("battle", ["battle", "siege", "war", "전투", "포위", "공방"]),
+    ("political", ["coronation", "treaty", "대관", "조약", "즉위"]),
+    ("major", ["victory", "liberation", "해방", "승리"]),
+]
+
+
+def determine_node_type(event_title: str, year: int, birth_year: int, death_year: int) -> str:
+    """이벤트 제목과 연도로 노드 타입 결정"""
+    title_lower = event_title.lower() if event_title else ""
+
+    # Birth/Death check by year
+    if birth_year and year == birth_year:
+        return "birth"
+    if death_year and year == death_year:
+        return "death"
+
+    # Keyword-based detection
+    for node_type, words in NODE_TYPE_KEYWORDS:
+        if any(word in title_lower for word in words):
+            return node_type
+
+    return "normal"
+
+
+def calculate_map_view(nodes: List[dict]) -> dict:
+    """노드들의 좌표로 적절한 지도 뷰 계산"""
+    lats = [n["lat"] for n in nodes if n.get("lat")]
+    lngs = [n["lng"] for n in nodes if n.get("lng")]
+
+    if not lats or not lngs:
+        return dict(DEFAULT_MAP_VIEW)
+
+    center_lat = sum(lats) / len(lats)
+    center_lng = sum(lngs) / len(lngs)
+
+    # Calculate zoom based on spread
+    lat_spread = max(lats) - min(lats)
+    lng_spread = max(lngs) - min(lngs)
+    spread = max(lat_spread, lng_spread)
+
+    if spread < 2:
+        zoom = 8
+    elif spread < 5:
+        zoom = 7
+    elif spread < 10:
+        zoom = 6
+    elif spread < 20:
+        zoom = 5
+    else:
+        zoom = 4
+
+    return {"center_lat": center_lat, "center_lng": center_lng, "zoom": zoom}
+
+
+def build_person_stories(
+    db: Session,
+    person_ids: List[int],
+    min_strength: float = 0,
+) -> Dict[int, dict]:
+    """
+    Build compact stories for a batch of persons in two queries.
+
+    Returns {person_id: payload}; persons that do not exist are absent.
+    Persons without dated events get an empty node list.
+    """
+    if not person_ids:
+        return {}
+
+    person_rows = db.execute(text("""
+        SELECT id, name, name_ko, birth_year, death_year, role
+        FROM persons
+        WHERE id = ANY(:person_ids)
+    """), {"person_ids": list(person_ids)}).fetchall()
+
+    stories = {}
+    for row in person_rows:
+        stories[row[0]] = {
+            "person": {
+                "id": row[0],
+                "name": row[1],
+                "name_ko": row[2],
+                "birth_year": row[3],
+                "death_year": row[4],
+                "role": row[5],
+            },
+            "nodes": [],
+        }
+
+    if not stories:
+        return {}
+
+    # Events from either side of every person-layer connection
+    events_result = db.execute(text("""
+        WITH person_events AS (
+            SELECT ec.layer_entity_id as person_id, ec.event_a_id as event_id
+            FROM event_connections ec
+            WHERE ec.layer_type = 'person'
+              AND ec.layer_entity_id = ANY(:person_ids)
+              AND ec.strength_score >= :min_strength
+
+            UNION
+
+            SELECT ec.layer_entity_id as person_id, ec.event_b_id as event_id
+            FROM event_connections ec
+            WHERE ec.layer_type = 'person'
+              AND ec.layer_entity_id = ANY(:person_ids)
+              AND ec.strength_score >= :min_strength
+        )
+        SELECT
+            pe.person_id,
+            e.id,
+            e.title,
+            e.title_ko,
+            e.description,
+            e.date_start as year,
+            e.date_end as year_end,
+            l.name as loc_name,
+            l.name_ko as loc_name_ko,
+            l.latitude as lat,
+            l.longitude as lng
+        FROM person_events pe
+        JOIN events e ON e.id = pe.event_id
+        LEFT JOIN locations l ON e.primary_location_id = l.id
+        WHERE e.date_start IS NOT NULL
+        ORDER BY pe.person_id, e.date_start, e.id
+    """), {"person_ids": list(stories), "min_strength": min_strength})
+
+    for row in events_result:
+        (person_id, event_id, title, title_ko, description,
+         year, year_end, loc_name, loc_name_ko, lat, lng) = row
+
+        story = stories[person_id]
+        person = story["person"]
+        has_location = bool(lat and lng)
+
+        story["nodes"].append([
+            event_id,
+            title,
+            title_ko,
+            year,
+            year_end,
+            (loc_name or "Unknown") if has_location else None,
+            loc_name_ko if has_location else None,
+            float(lat) if has_location else None,
+            float(lng) if has_location else None,
+            determine_node_type(title, year, person["birth_year"], person["death_year"]),
+            description[:200] if description else None,
+        ])
+
+    for story in stories.values():
+        located = [
+            {"lat": node[7], "lng": node[8]}
+            for node in story["nodes"]
+            if node[7] is not None
+        ]
+        story["map_view"] = calculate_map_view(located)
+
+    return stories
+
+
+def expand_story(payload: dict) -> dict:
+    """Expand a compact payload into the PersonStoryResponse shape."""
+    nodes = []
+    for order, values in enumerate(payload["nodes"]):
+        node = dict(zip(NODE_FIELDS, values))
+        location = None
+        if node["lat"] is not None:
+            location = {
+                "name": node["loc_name"],
+                "name_ko": node["loc_name_ko"],
+                "lat": node["lat"],
+                "lng": node["lng"],
+            }
+        nodes.append({
+            "order": order,
+            "event_id": node["event_id"],
+            "title": node["title"],
+            "title_ko": node["title_ko"],
+            "year": node["year"],
+            "year_end": node["year_end"],
+            "location": location,
+            "node_type": node["node_type"],
+            "description": node["description"],
+        })
+
+    return {
+        "person": payload["person"],
+        "nodes": nodes,
+        "total_nodes": len(nodes),
+        "map_view": payload["map_view"],
+    }
+
+
+def get_person_story(db: Session, person_id: int, min_strength: float = 0) -> Optional[dict]:
+    """
+    Get a person story, from the materialized table when possible.
+
+    Materialized stories cover min_strength == 0 (the default view);
+    other thresholds, and persons not yet materialized, are built live.
+    """
+    if min_strength == 0:
+        row = db.execute(text("""
+            SELECT payload FROM person_stories WHERE person_id = :person_id
+        """), {"person_id": person_id}).fetchone()
+        if row:
+            payload = row[0] if isinstance(row[0], dict) else json.loads(row[0])
+            return expand_story(payload)
+
+    stories = build_person_stories(db, [person_id], min_strength)
+    if person_id not in stories:
+        return None
+    return expand_story(stories[person_id])
+
+
+def _chain_signatures(db: Session, person_ids: Optional[List[int]] = None) -> Dict[int, str]:
+    """Per-person fingerprint of the person-layer chain and person row."""
+    params = {}
+    person_filter = ""
+    if person_ids is not None:
+        person_filter = "AND ec.layer_entity_id = ANY(:person_ids)"
+        params["person_ids"] = list(person_ids)
+
+    result = db.execute(text(f"""
+        SELECT
+            ec.layer_entity_id,
+            COUNT(*) || ':' || SUM(ec.id) || ':' || COALESCE(MAX(ec.updated_at)::text, '')
+                || ':' || COALESCE(MAX(p.updated_at)::text, '') as signature
+        FROM event_connections ec
+        JOIN persons p ON p.id = ec.layer_entity_id
+        WHERE ec.layer_type = 'person' {person_filter}
+        GROUP BY ec.layer_entity_id
+    """), params)
+    return {row[0]: row[1] for row in result}
+
+
+def materialize_person_stories(
+    db: Session,
+    person_ids: Optional[List[int]] = None,
+    force: bool = False,
+) -> dict:
+    """
+    Refresh materialized stories.
+
+    Only persons whose chain signature changed since the last run are
+    rebuilt (all of them with force=True); stories of persons that no
+    longer have a person-layer chain are removed.
+    """
+    current = _chain_signatures(db, person_ids)
+
+    params = {}
+    person_filter = ""
+    if person_ids is not None:
+        person_filter = "WHERE person_id = ANY(:person_ids)"
+        params["person_ids"] = list(person_ids)
+    stored = {
+        row[0]: row[1]
+        for row in db.execute(text(
+            f"SELECT person_id, chain_signature FROM person_stories {person_filter}"
+        ), params)
+    }
+
+    changed = [
+        pid for pid, signature in current.items()
+        if force or stored.get(pid) != signature
+    ]
+    removed = [pid for pid in stored if pid not in current]
+
+    if removed:
+        db.execute(text("DELETE FROM person_stories WHERE person_id = ANY(:person_ids)"),
+                   {"person_ids": removed})
+
+    rebuilt = 0
+    for i in range(0, len(changed), MATERIALIZE_BATCH_SIZE):
+        batch = changed[i:i + MATERIALIZE_BATCH_SIZE]
+        stories = build_person_stories(db, batch)
+        for person_id, payload in stories.items():
+            db.execute(text("""
+                INSERT INTO person_stories (person_id, payload, node_count, chain_signature, built_at)
+                VALUES (:person_id, CAST(:payload AS JSONB), :node_count, :signature, NOW())
+                ON CONFLICT (person_id) DO UPDATE SET
+                    payload = EXCLUDED.payload,
+                    node_count = EXCLUDED.node_count,
+                    chain_signature = EXCLUDED.chain_signature,
+                    built_at = EXCLUDED.built_at
+            """), {
+                "person_id": person_id,
+                "payload": json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                "node_count": len(payload["nodes"]),
+                "signature": current[person_id],
+            })
+            rebuilt += 1
+        db.commit()
+
+    db.commit()
+
+    return {
+        "checked": len(current),
+        "rebuilt": rebuilt,
+        "removed": len(removed),
+        "unchanged": len(current) - len(changed),
+    }
+
+
+def discard_stories(db: Session, person_ids: Iterable[int]) -> None:
+    """Drop materialized stories so reads fall back to live building until the next refresh."""
+    person_ids = [pid for pid in person_ids if pid]
+    if not person_ids:
+        return
+    db.execute(text("DELETE FROM person_stories WHERE person_id = ANY(:person_ids)"),
+               {"person_ids": person_ids})
+    db.commit()
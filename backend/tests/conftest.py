@@ -0,0 +1,72 @@
+"""
+Shared pytest fixtures for backend tests.
+
+DB tests run against the PostgreSQL database in DATABASE_URL (same as the
+app, schema from alembic) inside a transaction that is rolled back, and are
+skipped when the database is not reachable.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+
+
+@pytest.fixture(scope="session")
+def engine():
+    engine = create_engine(get_settings().database_url)
+    try:
+        with engine.connect():
+            pass
+    except OperationalError as e:
+        pytest.skip(f"PostgreSQL not available: {e.orig}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Session bound to a connection whose transaction is rolled back."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+class QueryCounter:
+    """Counts statements sent to the DB via before_cursor_execute."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.connection, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self.connection, "before_cursor_execute", self._record)
+
+
+@pytest.fixture
+def count_queries(db):
+    """with count_queries() as counter: ...; counter.count"""
+    return lambda: QueryCounter(db.connection())
@@ -0,0 +1,158 @@
+"""
+Streaming chat endpoints (/chat/rag/stream, /chat/agent/stream) against the
+fake OpenAI-compatible server in app/scripts/fake_llm_server.py, plus
+JSONFieldStreamer on chunked JSON.
+"""
+import json
+import threading
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1 import chat
+from app.core.sheba.history_agent import JSONFieldStreamer
+from app.main import app
+from app.scripts.fake_llm_server import FakeLLMHandler, FAKE_ANSWER, _fake_embedding, DEFAULT_DIMENSIONS
+from app.services import rag_service as rag_module
+from app.services.embeddings import LocalVectorStore
+from app.services.embeddings.local_store import quantize, MANIFEST_FILE, VECTORS_FILE, ROWS_FILE
+from app.services.rag_service import RAGService
+
+QUERY = "Battle of Marathon"
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """Fake LLM server on a free port; OpenAI clients created afterwards use it."""
+    handler = type("Handler", (FakeLLMHandler,), {"ttft": 0.0, "token_delay": 0.0})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    try:
+        yield
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def vector_store(tmp_path, monkeypatch):
+    """Local export whose first document is the fake embedding of QUERY."""
+    texts = [QUERY, "Battle of Salamis", "Treaty of Westphalia"]
+    vectors = np.array([_fake_embedding(t, DEFAULT_DIMENSIONS) for t in texts], dtype=np.float32)
+    codes, _ = quantize(vectors, "float16")
+    np.save(tmp_path / VECTORS_FILE, codes)
+    with open(tmp_path / ROWS_FILE, "w", encoding="utf-8") as f:
+        for i, text in enumerate(texts):
+            f.write(json.dumps({
+                "content_type": "event", "content_id": i + 1, "content_text": text,
+                "metadata": {"title": text, "date": "-490"},
+            }) + "\n")
+    with open(tmp_path / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump({"dim": DEFAULT_DIMENSIONS, "count": len(texts), "dtype": "float16"}, f)
+
+    store = LocalVectorStore(str(tmp_path))
+    monkeypatch.setattr(rag_module, "create_vector_store", lambda embedding_dimension: store)
+    monkeypatch.setattr(rag_module, "get_semantic_cache", lambda: None)
+    return store
+
+
+def read_events(response) -> list:
+    """SSE body → [(event, data), ...]"""
+    events = []
+    event = None
+    for line in response.iter_lines():
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            events.append((event, json.loads(line[len("data: "):])))
+    return events
+
+
+def assert_streamed(events: list, first: list, last: str) -> str:
+    """first events, then several tokens, then last + end; returns the joined tokens."""
+    names = [name for name, _ in events]
+    assert "error" not in names, events
+    assert names[:len(first)] == first
+    tokens = names[len(first):-2]
+    assert len(tokens) > 1 and set(tokens) == {"token"}
+    assert names[-2:] == [last, "end"]
+    return "".join(data["text"] for name, data in events if name == "token")
+
+
+def test_rag_stream_event_order(fake_llm, vector_store, monkeypatch):
+    monkeypatch.setattr(chat, "_rag_service", RAGService(api_key="sk-fake"))
+
+    with TestClient(app).stream("POST", "/api/v1/chat/rag/stream", json={"query": QUERY}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = read_events(response)
+
+    answer = assert_streamed(events, ["sources"], "done")
+    sources = events[0][1]["sources"]
+    assert sources[0]["id"] == 1 and sources[0]["similarity"] > 0.99
+    assert answer == FAKE_ANSWER
+    assert events[-2][1]["answer"] == FAKE_ANSWER
+
+
+def test_agent_stream_event_order(fake_llm, vector_store):
+    with TestClient(app).stream(
+        "POST", "/api/v1/chat/agent/stream", json={"query": QUERY, "api_key": "sk-fake"}
+    ) as response:
+        assert response.status_code == 200
+        events = read_events(response)
+
+    answer = assert_streamed(events, ["analysis", "sources"], "response")
+    assert events[0][1]["intent"] == "overview"
+    assert events[1][1]["sources"]
+    # Tokens are the decoded "answer" field, not the raw JSON
+    assert answer == FAKE_ANSWER
+    assert events[-2][1]["answer"] == FAKE_ANSWER
+
+
+def test_agent_stream_requires_api_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    response = TestClient(app).post("/api/v1/chat/agent/stream", json={"query": QUERY})
+    assert response.status_code == 401
+
+
+# ============ JSONFieldStreamer ============
+
+ANSWER = 'Line "one"\nCafé é \U0001F600 back\\slash / tab\tend'
+PAYLOAD = json.dumps({"intent": "overview", "answer": ANSWER, "structured_data": {"answer": "x"}})
+
+
+def stream_field(payload: str, size: int, field: str = "answer") -> str:
+    streamer = JSONFieldStreamer(field)
+    return "".join(streamer.feed(payload[i:i + size]) for i in range(0, len(payload), size))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 13, len(PAYLOAD)])
+def test_json_field_streamer_chunk_boundaries(size):
+    # Splits land inside the key, around the colon, inside escapes (\n, \", \\)
+    # and inside \uXXXX / surrogate-pair sequences
+    assert stream_field(PAYLOAD, size) == ANSWER
+
+
+def test_json_field_streamer_ascii_escapes():
+    payload = json.dumps({"answer": ANSWER}, ensure_ascii=True)
+    assert "\\ud83d\\ude00" in payload
+    for size in range(1, 14):
+        assert stream_field(payload, size) == ANSWER
+
+
+def test_json_field_streamer_emits_incrementally():
+    streamer = JSONFieldStreamer("answer")
+    assert streamer.feed('{"ans') == ""
+    assert streamer.feed('wer" : "Hel') == "Hel"
+    assert streamer.feed('lo\\') == "lo"
+    assert streamer.feed('n wor') == "\n wor"
+    assert streamer.feed('ld", "answer": "again"}') == "ld"
+    assert streamer.feed('more') == ""
+
+
+def test_json_field_streamer_non_string_value():
+    assert stream_field('{"answer": null, "other": "x"}', 4) == ""
@@ -0,0 +1,66 @@
+"""
+Smoke test: export_embeddings.main() against a throwaway schema, then load
+the export with LocalVectorStore.
+"""
+import uuid
+
+import numpy as np
+import psycopg2
+import pytest
+from psycopg2.extensions import make_dsn
+
+from app.config import get_settings
+from app.scripts import export_embeddings
+from app.services.embeddings import VectorStore, LocalVectorStore
+
+DIM = 8
+
+
+@pytest.fixture
+def export_dsn(engine):
+    """DSN whose search_path points at a fresh schema with the embeddings table."""
+    base = get_settings().database_url
+    schema = f"test_export_{uuid.uuid4().hex[:8]}"
+
+    conn = psycopg2.connect(base)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            try:
+                cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            except psycopg2.Error as e:
+                pytest.skip(f"pgvector not available: {e}")
+            cur.execute(f"CREATE SCHEMA {schema}")
+
+        dsn = make_dsn(base, options=f"-csearch_path={schema},public")
+        yield dsn
+    finally:
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        conn.close()
+
+
+def test_export_roundtrip(export_dsn, tmp_path, monkeypatch):
+    store = VectorStore(export_dsn, embedding_dimension=DIM, index_type="none")
+    store.initialize()
+
+    vectors = np.random.default_rng(0).normal(size=(20, DIM)).astype(np.float32)
+    for i, vector in enumerate(vectors):
+        store.upsert_embedding(
+            "event", i + 1, vector.tolist(), f"event {i + 1}",
+            {"category": "battle", "date_start": -50 + i}
+        )
+
+    out = tmp_path / "vector_index"
+    monkeypatch.setenv("DATABASE_URL", export_dsn)
+    monkeypatch.setattr("sys.argv", ["export_embeddings", "--out", str(out), "--nlist", "2"])
+
+    assert export_embeddings.main() == 0
+
+    local = LocalVectorStore(str(out))
+    assert local.get_stats()["total"] == 20
+    assert local.get_stats()["ivf_lists"] == 2
+
+    results = local.search_similar(vectors[3].tolist(), limit=1)
+    assert results[0]["content_id"] == 4
+    assert results[0]["similarity"] > 0.99
@@ -0,0 +1,104 @@
+"""
+Recall of the local vector store (IVF index, float16 / int8 storage)
+against exact float32 cosine search on a synthetic export. numpy only.
+"""
+import json
+
+import numpy as np
+import pytest
+
+from app.services.embeddings import LocalVectorStore, ReadOnlyStoreError
+from app.services.embeddings.local_store import (
+    quantize, MANIFEST_FILE, VECTORS_FILE, SCALES_FILE, ROWS_FILE
+)
+
+DIM = 32
+ROWS = 8000   # above EXACT_MAX_ROWS so unfiltered searches use the IVF index
+CLUSTERS = 40
+QUERIES = 50
+K = 10
+
+
+def synthetic_vectors(seed: int = 0) -> np.ndarray:
+    """Clustered data (like real embeddings), L2-normalized."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(CLUSTERS, DIM))
+    data = centers[rng.integers(CLUSTERS, size=ROWS)] + 0.35 * rng.normal(size=(ROWS, DIM))
+    return (data / np.linalg.norm(data, axis=1, keepdims=True)).astype(np.float32)
+
+
+def write_export(path, vectors: np.ndarray, dtype: str, nlist: int = 64) -> None:
+    path.mkdir()
+    codes, scales = quantize(vectors, dtype)
+    np.save(path / VECTORS_FILE, codes)
+    if scales is not None:
+        np.save(path / SCALES_FILE, scales)
+    with open(path / ROWS_FILE, "w", encoding="utf-8") as f:
+        for i in range(len(vectors)):
+            f.write(json.dumps({"content_type": "event", "content_id": i}) + "\n")
+    with open(path / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump({"dim": DIM, "count": len(vectors), "dtype": dtype}, f)
+    LocalVectorStore.build_ivf_index(str(path), nlist=nlist)
+
+
+@pytest.fixture(scope="module")
+def data():
+    vectors = synthetic_vectors()
+    rng = np.random.default_rng(1)
+    queries = vectors[rng.choice(ROWS, size=QUERIES, replace=False)] + 0.2 * rng.normal(size=(QUERIES, DIM))
+    queries = (queries / np.linalg.norm(queries, axis=1, keepdims=True)).astype(np.float32)
+    truth = [set(np.argsort(-(vectors @ q))[:K].tolist()) for q in queries]
+    return vectors, queries, truth
+
+
+@pytest.fixture(scope="module")
+def stores(data, tmp_path_factory):
+    vectors = data[0]
+    root = tmp_path_factory.mktemp("vector_index")
+    result = {}
+    for dtype in ("float16", "int8"):
+        write_export(root / dtype, vectors, dtype)
+        result[dtype] = LocalVectorStore(str(root / dtype))
+    return result
+
+
+def recall_at_k(store: LocalVectorStore, queries, truth, **kwargs) -> float:
+    hits = 0
+    for query, expected in zip(queries, truth):
+        results = store.search_similar(query.tolist(), limit=K, min_similarity=-1.0, **kwargs)
+        hits += len({r["content_id"] for r in results} & expected)
+    return hits / (len(queries) * K)
+
+
+@pytest.mark.parametrize("dtype, min_recall", [("float16", 0.99), ("int8", 0.95)])
+def test_exact_scan_recall(stores, data, dtype, min_recall):
+    _, queries, truth = data
+    store = stores[dtype]
+    # Every list probed = every row scored: only quantization error remains
+    recall = recall_at_k(store, queries, truth, ef_search=len(store._centroids))
+    assert store.last_plan["strategy"] == "ivf"
+    assert recall >= min_recall
+
+
+@pytest.mark.parametrize("dtype", ["float16", "int8"])
+def test_ivf_recall(stores, data, dtype):
+    _, queries, truth = data
+    store = stores[dtype]
+    recall = recall_at_k(store, queries, truth)
+    assert store.last_plan["strategy"] == "ivf"
+    assert store.last_plan["scanned"] < ROWS
+    assert recall >= 0.9
+
+
+def test_more_probes_do_not_lower_recall(stores, data):
+    _, queries, truth = data
+    store = stores["float16"]
+    recalls = [recall_at_k(store, queries, truth, ef_search=n) for n in (1, 4, 16)]
+    assert recalls == sorted(recalls)
+
+
+def test_writes_raise_read_only_error(stores):
+    with pytest.raises(ReadOnlyStoreError):
+        stores["float16"].upsert_embedding("event", 1, [0.0] * DIM)
+    with pytest.raises(ReadOnlyStoreError):
+        stores["float16"].clear_all()
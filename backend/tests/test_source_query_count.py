@@ -0,0 +1,206 @@
+"""
+Query-count regression tests for source attribution.
+
+get_person_sources, explore.get_entity_sources and LaplaceExplainer source
+lookup must issue a constant number of statements regardless of how many
+sources mention the entity (no per-source mention queries). LAPLACE also
+keeps curated event_sources / person_sources attribution.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from app.api.v1_new import explore
+from app.core.laplace.explain import LaplaceExplainer
+from app.core.sheba.observer import Observation
+from app.services import source_service
+
+# Entity ids far outside real data (text_mentions.entity_id has no FK)
+PERSON_ID = 2_000_000_001
+EVENT_ID = 2_000_000_002
+
+SOURCE_COUNTS = [1, 5, 20]
+MENTIONS_PER_SOURCE = 4
+
+
+def seed_mentions(db, entity_type: str, entity_id: int, source_count: int) -> None:
+    for i in range(source_count):
+        source_id = db.execute(text("""
+            INSERT INTO sources (name, type, created_at, updated_at)
+            VALUES (:name, 'primary', NOW(), NOW())
+            RETURNING id
+        """), {"name": f"query-count test source {i}"}).scalar()
+        for j in range(MENTIONS_PER_SOURCE):
+            db.execute(text("""
+                INSERT INTO text_mentions
+                    (entity_type, entity_id, source_id, mention_text, context_text, confidence)
+                VALUES (:entity_type, :entity_id, :source_id, 'mention', 'context', :confidence)
+            """), {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "source_id": source_id,
+                "confidence": 1.0 - j * 0.1,
+            })
+    db.flush()
+
+
+def count_for_each_size(db, count_queries, entity_type, entity_id, call):
+    """Run call() after seeding each source count; return statement counts and results."""
+    counts, results = [], []
+    seeded = 0
+    for source_count in SOURCE_COUNTS:
+        seed_mentions(db, entity_type, entity_id, source_count - seeded)
+        seeded = source_count
+        with count_queries() as counter:
+            results.append(call())
+        counts.append(counter.count)
+    return counts, results
+
+
+def test_get_person_sources_constant_queries(db, count_queries):
+    counts, results = count_for_each_size(
+        db, count_queries, "person", PERSON_ID,
+        lambda: source_service.get_person_sources(db, PERSON_ID, limit=50, max_contexts=3),
+    )
+
+    assert [total for _, total in results] == SOURCE_COUNTS
+    assert all(len(source["mentions"]) == 3 for source in results[-1][0])
+    assert len(set(counts)) == 1, counts
+    assert counts[0] == 1
+
+
+def test_get_entity_sources_constant_queries(db, count_queries):
+    counts, results = count_for_each_size(
+        db, count_queries, "person", PERSON_ID,
+        lambda: asyncio.run(explore.get_entity_sources("person", PERSON_ID, limit=50, db=db)),
+    )
+
+    assert [len(result["sources"]) for result in results] == SOURCE_COUNTS
+    assert len(set(counts)) == 1, counts
+    assert counts[0] == 1
+
+
+def test_laplace_find_sources_constant_queries(db, count_queries):
+    explainer = LaplaceExplainer(db)
+    observation = Observation(
+        query="test",
+        interpretation="test",
+        related_events=[SimpleNamespace(id=EVENT_ID)],
+        related_persons=[SimpleNamespace(id=PERSON_ID)],
+    )
+
+    def find_sources():
+        return asyncio.run(explainer._find_sources(observation))
+
+    seed_mentions(db, "event", EVENT_ID, 3)
+    counts, results = count_for_each_size(db, count_queries, "person", PERSON_ID, find_sources)
+
+    assert all(any(source.excerpt == "context" for source in result) for result in results)
+    assert len(set(counts)) == 1, counts
+    # Curated + mention queries, batched per entity type (events, persons)
+    assert counts[0] == 4
+
+
+def insert_source(db, name: str, reliability: int = 3) -> int:
+    return db.execute(text("""
+        INSERT INTO sources (name, type, reliability, created_at, updated_at)
+        VALUES (:name, 'primary', :reliability, NOW(), NOW())
+        RETURNING id
+    """), {"name": name, "reliability": reliability}).scalar()
+
+
+def test_laplace_find_sources_keeps_curated_sources(db, count_queries):
+    event_id = db.execute(text("""
+        INSERT INTO events (title, slug, date_start, created_at, updated_at)
+        VALUES ('curated test event', 'curated-test-event-qc', -490, NOW(), NOW())
+        RETURNING id
+    """)).scalar()
+    person_id = db.execute(text("""
+        INSERT INTO persons (name, slug, created_at, updated_at)
+        VALUES ('curated test person', 'curated-test-person-qc', NOW(), NOW())
+        RETURNING id
+    """)).scalar()
+
+    herodotus = insert_source(db, "curated event source", reliability=5)
+    plutarch = insert_source(db, "curated person source")
+    db.execute(text("""
+        INSERT INTO event_sources (event_id, source_id, quote)
+        VALUES (:event_id, :source_id, 'curated quote')
+    """), {"event_id": event_id, "source_id": herodotus})
+    db.execute(text("""
+        INSERT INTO person_sources (person_id, source_id)
+        VALUES (:person_id, :source_id)
+    """), {"person_id": person_id, "source_id": plutarch})
+    # The person's curated source is also mentioned, plus one mention-only source
+    seed_mentions(db, "person", person_id, 1)
+    mention_only = db.execute(text("SELECT MAX(id) FROM sources")).scalar()
+    db.execute(text("""
+        INSERT INTO text_mentions
+            (entity_type, entity_id, source_id, mention_text, context_text, confidence)
+        VALUES ('person', :person_id, :source_id, 'mention', 'person context', 0.9)
+    """), {"person_id": person_id, "source_id": plutarch})
+    db.flush()
+
+    observation = Observation(
+        query="test",
+        interpretation="test",
+        related_events=[SimpleNamespace(id=event_id)],
+        related_persons=[SimpleNamespace(id=person_id)],
+    )
+    with count_queries() as counter:
+        sources = LaplaceExplainer(db).find_sources(observation)
+
+    assert counter.count == 4
+    by_id = {source.source.id: source for source in sources}
+    assert len(by_id) == len(sources) == 3
+    # Event without text mentions: curated source, not the generic defaults
+    assert by_id[herodotus].excerpt == "curated quote"
+    assert by_id[herodotus].relevance == 0.8
+    # Curated + mentioned source listed once, with the mention excerpt
+    assert by_id[plutarch].excerpt == "person context"
+    assert by_id[mention_only].excerpt == "context"
+    assert [source.source.id for source in sources] == [herodotus, plutarch, mention_only]
+
+
+def test_curated_sources_batch_is_one_query(db, count_queries):
+    source_id = insert_source(db, "curated batch source")
+    event_ids = [
+        db.execute(text("""
+            INSERT INTO events (title, slug, date_start, created_at, updated_at)
+            VALUES (:title, :title, 0, NOW(), NOW())
+            RETURNING id
+        """), {"title": f"curated-batch-{i}"}).scalar()
+        for i in range(3)
+    ]
+    for event_id in event_ids[:2]:
+        db.execute(text("""
+            INSERT INTO event_sources (event_id, source_id) VALUES (:event_id, :source_id)
+        """), {"event_id": event_id, "source_id": source_id})
+    db.flush()
+
+    with count_queries() as counter:
+        by_entity = source_service.get_curated_sources(db, "event", event_ids)
+
+    assert counter.count == 1
+    assert set(by_entity) == set(event_ids[:2])
+    assert all(sources[0]["id"] == source_id for sources in by_entity.values())
+
+
+@pytest.mark.parametrize("max_mentions", [0, 2])
+def test_top_mentions_batch_is_one_query(db, count_queries, max_mentions):
+    seed_mentions(db, "person", PERSON_ID, 5)
+    seed_mentions(db, "person", PERSON_ID + 10, 5)
+
+    with count_queries() as counter:
+        by_entity = source_service.get_top_mentions_by_source(
+            db, "person", [PERSON_ID, PERSON_ID + 10], source_limit=3, max_mentions=max_mentions
+        )
+
+    assert counter.count == 1
+    assert set(by_entity) == {PERSON_ID, PERSON_ID + 10}
+    for entry in by_entity.values():
+        assert entry["total"] == 5
+        assert len(entry["sources"]) == 3
+        assert all(len(source["mentions"]) == max_mentions for source in entry["sources"])
@@ -16,12 +16,17 @@ Sources:
 """
 import httpx
 import asyncio
+import sys
 from pathlib import Path
 import json
 from typing import Optional
 from dataclasses import dataclass
 import re
 
+# Shared Wikidata response cache (poc/app/core/wikidata_cache.py)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "poc" / "app" / "core"))
+from wikidata_cache import get_wikidata_cache
+
 
 @dataclass
 class ResolvedLocation:
@@ -179,15 +184,19 @@ class GeoResolver:
         LIMIT 1
         """
 
+        params = {"query": sparql, "format": "json"}
+        cache = get_wikidata_cache()
+
         try:
-            response = await self.client.get(
-                self.WIKIDATA_ENDPOINT,
-                params={"query": sparql, "format": "json"}
-            )
-            response.raise_for_status()
-            data = response.json()
+            entry = cache.lookup(self.WIKIDATA_ENDPOINT, params)
+            if entry is not None:
+                bindings = entry.value
+            else:
+                response = await self.client.get(self.WIKIDATA_ENDPOINT, params=params)
+                response.raise_for_status()
+                bindings = response.json().get("results", {}).get("bindings", [])
+                cache.store(self.WIKIDATA_ENDPOINT, params, bindings)
 
-            bindings = data.get("results", {}).get("bindings", [])
             if bindings:
                 binding = bindings[0]
                 coord_str = binding.get("coord", {}).get("value", "")
@@ -2,15 +2,17 @@
 Archivist PoC - Entity Matching and Disambiguation
 Uses Qwen3:8B to decide: CREATE_NEW / LINK_EXISTING / PENDING
 """
+import heapq
 import json
 import re
 import httpx
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 
 from app.config import settings
+from app.core.name_dictionary import normalize_name, base_name, strip_ordinal_epithet
 
 
 class Decision(str, Enum):
@@ -73,6 +75,27 @@ class ArchivistStats:
     avg_candidates_per_decision: float = 0.0
 
 
+# 후보 검색: 이름 유사도 (_name_similarity) 가 이 값을 넘으면 후보
+NAME_SIMILARITY_THRESHOLD = 0.5
+# 베이스 이름 포함 검색용 문자 n-gram 길이
+NAME_NGRAM = 3
+# 문자 Jaccard prefix filter 의 전역 문자 순서: 드문 문자부터 (영어 빈도 역순).
+# 표에 없는 문자 (숫자, 발음 기호, 다른 문자 체계) 는 가장 드문 것으로 취급
+_CHAR_RANK = {c: i for i, c in enumerate("zqxjkvbpygfwmucldrhsnioate")}
+
+
+def _char_order(c: str) -> Tuple[int, str]:
+    return _CHAR_RANK.get(c, -1), c
+
+
+def _similarity_prefix(chars: Set[str]) -> List[str]:
+    """
+    Jaccard > 0.5 인 두 문자 집합은 각자 가장 드문 ceil(n/2) 개 문자 중
+    하나를 반드시 공유 (prefix filtering) → 이 문자들로만 색인/조회.
+    """
+    return sorted(chars, key=_char_order)[:(len(chars) + 1) // 2]
+
+
 class EntityRegistry:
     """In-memory entity registry for PoC."""
 
@@ -80,26 +103,45 @@ class EntityRegistry:
         self.entities: Dict[int, EntityRecord] = {}
         self.next_id = 1
         # 빠른 검색을 위한 인덱스
-        self._name_index: Dict[str, List[int]] = {}  # normalized_name -> [entity_ids]
+        self._name_index: Dict[str, List[int]] = {}  # normalize_name(name) -> [entity_ids]
         self._type_index: Dict[str, List[int]] = {}  # type -> [entity_ids]
+        # 후보 검색 인덱스 (find_candidates 가 전체 이름/엔티티를 훑지 않도록)
+        self._key_rank: Dict[str, int] = {}  # 이름 키 -> _name_index 등록 순서
+        self._max_key_len = 0
+        self._gram_index: Dict[str, Set[str]] = {}  # 이름 키의 n-gram -> {이름 키}
+        self._char_sets: Dict[int, frozenset] = {}  # entity_id -> 이름 문자 집합
+        # type -> prefix 문자 -> [_type_index 안 위치] (오름차순)
+        self._char_index: Dict[str, Dict[str, List[int]]] = {}
 
     def add(self, entity: EntityRecord) -> EntityRecord:
         """Add entity to registry."""
         entity.id = self.next_id
         self.next_id += 1
         self.entities[entity.id] = entity
+        self._index_entity(entity)
+        return entity
 
-        # Update indexes
-        norm_name = entity.normalized.lower()
+    def _index_entity(self, entity: EntityRecord) -> None:
+        """Update indexes (also used when restoring a registry from a checkpoint)."""
+        norm_name = normalize_name(entity.normalized)
         if norm_name not in self._name_index:
             self._name_index[norm_name] = []
+            self._key_rank[norm_name] = len(self._key_rank)
+            self._max_key_len = max(self._max_key_len, len(norm_name))
+            for i in range(len(norm_name) - NAME_NGRAM + 1):
+                self._gram_index.setdefault(norm_name[i:i + NAME_NGRAM], set()).add(norm_name)
         self._name_index[norm_name].append(entity.id)
 
         if entity.entity_type not in self._type_index:
             self._type_index[entity.entity_type] = []
+        rank = len(self._type_index[entity.entity_type])
         self._type_index[entity.entity_type].append(entity.id)
 
-        return entity
+        chars = frozenset(entity.normalized.lower().replace(" ", ""))
+        self._char_sets[entity.id] = chars
+        char_index = self._char_index.setdefault(entity.entity_type, {})
+        for c in _similarity_prefix(chars):
+            char_index.setdefault(c, []).append(rank)
 
     def find_candidates(
         self,
@@ -107,48 +149,100 @@ class EntityRegistry:
         entity_type: str,
         max_candidates: int = 10
     ) -> List[EntityRecord]:
-        """Find potential matching entities."""
+        """Find potential matching entities.
+
+        Order: exact name, base-name containment (registration order),
+        similar names of the same type (registration order). The indexes
+        only narrow the scan; results are the same as checking every entity.
+        """
+        if max_candidates <= 0:
+            return []
         candidates = []
+        seen: Set[int] = set()
         text_lower = text.lower()
-        text_base = self._extract_base_name(text_lower)
+        text_key = normalize_name(text)  # 대소문자/발음 기호/서수 표기 통일
+        text_base = base_name(text)
+
+        def take(eids) -> bool:
+            for eid in eids:
+                if eid not in seen:
+                    seen.add(eid)
+                    candidates.append(self.entities[eid])
+                    if len(candidates) >= max_candidates:
+                        return True
+            return False
 
         # 1. 정확히 일치하는 이름
-        if text_lower in self._name_index:
-            for eid in self._name_index[text_lower]:
-                candidates.append(self.entities[eid])
+        if take(self._name_index.get(text_key, ())):
+            return candidates
 
         # 2. 베이스 이름이 일치하는 경우 (Louis XIV -> Louis)
-        for norm_name, eids in self._name_index.items():
-            if norm_name == text_lower:
-                continue
-            if text_base in norm_name or norm_name in text_base:
-                for eid in eids:
-                    if self.entities[eid] not in candidates:
-                        candidates.append(self.entities[eid])
+        for norm_name in self._containment_keys(text_base, text_key):
+            if take(self._name_index[norm_name]):
+                return candidates
 
         # 3. 같은 타입의 유사한 이름
-        if entity_type in self._type_index:
-            for eid in self._type_index[entity_type]:
-                entity = self.entities[eid]
-                if entity not in candidates:
-                    similarity = self._name_similarity(text_lower, entity.normalized.lower())
-                    if similarity > 0.5:
-                        candidates.append(entity)
-
-        return candidates[:max_candidates]
+        query = frozenset(text_lower.replace(" ", ""))
+        char_index = self._char_index.get(entity_type)
+        if not query or not char_index:
+            return candidates
+
+        # prefix 문자를 공유하는 엔티티만, 등록 순서대로 합쳐 가며 필요한 만큼만 확인
+        # + 크기 필터 (Jaccard ≤ 작은 쪽 / 큰 쪽)
+        type_ids = self._type_index[entity_type]
+        postings = [char_index[c] for c in _similarity_prefix(query) if c in char_index]
+        low, high = len(query) / 2, len(query) * 2
+        last = -1
+        for rank in heapq.merge(*postings):
+            if rank == last:
+                continue
+            last = rank
+            eid = type_ids[rank]
+            if eid in seen:
+                continue
+            chars = self._char_sets[eid]
+            if not low < len(chars) < high:
+                continue
+            if len(query & chars) / len(query | chars) > NAME_SIMILARITY_THRESHOLD:
+                if take((eid,)):
+                    break
+
+        return candidates
+
+    def _containment_keys(self, text_base: str, text_key: str) -> List[str]:
+        """text_base 를 포함하거나 text_base 에 포함되는 이름 키 (등록 순서)"""
+        index = self._name_index
+        keys = set()
+
+        # 키 ⊂ text_base: text_base 의 부분 문자열을 직접 조회
+        if "" in index:
+            keys.add("")
+        n = len(text_base)
+        for i in range(n):
+            for j in range(i + 1, min(n, i + self._max_key_len) + 1):
+                if text_base[i:j] in index:
+                    keys.add(text_base[i:j])
+
+        # text_base ⊂ 키: n-gram 목록이 가장 짧은 것만 확인
+        if n < NAME_NGRAM:
+            keys.update(k for k in index if text_base in k)  # 아주 짧은 이름은 전체 확인
+        else:
+            postings = []
+            for i in range(n - NAME_NGRAM + 1):
+                posting = self._gram_index.get(text_base[i:i + NAME_NGRAM])
+                if not posting:
+                    postings = []
+                    break
+                postings.append(posting)
+            if postings:
+                keys.update(k for k in min(postings, key=len) if text_base in k)
+
+        keys.discard(text_key)
+        return sorted(keys, key=self._key_rank.__getitem__)
 
     def _extract_base_name(self, name: str) -> str:
         """Extract base name without ordinals."""
-        # Remove Roman numerals and ordinals
-        patterns = [
-            r'\s+(i{1,3}|iv|v|vi{0,3}|ix|x{0,3})$',  # Roman numerals
-            r'\s+\d+(st|nd|rd|th)?$',  # Arabic ordinals
-            r'\s+the\s+(great|elder|younger)$',  # Titles
-        ]
-        result = name
-        for pattern in patterns:
-            result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-        return result.strip()
+        return strip_ordinal_epithet(name)
 
     def _name_similarity(self, name1: str, name2: str) -> float:
         """Simple name similarity (Jaccard on characters)."""
@@ -273,16 +367,17 @@ class Archivist:
         """Fast rule-based decision without LLM.
 
         Rules:
-        1. Exact name match (case-insensitive) -> LINK_EXISTING
+        1. Exact name match (normalize_name) -> LINK_EXISTING
         2. Single candidate with high similarity (>0.8) -> LINK_EXISTING
         3. Multiple similar candidates -> PENDING
         4. Low similarity candidates -> CREATE_NEW
         """
         text_lower = text.lower().strip()
+        text_key = normalize_name(text)
 
         # Rule 1: Exact match
         for c in candidates:
-            if c.normalized.lower().strip() == text_lower:
+            if normalize_name(c.normalized) == text_key:
                 return ArchivistDecision(
                     decision=Decision.LINK_EXISTING,
                     confidence=0.95,
@@ -293,7 +388,7 @@ class Archivist:
                 )
             # Also check aliases
             for alias in c.aliases:
-                if alias.lower().strip() == text_lower:
+                if normalize_name(alias) == text_key:
                     return ArchivistDecision(
                         decision=Decision.LINK_EXISTING,
                         confidence=0.90,
@@ -7,11 +7,15 @@ Checkpoint System for Archivist V4
 - EntityRegistry: Entity 중복 제거용 레지스트리 (mentions 미저장)
 - MentionStore: Mention 별도 저장 (JSONL, append-only)
 
+EntityRegistry.find_similar: 타입별 인덱스 (정규화 이름 / 토큰 / 3-gram)
+로 후보만 확인 (전체 _entities 순회 X). 점수와 순서는 이전과 동일.
+
 V4 변경사항:
 - mentions를 EntityRegistry에서 분리 → MentionStore로 이동
 - checkpoint 파일 크기 대폭 감소 (811MB → ~5MB)
 - mentions.jsonl은 append-only로 빠른 저장
 """
+import heapq
 import json
 import os
 from pathlib import Path
@@ -24,6 +28,9 @@ import hashlib
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
+# find_similar 의 부분 문자열 인덱스 n-gram 길이 (이보다 짧은 검색어는 이름 전체 확인)
+SUBSTRING_GRAM = 3
+
 
 @dataclass
 class Phase1Status:
@@ -358,6 +365,13 @@ class EntityRegistry:
     Entity registry - 중복 제거 및 카운트 관리
 
     V4 변경: mentions를 저장하지 않음 (MentionStore로 분리)
+
+    find_similar 인덱스 (entity_type 별, add_mention / load_from_data 에서 갱신):
+    - _norm_index: normalized -> keys (완전 일치 1.0 + 이름이 검색어에 포함 0.8)
+    - _gram_index: 3-gram -> keys (검색어가 이름에 포함 0.8, 확인 후 채택)
+    - _token_index: 공백 토큰 -> keys (토큰 공유 0.5)
+    - _token_order: 토큰별 keys 를 mention_count 순으로 정렬한 캐시. registry 가
+      바뀌면 (_version) 다시 정렬 - Phase 2 처럼 registry 가 고정이면 계속 재사용
     """
 
     def __init__(self, mention_store: MentionStore = None):
@@ -366,6 +380,15 @@ class EntityRegistry:
         self._lock = threading.Lock()
         self._mention_store = mention_store
 
+        # Similarity indexes (posting list 는 등록 순서)
+        self._rank: Dict[str, int] = {}
+        self._norm_index: Dict[str, Dict[str, List[str]]] = {}
+        self._token_index: Dict[str, Dict[str, List[str]]] = {}
+        self._gram_index: Dict[str, Dict[str, List[str]]] = {}
+        self._max_norm_len: Dict[str, int] = {}
+        self._token_order: Dict[Tuple[str, str], Tuple[int, List[str]]] = {}
+        self._version = 0
+
     @staticmethod
     def normalize(text: str) -> str:
         """Normalize entity text for matching"""
@@ -396,6 +419,7 @@ class EntityRegistry:
         """
         with self._lock:
             key = self.entity_key(text, entity_type)
+            self._version += 1
 
             # Write mention to MentionStore (if provided)
             if self._mention_store:
@@ -428,8 +452,47 @@ class EntityRegistry:
                     "mention_count": 1,
                     "first_seen": datetime.now().isoformat()
                 }
+                self._index_entity(key, self._entities[key])
                 return (True, key)
 
+    def _index_entity(self, key: str, entity: Dict):
+        """find_similar 인덱스에 추가 (lock 안에서 호출)"""
+        entity_type = entity["entity_type"]
+        norm = entity["normalized"]
+        self._rank[key] = len(self._rank)
+
+        self._norm_index.setdefault(entity_type, {}).setdefault(norm, []).append(key)
+        tokens = self._token_index.setdefault(entity_type, {})
+        for token in set(norm.split()):
+            tokens.setdefault(token, []).append(key)
+        grams = self._gram_index.setdefault(entity_type, {})
+        for gram in {norm[i:i + SUBSTRING_GRAM] for i in range(len(norm) - SUBSTRING_GRAM + 1)}:
+            grams.setdefault(gram, []).append(key)
+        if len(norm) > self._max_norm_len.get(entity_type, 0):
+            self._max_norm_len[entity_type] = len(norm)
+
+    def _keys_by_count(self, entity_type: str, token: str) -> List[str]:
+        """토큰을 가진 keys, mention_count 많은 순 → 등록 순 (lock 안에서 호출)"""
+        cached = self._token_order.get((entity_type, token))
+        if cached and cached[0] == self._version:
+            return cached[1]
+        keys = self._token_index[entity_type].get(token)
+        if not keys:
+            return []
+        entities, rank = self._entities, self._rank
+        ordered = sorted(keys, key=lambda k: (-entities[k]["mention_count"], rank[k]))
+        self._token_order[(entity_type, token)] = (self._version, ordered)
+        return ordered
+
+    def _clear_index(self):
+        self._version += 1
+        self._token_order.clear()
+        self._rank.clear()
+        self._norm_index.clear()
+        self._token_index.clear()
+        self._gram_index.clear()
+        self._max_norm_len.clear()
+
     def get_unique_count(self) -> int:
         """Get count of unique entities"""
         return len(self._entities)
@@ -462,43 +525,91 @@ class EntityRegistry:
                     "first_seen": entity.get("first_seen", datetime.now().isoformat())
                 }
 
+            # 중복 key 는 마지막 값이 남으므로 다 읽은 뒤 한 번에 인덱싱
+            self._clear_index()
+            for key, entity in self._entities.items():
+                self._index_entity(key, entity)
+
     def get_entity(self, key: str) -> Optional[Dict]:
         """Get a specific entity by key"""
         return self._entities.get(key)
 
     def find_similar(self, text: str, entity_type: str, limit: int = 5) -> List[Dict]:
-        """Find similar entities by simple text matching"""
+        """
+        Find similar entities by simple text matching.
+
+        Similarity (높은 것 우선, 같으면 mention_count 많은 순 → 등록 순):
+        - 1.0: normalized 완전 일치
+        - 0.8: 한쪽이 다른 쪽의 부분 문자열
+        - 0.5: 공백 토큰 공유
+        인덱스로 해당 타입에서 조건에 걸리는 entity 만 확인. 0.5 는 흔한
+        토큰이면 많으므로 토큰별 정렬 목록을 합치면서 limit 개까지만 봄.
+        """
         normalized = self.normalize(text)
-        candidates = []
 
-        for key, entity in self._entities.items():
-            if entity["entity_type"] != entity_type:
-                continue
-
-            entity_norm = entity["normalized"]
-
-            # Calculate simple similarity
-            if normalized == entity_norm:
-                similarity = 1.0
-            elif normalized in entity_norm or entity_norm in normalized:
-                similarity = 0.8
-            elif len(set(normalized.split()) & set(entity_norm.split())) > 0:
-                similarity = 0.5
+        with self._lock:
+            norms = self._norm_index.get(entity_type)
+            if not norms:
+                return []
+            scores: Dict[str, float] = {}
+
+            # 0.8: 이름이 검색어에 포함 - 검색어의 부분 문자열 (최대 이름 길이까지) 조회
+            length = len(normalized)
+            max_len = self._max_norm_len.get(entity_type, 0)
+            for key in norms.get("", ()):
+                scores[key] = 0.8
+            for i in range(length):
+                for j in range(i + 1, min(length, i + max_len) + 1):
+                    for key in norms.get(normalized[i:j], ()):
+                        scores[key] = 0.8
+
+            # 0.8: 검색어가 이름에 포함 - 가장 짧은 3-gram posting list 에서 확인
+            if length >= SUBSTRING_GRAM:
+                grams = self._gram_index[entity_type]
+                postings = [grams.get(normalized[i:i + SUBSTRING_GRAM], ())
+                            for i in range(length - SUBSTRING_GRAM + 1)]
+                for key in min(postings, key=len):
+                    if normalized in self._entities[key]["normalized"]:
+                        scores[key] = 0.8
             else:
-                continue
-
-            candidates.append({
-                "key": key,
-                "text": entity["text"],
-                "normalized": entity_norm,
-                "entity_type": entity_type,
-                "similarity": similarity,
-                "mention_count": entity["mention_count"]
-            })
-
-        # Sort by similarity and mention count
-        candidates.sort(key=lambda x: (-x["similarity"], -x["mention_count"]))
-        return candidates[:limit]
+                for norm, keys in norms.items():
+                    if normalized in norm:
+                        for key in keys:
+                            scores[key] = 0.8
+
+            # 1.0: 완전 일치
+            for key in norms.get(normalized, ()):
+                scores[key] = 1.0
+
+            entities = self._entities
+            rank = self._rank
+            ranked = sorted(scores, key=lambda k: (-scores[k], -entities[k]["mention_count"], rank[k]))
+
+            # 0.5: token 공유 (위에서 limit 를 못 채웠을 때만)
+            if limit <= 0 or len(ranked) < limit:
+                shared = heapq.merge(
+                    *(self._keys_by_count(entity_type, token) for token in set(normalized.split())),
+                    key=lambda k: (-entities[k]["mention_count"], rank[k])
+                )
+                for key in shared:
+                    if key in scores:
+                        continue
+                    scores[key] = 0.5
+                    ranked.append(key)
+                    if len(ranked) == limit:
+                        break
+
+            return [
+                {
+                    "key": key,
+                    "text": entities[key]["text"],
+                    "normalized": entities[key]["normalized"],
+                    "entity_type": entity_type,
+                    "similarity": scores[key],
+                    "mention_count": entities[key]["mention_count"]
+                }
+                for key in ranked[:limit]
+            ]
 
 
 class PendingQueue:
@@ -0,0 +1,296 @@
+"""
+HTML Text - ZIM (Wikipedia / Wikisource) HTML → 구조화 텍스트 단일 패스 추출
+
+get_book_content_from_zim 의 re.sub 7단계 (책 전체를 매번 복사) 와 kiwix
+스크립트마다 복사된 html.parser 기반 HTMLTextExtractor / FullTextExtractor 를
+대체하는 공용 추출기.
+
+- 태그 정규식 하나로 한 번만 훑음 (script/style 본문은 닫는 태그로 바로 점프)
+- feed() 로 조각 단위 입력 가능 (태그/엔티티가 조각 경계에 걸려도 처리)
+- 블록 (문단/제목) 단위로 정리: 블록 사이는 빈 줄, <br> 은 줄바꿈,
+  그 외 공백은 하나로 (<pre> 는 그대로)
+- 제목/문단의 본문 내 offset 을 함께 반환 (챕터 탐지, 청크 분할용)
+
+stdlib 만 사용 (book_extractor 에서 경로만 추가해서 import).
+
+Usage:
+    from html_text import html_to_text, extract_text
+
+    text = html_to_text(html)                          # 문자열만
+    doc = extract_text(html, skip_tags=WIKIPEDIA_SKIP_TAGS)
+    for block in doc.headings:
+        print(block.level, doc.text[block.start:block.end])
+
+    doc = extract_text_stream(chunks)                  # bytes/str 조각
+"""
+import codecs
+import html
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Union
+
+# 본문 밖 요소 (내용 통째로 제외). <title> 은 본문 <h1> 과 중복
+DEFAULT_SKIP_TAGS = frozenset({'script', 'style', 'title', 'nav', 'header', 'footer', 'aside'})
+# Wikipedia 본문: 각주 번호 [1], 위/아래 첨자도 제외
+WIKIPEDIA_SKIP_TAGS = DEFAULT_SKIP_TAGS | {'sup', 'sub'}
+
+# 내용을 파싱하지 않는 태그 (닫는 태그까지 건너뜀)
+RAW_TEXT_TAGS = frozenset({'script', 'style', 'textarea', 'title'})
+
+HEADING_TAGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+BLOCK_TAGS = frozenset({
+    'p', 'div', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'tr', 'table', 'blockquote',
+    'section', 'article', 'main', 'figure', 'figcaption', 'caption', 'hr',
+    'body', 'center', 'poem',
+})
+CELL_TAGS = frozenset({'td', 'th'})
+
+# 구조 태그만 토큰으로 처리. 나머지 (a, b, span ...) 는 블록 정리 때 정규식
+# 한 번으로 제거 → 태그마다 Python 코드를 타지 않음
+_STRUCTURE_TAGS = (
+    set(HEADING_TAGS) | BLOCK_TAGS | CELL_TAGS | RAW_TEXT_TAGS | {'br', 'pre'}
+)
+_INLINE_TAG_RE = re.compile(r"<(?:/?[a-zA-Z][^>]*|[!?][^>]*)>")
+_tag_re_cache: Dict[FrozenSet[str], 're.Pattern'] = {}
+
+
+def _tag_re(skip_tags: FrozenSet[str]) -> 're.Pattern':
+    """구조 태그 + skip 태그 + 주석 패턴 (skip_tags 조합별 캐시)."""
+    skip_tags = frozenset(tag.lower() for tag in skip_tags)
+    pattern = _tag_re_cache.get(skip_tags)
+    if pattern is None:
+        # re.IGNORECASE 는 2배 가까이 느려서 [pP] 식 문자 클래스로 대소문자 처리
+        names = '|'.join(
+            ''.join(f'[{c}{c.upper()}]' if c.isalpha() else c for c in tag)
+            for tag in sorted(_STRUCTURE_TAGS | skip_tags, key=len, reverse=True)
+        )
+        pattern = re.compile(rf"<(?:(/?)({names})(?=[\s/>])([^>]*)>|!--.*?-->)", re.DOTALL)
+        _tag_re_cache[skip_tags] = pattern
+    return pattern
+
+
+_RAW_END_RE = {tag: re.compile(rf"</{tag}\s*>", re.IGNORECASE) for tag in RAW_TEXT_TAGS}
+
+# <br> 표시 (블록 정리 전까지 원문 공백/줄바꿈과 구분)
+_BR = '\x00'
+
+
+@dataclass
+class TextBlock:
+    """본문 내 블록 위치. level: 0 = 문단, 1-6 = 제목"""
+    level: int
+    start: int
+    end: int
+
+
+@dataclass
+class ExtractedText:
+    text: str
+    blocks: List[TextBlock] = field(default_factory=list)
+
+    @property
+    def headings(self) -> List[TextBlock]:
+        return [b for b in self.blocks if b.level]
+
+    @property
+    def paragraphs(self) -> List[TextBlock]:
+        return [b for b in self.blocks if not b.level]
+
+
+class HTMLTextExtractor:
+    """
+    스트리밍 HTML → 텍스트 추출기.
+
+        extractor = HTMLTextExtractor()
+        for chunk in chunks:
+            extractor.feed(chunk)
+        doc = extractor.close()
+    """
+
+    def __init__(self, skip_tags: Iterable[str] = DEFAULT_SKIP_TAGS):
+        self.skip_tags = frozenset(tag.lower() for tag in skip_tags)
+        self._tag_search = _tag_re(self.skip_tags).search
+        self._pending = ''          # 아직 처리 못 한 꼬리 (잘린 태그 등)
+        self._raw_end = None        # script/style 안: 닫는 태그 패턴
+        self._raw_skip = False      # 그 내용을 버리는지
+        self._skip_depth = 0
+        self._pre_depth = 0
+        self._heading = 0
+        self._parts: List[str] = []
+        self._out: List[str] = []
+        self._offset = 0
+        self.blocks: List[TextBlock] = []
+
+    # ─── 입력 ─────────────────────────────────────────────
+
+    def feed(self, data: str) -> None:
+        buf = self._pending + data if self._pending else data
+        self._pending = buf[self._consume(buf, final=False):]
+
+    def close(self) -> ExtractedText:
+        if self._pending:
+            self._consume(self._pending, final=True)
+            self._pending = ''
+        self._flush()
+        return ExtractedText(text=''.join(self._out), blocks=self.blocks)
+
+    # ─── 토큰 처리 ────────────────────────────────────────
+
+    def _consume(self, buf: str, final: bool) -> int:
+        """buf 를 가능한 데까지 처리하고 다음 시작 위치를 반환."""
+        pos = 0
+        end = len(buf)
+        parts = self._parts
+
+        while pos < end:
+            if self._raw_end is not None:
+                m = self._raw_end.search(buf, pos)
+                if m is None:
+                    if final:
+                        return end
+                    # 닫는 태그가 조각 경계에 걸릴 수 있으니 꼬리만 남김
+                    keep = max(pos, end - 16)
+                    if not self._raw_skip:
+                        parts.append(buf[pos:keep])
+                    return keep
+                if not self._raw_skip:
+                    parts.append(buf[pos:m.start()])
+                self._raw_end = None
+                pos = m.end()
+                continue
+
+            m = self._tag_search(buf, pos)
+            # 닫히지 않은 주석: 안쪽 태그를 건너뛰도록 주석 시작에서 멈춤
+            comment = buf.find('<!--', pos, m.start() if m else end)
+            if comment >= 0:
+                if not self._skip_depth:
+                    parts.append(buf[pos:comment])
+                return end if final else comment
+
+            if m is None:
+                cut = end
+                if not final:
+                    # 조각 끝에서 잘린 태그는 다음 feed 로
+                    lt = buf.rfind('<', pos)
+                    if lt >= 0 and buf.find('>', lt) < 0:
+                        cut = lt
+                if not self._skip_depth:
+                    parts.append(buf[pos:cut])
+                return cut
+
+            if not self._skip_depth and m.start() > pos:
+                parts.append(buf[pos:m.start()])
+            pos = m.end()
+            name = m.group(2)
+            if name is not None:
+                self._handle_tag(name.lower(), bool(m.group(1)), m.group(3).endswith('/'))
+        return end
+
+    def _handle_tag(self, tag: str, closing: bool, self_closing: bool) -> None:
+        if tag in self.skip_tags:
+            if tag in RAW_TEXT_TAGS:
+                if not closing and not self_closing:
+                    self._raw_end = _RAW_END_RE[tag]
+                    self._raw_skip = True
+            elif closing:
+                if self._skip_depth:
+                    self._skip_depth -= 1
+            elif not self_closing:
+                self._skip_depth += 1
+            return
+
+        if tag in RAW_TEXT_TAGS:
+            if not closing and not self_closing:
+                self._raw_end = _RAW_END_RE[tag]
+                self._raw_skip = False
+            return
+
+        if self._skip_depth:
+            return
+
+        if tag == 'br':
+            self._parts.append(_BR)
+        elif tag in HEADING_TAGS:
+            self._flush()
+            self._heading = 0 if closing else HEADING_TAGS[tag]
+        elif tag in BLOCK_TAGS:
+            self._flush()
+        elif tag in CELL_TAGS:
+            self._parts.append(' ')
+        elif tag == 'pre':
+            self._flush()
+            if closing:
+                self._pre_depth = max(0, self._pre_depth - 1)
+            elif not self_closing:
+                self._pre_depth += 1
+
+    # ─── 블록 정리 ────────────────────────────────────────
+
+    def _flush(self) -> None:
+        if not self._parts:
+            return
+        raw = ''.join(self._parts)
+        self._parts.clear()
+
+        if '<' in raw:
+            raw = _INLINE_TAG_RE.sub('', raw)
+        if '&' in raw:
+            raw = html.unescape(raw)
+        if self._pre_depth:
+            text = raw.replace(_BR, '\n').strip('\n')
+        elif _BR in raw:
+            lines = (' '.join(line.split()) for line in raw.split(_BR))
+            text = '\n'.join(line for line in lines if line)
+        else:
+            text = ' '.join(raw.split())
+        if not text or text.isspace():
+            return
+
+        if self._out:
+            self._out.append('\n\n')
+            self._offset += 2
+        self._out.append(text)
+        start = self._offset
+        self._offset += len(text)
+        self.blocks.append(TextBlock(level=self._heading, start=start, end=self._offset))
+
+
+def extract_text(html_text: str, skip_tags: Iterable[str] = DEFAULT_SKIP_TAGS) -> ExtractedText:
+    """HTML 문자열 → ExtractedText (본문 + 제목/문단 offset)."""
+    extractor = HTMLTextExtractor(skip_tags)
+    extractor.feed(html_text)
+    return extractor.close()
+
+
+def extract_text_stream(
+    chunks: Iterable[Union[str, bytes]],
+    skip_tags: Iterable[str] = DEFAULT_SKIP_TAGS,
+    encoding: str = 'utf-8',
+) -> ExtractedText:
+    """
+    조각 단위 입력 (str 또는 bytes). bytes 는 점진 디코딩
+    (조각 경계에서 잘린 멀티바이트 문자도 처리).
+    """
+    extractor = HTMLTextExtractor(skip_tags)
+    decoder: Optional[codecs.IncrementalDecoder] = None
+    for chunk in chunks:
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            chunk = decoder.decode(chunk)
+        extractor.feed(chunk)
+    if decoder is not None:
+        extractor.feed(decoder.decode(b'', final=True))
+    return extractor.close()
+
+
+def iter_chunks(data: Union[bytes, memoryview], size: int = 1 << 20) -> Iterable[memoryview]:
+    """큰 bytes (ZIM item.content 등) 를 복사 없이 조각으로."""
+    view = memoryview(data)
+    for i in range(0, len(view), size):
+        yield view[i:i + size]
+
+
+def html_to_text(html_text: str, skip_tags: Iterable[str] = DEFAULT_SKIP_TAGS) -> str:
+    """HTML → 텍스트 (블록 사이 빈 줄)."""
+    return extract_text(html_text, skip_tags).text
@@ -0,0 +1,373 @@
+"""
+Name Dictionary - 정규화된 이름/별칭 사전 (in-memory)
+
+엔티티 이름 (persons.name, locations.name, events.title) 과 entity_aliases 를
+정규화 키로 모아서, exact / alias 매칭을 DB 왕복 없이 처리.
+
+정규화 (normalize_name):
+    NFKD → 결합 문자(diacritics) 제거 → NFKC → casefold → 구두점 → 공백
+    서수 표기 통일: "Louis 14th" → "louis xiv"
+    "Napoléon Bonaparte" / "NAPOLEON  BONAPARTE" → "napoleon bonaparte"
+
+base_name: 끝의 서수/칭호 제거 ("louis 14th" → "louis", "alexander the great" →
+"alexander") - 후보 검색용 (exact 매칭에는 쓰지 않음).
+
+저장 구조:
+    키를 UTF-8 바이트로 정렬해서 하나의 bytes 에 이어 붙이고 (offset 배열),
+    키별 (entity_id, kind) 목록도 평탄한 array 로 보관 → 이분 탐색.
+    수십만 개 짧은 문자열을 dict/str 객체로 들고 있는 것보다 훨씬 작음.
+    빌드 이후 추가분 (alias 저장, 새 엔티티) 은 작은 overlay dict 에 넣고,
+    OVERLAY_MAX 를 넘으면 합쳐서 다시 빌드.
+
+stdlib 만 사용 (book_extractor / reconcile 스크립트에서 경로만 추가해서 import).
+
+Usage:
+    from app.core.name_dictionary import normalize_name, get_name_dictionary
+
+    names = get_name_dictionary(conn, 'person')     # psycopg2 connection
+    names.lookup('Napoléon')                        # [(26, 'name')]
+    names.add('Bonaparte', 26, 'alias')             # alias INSERT 후 동기화
+"""
+import re
+import threading
+import time
+import unicodedata
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# overlay (빌드 이후 추가분) 가 이만큼 쌓이면 정렬 배열로 합침
+OVERLAY_MAX = 5000
+
+# DB 변경 확인 주기 (초)
+REFRESH_CHECK_SECONDS = 60
+
+# entity_type → (table, name column)
+ENTITY_TABLES = {
+    'person': ('persons', 'name'),
+    'location': ('locations', 'name'),
+    'event': ('events', 'title'),
+}
+
+KIND_NAME = 'name'
+KIND_ALIAS = 'alias'
+_KINDS = (KIND_NAME, KIND_ALIAS)
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+_ORDINAL_SUFFIX_RE = re.compile(r"\b(\d{1,2})(st|nd|rd|th)$")
+
+# archivist._extract_base_name 과 같은 패턴
+_BASE_NAME_PATTERNS = [
+    re.compile(r'\s+(i{1,3}|iv|v|vi{0,3}|ix|x{0,3})$', re.IGNORECASE),  # Roman numerals
+    re.compile(r'\s+\d+(st|nd|rd|th)?$', re.IGNORECASE),  # Arabic ordinals
+    re.compile(r'\s+the\s+(great|elder|younger)$', re.IGNORECASE),  # Titles
+]
+
+
+def _to_roman(value: int) -> str:
+    numerals = [(10, 'x'), (9, 'ix'), (5, 'v'), (4, 'iv'), (1, 'i')]
+    result = ''
+    for number, numeral in numerals:
+        while value >= number:
+            result += numeral
+            value -= number
+    return result
+
+
+def fold_text(value: Optional[str]) -> str:
+    """유니코드/대소문자/발음 구별 기호/구두점 차이를 없앤 비교용 문자열."""
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', value)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    folded = unicodedata.normalize('NFKC', stripped).casefold()
+    folded = _PUNCT_RE.sub(' ', folded)
+    return _SPACE_RE.sub(' ', folded).strip()
+
+
+def normalize_name(value: Optional[str]) -> str:
+    """사전 키: fold_text + 서수 표기 통일 ("henry 8th" → "henry viii")."""
+    folded = fold_text(value)
+    match = _ORDINAL_SUFFIX_RE.search(folded)
+    if match and ' ' in folded and 0 < int(match.group(1)) < 40:
+        folded = folded[:match.start()] + _to_roman(int(match.group(1)))
+    return folded
+
+
+def strip_ordinal_epithet(name: str) -> str:
+    """끝의 서수/칭호 제거 (정규화 없이 패턴만 적용)."""
+    result = name
+    for pattern in _BASE_NAME_PATTERNS:
+        result = pattern.sub('', result)
+    return result.strip()
+
+
+def base_name(value: Optional[str]) -> str:
+    """fold_text 후 서수/칭호 제거: "Louis 14th" → "louis"."""
+    return strip_ordinal_epithet(fold_text(value))
+
+
+class _Packed:
+    """정렬된 packed 배열 (불변). 교체는 NameDictionary._packed 대입 한 번."""
+
+    __slots__ = ('blob', 'key_offsets', 'post_offsets', 'ids', 'kinds')
+
+    def __init__(self, blob=b'', key_offsets=None, post_offsets=None, ids=None, kinds=b''):
+        self.blob = blob
+        self.key_offsets = key_offsets if key_offsets is not None else array('I', [0])
+        self.post_offsets = post_offsets if post_offsets is not None else array('I', [0])
+        self.ids = ids if ids is not None else array('q')
+        self.kinds = kinds
+
+    def __len__(self) -> int:
+        return len(self.key_offsets) - 1
+
+    @classmethod
+    def from_postings(cls, postings: Dict[bytes, set]) -> '_Packed':
+        blob = bytearray()
+        key_offsets = array('I', [0])
+        post_offsets = array('I', [0])
+        ids = array('q')
+        kinds = bytearray()
+        # UTF-8 바이트 순서 = 코드포인트 순서
+        for key in sorted(postings):
+            blob += key
+            key_offsets.append(len(blob))
+            for entity_id, kind in sorted(postings[key]):
+                ids.append(entity_id)
+                kinds.append(kind)
+            post_offsets.append(len(ids))
+        return cls(bytes(blob), key_offsets, post_offsets, ids, bytes(kinds))
+
+    def find(self, key: bytes) -> int:
+        """key 의 위치 (없으면 -1), 이분 탐색."""
+        lo, hi = 0, len(self.key_offsets) - 1
+        blob, offsets = self.blob, self.key_offsets
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[offsets[mid]:offsets[mid + 1]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(offsets) - 1 and blob[offsets[lo]:offsets[lo + 1]] == key:
+            return lo
+        return -1
+
+    def entries(self, pos: int) -> List[Tuple[int, int]]:
+        """pos 의 (entity_id, kind index) 목록."""
+        return [(self.ids[j], self.kinds[j])
+                for j in range(self.post_offsets[pos], self.post_offsets[pos + 1])]
+
+    def items(self):
+        """(key bytes, [(entity_id, kind index)]) 전체."""
+        for i in range(len(self)):
+            yield self.blob[self.key_offsets[i]:self.key_offsets[i + 1]], self.entries(i)
+
+
+class NameDictionary:
+    """
+    정규화 이름 → [(entity_id, kind)] (정렬된 packed 배열 + overlay).
+
+    매처 스레드 여러 개가 같이 씀: packed 배열은 불변 스냅샷 (_Packed) 으로
+    한 번에 교체하고, lookup 은 lock 안에서 스냅샷 / overlay / 삭제 목록을
+    같이 읽은 뒤 탐색은 lock 밖에서 함. _removed 는 copy-on-write.
+    """
+
+    def __init__(self, entity_type: str, signature: tuple = ()):
+        self.entity_type = entity_type
+        self.signature = signature
+        self.checked_at = 0.0
+        self.build_seconds = 0.0
+
+        self._packed = _Packed()
+        self._overlay: Dict[str, List[Tuple[int, str]]] = {}
+        self._removed: frozenset = frozenset()
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._packed) + len(self._overlay)
+
+    # ─── 빌드 ─────────────────────────────────────────────
+
+    def build(self, entries: Iterable[Tuple[str, int, str]]) -> None:
+        """(name, entity_id, kind) 전체로 정렬 배열 생성 (기존 내용 대체)."""
+        started = time.perf_counter()
+        postings: Dict[bytes, set] = {}
+        for name, entity_id, kind in entries:
+            key = normalize_name(name)
+            if key:
+                postings.setdefault(key.encode('utf-8'), set()).add((entity_id, _KINDS.index(kind)))
+        packed = _Packed.from_postings(postings)
+        with self._lock:
+            self._packed = packed
+            self._overlay = {}
+            self._removed = frozenset()
+        self.build_seconds = time.perf_counter() - started
+
+    def _compact(self) -> None:
+        """overlay / 삭제분을 정렬 배열에 합침 (합치는 동안 들어온 변경은 유지)."""
+        with self._compact_lock:
+            with self._lock:
+                if len(self._overlay) <= OVERLAY_MAX:
+                    return  # 다른 스레드가 이미 합침
+                packed = self._packed
+                overlay = {key: list(entries) for key, entries in self._overlay.items()}
+                removed = self._removed
+
+            postings: Dict[bytes, set] = {}
+            for key, entries in packed.items():
+                for entity_id, kind in entries:
+                    if entity_id not in removed:
+                        postings.setdefault(key, set()).add((entity_id, kind))
+            for key, entries in overlay.items():
+                for entity_id, kind in entries:
+                    if entity_id not in removed:
+                        postings.setdefault(key.encode('utf-8'), set()).add((entity_id, _KINDS.index(kind)))
+            merged = _Packed.from_postings(postings)
+
+            with self._lock:
+                # 합치는 동안 추가된 항목 (삭제 상태라 빠졌다가 다시 추가된 것 포함) 은 overlay 에 남김
+                leftover = {}
+                for key, entries in self._overlay.items():
+                    merged_entries = overlay.get(key, ())
+                    rest = [e for e in entries
+                            if e not in merged_entries or (e[0] in removed and e[0] not in self._removed)]
+                    if rest:
+                        leftover[key] = rest
+                self._packed = merged
+                self._overlay = leftover
+                self._removed = self._removed - removed
+
+    # ─── 조회 ─────────────────────────────────────────────
+
+    def lookup(self, name: str, kind: Optional[str] = None) -> List[Tuple[int, str]]:
+        """이름 → [(entity_id, kind)] (entity_id 순, kind 지정 시 해당 종류만)."""
+        key = normalize_name(name)
+        if not key:
+            return []
+
+        with self._lock:
+            packed = self._packed
+            results = list(self._overlay.get(key, ()))
+            removed = self._removed
+
+        pos = packed.find(key.encode('utf-8'))
+        if pos >= 0:
+            results.extend((entity_id, _KINDS[k]) for entity_id, k in packed.entries(pos))
+
+        if removed:
+            results = [r for r in results if r[0] not in removed]
+        if kind:
+            results = [r for r in results if r[1] == kind]
+        return sorted(set(results))
+
+    def lookup_id(self, name: str, kind: Optional[str] = None) -> Optional[int]:
+        """가장 작은 entity_id (없으면 None)."""
+        found = self.lookup(name, kind)
+        return found[0][0] if found else None
+
+    # ─── 동기화 ───────────────────────────────────────────
+
+    def add(self, name: str, entity_id: int, kind: str = KIND_ALIAS) -> None:
+        """alias INSERT / 새 엔티티 생성 후 호출."""
+        key = normalize_name(name)
+        if not key:
+            return
+        with self._lock:
+            if entity_id in self._removed:
+                self._removed = self._removed - {entity_id}
+            entries = self._overlay.setdefault(key, [])
+            if (entity_id, kind) not in entries:
+                entries.append((entity_id, kind))
+            needs_compact = len(self._overlay) > OVERLAY_MAX
+        if needs_compact:
+            self._compact()
+
+    def remove_entity(self, entity_id: int) -> None:
+        """엔티티 삭제 (중복 병합) 후 호출."""
+        with self._lock:
+            self._removed = self._removed | {entity_id}
+
+
+# ─── DB 로드 (psycopg2 connection) ─────────────────────────
+
+_dictionaries: Dict[str, NameDictionary] = {}
+_registry_lock = threading.Lock()
+
+
+def table_signature(conn, entity_type: str) -> tuple:
+    """변경 감지: 행 수 + 최근 수정 시각 (엔티티 테이블, 별칭)."""
+    table, _ = ENTITY_TABLES[entity_type]
+    cur = conn.cursor()
+    cur.execute(f"SELECT COUNT(*), MAX(updated_at) FROM {table}")
+    entity_row = cur.fetchone()
+    cur.execute(
+        "SELECT COUNT(*), MAX(created_at) FROM entity_aliases WHERE entity_type = %s",
+        (entity_type,)
+    )
+    alias_row = cur.fetchone()
+    conn.commit()
+    return tuple(entity_row) + tuple(alias_row)
+
+
+def _load_entries(conn, entity_type: str):
+    """(name, entity_id, kind) 스트리밍."""
+    table, name_col = ENTITY_TABLES[entity_type]
+    cur = conn.cursor()
+    cur.execute(f"SELECT {name_col}, id FROM {table} WHERE {name_col} IS NOT NULL")
+    for name, entity_id in cur:
+        yield name, entity_id, KIND_NAME
+    cur.execute(
+        "SELECT alias, entity_id FROM entity_aliases WHERE entity_type = %s",
+        (entity_type,)
+    )
+    for alias, entity_id in cur:
+        yield alias, entity_id, KIND_ALIAS
+    conn.commit()
+
+
+def get_name_dictionary(conn, entity_type: str) -> NameDictionary:
+    """
+    프로세스 공용 사전 (entity_type 별). DB 가 바뀌었으면 다시 로드
+    (REFRESH_CHECK_SECONDS 마다 signature 확인).
+    """
+    now = time.monotonic()
+    dictionary = _dictionaries.get(entity_type)
+    if dictionary and now - dictionary.checked_at < REFRESH_CHECK_SECONDS:
+        return dictionary
+
+    with _registry_lock:
+        dictionary = _dictionaries.get(entity_type)
+        if dictionary and now - dictionary.checked_at < REFRESH_CHECK_SECONDS:
+            return dictionary
+
+        signature = table_signature(conn, entity_type)
+        if dictionary is None or dictionary.signature != signature:
+            dictionary = NameDictionary(entity_type, signature)
+            dictionary.build(_load_entries(conn, entity_type))
+            _dictionaries[entity_type] = dictionary
+            print(f"[NameDictionary] {entity_type}: {len(dictionary):,} names "
+                  f"({dictionary.build_seconds:.1f}s)")
+
+        dictionary.checked_at = time.monotonic()
+        return dictionary
+
+
+def note_local_write(conn, entity_type: str) -> None:
+    """
+    자기 쓰기 (add / remove_entity 로 이미 반영) 후 signature 갱신.
+    안 하면 다음 확인 때 자기 쓰기 때문에 전체를 다시 로드함.
+    """
+    dictionary = _dictionaries.get(entity_type)
+    if dictionary is not None:
+        dictionary.signature = table_signature(conn, entity_type)
+
+
+def invalidate_name_dictionary(entity_type: Optional[str] = None) -> None:
+    """다음 사용 시 다시 로드 (entity_type=None 이면 전부)."""
+    with _registry_lock:
+        if entity_type is None:
+            _dictionaries.clear()
+        else:
+            _dictionaries.pop(entity_type, None)
@@ -0,0 +1,297 @@
+"""
+Wikidata Cache - Wikidata 응답 영구 캐시 (SQLite)
+
+EntityMatcher, wikidata_match_parallel, GeoResolver, search_correct_qids* 가
+같은 검색/엔티티 조회를 각자 다시 요청하던 것을 하나의 디스크 캐시로 공유.
+재실행이나 겹치는 파이프라인은 이전 응답을 그대로 쓰고, 실제 요청
+(캐시 miss) 에만 rate limit 을 적용.
+
+- 키: sha256(endpoint + 정규화된 파라미터) - 공백/유니코드 정규화,
+  검색어(search)는 대소문자 무시
+- 엔티티 상세 (wbgetentities) 는 QID 단위로 저장 → 다른 검색에서 나온
+  같은 QID 도 재사용
+- TTL: 결과 있음 DEFAULT_TTL, 결과 없음 (negative) NEGATIVE_TTL
+- 오류 (예외, 429) 는 캐시하지 않음
+- offline 모드 (WIKIDATA_CACHE_OFFLINE=1): 네트워크 요청 없이 만료된 항목까지
+  재사용, miss 는 OfflineCacheMiss
+
+stdlib 만 사용 (book_extractor / data/scripts 에서 경로만 추가해서 import).
+
+Usage:
+    from app.core.wikidata_cache import get_wikidata_cache
+
+    cache = get_wikidata_cache()
+    results = cache.fetch(
+        WIKIDATA_API,
+        {"action": "wbsearchentities", "search": name, "language": "en", ...},
+        lambda: httpx.get(WIKIDATA_API, params=..., timeout=10).json().get("search", []),
+        min_interval=0.3,
+    )
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+DEFAULT_PATH = PROJECT_ROOT / "data" / "cache" / "wikidata.sqlite3"
+
+DAY = 24 * 3600
+DEFAULT_TTL = 30 * DAY
+NEGATIVE_TTL = 3 * DAY
+
+# 대소문자 무시하는 파라미터 (Wikidata 검색은 대소문자 구분 없음)
+CASE_INSENSITIVE_PARAMS = {"search"}
+
+
+class OfflineCacheMiss(LookupError):
+    """offline 모드에서 캐시에 없는 요청"""
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    negative: bool
+    fetched_at: float
+    expires_at: float
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+
+def _normalize_value(key: str, value: Any) -> str:
+    text = unicodedata.normalize("NFKC", str(value))
+    text = " ".join(text.split())
+    if key in CASE_INSENSITIVE_PARAMS:
+        text = text.casefold()
+    return text
+
+
+def cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """content-addressed 키: endpoint + 정규화 파라미터 (순서 무관)."""
+    canonical = json.dumps(
+        [endpoint, sorted((k, _normalize_value(k, v)) for k, v in params.items())],
+        ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class WikidataCache:
+    """SQLite (WAL) 캐시. 스레드별 연결, 여러 프로세스 동시 사용 가능."""
+
+    def __init__(self, path: Path = DEFAULT_PATH, offline: bool = False):
+        self.path = Path(path)
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._rate_lock = threading.Lock()
+        self._last_request: Dict[str, float] = {}
+        self._init_schema()
+
+    # ─── 저장소 ───────────────────────────────────────────
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self) -> None:
+        with self._conn as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    request TEXT NOT NULL,
+                    payload BLOB,
+                    negative INTEGER NOT NULL DEFAULT 0,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_expires ON responses (expires_at)")
+
+    def lookup(self, endpoint: str, params: Dict[str, Any]) -> Optional[CacheEntry]:
+        """
+        캐시 조회. 없거나 만료면 None (offline 모드: 만료돼도 반환, 없으면
+        OfflineCacheMiss).
+        """
+        row = self._conn.execute(
+            "SELECT payload, negative, fetched_at, expires_at FROM responses WHERE key = ?",
+            (cache_key(endpoint, params),)
+        ).fetchone()
+
+        if row is not None:
+            payload, negative, fetched_at, expires_at = row
+            entry = CacheEntry(
+                value=json.loads(zlib.decompress(payload)) if payload is not None else None,
+                negative=bool(negative),
+                fetched_at=fetched_at,
+                expires_at=expires_at,
+            )
+            if self.offline or not entry.expired:
+                self.hits += 1
+                return entry
+
+        self.misses += 1
+        if self.offline:
+            raise OfflineCacheMiss(f"{endpoint} {params}")
+        return None
+
+    def store(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        value: Any,
+        ttl: Optional[float] = None,
+        negative: Optional[bool] = None,
+    ) -> None:
+        """응답 저장. negative 미지정 시 빈 값이면 negative (짧은 TTL)."""
+        if negative is None:
+            negative = not value
+        if ttl is None:
+            ttl = NEGATIVE_TTL if negative else DEFAULT_TTL
+
+        now = time.time()
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        request = json.dumps(params, ensure_ascii=False, sort_keys=True)[:2000]
+        with self._conn as conn:
+            conn.execute("""
+                INSERT INTO responses (key, endpoint, request, payload, negative, fetched_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    payload = excluded.payload,
+                    negative = excluded.negative,
+                    fetched_at = excluded.fetched_at,
+                    expires_at = excluded.expires_at
+            """, (cache_key(endpoint, params), endpoint, request, payload,
+                  int(negative), now, now + ttl))
+        self.stored += 1
+
+    # ─── 요청 래퍼 ────────────────────────────────────────
+
+    def _wait_turn(self, endpoint: str, min_interval: float) -> None:
+        """endpoint 별 최소 요청 간격 (실제 요청에만 적용)."""
+        if min_interval <= 0:
+            return
+        with self._rate_lock:
+            wait = self._last_request.get(endpoint, 0) + min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request[endpoint] = time.monotonic()
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        fetcher: Callable[[], Any],
+        ttl: Optional[float] = None,
+        min_interval: float = 0.0,
+        is_negative: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        캐시에 있으면 반환, 없으면 fetcher() 호출 후 저장.
+        fetcher 가 예외를 던지면 저장하지 않고 그대로 전달.
+        """
+        entry = self.lookup(endpoint, params)
+        if entry is not None:
+            return entry.value
+
+        self._wait_turn(endpoint, min_interval)
+        value = fetcher()
+        negative = is_negative(value) if is_negative else None
+        self.store(endpoint, params, value, ttl=ttl, negative=negative)
+        return value
+
+    def fetch_entities(
+        self,
+        endpoint: str,
+        qids: Iterable[str],
+        fetcher: Callable[[List[str]], Dict[str, Any]],
+        variant: str = "",
+        ttl: Optional[float] = None,
+        min_interval: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        QID 단위 엔티티 상세 캐시. 없는 QID 만 fetcher(missing) 로 한 번에 요청.
+        fetcher 는 {qid: entity} 를 반환 (없는 QID 는 negative 로 저장).
+        variant: 요청 옵션 구분 (props/languages 등).
+        """
+        results: Dict[str, Any] = {}
+        missing = []
+        for qid in dict.fromkeys(qids):
+            entry = self.lookup(endpoint, {"ids": qid, "variant": variant})
+            if entry is None:
+                missing.append(qid)
+            elif entry.value is not None:
+                results[qid] = entry.value
+
+        if missing:
+            self._wait_turn(endpoint, min_interval)
+            fetched = fetcher(missing)
+            for qid in missing:
+                entity = fetched.get(qid)
+                self.store(endpoint, {"ids": qid, "variant": variant}, entity, ttl=ttl)
+                if entity is not None:
+                    results[qid] = entity
+        return results
+
+    # ─── 관리 ─────────────────────────────────────────────
+
+    def purge_expired(self) -> int:
+        with self._conn as conn:
+            return conn.execute(
+                "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+            ).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        total, negative = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(negative), 0) FROM responses"
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": total,
+            "negative_entries": negative,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "stored": self.stored,
+            "offline": self.offline,
+        }
+
+
+_cache: Optional[WikidataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_wikidata_cache() -> WikidataCache:
+    """
+    프로세스 공용 캐시.
+    WIKIDATA_CACHE_PATH: 파일 위치 (기본 data/cache/wikidata.sqlite3)
+    WIKIDATA_CACHE_OFFLINE=1: 캐시만 사용 (replay)
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = WikidataCache(
+                    Path(os.environ.get("WIKIDATA_CACHE_PATH", DEFAULT_PATH)),
+                    offline=os.environ.get("WIKIDATA_CACHE_OFFLINE", "").lower() in ("1", "true", "yes"),
+                )
+    return _cache
@@ -0,0 +1,172 @@
+"""
+ZIM Pool - libzim 아카이브 공용 접근 계층
+
+1. get_archive(path) - 프로세스별로 한 번만 여는 공유 핸들
+   (book_extractor server / kiwix_reader / link_wikipedia_to_db 가 각자 열던 것)
+2. ZimReaderPool - 멀티프로세스 리더 풀
+   - 워커마다 아카이브 핸들을 한 번 열어서 계속 사용 (엔트리마다 열지 않음)
+   - 엔트리 id 구간 (batch_size 개) 단위로 분배
+   - 워커가 processor(entry) 로 처리한 결과만 BatchResult 로 돌려줌
+     (HTML 원문은 프로세스 사이로 넘기지 않음)
+   - 결과는 구간 순서대로 스트리밍 → 호출 쪽에서 바로 쓰고 체크포인트
+
+processor 는 모듈 최상위 함수여야 함 (Windows spawn 에서 pickle).
+반환: (record 또는 None, status 문자열). 예외는 'error' 로 집계.
+
+Usage:
+    from zim_pool import ZimReaderPool
+
+    def process_entry(entry):
+        if entry.is_redirect:
+            return None, 'redirect'
+        html = bytes(entry.get_item().content).decode('utf-8', errors='ignore')
+        return json.dumps({...}), 'ok'
+
+    with ZimReaderPool(ZIM_PATH, process_entry, workers=12) as pool:
+        for batch in pool.run(start, end):
+            for line in batch.records:
+                out.write(line + '\\n')
+"""
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+EntryProcessor = Callable[[Any], Tuple[Any, str]]
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+# ============ 프로세스 내 공유 핸들 ============
+
+_archives: Dict[str, Any] = {}
+_archives_pid: Optional[int] = None
+
+
+def get_archive(path) -> Any:
+    """
+    경로별 공유 Archive (프로세스당 한 번 열기).
+    fork 된 자식 프로세스에서는 부모 핸들을 쓰지 않고 새로 엶.
+    """
+    global _archives_pid
+    if _archives_pid != os.getpid():
+        _archives.clear()
+        _archives_pid = os.getpid()
+
+    key = str(Path(path))
+    archive = _archives.get(key)
+    if archive is None:
+        from libzim.reader import Archive
+        archive = _archives[key] = Archive(key)
+    return archive
+
+
+# ============ 워커 ============
+
+@dataclass
+class BatchResult:
+    start: int
+    end: int
+    records: List[Any]
+    statuses: Dict[str, int]
+    seconds: float
+
+    @property
+    def count(self) -> int:
+        return self.end - self.start
+
+
+_worker_zim = None
+_worker_processor: Optional[EntryProcessor] = None
+
+
+def _init_worker(zim_path: str, processor: EntryProcessor) -> None:
+    global _worker_zim, _worker_processor
+    _worker_zim = get_archive(zim_path)
+    _worker_processor = processor
+
+
+def _run_range(bounds: Tuple[int, int]) -> BatchResult:
+    start, end = bounds
+    started = time.perf_counter()
+    records = []
+    statuses = Counter()
+    get_entry = _worker_zim._get_entry_by_id
+    processor = _worker_processor
+
+    for entry_id in range(start, end):
+        try:
+            record, status = processor(get_entry(entry_id))
+        except Exception:
+            record, status = None, 'error'
+        if record is not None:
+            records.append(record)
+        statuses[status] += 1
+
+    return BatchResult(start, end, records, dict(statuses), time.perf_counter() - started)
+
+
+def id_ranges(start: int, end: int, batch_size: int) -> Iterator[Tuple[int, int]]:
+    for lo in range(start, end, batch_size):
+        yield lo, min(lo + batch_size, end)
+
+
+# ============ 풀 ============
+
+class ZimReaderPool:
+    """워커별 영구 아카이브 핸들을 가진 프로세스 풀 (workers=1 이면 프로세스 내 실행)"""
+
+    def __init__(
+        self,
+        zim_path,
+        processor: EntryProcessor,
+        workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        self.zim_path = str(zim_path)
+        self.processor = processor
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.batch_size = max(1, batch_size)
+        self._pool = None
+
+    def __enter__(self) -> "ZimReaderPool":
+        if self.workers > 1:
+            self._pool = Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.zim_path, self.processor),
+            )
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(terminate=exc_type is not None)
+
+    def close(self, terminate: bool = False) -> None:
+        if self._pool is not None:
+            if terminate:
+                self._pool.terminate()
+            else:
+                self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    @property
+    def entry_count(self) -> int:
+        return get_archive(self.zim_path).entry_count
+
+    def run(self, start: int = 0, end: Optional[int] = None) -> Iterator[BatchResult]:
+        """[start, end) 엔트리를 처리. 결과는 구간 순서대로."""
+        if end is None:
+            end = self.entry_count
+        ranges = id_ranges(start, end, self.batch_size)
+
+        if self._pool is None:
+            _init_worker(self.zim_path, self.processor)
+            for bounds in ranges:
+                yield _run_range(bounds)
+        else:
+            # 순서 유지 (체크포인트가 연속 구간) + 워커는 쉬지 않고 다음 구간 처리
+            yield from self._pool.imap(_run_range, ranges)
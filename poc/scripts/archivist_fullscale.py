@@ -221,15 +221,8 @@ class FullScaleProcessor:
                         self.archivist.registry.entities[entity.id] = entity
                         self.archivist.registry.next_id = max(self.archivist.registry.next_id, entity.id + 1)
 
-                        # Rebuild indexes
-                        norm_name = entity.normalized.lower()
-                        if norm_name not in self.archivist.registry._name_index:
-                            self.archivist.registry._name_index[norm_name] = []
-                        self.archivist.registry._name_index[norm_name].append(entity.id)
-
-                        if entity.entity_type not in self.archivist.registry._type_index:
-                            self.archivist.registry._type_index[entity.entity_type] = []
-                        self.archivist.registry._type_index[entity.entity_type].append(entity.id)
+                        # Rebuild indexes (name / type / candidate search)
+                        self.archivist.registry._index_entity(entity)
 
             except Exception as e:
                 print(f"Error loading checkpoint: {e}")
@@ -0,0 +1,189 @@
+"""
+Archivist EntityRegistry.find_candidates 벤치마크 (registry 크기별 lookups/sec)
+
+Phase 1 mention 스트림 (data/mentions.jsonl, entity_key = "type:normalized")
+을 순서대로 재생: 매 mention 마다 find_candidates → 정확히 같은 이름이
+없으면 새 엔티티로 등록 (fast_mode CREATE_NEW 와 같은 흐름).
+registry 가 --sizes 크기에 도달할 때마다 다음 --sample 개 mention 으로
+인덱스 검색을, 그중 앞 --legacy-sample 개로 이전 구현 (이름/엔티티 전체
+순회, 큰 registry 에서는 매우 느림) 을 측정하고 두 결과가 같은지 확인.
+
+이전 구현은 비교용으로 이 파일에만 남겨 둠.
+
+Usage:
+    python benchmark_archivist_candidates.py                         # data/mentions.jsonl
+    python benchmark_archivist_candidates.py --sizes 1000 10000 50000 --sample 300 --legacy-sample 20
+    python benchmark_archivist_candidates.py --synthetic 200000      # mention 파일 없을 때
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.archivist import EntityRegistry, EntityRecord
+from app.core.name_dictionary import normalize_name, base_name
+
+MENTIONS_PATH = Path(__file__).parent.parent / "data" / "mentions.jsonl"
+
+
+# ============ 이전 구현 (baseline) ============
+
+def legacy_find_candidates(registry: EntityRegistry, text: str, entity_type: str,
+                           max_candidates: int = 10) -> List[EntityRecord]:
+    candidates = []
+    text_lower = text.lower()
+    text_key = normalize_name(text)
+    text_base = base_name(text)
+
+    if text_key in registry._name_index:
+        for eid in registry._name_index[text_key]:
+            candidates.append(registry.entities[eid])
+
+    for norm_name, eids in registry._name_index.items():
+        if norm_name == text_key:
+            continue
+        if text_base in norm_name or norm_name in text_base:
+            for eid in eids:
+                if registry.entities[eid] not in candidates:
+                    candidates.append(registry.entities[eid])
+
+    if entity_type in registry._type_index:
+        for eid in registry._type_index[entity_type]:
+            entity = registry.entities[eid]
+            if entity not in candidates:
+                similarity = registry._name_similarity(text_lower, entity.normalized.lower())
+                if similarity > 0.5:
+                    candidates.append(entity)
+
+    return candidates[:max_candidates]
+
+
+# ============ mention 스트림 ============
+
+def iter_mentions(path: Path) -> Iterator[Tuple[str, str]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entity_type, _, text = json.loads(line)["entity_key"].partition(":")
+            if text:
+                yield text, entity_type
+
+
+def iter_synthetic(count: int, seed: int) -> Iterator[Tuple[str, str]]:
+    """실제 mention 분포 흉내: 이름 조합 + 서수/칭호, 자주 나오는 이름은 반복"""
+    rng = random.Random(seed)
+    syllables = ["al", "ar", "ba", "ca", "da", "el", "fa", "ga", "ha", "is", "ja", "ka", "lo",
+                 "ma", "ne", "or", "pa", "qu", "ra", "sa", "te", "ul", "va", "wi", "xe", "yo", "zu"]
+    word = lambda: "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).capitalize()
+    given = [word() for _ in range(3000)]
+    family = [word() for _ in range(6000)]
+    places = [word() + rng.choice(["", "ia", "burg", " city", "polis"]) for _ in range(8000)]
+    suffixes = ["", "", "", " II", " III", " IV", " XIV", " the Great", " the Elder", " 2nd"]
+    seen: List[Tuple[str, str]] = []
+    for _ in range(count):
+        if seen and rng.random() < 0.6:
+            yield seen[min(int(rng.paretovariate(1.2)) - 1, len(seen) - 1)]
+            continue
+        if rng.random() < 0.65:
+            mention = (f"{rng.choice(given)} {rng.choice(family)}{rng.choice(suffixes)}"
+                       if rng.random() < 0.7 else rng.choice(given) + rng.choice(suffixes), "person")
+        else:
+            mention = (rng.choice(places), "location")
+        seen.append(mention)
+        yield mention
+
+
+# ============ 측정 ============
+
+def replay(stream: Iterator[Tuple[str, str]], sizes: List[int], sample: int, legacy_sample: int) -> None:
+    registry = EntityRegistry()
+    targets = sorted(sizes)
+    mentions = 0
+    started = time.perf_counter()
+
+    for text, entity_type in stream:
+        if targets and len(registry.entities) >= targets[0]:
+            size = targets.pop(0)
+            window = [(text, entity_type)] + [m for _, m in zip(range(sample - 1), stream)]
+            measure(registry, window, window[:legacy_sample], size)
+            for t, et in window:
+                add_mention(registry, t, et)
+            mentions += len(window)
+            if not targets:
+                break
+            continue
+        add_mention(registry, text, entity_type)
+        mentions += 1
+
+    print(f"\n  replayed {mentions:,} mentions → {len(registry.entities):,} entities "
+          f"({time.perf_counter() - started:.1f}s)")
+    if targets:
+        print(f"  stream ended before sizes {targets}")
+
+
+def add_mention(registry: EntityRegistry, text: str, entity_type: str) -> None:
+    key = normalize_name(text)
+    if not any(normalize_name(c.normalized) == key for c in registry.find_candidates(text, entity_type)):
+        registry.add(EntityRecord(id=0, text=text, normalized=text.lower(),
+                                  entity_type=entity_type, context_snippet=""))
+
+
+def measure(registry: EntityRegistry, window: List[Tuple[str, str]],
+            legacy_window: List[Tuple[str, str]], size: int) -> None:
+    t0 = time.perf_counter()
+    indexed = [registry.find_candidates(t, et) for t, et in window]
+    t1 = time.perf_counter()
+    legacy = [legacy_find_candidates(registry, t, et) for t, et in legacy_window]
+    t2 = time.perf_counter()
+
+    mismatches = sum(
+        [c.id for c in a] != [c.id for c in b] for a, b in zip(indexed, legacy)
+    )
+    indexed_rate = len(window) / (t1 - t0)
+    legacy_rate = len(legacy_window) / (t2 - t1)
+    avg = sum(len(c) for c in indexed) / len(window)
+    print(f"  {size:>8,} entities  indexed {indexed_rate:9,.0f}/s  legacy {legacy_rate:7,.0f}/s  "
+          f"{indexed_rate / legacy_rate:6.1f}x  avg {avg:.1f} cands  mismatches {mismatches}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Archivist candidate generation by registry size")
+    parser.add_argument("--mentions", type=Path, default=MENTIONS_PATH, help="Phase 1 mentions.jsonl")
+    parser.add_argument("--synthetic", type=int, help="Use a generated stream of N mentions instead")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000, 50000])
+    parser.add_argument("--sample", type=int, default=500, help="Lookups measured at each size")
+    parser.add_argument("--legacy-sample", type=int, default=50,
+                        help="Of those, lookups also run through the old full scan")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+    if args.synthetic:
+        stream = iter_synthetic(args.synthetic, args.seed)
+        source = f"synthetic ({args.synthetic:,})"
+    elif args.mentions.exists():
+        stream = iter_mentions(args.mentions)
+        source = str(args.mentions)
+    else:
+        print(f"{args.mentions} not found (run phase 1 first, or use --synthetic N)")
+        return 1
+
+    print("=" * 50)
+    print(f"Archivist find_candidates Benchmark: {source}")
+    print("=" * 50)
+    replay(iter(stream), args.sizes, args.sample, max(1, min(args.legacy_sample, args.sample)))
+    print("=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
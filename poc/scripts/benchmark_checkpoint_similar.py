@@ -0,0 +1,142 @@
+"""
+checkpoint EntityRegistry.find_similar 벤치마크 (registry 크기별 lookups/sec)
+
+Phase 1 체크포인트 (data/phase1_checkpoint.json) 의 entity 를 앞에서부터
+--sizes 개씩 load_from_data 로 올리고, 그 뒤 entity 들 (아직 registry 에
+없는 이름 = Phase 2 pending 과 같은 상황) 을 --sample 개 검색.
+앞 --legacy-sample 개는 이전 구현 (_entities 전체 순회) 으로도 검색해서
+속도와 결과 (key / similarity / 순서) 가 같은지 비교.
+
+이전 구현은 비교용으로 이 파일에만 남겨 둠.
+
+Usage:
+    python benchmark_checkpoint_similar.py                           # data/phase1_checkpoint.json
+    python benchmark_checkpoint_similar.py --sizes 10000 100000 --sample 1000
+    python benchmark_checkpoint_similar.py --synthetic 300000        # 체크포인트 없을 때
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.checkpoint import EntityRegistry, Phase1Checkpoint, DATA_DIR
+from benchmark_archivist_candidates import iter_synthetic
+
+
+# ============ 이전 구현 (baseline) ============
+
+def legacy_find_similar(registry: EntityRegistry, text: str, entity_type: str, limit: int = 5) -> List[Dict]:
+    normalized = registry.normalize(text)
+    candidates = []
+
+    for key, entity in registry._entities.items():
+        if entity["entity_type"] != entity_type:
+            continue
+
+        entity_norm = entity["normalized"]
+
+        if normalized == entity_norm:
+            similarity = 1.0
+        elif normalized in entity_norm or entity_norm in normalized:
+            similarity = 0.8
+        elif len(set(normalized.split()) & set(entity_norm.split())) > 0:
+            similarity = 0.5
+        else:
+            continue
+
+        candidates.append({
+            "key": key,
+            "text": entity["text"],
+            "normalized": entity_norm,
+            "entity_type": entity_type,
+            "similarity": similarity,
+            "mention_count": entity["mention_count"]
+        })
+
+    candidates.sort(key=lambda x: (-x["similarity"], -x["mention_count"]))
+    return candidates[:limit]
+
+
+# ============ entity 목록 ============
+
+def load_checkpoint_entities(data_dir: Path) -> List[Dict]:
+    data = Phase1Checkpoint(data_dir).load() or {}
+    return data.get("registry", {}).get("entities", [])
+
+
+def synthetic_entities(count: int, seed: int) -> List[Dict]:
+    """mention 스트림을 add_mention 으로 모은 것과 같은 형태 (중복 제거, mention_count)"""
+    registry = EntityRegistry()
+    for text, entity_type in iter_synthetic(count, seed):
+        registry.add_mention(text, entity_type, "synthetic", 0, len(text))
+    return registry.get_all_entities()
+
+
+# ============ 측정 ============
+
+def measure(entities: List[Dict], size: int, sample: int, legacy_sample: int) -> None:
+    registry = EntityRegistry()
+    t0 = time.perf_counter()
+    registry.load_from_data(entities[:size])
+    load_seconds = time.perf_counter() - t0
+
+    queries = [(e["text"], e["entity_type"]) for e in entities[size:size + sample]]
+    if not queries:
+        print(f"  {size:>9,} entities  (no entities left to query)")
+        return
+
+    t0 = time.perf_counter()
+    indexed = [registry.find_similar(t, et) for t, et in queries]
+    t1 = time.perf_counter()
+    legacy = [legacy_find_similar(registry, t, et) for t, et in queries[:legacy_sample]]
+    t2 = time.perf_counter()
+
+    mismatches = sum(a != b for a, b in zip(indexed, legacy))
+    indexed_rate = len(queries) / (t1 - t0)
+    legacy_rate = len(legacy) / (t2 - t1)
+    avg = sum(len(c) for c in indexed) / len(queries)
+    print(f"  {len(registry._entities):>9,} entities  load {load_seconds:5.1f}s  "
+          f"indexed {indexed_rate:9,.0f}/s  legacy {legacy_rate:7,.0f}/s  "
+          f"{indexed_rate / legacy_rate:7.1f}x  avg {avg:.1f} cands  mismatches {mismatches}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark checkpoint EntityRegistry.find_similar by registry size")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="Directory with phase1_checkpoint.json")
+    parser.add_argument("--synthetic", type=int, help="Use entities from a generated stream of N mentions instead")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000, 100000])
+    parser.add_argument("--sample", type=int, default=500, help="Lookups measured at each size")
+    parser.add_argument("--legacy-sample", type=int, default=50,
+                        help="Of those, lookups also run through the old full scan")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+    if args.synthetic:
+        entities = synthetic_entities(args.synthetic, args.seed)
+        source = f"synthetic ({args.synthetic:,} mentions)"
+    else:
+        entities = load_checkpoint_entities(args.data_dir)
+        source = str(args.data_dir / "phase1_checkpoint.json")
+        if not entities:
+            print(f"{source} not found or empty (run phase 1 first, or use --synthetic N)")
+            return 1
+
+    print("=" * 50)
+    print(f"find_similar Benchmark: {source}, {len(entities):,} entities")
+    print("=" * 50)
+    legacy_sample = max(1, min(args.legacy_sample, args.sample))
+    for size in sorted(args.sizes):
+        measure(entities, size, args.sample, legacy_sample)
+    print("=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
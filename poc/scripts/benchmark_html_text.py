@@ -0,0 +1,177 @@
+"""
+HTML → 텍스트 추출 벤치마크 (MB/s)
+
+ZIM 문서 샘플로 공용 단일 패스 추출기 (app/core/html_text.py) 와 이전
+구현을 비교:
+- regex_chain:  get_book_content_from_zim 의 re.sub 7단계 (이전 버전)
+- html_parser:  kiwix_extract_parallel.FullTextExtractor (이전 버전)
+- html_text:    extract_text (문자열 한 번에)
+- html_text_stream: extract_text_stream (bytes 1MB 조각, book_extractor 방식)
+
+이전 구현은 비교용으로 이 파일에만 남겨 둠.
+
+Usage:
+    python benchmark_html_text.py                              # wikipedia ZIM 200개
+    python benchmark_html_text.py --zim ../../data/kiwix/gutenberg_en_all.zim --sample 20
+    python benchmark_html_text.py --html-dir samples/ --repeat 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from html_text import extract_text, extract_text_stream, iter_chunks, WIKIPEDIA_SKIP_TAGS
+
+ZIM_PATH = Path(__file__).parent.parent.parent / "data" / "kiwix" / "wikipedia_en_nopic.zim"
+
+
+# ============ 이전 구현 (baseline) ============
+
+def legacy_regex_chain(content: str) -> str:
+    content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
+    content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
+    content = re.sub(r'</?(h[1-6]|p|div|br|tr|li)[^>]*>', '\n', content, flags=re.IGNORECASE)
+    content = re.sub(r'<[^>]+>', '', content)
+    content = re.sub(r'[ \t]+', ' ', content)
+    content = re.sub(r'\n\s*\n+', '\n\n', content)
+    return content.strip()
+
+
+class LegacyFullTextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.text_parts = []
+        self.skip_tags = {'script', 'style', 'nav', 'header', 'footer', 'aside', 'sup', 'sub'}
+        self.current_skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.skip_tags:
+            self.current_skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.skip_tags and self.current_skip > 0:
+            self.current_skip -= 1
+        if tag in ('p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr'):
+            self.text_parts.append('\n')
+
+    def handle_data(self, data):
+        if self.current_skip == 0:
+            self.text_parts.append(data)
+
+    def get_text(self) -> str:
+        text = ''.join(self.text_parts)
+        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = re.sub(r' +', ' ', text)
+        text = re.sub(r'\n +', '\n', text)
+        return text.strip()
+
+
+def legacy_html_parser(html: str) -> str:
+    parser = LegacyFullTextExtractor()
+    parser.feed(html)
+    return parser.get_text()
+
+
+# ============ 샘플 ============
+
+def load_zim_sample(zim_path: Path, sample: int, seed: int) -> List[bytes]:
+    from libzim.reader import Archive
+
+    zim = Archive(str(zim_path))
+    rng = random.Random(seed)
+    docs = []
+    attempts = 0
+    while len(docs) < sample and attempts < sample * 50:
+        attempts += 1
+        try:
+            entry = zim._get_entry_by_id(rng.randrange(zim.entry_count))
+            if entry.is_redirect:
+                continue
+            item = entry.get_item()
+            if not item.mimetype.startswith('text/html'):
+                continue
+            docs.append(bytes(item.content))
+        except Exception:
+            continue
+    return docs
+
+
+def load_html_dir(html_dir: Path) -> List[bytes]:
+    return [p.read_bytes() for p in sorted(html_dir.glob("*.htm*"))]
+
+
+# ============ 측정 ============
+
+def measure(fn: Callable[[bytes], str], docs: List[bytes], repeat: int) -> Dict:
+    total_bytes = sum(len(d) for d in docs) * repeat
+    out_chars = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            out_chars += len(fn(doc))
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "mb_per_s": total_bytes / elapsed / (1024 * 1024),
+        "docs_per_s": len(docs) * repeat / elapsed,
+        "out_chars": out_chars // repeat,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML-to-text extraction throughput")
+    parser.add_argument("--zim", type=Path, default=ZIM_PATH, help="ZIM file to sample articles from")
+    parser.add_argument("--html-dir", type=Path, help="Use *.html files from a directory instead of a ZIM")
+    parser.add_argument("--sample", type=int, default=200, help="Number of ZIM articles")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+    if args.html_dir:
+        docs = load_html_dir(args.html_dir)
+        source = args.html_dir
+    else:
+        docs = load_zim_sample(args.zim, args.sample, args.seed)
+        source = args.zim.name
+    if not docs:
+        print("No HTML documents found")
+        return 1
+
+    total_mb = sum(len(d) for d in docs) / (1024 * 1024)
+    print("=" * 50)
+    print(f"HTML → Text Benchmark: {len(docs)} docs, {total_mb:.1f} MB ({source})")
+    print("=" * 50)
+
+    decode = lambda d: d.decode('utf-8', errors='replace')
+    candidates = {
+        "regex_chain": lambda d: legacy_regex_chain(decode(d)),
+        "html_parser": lambda d: legacy_html_parser(decode(d)),
+        "html_text": lambda d: extract_text(decode(d), WIKIPEDIA_SKIP_TAGS).text,
+        "html_text_stream": lambda d: extract_text_stream(iter_chunks(d), WIKIPEDIA_SKIP_TAGS).text,
+    }
+
+    results = {}
+    for name, fn in candidates.items():
+        results[name] = r = measure(fn, docs, args.repeat)
+        print(f"  {name:17s} {r['mb_per_s']:7.1f} MB/s  {r['docs_per_s']:8.1f} docs/s  "
+              f"→ {r['out_chars'] / 1024:,.0f} KB text")
+
+    base = results["html_parser"]["mb_per_s"]
+    print(f"\n  html_text vs html_parser: {results['html_text']['mb_per_s'] / base:.1f}x")
+    print(f"  html_text vs regex_chain: "
+          f"{results['html_text']['mb_per_s'] / results['regex_chain']['mb_per_s']:.1f}x")
+    print("=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+ZimReaderPool 벤치마크 (entries/sec, 워커 수별)
+
+같은 id 구간을 워커 수를 바꿔 가며 처리해서 처리량 비교.
+--legacy: 이전 kiwix_extract_parallel 방식 (mp.Pool.map 으로 엔트리마다
+Archive 를 새로 열기) 도 함께 측정.
+
+Processors:
+- read: 엔트리 읽기 + content bytes (I/O, 압축 해제)
+- text: read + HTML → 텍스트 (app/core/html_text.py)
+
+Usage:
+    python benchmark_zim_pool.py --count 20000
+    python benchmark_zim_pool.py --workers 1 2 4 8 16 --processor text --legacy
+    python benchmark_zim_pool.py --zim ../../data/kiwix/wikisource_en_nopic.zim --start 100000
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from html_text import extract_text, WIKIPEDIA_SKIP_TAGS
+from zim_pool import ZimReaderPool, get_archive
+
+ZIM_PATH = Path(__file__).parent.parent.parent / "data" / "kiwix" / "wikipedia_en_nopic.zim"
+
+
+# ============ Processors (모듈 최상위: spawn 에서 pickle) ============
+
+def read_entry(entry):
+    if entry.is_redirect:
+        return None, 'redirect'
+    content = entry.get_item().content
+    return len(content), 'ok'
+
+
+def text_entry(entry):
+    if entry.is_redirect:
+        return None, 'redirect'
+    item = entry.get_item()
+    if not item.mimetype.startswith('text/html'):
+        return None, 'non_html'
+    html = bytes(item.content).decode('utf-8', errors='ignore')
+    return len(extract_text(html, WIKIPEDIA_SKIP_TAGS).text), 'ok'
+
+
+PROCESSORS = {"read": read_entry, "text": text_entry}
+
+
+# ============ 이전 방식 (baseline) ============
+
+_legacy_args = None
+
+
+def _legacy_init(zim_path, processor_name):
+    global _legacy_args
+    _legacy_args = (zim_path, PROCESSORS[processor_name])
+
+
+def legacy_process(entry_id):
+    from libzim.reader import Archive
+
+    zim_path, processor = _legacy_args
+    try:
+        zim = Archive(zim_path)  # 엔트리마다 새로 열기 (이전 process_entry)
+        return processor(zim._get_entry_by_id(entry_id))
+    except Exception:
+        return None, 'error'
+
+
+def run_legacy(zim_path: Path, processor_name: str, workers: int, start: int, end: int) -> tuple:
+    started = time.perf_counter()
+    ok = 0
+    with mp.Pool(workers, initializer=_legacy_init, initargs=(str(zim_path), processor_name)) as pool:
+        for record, status in pool.map(legacy_process, range(start, end), chunksize=64):
+            ok += status == 'ok'
+    return time.perf_counter() - started, ok
+
+
+def run_pool(zim_path: Path, processor_name: str, workers: int, start: int, end: int, batch_size: int) -> tuple:
+    started = time.perf_counter()
+    ok = 0
+    with ZimReaderPool(zim_path, PROCESSORS[processor_name], workers=workers, batch_size=batch_size) as pool:
+        for batch in pool.run(start, end):
+            ok += batch.statuses.get('ok', 0)
+    return time.perf_counter() - started, ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ZimReaderPool throughput by worker count")
+    parser.add_argument("--zim", type=Path, default=ZIM_PATH)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}))
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--processor", choices=list(PROCESSORS), default="read")
+    parser.add_argument("--legacy", action="store_true", help="Also measure per-entry Archive open (old)")
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+    total = get_archive(args.zim).entry_count
+    start = min(args.start, total)
+    end = min(start + args.count, total)
+
+    print("=" * 50)
+    print(f"ZIM Pool Benchmark: {args.zim.name} [{start:,}, {end:,}) "
+          f"processor={args.processor} batch={args.batch_size}")
+    print("=" * 50)
+
+    base_rate = None
+    for workers in args.workers:
+        elapsed, ok = run_pool(args.zim, args.processor, workers, start, end, args.batch_size)
+        rate = (end - start) / elapsed
+        base_rate = base_rate or rate
+        print(f"  pool   workers={workers:3d}  {rate:10,.0f} entries/s  ({ok:,} ok, {elapsed:.1f}s)"
+              f"  {rate / base_rate:4.1f}x")
+
+        if args.legacy and workers > 1:
+            elapsed, ok = run_legacy(args.zim, args.processor, workers, start, end)
+            print(f"  legacy workers={workers:3d}  {(end - start) / elapsed:10,.0f} entries/s  "
+                  f"({ok:,} ok, {elapsed:.1f}s)")
+
+    print("=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,9 @@ from functools import partial
 
 from libzim.reader import Archive
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from html_text import extract_text, WIKIPEDIA_SKIP_TAGS
+
 # ============ Config ============
 
 ZIM_PATH = Path(__file__).parent.parent.parent / "data" / "kiwix" / "wikipedia_en_nopic.zim"
@@ -34,38 +37,11 @@ CHECKPOINT_FILE = OUTPUT_DIR / "enrich_checkpoint.json"
 
 WIKIPEDIA_BASE_URL = "https://en.wikipedia.org/wiki/"
 
+# 본문 추출 시 제외 (각주, 첨자, 표)
+CONTENT_SKIP_TAGS = WIKIPEDIA_SKIP_TAGS | {'table'}
 
-# ============ HTML Parsers ============
-
-class FullTextExtractor(HTMLParser):
-    """전체 본문 추출 (깨끗한 텍스트)"""
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-        self.skip_tags = {'script', 'style', 'nav', 'header', 'footer', 'aside', 'sup', 'sub', 'table'}
-        self.current_skip = 0
-
-    def handle_starttag(self, tag, attrs):
-        if tag in self.skip_tags:
-            self.current_skip += 1
-
-    def handle_endtag(self, tag):
-        if tag in self.skip_tags and self.current_skip > 0:
-            self.current_skip -= 1
-        if tag in ('p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr'):
-            self.text_parts.append('\n')
-
-    def handle_data(self, data):
-        if self.current_skip == 0:
-            self.text_parts.append(data)
-
-    def get_text(self) -> str:
-        text = ''.join(self.text_parts)
-        text = re.sub(r'\n\s*\n+', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        text = re.sub(r'\n +', '\n', text)
-        return text.strip()
 
+# ============ HTML Parsers ============
 
 class LinkExtractor(HTMLParser):
     """내부 링크 추출"""
@@ -107,13 +83,8 @@ class LinkExtractor(HTMLParser):
 
 
 def extract_full_text(html: str) -> str:
-    """HTML에서 전체 본문 추출"""
-    parser = FullTextExtractor()
-    try:
-        parser.feed(html)
-    except:
-        pass
-    return parser.get_text()
+    """HTML에서 전체 본문 추출 (표 제외, 블록 사이 빈 줄)"""
+    return extract_text(html, CONTENT_SKIP_TAGS).text
 
 
 def extract_links(html: str) -> List[str]:
@@ -25,9 +25,10 @@ from dataclasses import dataclass, asdict
 # 프로젝트 경로 설정
 BACKEND_PATH = Path(__file__).parent.parent.parent / "backend"
 sys.path.insert(0, str(BACKEND_PATH))
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
 
 from libzim.reader import Archive
-from html.parser import HTMLParser
+from html_text import extract_text, DEFAULT_SKIP_TAGS
 
 
 # ============ Config ============
@@ -55,38 +56,11 @@ def get_archive(source: str = "wikipedia") -> Archive:
 
 # ============ HTML Parser ============
 
-class HTMLTextExtractor(HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-        self.skip_tags = {'script', 'style', 'nav', 'header', 'footer', 'aside', 'sup'}
-        self.current_skip = 0
-
-    def handle_starttag(self, tag, attrs):
-        if tag in self.skip_tags:
-            self.current_skip += 1
-
-    def handle_endtag(self, tag):
-        if tag in self.skip_tags and self.current_skip > 0:
-            self.current_skip -= 1
-        if tag in ('p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
-            self.text_parts.append('\n')
-
-    def handle_data(self, data):
-        if self.current_skip == 0:
-            self.text_parts.append(data)
-
-    def get_text(self):
-        text = ''.join(self.text_parts)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        return text.strip()
+SKIP_TAGS = DEFAULT_SKIP_TAGS | {'sup'}
 
 
 def html_to_text(html: str) -> str:
-    parser = HTMLTextExtractor()
-    parser.feed(html)
-    return parser.get_text()
+    return extract_text(html, SKIP_TAGS).text
 
 
 # ============ Wikipedia Access ============
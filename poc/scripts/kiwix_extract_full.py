@@ -25,10 +25,12 @@ import re
 import argparse
 from pathlib import Path
 from typing import Optional, Tuple
-from html.parser import HTMLParser
 
 from libzim.reader import Archive
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from html_text import extract_text, WIKIPEDIA_SKIP_TAGS
+
 # ============ Config ============
 
 ZIM_PATH = Path(__file__).parent.parent.parent / "data" / "kiwix" / "wikipedia_en_nopic.zim"
@@ -48,47 +50,9 @@ def get_archive() -> Archive:
 
 # ============ HTML Text Extractor (개선) ============
 
-class FullTextExtractor(HTMLParser):
-    """HTML에서 전체 텍스트 추출 (개선 버전)"""
-
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-        self.skip_tags = {'script', 'style', 'nav', 'header', 'footer', 'aside', 'sup', 'sub'}
-        self.current_skip = 0
-
-    def handle_starttag(self, tag, attrs):
-        if tag in self.skip_tags:
-            self.current_skip += 1
-
-    def handle_endtag(self, tag):
-        if tag in self.skip_tags and self.current_skip > 0:
-            self.current_skip -= 1
-        # 블록 태그 후 줄바꿈
-        if tag in ('p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr'):
-            self.text_parts.append('\n')
-
-    def handle_data(self, data):
-        if self.current_skip == 0:
-            self.text_parts.append(data)
-
-    def get_text(self) -> str:
-        text = ''.join(self.text_parts)
-        # 연속 공백/줄바꿈 정리
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        text = re.sub(r'\n +', '\n', text)
-        return text.strip()
-
-
 def html_to_full_text(html: str) -> str:
-    """HTML을 전체 텍스트로 변환"""
-    parser = FullTextExtractor()
-    try:
-        parser.feed(html)
-    except:
-        pass
-    return parser.get_text()
+    """HTML을 전체 텍스트로 변환 (블록 사이 빈 줄)"""
+    return extract_text(html, WIKIPEDIA_SKIP_TAGS).text
 
 
 def html_to_summary(html: str) -> str:
@@ -2,6 +2,8 @@
 Wikipedia 전체 본문 추출 - 병렬 처리 버전
 
 16코어 병렬 처리로 ~50시간 → ~4시간으로 단축
+ZimReaderPool (app/core/zim_pool.py): 워커마다 아카이브를 한 번만 열고
+id 구간 단위로 처리, 결과는 JSON 한 줄로 돌려받아 바로 기록
 
 출력 필드:
 - title, qid, path, wikipedia_url
@@ -22,13 +24,13 @@ sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 import json
 import re
 import argparse
-import multiprocessing as mp
 from pathlib import Path
 from typing import Optional, Tuple
-from html.parser import HTMLParser
 from datetime import datetime
 
-from libzim.reader import Archive
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from html_text import extract_text, WIKIPEDIA_SKIP_TAGS
+from zim_pool import ZimReaderPool, get_archive
 
 # ============ Config ============
 
@@ -38,55 +40,23 @@ CHECKPOINT_FILE = OUTPUT_DIR / "checkpoint_parallel.json"
 
 WIKIPEDIA_BASE_URL = "https://en.wikipedia.org/wiki/"
 
+BATCH_SIZE = 1000      # 워커 1회 처리 id 구간
+REPORT_EVERY = 5000    # 진행 출력 + 체크포인트 간격
 
-# ============ HTML Text Extractor ============
-
-class FullTextExtractor(HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-        self.skip_tags = {'script', 'style', 'nav', 'header', 'footer', 'aside', 'sup', 'sub'}
-        self.current_skip = 0
-
-    def handle_starttag(self, tag, attrs):
-        if tag in self.skip_tags:
-            self.current_skip += 1
-
-    def handle_endtag(self, tag):
-        if tag in self.skip_tags and self.current_skip > 0:
-            self.current_skip -= 1
-        if tag in ('p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr'):
-            self.text_parts.append('\n')
-
-    def handle_data(self, data):
-        if self.current_skip == 0:
-            self.text_parts.append(data)
-
-    def get_text(self) -> str:
-        text = ''.join(self.text_parts)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        text = re.sub(r'\n +', '\n', text)
-        return text.strip()
 
+# ============ HTML Text Extractor ============
 
 def html_to_full_text(html: str) -> str:
-    parser = FullTextExtractor()
-    try:
-        parser.feed(html)
-    except:
-        pass
-    return parser.get_text()
+    return extract_text(html, WIKIPEDIA_SKIP_TAGS).text
 
 
-def html_to_summary(html: str) -> str:
-    text = html_to_full_text(html[:10000])
-    paragraphs = text.split('\n\n')
-    for p in paragraphs:
+def summary_from_text(text: str) -> str:
+    """첫 문단 (50자 이상) - 본문 텍스트에서 바로 (HTML 재파싱 없음)"""
+    for p in text[:10000].split('\n\n'):
         p = p.strip()
         if len(p) > 50:
             return p[:500]
-    return text[:500] if text else ""
+    return text[:500]
 
 
 # ============ Entity Classification ============
@@ -237,12 +207,12 @@ def extract_coordinates(html: str) -> Tuple[Optional[float], Optional[float]]:
 
 # ============ Worker Function ============
 
-def process_entry(entry_id):
-    """단일 엔트리 처리 (워커 함수)"""
-    try:
-        zim = Archive(str(ZIM_PATH))
-        entry = zim._get_entry_by_id(entry_id)
+def process_entry(entry):
+    """단일 엔트리 처리 (ZimReaderPool 워커 함수)
 
+    Returns: ((entity_type, json_line) 또는 None, status)
+    """
+    try:
         if entry.is_redirect:
             return None, 'redirect'
 
@@ -263,7 +233,7 @@ def process_entry(entry_id):
         # 데이터 추출
         qid = extract_wikidata_qid(html)
         full_content = html_to_full_text(html)
-        summary = html_to_summary(html)
+        summary = summary_from_text(full_content)
         wikipedia_url = WIKIPEDIA_BASE_URL + path
         internal_links = extract_internal_links(html)
 
@@ -283,7 +253,7 @@ def process_entry(entry_id):
                 'content': full_content,
                 'links': internal_links,
             }
-            return ('person', data), 'ok'
+            return ('person', json.dumps(data, ensure_ascii=False)), 'ok'
 
         elif entity_type == 'location':
             lat, lon = extract_coordinates(html)
@@ -298,7 +268,7 @@ def process_entry(entry_id):
                 'content': full_content,
                 'links': internal_links,
             }
-            return ('location', data), 'ok'
+            return ('location', json.dumps(data, ensure_ascii=False)), 'ok'
 
         elif entity_type == 'event':
             start_year, end_year = extract_years(html)
@@ -313,7 +283,7 @@ def process_entry(entry_id):
                 'content': full_content,
                 'links': internal_links,
             }
-            return ('event', data), 'ok'
+            return ('event', json.dumps(data, ensure_ascii=False)), 'ok'
 
     except Exception as e:
         return None, 'error'
@@ -329,9 +299,7 @@ def extract_parallel(num_workers: int = 12, limit: int = None, resume: bool = Tr
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     # ZIM 정보
-    zim = Archive(str(ZIM_PATH))
-    total_entries = zim.entry_count
-    del zim
+    total_entries = get_archive(ZIM_PATH).entry_count
 
     # 체크포인트
     start_index = 0
@@ -360,36 +328,37 @@ def extract_parallel(num_workers: int = 12, limit: int = None, resume: bool = Tr
     start_time = datetime.now()
 
     try:
-        tasks = list(range(start_index, end_index))
-
-        with mp.Pool(num_workers) as pool:
-            batch_size = 5000
-            for batch_start in range(0, len(tasks), batch_size):
-                batch = tasks[batch_start:batch_start + batch_size]
-                results = pool.map(process_entry, batch)
-
-                for result, status in results:
-                    if status == 'ok' and result:
-                        entity_type, data = result
-                        files[entity_type].write(json.dumps(data, ensure_ascii=False) + '\n')
-                        stats[entity_type + 's'] += 1
-                    else:
-                        stats[status] = stats.get(status, 0) + 1
-
-                processed = batch_start + len(batch)
-                pct = processed / len(tasks) * 100
+        total = end_index - start_index
+        processed = 0
+        next_report = REPORT_EVERY
+
+        with ZimReaderPool(ZIM_PATH, process_entry, workers=num_workers, batch_size=BATCH_SIZE) as pool:
+            for batch in pool.run(start_index, end_index):
+                for entity_type, line in batch.records:
+                    files[entity_type].write(line + '\n')
+                    stats[entity_type + 's'] += 1
+                for status, count in batch.statuses.items():
+                    if status != 'ok':
+                        stats[status] = stats.get(status, 0) + count
+
+                processed += batch.count
+                if processed < next_report and processed < total:
+                    continue
+                next_report = processed + REPORT_EVERY
+
+                pct = processed / total * 100
                 elapsed = (datetime.now() - start_time).total_seconds()
                 rate = processed / elapsed if elapsed > 0 else 0
-                eta = (len(tasks) - processed) / rate / 60 if rate > 0 else 0
+                eta = (total - processed) / rate / 60 if rate > 0 else 0
 
-                print(f"[{processed:,}/{len(tasks):,} ({pct:.1f}%)] "
+                print(f"[{processed:,}/{total:,} ({pct:.1f}%)] "
                       f"P:{stats['persons']:,} L:{stats['locations']:,} E:{stats['events']:,} "
                       f"({rate:.0f}/s, ETA:{eta:.0f}min)", flush=True)
 
                 for f in files.values():
                     f.flush()
                 with open(CHECKPOINT_FILE, 'w') as f:
-                    json.dump({'last_index': start_index + processed, 'stats': stats}, f)
+                    json.dump({'last_index': batch.end, 'stats': stats}, f)
 
     finally:
         for f in files.values():
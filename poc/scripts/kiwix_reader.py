@@ -9,8 +9,12 @@ Usage:
 
 import argparse
 import re
+import sys
 from pathlib import Path
-from html.parser import HTMLParser
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from html_text import extract_text
+from zim_pool import get_archive as get_shared_archive
 
 # ZIM 파일 경로
 ZIM_DIR = Path(__file__).parent.parent.parent / "data" / "kiwix"
@@ -21,64 +25,27 @@ ZIM_FILES = {
 }
 
 
-class HTMLTextExtractor(HTMLParser):
-    """HTML에서 텍스트만 추출"""
-
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-        self.skip_tags = {'script', 'style', 'nav', 'header', 'footer', 'aside'}
-        self.current_skip = 0
-
-    def handle_starttag(self, tag, attrs):
-        if tag in self.skip_tags:
-            self.current_skip += 1
-
-    def handle_endtag(self, tag):
-        if tag in self.skip_tags and self.current_skip > 0:
-            self.current_skip -= 1
-        if tag in ('p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
-            self.text_parts.append('\n')
-
-    def handle_data(self, data):
-        if self.current_skip == 0:
-            self.text_parts.append(data)
-
-    def get_text(self):
-        text = ''.join(self.text_parts)
-        # 연속 공백/줄바꿈 정리
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
-        return text.strip()
-
-
 def html_to_text(html: str) -> str:
-    """HTML을 텍스트로 변환"""
-    parser = HTMLTextExtractor()
-    parser.feed(html)
-    return parser.get_text()
+    """HTML을 텍스트로 변환 (블록 사이 빈 줄)"""
+    return extract_text(html).text
 
 
 def get_archive(source: str = "wikipedia"):
-    """ZIM 아카이브 열기"""
-    from libzim.reader import Archive
-
+    """ZIM 아카이브 (프로세스 내 공유 핸들, app/core/zim_pool.py)"""
     zim_path = ZIM_FILES.get(source)
     if not zim_path or not zim_path.exists():
         raise FileNotFoundError(f"ZIM file not found: {zim_path}")
 
-    return Archive(str(zim_path))
+    return get_shared_archive(zim_path)
 
 
 def show_info():
     """모든 ZIM 파일 정보 출력"""
-    from libzim.reader import Archive
-
     print("=== Kiwix ZIM Files ===\n")
 
     for name, path in ZIM_FILES.items():
         if path.exists():
-            zim = Archive(str(path))
+            zim = get_shared_archive(path)
             size_gb = path.stat().st_size / (1024**3)
             print(f"{name}:")
             print(f"  Path: {path}")
@@ -28,8 +28,10 @@ from html.parser import HTMLParser
 # 프로젝트 경로 설정
 BACKEND_PATH = Path(__file__).parent.parent.parent / "backend"
 sys.path.insert(0, str(BACKEND_PATH))
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
 
 from libzim.reader import Archive
+from zim_pool import get_archive as get_shared_archive
 
 # ============ Config ============
 
@@ -39,8 +41,6 @@ CHECKPOINT_FILE = EXTRACT_DIR / "linker_checkpoint.json"
 
 CHECKPOINT_INTERVAL = 100  # DB 작업이므로 더 자주 저장
 
-_archive = None
-
 # ============ Entity Cache (최적화) ============
 _person_cache: Dict[str, Optional[int]] = {}  # name -> person_id
 _event_cache: Dict[str, Optional[int]] = {}   # title -> event_id
@@ -49,10 +49,8 @@ CACHE_SIZE_LIMIT = 50000
 
 
 def get_archive() -> Archive:
-    global _archive
-    if _archive is None:
-        _archive = Archive(str(ZIM_PATH))
-    return _archive
+    """공유 아카이브 핸들 (app/core/zim_pool.py)"""
+    return get_shared_archive(ZIM_PATH)
 
 
 # ============ Internal Link Extractor ============
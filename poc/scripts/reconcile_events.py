@@ -34,10 +34,13 @@ if sys.platform == 'win32':
     sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'backend'))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
 load_dotenv()
 
+from app.core.name_dictionary import fold_text
+
 # Configuration
 NER_DIR = Path(__file__).parent.parent / "data" / "integrated_ner_full"
 RESULTS_DIR = Path(__file__).parent.parent / "data" / "reconcile_results"
@@ -193,12 +196,8 @@ def parse_source_id(custom_id: str) -> Tuple[str, str]:
 
 
 def normalize_text(text: str) -> str:
-    """텍스트 정규화 (소문자, 특수문자 제거)."""
-    import re
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    """텍스트 정규화 (name_dictionary 와 같은 규칙: 대소문자/발음 기호/구두점)."""
+    return fold_text(text)
 
 
 def fuzzy_match_score(text1: str, text2: str) -> float:
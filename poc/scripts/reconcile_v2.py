@@ -29,12 +29,16 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
     sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from dotenv import load_dotenv
 load_dotenv()
 
 import psycopg2
 from openai import OpenAI
 
+from app.core.name_dictionary import fold_text
+
 # Configuration
 RESULTS_DIR = Path(__file__).parent.parent / "data" / "reconcile_results"
 RESULTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -51,14 +55,8 @@ def get_db_connection():
 
 
 def normalize_title(title: str) -> str:
-    """제목 정규화."""
-    import re
-    if not title:
-        return ""
-    title = title.lower().strip()
-    title = re.sub(r'[^\w\s]', ' ', title)
-    title = re.sub(r'\s+', ' ', title)
-    return title.strip()
+    """제목 정규화 (name_dictionary 와 같은 규칙: 대소문자/발음 기호/구두점)."""
+    return fold_text(title)
 
 
 def title_similarity(t1: str, t2: str) -> float:
@@ -3,9 +3,12 @@ Search Wikidata for correct QIDs for FGO servants
 """
 import requests
 import json
-import time
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from wikidata_cache import get_wikidata_cache
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 HEADERS = {"User-Agent": "ChaldeasBot/1.0 (https://chaldeas.site)"}
 
@@ -110,10 +113,15 @@ def search_wikidata(query, hint=""):
         'format': 'json',
         'limit': 5
     }
-    try:
+
+    def fetch():
         r = requests.get(url, params=params, headers=HEADERS, timeout=30)
-        results = r.json().get('search', [])
-        return results
+        r.raise_for_status()
+        return r.json().get('search', [])
+
+    try:
+        # Shared on-disk cache; only real requests are spaced out
+        return get_wikidata_cache().fetch(url, params, fetch, min_interval=0.5)
     except Exception as e:
         return []
 
@@ -141,8 +149,6 @@ def main():
             results[name] = None
             log_lines.append(f"{name}: NOT FOUND")
 
-        time.sleep(0.5)
-
     # Save results
     output_path = PROJECT_ROOT / "data/raw/atlas_academy/wikidata_qid_search.json"
     with open(output_path, 'w', encoding='utf-8') as f:
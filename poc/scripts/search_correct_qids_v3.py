@@ -3,9 +3,12 @@ Search remaining names
 """
 import requests
 import json
-import time
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from wikidata_cache import get_wikidata_cache
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 HEADERS = {"User-Agent": "ChaldeasBot/1.0 (https://chaldeas.site)"}
 
@@ -60,10 +63,15 @@ def search_wikidata(query):
         'format': 'json',
         'limit': 5
     }
-    try:
+
+    def fetch():
         r = requests.get(url, params=params, headers=HEADERS, timeout=30)
-        results = r.json().get('search', [])
-        return results
+        r.raise_for_status()
+        return r.json().get('search', [])
+
+    try:
+        # Shared on-disk cache; only real requests are spaced out
+        return get_wikidata_cache().fetch(url, params, fetch, min_interval=0.3)
     except Exception as e:
         return []
 
@@ -83,8 +91,6 @@ def main():
             log_lines.append(f"{name}: NOT FOUND")
             log_lines.append("")
 
-        time.sleep(0.3)
-
     # Save log
     log_path = PROJECT_ROOT / "poc/data/qid_search_log_v3.txt"
     with open(log_path, 'w', encoding='utf-8') as f:
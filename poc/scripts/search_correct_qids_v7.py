@@ -2,9 +2,12 @@
 Final search v7 - Greek mythology
 """
 import requests
-import time
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
+from wikidata_cache import get_wikidata_cache
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 HEADERS = {"User-Agent": "ChaldeasBot/1.0 (https://chaldeas.site)"}
 
@@ -24,10 +27,15 @@ def search_wikidata(query):
         'format': 'json',
         'limit': 5
     }
-    try:
+
+    def fetch():
         r = requests.get(url, params=params, headers=HEADERS, timeout=30)
-        results = r.json().get('search', [])
-        return results
+        r.raise_for_status()
+        return r.json().get('search', [])
+
+    try:
+        # Shared on-disk cache; only real requests are spaced out
+        return get_wikidata_cache().fetch(url, params, fetch, min_interval=0.3)
     except:
         return []
 
@@ -46,8 +54,6 @@ def main():
             log_lines.append(f"{name}: NOT FOUND")
             log_lines.append("")
 
-        time.sleep(0.3)
-
     log_path = PROJECT_ROOT / "poc/data/qid_search_log_v7.txt"
     with open(log_path, 'w', encoding='utf-8') as f:
         f.write('\n'.join(log_lines))
@@ -29,8 +29,11 @@ from typing import Optional, List, Dict, Any
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "backend"))
+# Shared Wikidata response cache (poc/app/core/wikidata_cache.py)
+sys.path.insert(0, str(Path(__file__).parent.parent / "app" / "core"))
 
 import requests
+from wikidata_cache import get_wikidata_cache, OfflineCacheMiss
 from rapidfuzz import fuzz
 from rapidfuzz.distance import JaroWinkler
 
@@ -82,6 +85,10 @@ class LLMTask:
     fuzzy_score: float
 
 
+class RateLimited(Exception):
+    """429 from Wikidata (not cached)"""
+
+
 class GlobalRateLimiter:
     """Thread-safe global rate limiter shared across all workers"""
     _instance = None
@@ -221,34 +228,41 @@ class WikidataFetcher:
         """
         Search using wbsearchentities API.
         Returns None on 429 (rate limit), [] on no results.
+        Responses are shared through the on-disk Wikidata cache.
         """
-        self._rate_limit()
+        params = {
+            "action": "wbsearchentities",
+            "search": name,
+            "language": "en",
+            "type": "item",
+            "limit": limit,
+            "format": "json"
+        }
+        cache = get_wikidata_cache()
 
         try:
-            resp = requests.get(
-                self.SEARCH_API,
-                params={
-                    "action": "wbsearchentities",
-                    "search": name,
-                    "language": "en",
-                    "type": "item",
-                    "limit": limit,
-                    "format": "json"
-                },
-                headers={"User-Agent": "CHALDEAS/1.0 (historical data project)"},
-                timeout=30
-            )
+            entry = cache.lookup(self.SEARCH_API, params)
+            if entry is not None:
+                search_results = entry.value
+            else:
+                self._rate_limit()
+                resp = requests.get(
+                    self.SEARCH_API,
+                    params=params,
+                    headers={"User-Agent": "CHALDEAS/1.0 (historical data project)"},
+                    timeout=30
+                )
 
-            if resp.status_code == 429:
-                self._mark_blocked("primary")
-                return None  # Signal to try fallback
+                if resp.status_code == 429:
+                    self._mark_blocked("primary")
+                    return None  # Signal to try fallback
 
-            if resp.status_code != 200:
-                return []
+                if resp.status_code != 200:
+                    return []
 
-            self._reset_consecutive_429s()
-            data = resp.json()
-            search_results = data.get("search", [])
+                self._reset_consecutive_429s()
+                search_results = resp.json().get("search", [])
+                cache.store(self.SEARCH_API, params, search_results)
 
             if not search_results:
                 return []
@@ -257,6 +271,8 @@ class WikidataFetcher:
             qids = [r["id"] for r in search_results]
             return self._get_entity_details(qids)
 
+        except OfflineCacheMiss:
+            return []
         except Exception as e:
             safe_print(f"  [WARN] Primary API error: {e}")
             return []
@@ -266,8 +282,6 @@ class WikidataFetcher:
         Search using SPARQL endpoint.
         Returns None on 429 (rate limit), [] on no results.
         """
-        self._rate_limit()
-
         # Escape quotes in name
         escaped_name = name.replace('"', '\\"').replace("'", "\\'")
 
@@ -287,24 +301,32 @@ class WikidataFetcher:
         LIMIT {limit}
         '''
 
+        params = {"query": query, "format": "json"}
+        cache = get_wikidata_cache()
+
         try:
-            resp = requests.get(
-                self.SPARQL_API,
-                params={"query": query, "format": "json"},
-                headers={"User-Agent": "CHALDEAS/1.0 (historical data project)"},
-                timeout=30
-            )
+            entry = cache.lookup(self.SPARQL_API, params)
+            if entry is not None:
+                results = entry.value
+            else:
+                self._rate_limit()
+                resp = requests.get(
+                    self.SPARQL_API,
+                    params=params,
+                    headers={"User-Agent": "CHALDEAS/1.0 (historical data project)"},
+                    timeout=30
+                )
 
-            if resp.status_code == 429:
-                self._mark_blocked("sparql")
-                return None  # Signal to try fallback
+                if resp.status_code == 429:
+                    self._mark_blocked("sparql")
+                    return None  # Signal to try fallback
 
-            if resp.status_code != 200:
-                return []
+                if resp.status_code != 200:
+                    return []
 
-            self._reset_consecutive_429s()
-            data = resp.json()
-            results = data.get("results", {}).get("bindings", [])
+                self._reset_consecutive_429s()
+                results = resp.json().get("results", {}).get("bindings", [])
+                cache.store(self.SPARQL_API, params, results)
 
             # Format to match primary API output
             formatted = []
@@ -320,23 +342,24 @@ class WikidataFetcher:
 
             return formatted
 
+        except OfflineCacheMiss:
+            return []
         except Exception as e:
             safe_print(f"  [WARN] SPARQL API error: {e}")
             return []
 
     def _get_entity_details(self, qids: List[str]) -> List[Dict]:
-        """Fetch entity details using wbgetentities API"""
+        """Fetch entity details using wbgetentities API (cached per QID)"""
         if not qids:
             return []
 
-        self._rate_limit()
-
-        try:
+        def fetch(missing: List[str]) -> Dict[str, Dict]:
+            self._rate_limit()
             resp = requests.get(
                 self.SEARCH_API,
                 params={
                     "action": "wbgetentities",
-                    "ids": "|".join(qids),
+                    "ids": "|".join(missing),
                     "props": "labels|descriptions|aliases|claims",
                     "languages": "en",
                     "format": "json"
@@ -347,19 +370,26 @@ class WikidataFetcher:
 
             if resp.status_code == 429:
                 self._mark_blocked("primary")
-                return []
+                raise RateLimited()
 
             if resp.status_code != 200:
-                return []
+                raise RuntimeError(f"HTTP {resp.status_code}")
 
             self._reset_consecutive_429s()
+            entities = resp.json().get("entities", {})
+            # Missing QIDs are left out → cached as negative
+            return {qid: e for qid, e in entities.items() if "missing" not in e}
 
-            data = resp.json()
-            entities = data.get("entities", {})
+        try:
+            entities = get_wikidata_cache().fetch_entities(
+                self.SEARCH_API, qids, fetch,
+                variant="labels|descriptions|aliases|claims:en"
+            )
 
             results = []
-            for qid, entity in entities.items():
-                if "missing" in entity:
+            for qid in qids:
+                entity = entities.get(qid)
+                if entity is None:
                     continue
 
                 # Check if human (P31 = Q5)
@@ -408,6 +438,8 @@ class WikidataFetcher:
 
             return results
 
+        except (RateLimited, OfflineCacheMiss):
+            return []
         except Exception as e:
             safe_print(f"  [WARN] Entity fetch error: {e}")
             return []
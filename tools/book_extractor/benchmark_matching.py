@@ -0,0 +1,179 @@
+"""
+EntityMatcher 벤치마크: 이름별 match() vs 단계별 일괄 match_many()
+
+추출 결과 파일(*_extraction.json) 하나의 이름 전체를 두 방식으로 매칭해서
+소요 시간, 단계별 처리 수, 결과 일치율을 비교.
+
+매칭 중 alias 저장 / 중복 병합은 하지 않음 (두 번째 실행이 첫 번째의
+alias 로 매칭되면 비교가 안 되므로).
+
+각 방식은 따로 측정: 실행마다 새 매처 + 빈 임시 Wikidata 캐시를 씀
+(먼저 돈 쪽이 채운 캐시를 뒤 쪽이 재사용하면 뒤 쪽이 빨라 보임).
+이름 사전 (프로세스 공용) 은 측정 전에 미리 로드. --repeat N 이면
+반복마다 순서를 바꿔서 (bulk→per-name, per-name→bulk) DB 버퍼 캐시
+같은 나머지 순서 효과도 상쇄하고, 방식별 중앙값을 보고.
+
+Usage:
+    python benchmark_matching.py ../../poc/data/book_samples/extraction_results/<book>_extraction.json
+    python benchmark_matching.py <file> --types person --sample 200
+    python benchmark_matching.py <file> --repeat 4
+    python benchmark_matching.py <file> --shared-cache     # 기존 Wikidata 캐시로 (warm) 비교
+    python benchmark_matching.py <file> --bulk-only
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import statistics
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from entity_matcher import EntityMatcher
+import wikidata_cache  # entity_matcher 가 poc/app/core 경로를 추가한 뒤에
+
+TYPES = {"person": "persons", "location": "locations", "event": "events"}
+
+
+class ReadOnlyMatcher(EntityMatcher):
+    """DB 에 쓰지 않는 매처 (alias 저장 / 병합 생략)"""
+
+    def _save_alias(self, entity_type, entity_id, alias, alias_type):
+        pass
+
+    def _merge_duplicates(self, entity_type, entities):
+        return self._select_primary(entities)
+
+
+def run_per_name(matcher: EntityMatcher, entity_type: str, names: list) -> tuple:
+    started = time.perf_counter()
+    results = {name: matcher.match(entity_type, name) for name in dict.fromkeys(names)}
+    return results, time.perf_counter() - started
+
+
+def run_bulk(matcher: EntityMatcher, entity_type: str, names: list) -> tuple:
+    started = time.perf_counter()
+    results = matcher.match_many(entity_type, names)
+    return results, time.perf_counter() - started
+
+
+MODES = {"bulk": run_bulk, "per-name": run_per_name}
+
+
+@contextmanager
+def wikidata_cache_at(path):
+    """프로세스 공용 Wikidata 캐시를 잠시 path 의 캐시로 교체 (None 이면 그대로)."""
+    if path is None:
+        yield
+        return
+    previous = wikidata_cache._cache
+    wikidata_cache._cache = wikidata_cache.WikidataCache(path)
+    try:
+        yield
+    finally:
+        wikidata_cache._cache = previous
+
+
+def run_isolated(mode: str, entity_type: str, names: list, cache_path) -> tuple:
+    """새 매처 + (cache_path 가 있으면) 빈 Wikidata 캐시로 한 방식만 실행"""
+    with wikidata_cache_at(cache_path):
+        matcher = ReadOnlyMatcher()
+        try:
+            results, seconds = MODES[mode](matcher, entity_type, names)
+            return results, seconds, matcher.last_match_stats
+        finally:
+            matcher.close()
+
+
+def warm_name_dictionaries(types: list) -> None:
+    matcher = ReadOnlyMatcher()
+    try:
+        for entity_type in types:
+            matcher._name_dictionary(entity_type)
+    finally:
+        matcher.close()
+
+
+def count_methods(results: dict) -> dict:
+    counts = {}
+    for r in results.values():
+        counts[r.method] = counts.get(r.method, 0) + 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-name vs staged bulk entity matching")
+    parser.add_argument("extraction", help="*_extraction.json file")
+    parser.add_argument("--types", nargs="+", default=list(TYPES), choices=list(TYPES))
+    parser.add_argument("--sample", type=int, help="Random sample of N names per type")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per mode (order alternates)")
+    parser.add_argument("--shared-cache", action="store_true",
+                        help="Use the persistent Wikidata cache instead of an empty one per run")
+    parser.add_argument("--bulk-only", action="store_true", help="Skip the per-name baseline")
+    args = parser.parse_args()
+
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
+    with open(args.extraction, 'r', encoding='utf-8') as f:
+        extraction = json.load(f)
+
+    print("=" * 50)
+    print(f"EntityMatcher Benchmark: {extraction.get('title', Path(args.extraction).name)[:60]}")
+    print(f"Wikidata cache: {'shared' if args.shared_cache else 'empty per run'}, repeat {args.repeat}")
+    print("=" * 50)
+
+    warm_name_dictionaries(args.types)
+
+    with tempfile.TemporaryDirectory(prefix="benchmark_matching_") as tmp:
+        runs = 0
+        for entity_type in args.types:
+            names = [n for n in extraction.get(TYPES[entity_type], []) if n]
+            if args.sample and len(names) > args.sample:
+                names = random.Random(0).sample(names, args.sample)
+            if not names:
+                continue
+
+            print(f"\n[{entity_type}] {len(names)} names")
+
+            modes = ["bulk"] if args.bulk_only else ["bulk", "per-name"]
+            seconds = {mode: [] for mode in modes}
+            results = {}
+            for rep in range(args.repeat):
+                order = modes if rep % 2 == 0 else modes[::-1]
+                for mode in order:
+                    runs += 1
+                    cache_path = None if args.shared_cache else Path(tmp) / f"wikidata_{runs}.sqlite3"
+                    results[mode], elapsed, stats = run_isolated(mode, entity_type, names, cache_path)
+                    seconds[mode].append(elapsed)
+                    print(f"  #{rep + 1} {mode:<9} {elapsed:8.2f}s")
+                    if mode == "bulk" and rep == 0:
+                        print(f"    resolved: exact={stats.get('exact', 0)} alias={stats.get('alias', 0)} "
+                              f"wikidata={stats.get('wikidata', 0)} embedding={stats.get('embedding', 0)} "
+                              f"unmatched={stats.get('unmatched', 0)}")
+                        print("    stage s:  " + " ".join(f"{k}={v}" for k, v in stats.get('timings', {}).items()))
+
+            bulk_s = statistics.median(seconds["bulk"])
+            print(f"  match_many: {bulk_s:8.2f}s median  ({len(names) / bulk_s:.1f} names/s)")
+            if args.bulk_only:
+                continue
+
+            single_s = statistics.median(seconds["per-name"])
+            print(f"  match:      {single_s:8.2f}s median  ({len(names) / single_s:.1f} names/s)"
+                  f"  → {single_s / bulk_s:.1f}x")
+
+            # confidence 는 LLM 응답마다 달라지므로 entity_id 로 비교 (마지막 반복 결과)
+            single, bulk = results["per-name"], results["bulk"]
+            same = sum(1 for n in single if single[n].entity_id == bulk[n].entity_id)
+            print(f"  agreement:  {same}/{len(single)} ({same / len(single):.1%})")
+            print(f"  methods:    per-name {count_methods(single)}")
+            print(f"              bulk     {count_methods(bulk)}")
+
+    print("\n" + "=" * 50)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Chunk Cache - 청크 매니페스트 + LLM 추출 결과 캐시 (SQLite)
+
+책을 다시 큐에 넣거나 다른 모델로 돌릴 때마다 구조 탐지 (정규식) 와
+청킹을 다시 하고, 모든 청크를 LLM 에 다시 보내던 것을 줄이기 위한 저장소:
+
+1. manifests - ZIM path 별 청크 경계 (+ 청크 해시) 와 구조 탐지 결과
+   - 책 내용 해시 + 청킹 설정 (CHUNKER_VERSION, chunk_size, overlap) 이
+     같을 때만 재사용, 다르면 다시 계산해서 덮어씀
+   - 본문은 저장하지 않음 (ZIM 에서 읽은 content 를 경계대로 잘라 씀)
+2. chunk_results - (청크 해시, 모델, 프롬프트 버전) 별 LLM 추출 결과
+   - 내용이 같은 청크는 재실행 / 부분 재시도 / 같은 책을 다시 큐에 넣을 때 재사용
+   - 프롬프트에 책 제목이 들어가므로 프롬프트 버전이 제목마다 다름 → 제목이
+     다른 책끼리는 같은 본문이어도 공유하지 않음
+   - 모델 비교: 모델만 바뀐 청크만 다시 요청
+   - 성공한 (비어 있지 않은) 결과만 저장
+
+job_store.py 의 청크 행과는 별개 - 작업 저장소는 실행 단위 이어하기,
+이 캐시는 실행 간 재사용.
+
+Usage:
+    cache = get_chunk_cache()
+    manifest = cache.load_manifest(zim_path, content_hash(content), params)
+    cached = cache.get_results([c["chunk_hash"] for c in chunks], model_id, prompt_version)
+    cache.put_result(chunk["chunk_hash"], model_id, prompt_version, data)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# 청킹 로직 (get_hierarchical_chunks / detect_book_structure) 이 바뀌면 올릴 것
+CHUNKER_VERSION = 1
+
+DEFAULT_PATH = Path(__file__).parent / "chunk_cache.sqlite3"
+
+# 매니페스트에 저장하는 청크 필드 (text 제외)
+MANIFEST_FIELDS = (
+    "section", "section_type", "chunk_in_section", "global_char_start",
+    "section_char_start", "content_start", "content_end", "chunk_hash",
+)
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "replace")).hexdigest()
+
+
+def chunk_hash(text: str) -> str:
+    """청크 내용 주소 (sha256 앞 32자)"""
+    return content_hash(text)[:32]
+
+
+class ChunkCache:
+    """매니페스트 + 청크 결과 저장소 (SQLite WAL, 연결 하나 + lock)"""
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self.manifest_hits = 0
+        self.manifest_misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS manifests (
+                    zim_path TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    structure TEXT NOT NULL,
+                    chunks TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS chunk_results (
+                    chunk_hash TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (chunk_hash, model, prompt_version)
+                )
+            """)
+
+    # ─── 매니페스트 ───────────────────────────────────────
+
+    @staticmethod
+    def _params_key(params: dict) -> str:
+        return json.dumps({"chunker_version": CHUNKER_VERSION, **params}, sort_keys=True)
+
+    def load_manifest(self, zim_path: str, digest: str, params: dict) -> Optional[dict]:
+        """
+        같은 내용 + 같은 청킹 설정의 매니페스트 {"structure", "chunks"}.
+        없거나 바뀌었으면 None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, params, structure, chunks FROM manifests WHERE zim_path = ?",
+                (zim_path,)
+            ).fetchone()
+
+        if row is None or row[0] != digest or row[1] != self._params_key(params):
+            self.manifest_misses += 1
+            return None
+        self.manifest_hits += 1
+        return {"structure": json.loads(row[2]), "chunks": json.loads(row[3])}
+
+    def save_manifest(self, zim_path: str, digest: str, params: dict, structure: dict, chunks: List[dict]) -> None:
+        entries = [{k: c[k] for k in MANIFEST_FIELDS} for c in chunks]
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO manifests (zim_path, content_hash, params, structure, chunks, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (zim_path) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    params = excluded.params,
+                    structure = excluded.structure,
+                    chunks = excluded.chunks,
+                    created_at = excluded.created_at
+            """, (zim_path, digest, self._params_key(params),
+                  json.dumps(structure, ensure_ascii=False),
+                  json.dumps(entries, ensure_ascii=False), time.time()))
+
+    @staticmethod
+    def chunks_from_manifest(manifest: dict, content: str) -> List[dict]:
+        """매니페스트 경계대로 content 를 잘라 청크 목록 복원"""
+        return [
+            {"text": content[c["content_start"]:c["content_end"]], **c}
+            for c in manifest["chunks"]
+        ]
+
+    # ─── 청크 결과 ────────────────────────────────────────
+
+    def get_results(self, hashes: Iterable[str], model: str, prompt_version: str) -> Dict[str, dict]:
+        """캐시된 결과 {chunk_hash: result} (한 번에 조회)"""
+        hashes = list(dict.fromkeys(hashes))
+        found: Dict[str, dict] = {}
+        with self._lock:
+            for i in range(0, len(hashes), 500):
+                batch = hashes[i:i + 500]
+                rows = self._conn.execute(
+                    f"""
+                    SELECT chunk_hash, result FROM chunk_results
+                    WHERE model = ? AND prompt_version = ?
+                      AND chunk_hash IN ({",".join("?" * len(batch))})
+                    """,
+                    (model, prompt_version, *batch)
+                ).fetchall()
+                found.update((h, json.loads(r)) for h, r in rows)
+        self.hits += len(found)
+        self.misses += len(hashes) - len(found)
+        return found
+
+    def put_result(self, hash_: str, model: str, prompt_version: str, result: dict) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT OR REPLACE INTO chunk_results (chunk_hash, model, prompt_version, result, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (hash_, model, prompt_version, json.dumps(result, ensure_ascii=False), time.time()))
+
+    def stats(self) -> dict:
+        with self._lock:
+            manifests = self._conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0]
+            by_model = dict(self._conn.execute(
+                "SELECT model, COUNT(*) FROM chunk_results GROUP BY model"
+            ).fetchall())
+        lookups = self.hits + self.misses
+        return {
+            "manifests": manifests,
+            "manifest_hits": self.manifest_hits,
+            "manifest_misses": self.manifest_misses,
+            "cached_results": by_model,
+            "result_hits": self.hits,
+            "result_misses": self.misses,
+            "result_hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+_cache: Optional[ChunkCache] = None
+
+
+def get_chunk_cache() -> ChunkCache:
+    global _cache
+    if _cache is None:
+        _cache = ChunkCache()
+    return _cache
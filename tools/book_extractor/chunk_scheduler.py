@@ -0,0 +1,249 @@
+"""
+Chunk Scheduler - 청크 단위 병렬 추출 (백엔드별 동시 실행 제한)
+
+run_extraction() 이 청크를 하나씩 순서대로 처리하던 것을, 모델 백엔드가
+감당할 수 있는 만큼 동시에 보내도록 하는 부품들:
+
+1. AdaptiveLimiter - 백엔드(ollama / openai 모델)별 동시 요청 수 제한
+   - 성공이 이어지면 한 칸씩 늘리고 (additive increase)
+   - 429 / 503 / timeout 이면 절반으로 줄이고 잠시 쉼 (multiplicative decrease)
+   - 1k chars 당 지연이 기준치의 2배를 넘는 상태가 연속되면 (서버 큐잉) 한 칸 줄임
+     (동시 수 1 에서도 계속 느리면 서버 자체가 느려진 것 → 기준치를 현재 값으로)
+2. content_fingerprint - 같은 책/청킹인지 확인 (job_store.py 의 청크 이어하기)
+3. BackendStats - 백엔드별 처리량/지연/오류 (GET /api/stats 의 "backends")
+
+Usage:
+    limiter = get_limiter("ollama", max_concurrency=3)
+    await limiter.acquire()
+    try:
+        ...
+        limiter.release(latency, chars, "success")
+    except RateLimitedError as e:
+        limiter.release(latency, chars, "rate_limited", retry_after=e.retry_after)
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+# Limiter tuning
+LATENCY_BACKOFF_RATIO = 2.0   # ms/kchar 가 기준치의 2배 이상이면 느린 샘플
+LATENCY_BACKOFF_SAMPLES = 3   # 느린 샘플이 이만큼 연속이면 동시 수 감소
+LATENCY_MIN_CHARS = 500       # 이보다 짧은 청크는 지연 통계에서 제외 (고정 오버헤드가 지배)
+RATE_LIMIT_COOLDOWN = 5.0     # Retry-After 가 없을 때 쉬는 시간 (초)
+EWMA_ALPHA = 0.3
+
+
+class RateLimitedError(Exception):
+    """백엔드가 429/503 으로 거절 (과부하)"""
+
+    def __init__(self, message: str = "rate limited", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class BackendStats:
+    """백엔드별 처리 통계"""
+    name: str
+    requests: int = 0
+    successes: int = 0
+    empty: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    rate_limited: int = 0
+    chars: int = 0
+    latency_total: float = 0.0
+    first_request_at: Optional[float] = None
+    last_request_at: Optional[float] = None
+
+    def as_dict(self) -> dict:
+        wall = (self.last_request_at - self.first_request_at) if self.first_request_at and self.last_request_at else 0
+        return {
+            "requests": self.requests,
+            "successes": self.successes,
+            "empty": self.empty,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "rate_limited": self.rate_limited,
+            "avg_latency_sec": round(self.latency_total / self.requests, 2) if self.requests else 0,
+            "chunks_per_min": round(self.successes / (wall / 60), 2) if wall > 0 else 0,
+            "chars_per_sec": round(self.chars / wall, 1) if wall > 0 else 0,
+        }
+
+
+class AdaptiveLimiter:
+    """AIMD 방식으로 동시 요청 수를 조절하는 비동기 세마포어"""
+
+    def __init__(self, name: str, max_concurrency: int, initial: int = 1):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = max(1, min(initial, self.max_concurrency))
+        self.in_flight = 0
+        self.stats = BackendStats(name=name)
+
+        self._cond: Optional[asyncio.Condition] = None
+        self._successes_at_limit = 0
+        self._cooldown_until = 0.0
+        self._ewma_ms_per_kchar: Optional[float] = None
+        self._baseline_ms_per_kchar: Optional[float] = None
+        self._latency_samples = 0
+        self._slow_samples = 0
+
+    @property
+    def cond(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """속도 모드 변경 등으로 상한 조정"""
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = min(self.limit, self.max_concurrency)
+
+    async def acquire(self) -> None:
+        async with self.cond:
+            while True:
+                wait = self._cooldown_until - time.monotonic()
+                if wait <= 0 and self.in_flight < self.limit:
+                    break
+                try:
+                    await asyncio.wait_for(self.cond.wait(), timeout=wait if wait > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+            self.in_flight += 1
+
+        now = time.time()
+        self.stats.requests += 1
+        self.stats.first_request_at = self.stats.first_request_at or now
+
+    def release(
+        self,
+        latency: float,
+        chars: int,
+        outcome: str,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        요청 종료 기록 + 동시 수 조정.
+
+        outcome: success | empty | error | timeout | rate_limited
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+        self.stats.latency_total += latency
+        self.stats.last_request_at = time.time()
+
+        if outcome == "success":
+            self.stats.successes += 1
+            self.stats.chars += chars
+            self._on_success(latency, chars)
+        elif outcome in ("timeout", "rate_limited"):
+            if outcome == "timeout":
+                self.stats.timeouts += 1
+            else:
+                self.stats.rate_limited += 1
+                self._cooldown_until = time.monotonic() + (retry_after or RATE_LIMIT_COOLDOWN)
+            self.limit = max(1, self.limit // 2)
+            self._successes_at_limit = 0
+        elif outcome == "empty":
+            self.stats.empty += 1
+        else:
+            self.stats.errors += 1
+
+        try:
+            asyncio.get_running_loop().create_task(self._notify())
+        except RuntimeError:
+            pass  # 이벤트 루프 종료 중
+
+    def _on_success(self, latency: float, chars: int) -> None:
+        if chars >= LATENCY_MIN_CHARS and self._is_slow(latency * 1000 / (chars / 1000)):
+            return
+
+        # 현재 동시 수만큼 연속 성공하면 한 칸 증가
+        self._successes_at_limit += 1
+        if self._successes_at_limit >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes_at_limit = 0
+
+    def _is_slow(self, ms_per_kchar: float) -> bool:
+        """
+        지연 샘플 반영. 기준치 대비 느린 상태면 True (증가 보류),
+        느린 샘플이 LATENCY_BACKOFF_SAMPLES 번 연속이면 한 칸 감소.
+        """
+        self._latency_samples += 1
+        if self._ewma_ms_per_kchar is None:
+            self._ewma_ms_per_kchar = ms_per_kchar
+            return False
+
+        ewma = self._ewma_ms_per_kchar = (
+            EWMA_ALPHA * ms_per_kchar + (1 - EWMA_ALPHA) * self._ewma_ms_per_kchar
+        )
+        # 처음 몇 샘플은 EWMA 가 자리 잡을 때까지 기준치 없음 (첫 샘플 하나에 고정 X)
+        if self._latency_samples < LATENCY_BACKOFF_SAMPLES:
+            return False
+        if self._baseline_ms_per_kchar is None:
+            self._baseline_ms_per_kchar = ewma
+            return False
+
+        self._baseline_ms_per_kchar = min(self._baseline_ms_per_kchar, ewma)
+
+        if ewma <= self._baseline_ms_per_kchar * LATENCY_BACKOFF_RATIO:
+            self._slow_samples = 0
+            return False
+
+        self._slow_samples += 1
+        if self._slow_samples < LATENCY_BACKOFF_SAMPLES:
+            return True
+        self._slow_samples = 0
+        if self.limit > 1:
+            # 지연이 계속 크게 늘어 있으면 서버가 요청을 쌓아두는 중 → 한 칸 감소.
+            # 줄인 뒤 지연이 내려오면 느린 상태가 풀리고 다시 증가 경로로
+            self.limit -= 1
+            self._successes_at_limit = 0
+            return True
+        # 동시 수 1 인데도 느림 → 우리 부하가 아니라 서버가 느려진 것. 기준치를 다시 잡고 증가 허용
+        self._baseline_ms_per_kchar = ewma
+        return False
+
+    async def _notify(self) -> None:
+        async with self.cond:
+            self.cond.notify_all()
+
+    def as_dict(self) -> dict:
+        cooldown = max(0.0, self._cooldown_until - time.monotonic())
+        return {
+            **self.stats.as_dict(),
+            "concurrency": self.limit,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "cooldown_sec": round(cooldown, 1),
+            "ms_per_kchar": round(self._ewma_ms_per_kchar, 1) if self._ewma_ms_per_kchar else None,
+        }
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(backend: str, max_concurrency: int) -> AdaptiveLimiter:
+    """백엔드별 공유 limiter (상한은 호출 시점 설정으로 갱신)"""
+    limiter = _limiters.get(backend)
+    if limiter is None:
+        limiter = _limiters[backend] = AdaptiveLimiter(backend, max_concurrency)
+    elif limiter.max_concurrency != max_concurrency:
+        limiter.set_max_concurrency(max_concurrency)
+    return limiter
+
+
+def get_backend_stats() -> Dict[str, dict]:
+    return {name: limiter.as_dict() for name, limiter in _limiters.items()}
+
+
+# ============ Fingerprint ============
+
+def content_fingerprint(content: str, total_chunks: int) -> str:
+    """같은 책/같은 청킹인지 확인용"""
+    digest = hashlib.sha1(content.encode("utf-8", "replace")).hexdigest()[:16]
+    return f"{digest}:{total_chunks}"
@@ -2,8 +2,9 @@
 Entity Matcher Service
 
 책에서 추출된 엔티티를 DB와 매칭하는 5단계 파이프라인:
-1. Exact Match - 이름 정확히 일치
-2. Alias Match - entity_aliases 테이블에서 검색
+1. Exact Match - 이름 정확히 일치 (정규화: 대소문자/발음 기호/서수 표기)
+2. Alias Match - entity_aliases 에서 검색
+   → 1-2 는 메모리 이름 사전 (poc/app/core/name_dictionary.py) 으로 처리
 3. Wikidata QID - Wikidata 검색 → 기존 QID와 매칭
 4. Embedding Similarity - 임베딩 유사도 검색
 5. LLM Verification - 최종 검증
@@ -14,12 +15,18 @@ Usage:
     matcher = EntityMatcher()
     result = matcher.match('person', 'Napoleon Bonaparte')
     # MatchResult(matched=True, entity_id=26, confidence=0.98, method='wikidata')
+
+    # 책 한 권 분량: 단계별로 이름 전체를 한 번에 처리
+    results = matcher.match_many('person', ['Napoleon', 'Caesar', ...])
+    # {'Napoleon': MatchResult(...), 'Caesar': MatchResult(...)}
 """
 
 import os
 import sys
 import json
+import time
 import httpx
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -49,7 +56,12 @@ def _load_env():
             break
 
 _load_env()
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
+
+# 이름/별칭 사전 (poc/app/core/name_dictionary.py, stdlib only) - Stage 1-2 를 메모리에서
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'poc' / 'app' / 'core'))
+from name_dictionary import get_name_dictionary, note_local_write, KIND_NAME, KIND_ALIAS
+from wikidata_cache import get_wikidata_cache, OfflineCacheMiss
 
 # OpenAI for embeddings
 try:
@@ -58,17 +70,28 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
-# DB 설정
-DB_CONFIG = {
-    'host': 'localhost',
-    'port': 5432,
-    'dbname': 'chaldeas',
-    'user': 'chaldeas',
-    'password': 'chaldeas_dev'
-}
+# DB 설정 (DATABASE_URL, 서버의 연결 풀과 같은 접속 정보)
+from db_pool import DATABASE_URL
+
+# 임베딩 후보 검색 방식 (BOOK_EXTRACTOR_EMBEDDING_CANDIDATES)
+# - vector (기본): 원본 벡터 cosine 검색 (ivfflat 인덱스)
+# - binary: binary-quantized HNSW 인덱스 (006_quantized_embedding_indexes) 로
+#   결과 수 × RERANK_FACTOR 만큼 후보를 뽑고 원본 float32 벡터로 재정렬.
+#   실제 데이터에서 recall 확인 후 사용
+EMBEDDING_DIM = 1536
+EMBEDDING_CANDIDATES = os.getenv("BOOK_EXTRACTOR_EMBEDDING_CANDIDATES", "vector")
+EMBEDDING_RERANK_FACTOR = int(os.getenv("BOOK_EXTRACTOR_EMBEDDING_RERANK_FACTOR", "8"))
+if EMBEDDING_CANDIDATES not in ("vector", "binary"):
+    raise ValueError(f"BOOK_EXTRACTOR_EMBEDDING_CANDIDATES must be vector or binary, got {EMBEDDING_CANDIDATES!r}")
+# 일괄 검색 시 SQL 1회에 넣는 이름 수 (임베딩 API 요청 1회 = 같은 단위)
+EMBEDDING_BATCH_SIZE = 200
 
 # Wikidata API
 WIKIDATA_API = "https://www.wikidata.org/w/api.php"
+# match_many() 의 Wikidata 검색 동시 요청 수 (API 예절상 작게 유지)
+WIKIDATA_MAX_WORKERS = 4
+# 캐시 miss (실제 요청) 간 최소 간격 (초)
+WIKIDATA_MIN_INTERVAL = 0.1
 
 # Ollama 설정 (LLM 검증용)
 OLLAMA_URL = "http://localhost:11434"
@@ -103,24 +126,35 @@ class EntityMatcher:
     매칭 실패 시 새 엔티티 생성.
     """
 
-    def __init__(self, auto_create: bool = False):
+    def __init__(self, auto_create: bool = False, conn=None):
         """
         Args:
             auto_create: True면 매칭 실패 시 자동으로 새 엔티티 생성
+            conn: 빌려 쓰는 연결 (db_pool.connection()). 없으면 직접 연결하고
+                  close() 때 닫음
         """
         self.auto_create = auto_create
-        self._conn = None
+        self._conn = conn
+        self._owns_conn = conn is None
+        self._openai = None
+        # prefetch_embedding_candidates() 결과: (type, name, limit, min_sim) → 후보
+        self._embedding_candidates: Dict[tuple, List[MatchCandidate]] = {}
+        # 마지막 match_many() 의 단계별 처리 수/시간
+        self.last_match_stats: Dict[str, Any] = {}
+        # 이름 사전에 반영했지만 signature 갱신이 남은 entity_type
+        self._name_writes: set = set()
 
     @property
     def conn(self):
         """Lazy DB connection"""
         if self._conn is None or self._conn.closed:
-            self._conn = psycopg2.connect(**DB_CONFIG)
+            self._conn = psycopg2.connect(DATABASE_URL)
+            self._owns_conn = True
         return self._conn
 
     def close(self):
-        """DB 연결 종료"""
-        if self._conn and not self._conn.closed:
+        """DB 연결 종료 (빌려 쓴 연결은 풀에 돌려주는 쪽에서 처리)"""
+        if self._owns_conn and self._conn and not self._conn.closed:
             self._conn.close()
 
     # ─── 메인 매칭 메서드 ─────────────────────────────────────
@@ -137,51 +171,173 @@ class EntityMatcher:
         Returns:
             MatchResult
         """
-        table = self._get_table(entity_type)
-
-        # 1. Exact match
-        entity = self._exact_match(table, name)
-        if entity:
-            return MatchResult(True, entity['id'], 1.0, 'exact')
+        try:
+            return self._match(entity_type, name, context)
+        finally:
+            self._flush_name_writes()
 
-        # 2. Alias match
-        entity = self._alias_match(entity_type, name)
-        if entity:
-            return MatchResult(True, entity['id'], 0.95, 'alias')
+    def _match(self, entity_type: str, name: str, context: str = None) -> MatchResult:
+        table = self._get_table(entity_type)
+        names = self._name_dictionary(entity_type)
+
+        if names is not None:
+            # 1-2. Exact / alias (메모리 사전)
+            result = self._dictionary_match(names, name)
+            if result:
+                return result
+        else:
+            # 1. Exact match
+            entity = self._exact_match(table, name)
+            if entity:
+                return MatchResult(True, entity['id'], 1.0, 'exact')
+
+            # 2. Alias match
+            entity = self._alias_match(entity_type, name)
+            if entity:
+                return MatchResult(True, entity['id'], 0.95, 'alias')
 
         # 3. Wikidata QID
         qid = self._search_wikidata(name, entity_type)
         if qid:
-            entities = self._find_by_qid(table, qid)
-            if entities:
-                if len(entities) > 1:
-                    # QID 중복 발견 → 자동 병합
-                    primary = self._merge_duplicates(entity_type, entities)
-                    self._save_alias(entity_type, primary['id'], name, 'merged')
-                    return MatchResult(True, primary['id'], 0.98, 'wikidata', merged=True)
-                else:
-                    self._save_alias(entity_type, entities[0]['id'], name, 'wikidata')
-                    return MatchResult(True, entities[0]['id'], 0.98, 'wikidata')
-
-        # 4. Embedding similarity
-        candidates = self._embedding_search(entity_type, name)
-        if candidates:
-            # 높은 유사도면 바로 매칭
-            if candidates[0].similarity >= 0.95:
-                self._save_alias(entity_type, candidates[0].entity_id, name, 'learned')
-                return MatchResult(True, candidates[0].entity_id, candidates[0].similarity, 'embedding')
-
-            # 5. LLM verification (0.85-0.95 구간)
-            best = self._llm_verify(entity_type, name, context, candidates)
-            if best and best.similarity >= 0.9:
-                self._save_alias(entity_type, best.entity_id, name, 'learned')
-                return MatchResult(True, best.entity_id, best.similarity, 'llm')
+            result = self._resolve_qid_match(entity_type, name, self._find_by_qid(table, qid))
+            if result:
+                return result
+
+        # 4. Embedding similarity + 5. LLM verification
+        result = self._resolve_embedding_match(
+            entity_type, name, context, self._embedding_search(entity_type, name)
+        )
+        if result:
+            return result
+
+        return self._no_match(entity_type, name, qid)
+
+    def match_many(self, entity_type: str, names: List[str],
+                   contexts: Optional[Dict[str, str]] = None) -> Dict[str, MatchResult]:
+        """
+        여러 이름을 단계별로 한 번에 매칭 (책 한 권 분량).
+
+        match() 를 이름마다 부르면 이름 × 단계 만큼 쿼리/API 호출이 생기므로,
+        각 단계를 이름 전체에 대해 한 번씩 실행하고 매칭 안 된 이름만 다음 단계로:
+        1-2. 메모리 이름 사전 (없으면 임시 테이블 + 조인 1회씩)
+        3.   Wikidata 검색 병렬 (WIKIDATA_MAX_WORKERS) + QID 조회 쿼리 1회
+        4.   임베딩 API + 벡터 검색 EMBEDDING_BATCH_SIZE 단위 1회
+        5.   LLM 검증은 애매한 구간(0.85-0.95)만 이름별로
+
+        Args:
+            entity_type: 'person', 'location', 'event'
+            names: 엔티티 이름 목록 (중복/빈 문자열 무시)
+            contexts: {name: 문맥} (LLM 검증용)
+
+        Returns:
+            {name: MatchResult} (입력 순서)
+        """
+        contexts = contexts or {}
+        table = self._get_table(entity_type)
+        pending = list(dict.fromkeys(n for n in names if n))
+        results: Dict[str, MatchResult] = {}
+        stats = {'names': len(pending), 'timings': {}}
+
+        def stage(label: str, started: float, resolved: int):
+            stats[label] = resolved
+            stats['timings'][label] = round(time.perf_counter() - started, 3)
+
+        # 1-2. Exact + alias
+        started = time.perf_counter()
+        names_dict = self._name_dictionary(entity_type)
+        if names_dict is not None:
+            for name in pending:
+                result = self._dictionary_match(names_dict, name)
+                if result:
+                    results[name] = result
+        else:
+            exact, alias = self._bulk_exact_alias_match(entity_type, table, pending)
+            for name, entity in exact.items():
+                results[name] = MatchResult(True, entity['id'], 1.0, 'exact')
+            for name, entity in alias.items():
+                results[name] = MatchResult(True, entity['id'], 0.95, 'alias')
+        pending = [n for n in pending if n not in results]
+        stage('exact', started, sum(1 for r in results.values() if r.method == 'exact'))
+        # exact 와 같은 단계 (timings['exact'] 에 포함)
+        stats['alias'] = sum(1 for r in results.values() if r.method == 'alias')
+
+        # 3. Wikidata QID
+        started = time.perf_counter()
+        qids = self._search_wikidata_many(pending, entity_type)
+        by_qid = self._find_by_qids(table, list(set(qids.values())))
+        resolved = 0
+        for name in pending:
+            qid = qids.get(name)
+            if not qid or qid not in by_qid:
+                continue
+            result = self._resolve_qid_match(entity_type, name, by_qid[qid])
+            if result:
+                results[name] = result
+                resolved += 1
+                if result.merged:
+                    # 병합으로 삭제된 엔티티가 다른 이름의 후보로 남지 않도록
+                    by_qid[qid] = [e for e in by_qid[qid] if e['id'] == result.entity_id]
+        pending = [n for n in pending if n not in results]
+        stage('wikidata', started, resolved)
+
+        # 4-5. Embedding similarity + LLM verification
+        started = time.perf_counter()
+        candidates = self._embedding_candidates_many(entity_type, pending)
+        resolved = 0
+        for name in pending:
+            result = self._resolve_embedding_match(
+                entity_type, name, contexts.get(name), candidates.get(name, [])
+            )
+            if result:
+                results[name] = result
+                resolved += 1
+        pending = [n for n in pending if n not in results]
+        stage('embedding', started, resolved)
 
         # No match
+        for name in pending:
+            results[name] = self._no_match(entity_type, name, qids.get(name))
+        stats['unmatched'] = len(pending)
+        self.last_match_stats = stats
+        self._flush_name_writes()
+
+        return {n: results[n] for n in dict.fromkeys(n for n in names if n)}
+
+    def _resolve_qid_match(self, entity_type: str, name: str,
+                           entities: List[Dict]) -> Optional[MatchResult]:
+        """Stage 3: QID 로 찾은 엔티티 → 결과 (중복이면 병합)"""
+        if not entities:
+            return None
+        if len(entities) > 1:
+            # QID 중복 발견 → 자동 병합
+            primary = self._merge_duplicates(entity_type, entities)
+            self._save_alias(entity_type, primary['id'], name, 'merged')
+            return MatchResult(True, primary['id'], 0.98, 'wikidata', merged=True)
+        self._save_alias(entity_type, entities[0]['id'], name, 'wikidata')
+        return MatchResult(True, entities[0]['id'], 0.98, 'wikidata')
+
+    def _resolve_embedding_match(self, entity_type: str, name: str, context: Optional[str],
+                                 candidates: List[MatchCandidate]) -> Optional[MatchResult]:
+        """Stage 4-5: 임베딩 후보 → 결과 (애매하면 LLM 검증)"""
+        if not candidates:
+            return None
+
+        # 높은 유사도면 바로 매칭
+        if candidates[0].similarity >= 0.95:
+            self._save_alias(entity_type, candidates[0].entity_id, name, 'learned')
+            return MatchResult(True, candidates[0].entity_id, candidates[0].similarity, 'embedding')
+
+        # 5. LLM verification (0.85-0.95 구간)
+        best = self._llm_verify(entity_type, name, context, candidates)
+        if best and best.similarity >= 0.9:
+            self._save_alias(entity_type, best.entity_id, name, 'learned')
+            return MatchResult(True, best.entity_id, best.similarity, 'llm')
+        return None
+
+    def _no_match(self, entity_type: str, name: str, qid: Optional[str]) -> MatchResult:
         if self.auto_create:
             new_entity = self._create_entity(entity_type, name, qid)
             return MatchResult(True, new_entity['id'], 1.0, 'new')
-
         return MatchResult(False, None, 0.0, 'none', details={'wikidata_qid': qid})
 
     def match_person(self, name: str, context: str = None) -> MatchResult:
@@ -207,6 +363,104 @@ class EntityMatcher:
         """, (name,))
         return cur.fetchone()
 
+    def _name_dictionary(self, entity_type: str):
+        """프로세스 공용 이름 사전 (로드 실패 시 None → SQL 경로)."""
+        try:
+            return get_name_dictionary(self.conn, entity_type)
+        except Exception as e:
+            print(f"Name dictionary unavailable ({entity_type}): {e}")
+            self.conn.rollback()
+            return None
+
+    def _dictionary_match(self, names, name: str) -> Optional[MatchResult]:
+        """Stage 1-2 (사전): 이름 → exact, 별칭 → alias"""
+        entity_id = names.lookup_id(name, KIND_NAME)
+        if entity_id is not None:
+            return MatchResult(True, entity_id, 1.0, 'exact')
+        entity_id = names.lookup_id(name, KIND_ALIAS)
+        if entity_id is not None:
+            return MatchResult(True, entity_id, 0.95, 'alias')
+        return None
+
+    def _sync_name(self, entity_type: str, name: str, entity_id: int, kind: str):
+        """DB 쓰기를 이름 사전에 반영 (signature 갱신은 _flush_name_writes)."""
+        names = self._name_dictionary(entity_type)
+        if names is not None:
+            names.add(name, entity_id, kind)
+            self._name_writes.add(entity_type)
+
+    def _flush_name_writes(self):
+        """자기 쓰기 때문에 사전 전체를 다시 로드하지 않도록 signature 갱신."""
+        for entity_type in self._name_writes:
+            try:
+                note_local_write(self.conn, entity_type)
+            except Exception as e:
+                print(f"Name dictionary signature error: {e}")
+                self.conn.rollback()
+        self._name_writes.clear()
+
+    def _bulk_exact_alias_match(self, entity_type: str, table: str,
+                                names: List[str]) -> tuple:
+        """
+        Stage 1-2 일괄: 이름을 임시 테이블에 넣고 exact / alias 조인 1회씩.
+
+        이름별 LOWER(col) = LOWER(%s) 대신 LOWER(col) 을 한 번 계산해서
+        해시 조인. exact 로 찾은 이름은 alias 조인에서 제외.
+
+        Returns:
+            ({name: entity}, {name: entity})
+        """
+        if not names:
+            return {}, {}
+
+        name_col = 'title' if table == 'events' else 'name'
+        exact: Dict[str, Dict] = {}
+        alias: Dict[str, Dict] = {}
+        try:
+            cur = self.conn.cursor(cursor_factory=RealDictCursor)
+            cur.execute("""
+                CREATE TEMP TABLE match_names (
+                    idx INTEGER PRIMARY KEY,
+                    lname TEXT NOT NULL
+                ) ON COMMIT DROP
+            """)
+            execute_values(
+                cur,
+                "INSERT INTO match_names (idx, lname) VALUES %s",
+                [(i, n.lower()) for i, n in enumerate(names)],
+                page_size=1000
+            )
+            cur.execute("ANALYZE match_names")
+
+            cur.execute(f"""
+                SELECT DISTINCT ON (n.idx) n.idx, t.id, t.{name_col} as name, t.wikidata_id
+                FROM match_names n
+                JOIN {table} t ON LOWER(t.{name_col}) = n.lname
+                ORDER BY n.idx, t.id
+            """)
+            exact_idx = []
+            for row in cur.fetchall():
+                exact_idx.append(row['idx'])
+                exact[names[row.pop('idx')]] = row
+
+            cur.execute(f"""
+                SELECT DISTINCT ON (n.idx) n.idx, t.id, t.{name_col} as name, t.wikidata_id
+                FROM match_names n
+                JOIN entity_aliases a
+                  ON a.entity_type = %s AND LOWER(a.alias) = n.lname
+                JOIN {table} t ON t.id = a.entity_id
+                WHERE n.idx <> ALL(%s::int[])
+                ORDER BY n.idx, a.entity_id
+            """, (entity_type, exact_idx))
+            for row in cur.fetchall():
+                alias[names[row.pop('idx')]] = row
+
+            self.conn.commit()  # 임시 테이블 정리
+        except Exception as e:
+            print(f"Bulk exact/alias match error: {e}")
+            self.conn.rollback()
+        return exact, alias
+
     # ─── Stage 2: Alias Match ─────────────────────────────────
 
     def _alias_match(self, entity_type: str, name: str) -> Optional[Dict]:
@@ -230,7 +484,7 @@ class EntityMatcher:
     # ─── Stage 3: Wikidata QID ────────────────────────────────
 
     def _search_wikidata(self, name: str, entity_type: str) -> Optional[str]:
-        """Wikidata에서 이름 검색 → QID 반환"""
+        """Wikidata에서 이름 검색 → QID 반환 (영구 캐시 공유, wikidata_cache.py)"""
         try:
             params = {
                 "action": "wbsearchentities",
@@ -244,17 +498,49 @@ class EntityMatcher:
                 "User-Agent": "CHALDEAS/1.0 (https://chaldeas.site; contact@chaldeas.site)"
             }
 
-            resp = httpx.get(WIKIDATA_API, params=params, headers=headers, timeout=10)
-            data = resp.json()
+            def fetch():
+                resp = httpx.get(WIKIDATA_API, params=params, headers=headers, timeout=10)
+                resp.raise_for_status()  # 429 등은 캐시하지 않음
+                return resp.json().get("search", [])
 
-            if data.get("search"):
+            results = get_wikidata_cache().fetch(
+                WIKIDATA_API, params, fetch, min_interval=WIKIDATA_MIN_INTERVAL
+            )
+            if results:
                 # 첫 번째 결과 반환 (향후: entity_type으로 필터링 가능)
-                return data["search"][0]["id"]
+                return results[0]["id"]
+        except OfflineCacheMiss:
+            pass  # WIKIDATA_CACHE_OFFLINE: 캐시에 없는 이름
         except Exception as e:
             print(f"Wikidata search error: {e}")
 
         return None
 
+    def _search_wikidata_many(self, names: List[str], entity_type: str) -> Dict[str, str]:
+        """여러 이름 Wikidata 검색 (병렬) → {name: QID}"""
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=WIKIDATA_MAX_WORKERS) as executor:
+            qids = executor.map(lambda n: self._search_wikidata(n, entity_type), names)
+            return {name: qid for name, qid in zip(names, qids) if qid}
+
+    def _find_by_qids(self, table: str, qids: List[str]) -> Dict[str, List[Dict]]:
+        """DB에서 여러 QID 한 번에 조회 → {QID: [엔티티]}"""
+        if not qids:
+            return {}
+        cur = self.conn.cursor(cursor_factory=RealDictCursor)
+        name_col = 'title' if table == 'events' else 'name'
+        cur.execute(f"""
+            SELECT id, {name_col} as name, wikidata_id
+            FROM {table}
+            WHERE wikidata_id = ANY(%s)
+            ORDER BY id
+        """, (qids,))
+        found: Dict[str, List[Dict]] = {}
+        for row in cur.fetchall():
+            found.setdefault(row['wikidata_id'], []).append(row)
+        return found
+
     def _find_by_qid(self, table: str, qid: str) -> List[Dict]:
         """DB에서 QID로 엔티티 찾기"""
         cur = self.conn.cursor(cursor_factory=RealDictCursor)
@@ -270,66 +556,154 @@ class EntityMatcher:
 
     def _embedding_search(self, entity_type: str, name: str,
                           limit: int = 5, min_sim: float = 0.85) -> List[MatchCandidate]:
-        """임베딩 유사도로 후보 검색"""
-        if not OPENAI_AVAILABLE:
-            return []
+        """임베딩 유사도로 후보 검색 (prefetch 된 결과가 있으면 재사용)"""
+        key = (entity_type, name, limit, min_sim)
+        if key in self._embedding_candidates:
+            return self._embedding_candidates.pop(key)
+        return self._embedding_search_batch(entity_type, [name], limit, min_sim).get(name, [])
+
+    def _embedding_candidates_many(self, entity_type: str, names: List[str],
+                                   limit: int = 5, min_sim: float = 0.85) -> Dict[str, List[MatchCandidate]]:
+        """prefetch 된 후보 + 나머지 이름 일괄 검색"""
+        found: Dict[str, List[MatchCandidate]] = {}
+        missing = []
+        for name in names:
+            key = (entity_type, name, limit, min_sim)
+            if key in self._embedding_candidates:
+                found[name] = self._embedding_candidates.pop(key)
+            else:
+                missing.append(name)
+        found.update(self._embedding_search_batch(entity_type, missing, limit, min_sim))
+        return found
+
+    def prefetch_embedding_candidates(self, entity_type: str, names: List[str],
+                                      limit: int = 5, min_sim: float = 0.85) -> int:
+        """
+        책 전체 매칭 전에 Stage 4 후보를 일괄 조회.
 
-        try:
-            # 이름 임베딩 생성
-            query_embedding = self._get_embedding(name)
-            if not query_embedding:
-                return []
+        이름별 임베딩 호출 + 쿼리 대신 임베딩 API 1회 + SQL 1회
+        (EMBEDDING_BATCH_SIZE 단위)로 가져와서, 이후 match() 의 Stage 4 에서 사용.
 
-            table = self._get_table(entity_type)
-            cur = self.conn.cursor(cursor_factory=RealDictCursor)
+        Returns:
+            조회한 이름 수
+        """
+        unique = list(dict.fromkeys(n for n in names if n))
+        found = self._embedding_search_batch(entity_type, unique, limit, min_sim)
+        for name in unique:
+            self._embedding_candidates[(entity_type, name, limit, min_sim)] = found.get(name, [])
+        return len(unique)
+
+    def _embedding_search_batch(self, entity_type: str, names: List[str],
+                                limit: int = 5, min_sim: float = 0.85) -> Dict[str, List[MatchCandidate]]:
+        """
+        여러 이름의 임베딩 후보를 한 번에 검색.
 
-            # pgvector 유사도 검색 (cosine similarity)
-            name_col = 'title' if table == 'events' else 'name'
-            cur.execute(f"""
-                SELECT id, {name_col} as name, wikidata_id,
-                       1 - (embedding <=> %s::vector) as similarity
-                FROM {table}
-                WHERE embedding IS NOT NULL
-                AND 1 - (embedding <=> %s::vector) > %s
-                ORDER BY embedding <=> %s::vector
-                LIMIT %s
-            """, (query_embedding, query_embedding, min_sim, query_embedding, limit))
-
-            candidates = []
-            for row in cur.fetchall():
-                candidates.append(MatchCandidate(
-                    entity_id=row['id'],
-                    name=row['name'],
-                    similarity=row['similarity'],
-                    wikidata_id=row.get('wikidata_id')
-                ))
+        VALUES 리스트 + LATERAL top-k 로 이름 전체를 SQL 1회에 검색.
+        EMBEDDING_CANDIDATES=binary 면 이름마다 binary 인덱스 후보 → 원본 벡터 재정렬.
+        """
+        if not OPENAI_AVAILABLE or not names:
+            return {}
 
-            return candidates
+        try:
+            table = self._get_table(entity_type)
+            name_col = 'title' if table == 'events' else 'name'
+            results: Dict[str, List[MatchCandidate]] = {}
+
+            if EMBEDDING_CANDIDATES == "binary":
+                candidate_order = (f"binary_quantize(embedding)::bit({EMBEDDING_DIM})"
+                                   f" <~> binary_quantize(q.vec)")
+                pool = limit * EMBEDDING_RERANK_FACTOR
+            else:
+                candidate_order = "embedding <=> q.vec"
+                pool = limit
+
+            for start in range(0, len(names), EMBEDDING_BATCH_SIZE):
+                batch = names[start:start + EMBEDDING_BATCH_SIZE]
+                embeddings = self._get_embeddings(batch)
+
+                queries = [(n, e) for n, e in zip(batch, embeddings) if e]
+                if not queries:
+                    continue
+
+                params = {
+                    'pool': pool,
+                    'min_sim': min_sim,
+                    'limit': limit,
+                }
+                values = []
+                for i, (_, embedding) in enumerate(queries):
+                    params[f'vec_{i}'] = embedding
+                    values.append(f"({i}, %(vec_{i})s::vector)")
+
+                # pgvector 유사도 검색 (cosine similarity)
+                # 1) 인덱스 순서 (vector: cosine / binary: hamming) 로 후보 추림
+                # 2) 원본 벡터로 min_sim 필터 + 재정렬 (vector 면 순서 그대로)
+                cur = self.conn.cursor(cursor_factory=RealDictCursor)
+                cur.execute(f"""
+                    SELECT q.idx, c.id, c.name, c.wikidata_id, c.similarity
+                    FROM (VALUES {", ".join(values)}) AS q(idx, vec)
+                    CROSS JOIN LATERAL (
+                        SELECT id, name, wikidata_id,
+                               1 - (embedding <=> q.vec) as similarity
+                        FROM (
+                            SELECT id, {name_col} as name, wikidata_id, embedding
+                            FROM {table}
+                            WHERE embedding IS NOT NULL
+                            ORDER BY {candidate_order}
+                            LIMIT %(pool)s
+                        ) candidates
+                        WHERE 1 - (embedding <=> q.vec) > %(min_sim)s
+                        ORDER BY embedding <=> q.vec
+                        LIMIT %(limit)s
+                    ) c
+                    ORDER BY q.idx, c.similarity DESC
+                """, params)
+
+                for name, _ in queries:
+                    results[name] = []
+                for row in cur.fetchall():
+                    results[queries[row['idx']][0]].append(MatchCandidate(
+                        entity_id=row['id'],
+                        name=row['name'],
+                        similarity=row['similarity'],
+                        wikidata_id=row.get('wikidata_id')
+                    ))
+
+            return results
 
         except Exception as e:
             print(f"Embedding search error: {e}")
-            return []
+            # 실패한 트랜잭션이 이후 Stage 1~3 쿼리를 막지 않도록
+            if self._conn is not None and not self._conn.closed:
+                self._conn.rollback()
+            return {}
 
     def _get_embedding(self, text: str) -> Optional[List[float]]:
         """OpenAI 임베딩 생성"""
-        if not OPENAI_AVAILABLE:
-            return None
+        return self._get_embeddings([text])[0]
+
+    def _get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """OpenAI 임베딩 일괄 생성 (API 1회 호출)"""
+        if not OPENAI_AVAILABLE or not texts:
+            return [None] * len(texts)
 
         try:
             api_key = os.environ.get("OPENAI_API_KEY")
             if not api_key:
-                return None
+                return [None] * len(texts)
 
-            client = OpenAI(api_key=api_key)
-            response = client.embeddings.create(
+            if self._openai is None:
+                self._openai = OpenAI(api_key=api_key)
+            response = self._openai.embeddings.create(
                 model="text-embedding-3-small",
-                input=text
+                input=texts
             )
-            return response.data[0].embedding
+            by_index = {d.index: d.embedding for d in response.data}
+            return [by_index.get(i) for i in range(len(texts))]
 
         except Exception as e:
             print(f"Embedding error: {e}")
-            return None
+            return [None] * len(texts)
 
     # ─── Stage 5: LLM Verification ────────────────────────────
 
@@ -450,6 +824,12 @@ If no match, respond:
                 cur.execute(f"DELETE FROM {table} WHERE id = %s", (entity['id'],))
 
         self.conn.commit()
+        names = self._name_dictionary(entity_type)
+        if names is not None:
+            for entity in entities:
+                if entity['id'] != primary['id']:
+                    names.remove_entity(entity['id'])
+            self._name_writes.add(entity_type)
         print(f"Merged {len(entities)} duplicates → {primary['name']} (id={primary['id']})")
         return primary
 
@@ -552,6 +932,8 @@ If no match, respond:
         except Exception as e:
             self.conn.rollback()
             print(f"Error saving alias: {e}")
+            return
+        self._sync_name(entity_type, alias, entity_id, KIND_ALIAS)
 
     # ─── 새 엔티티 생성 ───────────────────────────────────────
 
@@ -580,7 +962,9 @@ If no match, respond:
             """, (name, qid, datetime.utcnow()))
 
         self.conn.commit()
-        return cur.fetchone()
+        entity = cur.fetchone()
+        self._sync_name(entity_type, name, entity['id'], KIND_NAME)
+        return entity
 
     # ─── 유틸리티 ─────────────────────────────────────────────
 
@@ -0,0 +1,494 @@
+"""
+Job Store - 추출 큐 / 추출 작업 / 매칭 작업 상태 저장소 (SQLite)
+
+server.py 가 모듈 전역 dict (extraction_tasks, matching_tasks, queue_state)
+에 이름 set 과 청크 결과 전체를 들고 있다가 queue_state.json 을 통째로
+다시 쓰던 것을 대체:
+
+1. queue_books / queue_errors / queue_state - 큐 (책 1권 = 1행, 상태 컬럼)
+   - 다음 책은 (status, position) 인덱스로 조회, 처리 중 죽은 책은 재시작 때 다시 queued
+   - queue_state 는 running / paused / speed_mode 등 스칼라만 (key → JSON)
+2. extraction_jobs / extraction_chunks / extraction_entities - 책별 추출 작업
+   - 완료된 청크 결과는 1행씩 바로 추가 (이전 ChunkCheckpoint JSONL 대체)
+   - 인물/장소/사건 이름은 (book_id, type, name) PK 로 중복 제거,
+     개수는 작업 행에 누적 → 상태 조회가 집합을 들고 있지 않아도 됨
+   - 책 내용/청킹이 바뀌었으면 (fingerprint) 이전 청크 행을 버리고 처음부터
+3. matching_jobs / match_results - 책별 매칭 작업과 결과 (결과 1개 = 1행)
+
+메모리에는 진행 중인 청크만 남고, 상태 API 는 인덱스 조회만 함.
+연결 하나 + lock (chunk_cache.py 와 같은 방식, WAL).
+
+Usage:
+    store = get_job_store()
+    done = store.start_extraction(book_id, fingerprint, total, model, structure)
+    store.add_chunk_result(book_id, chunk_result, progress)
+    job = store.get_extraction(book_id)      # {"status", "progress", "persons_count", ...}
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PATH = Path(__file__).parent / "job_store.sqlite3"
+
+ENTITY_KEYS = ("persons", "locations", "events")
+MATCH_BUCKETS = ("matched", "new", "merged")
+
+# update_extraction / update_matching 으로 바꿀 수 있는 컬럼
+EXTRACTION_FIELDS = {
+    "status", "progress", "total", "cached_chunks", "skipped_chunks", "error", "finished_at",
+}
+MATCHING_FIELDS = {"status", "progress", "total", "elapsed_seconds", "error"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS queue_books (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    book_id TEXT NOT NULL UNIQUE,
+    path TEXT NOT NULL,
+    title TEXT NOT NULL,
+    category TEXT,
+    status TEXT NOT NULL DEFAULT 'queued',   -- queued | running | done | error
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_queue_books_status ON queue_books (status, position);
+CREATE TABLE IF NOT EXISTS queue_errors (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    book TEXT NOT NULL,
+    error TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS extraction_jobs (
+    book_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,                    -- running | cancelled | completed | error
+    progress INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    model TEXT,
+    fingerprint TEXT,
+    structure TEXT,
+    resumed_chunks INTEGER NOT NULL DEFAULT 0,
+    cached_chunks INTEGER NOT NULL DEFAULT 0,
+    skipped_chunks TEXT NOT NULL DEFAULT '[]',
+    persons_count INTEGER NOT NULL DEFAULT 0,
+    locations_count INTEGER NOT NULL DEFAULT 0,
+    events_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    start_time REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_extraction_jobs_status ON extraction_jobs (status);
+CREATE TABLE IF NOT EXISTS extraction_chunks (
+    book_id TEXT NOT NULL,
+    chunk_id INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (book_id, chunk_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS extraction_entities (
+    book_id TEXT NOT NULL,
+    entity_type TEXT NOT NULL,               -- persons | locations | events
+    name TEXT NOT NULL,
+    PRIMARY KEY (book_id, entity_type, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS matching_jobs (
+    book_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    matched_count INTEGER NOT NULL DEFAULT 0,
+    new_count INTEGER NOT NULL DEFAULT 0,
+    merged_count INTEGER NOT NULL DEFAULT 0,
+    elapsed_seconds REAL,
+    error TEXT,
+    start_time REAL
+);
+CREATE TABLE IF NOT EXISTS match_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    book_id TEXT NOT NULL,
+    bucket TEXT NOT NULL,                    -- matched | new | merged
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_match_results_book ON match_results (book_id, bucket);
+"""
+
+
+class JobStore:
+    """큐 + 추출/매칭 작업 저장소 (SQLite WAL, 연결 하나 + lock)"""
+
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ─── 큐 상태 (스칼라) ─────────────────────────────────
+
+    def save_state(self, state: dict) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO queue_state (key, value) VALUES (?, ?)",
+                [(k, json.dumps(v, ensure_ascii=False)) for k, v in state.items()]
+            )
+
+    def load_state(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM queue_state").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    # ─── 큐 (책) ──────────────────────────────────────────
+
+    def replace_queue(self, books: Iterable[dict]) -> int:
+        """새 큐로 교체 (이전 큐 기록은 모두 삭제)"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM queue_books")
+            cur = self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO queue_books (book_id, path, title, category, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(b["id"], b["path"], b["title"], b.get("category"), now) for b in books]
+            )
+            return cur.rowcount
+
+    def enqueue(self, book: dict) -> bool:
+        """큐 끝에 추가. 이미 큐에 있으면 (상태 무관) False"""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO queue_books (book_id, path, title, category, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (book["id"], book["path"], book["title"], book.get("category"), time.time())
+            )
+            return cur.rowcount > 0
+
+    def next_book(self) -> Optional[dict]:
+        """다음 queued 책을 running 으로 바꾸고 반환 (없으면 None)"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                """
+                SELECT position, book_id, path, title, category FROM queue_books
+                WHERE status = 'queued' ORDER BY position LIMIT 1
+                """
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE queue_books SET status = 'running', updated_at = ? WHERE position = ?",
+                (time.time(), row["position"])
+            )
+        return {"id": row["book_id"], "path": row["path"], "title": row["title"], "category": row["category"]}
+
+    def finish_book(self, book_id: str, status: str = "done", error: Optional[str] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE queue_books SET status = ?, error = ?, updated_at = ? WHERE book_id = ?",
+                (status, error, time.time(), book_id)
+            )
+
+    def requeue_running(self) -> int:
+        """처리 중에 서버가 죽은 책을 다시 queued 로 (앞 순서 유지)"""
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "UPDATE queue_books SET status = 'queued', updated_at = ? WHERE status = 'running'",
+                (time.time(),)
+            )
+            return cur.rowcount
+
+    def interrupt_running_jobs(self) -> int:
+        """재시작 때: running 으로 남은 추출/매칭 작업을 cancelled 로 (청크 행은 남겨서 이어하기)"""
+        with self._lock, self._conn:
+            n = self._conn.execute(
+                "UPDATE extraction_jobs SET status = 'cancelled' WHERE status = 'running'"
+            ).rowcount
+            n += self._conn.execute(
+                "UPDATE matching_jobs SET status = 'cancelled' WHERE status = 'running'"
+            ).rowcount
+        return n
+
+    def queue_counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM queue_books GROUP BY status"
+            ).fetchall()
+        counts = {"queued": 0, "running": 0, "done": 0, "error": 0}
+        counts.update((status, n) for status, n in rows)
+        return counts
+
+    def add_error(self, book: str, error: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO queue_errors (book, error, created_at) VALUES (?, ?, ?)",
+                (book, error, time.time())
+            )
+
+    def clear_errors(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM queue_errors")
+
+    def error_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM queue_errors").fetchone()[0]
+
+    # ─── 추출 작업 ────────────────────────────────────────
+
+    def start_extraction(
+        self, book_id: str, fingerprint: str, total: int, model: str, structure: dict
+    ) -> List[int]:
+        """
+        작업 시작 (running). 같은 fingerprint 의 이전 실행이 남긴 청크 id 목록을
+        반환 (이어하기). fingerprint 가 다르면 이전 청크/이름을 버림.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT fingerprint FROM extraction_jobs WHERE book_id = ?", (book_id,)
+            ).fetchone()
+            if row is not None and row["fingerprint"] != fingerprint:
+                self._conn.execute("DELETE FROM extraction_chunks WHERE book_id = ?", (book_id,))
+                self._conn.execute("DELETE FROM extraction_entities WHERE book_id = ?", (book_id,))
+                print(f"[JobStore] {book_id}: content changed, starting over")
+
+            done = [r[0] for r in self._conn.execute(
+                "SELECT chunk_id FROM extraction_chunks WHERE book_id = ? ORDER BY chunk_id", (book_id,)
+            )]
+            counts = dict.fromkeys(ENTITY_KEYS, 0)
+            if done:
+                counts.update(self._conn.execute(
+                    """
+                    SELECT entity_type, COUNT(*) FROM extraction_entities
+                    WHERE book_id = ? GROUP BY entity_type
+                    """, (book_id,)
+                ).fetchall())
+            else:
+                # 청크 없이 남은 이름 (완료 후 청크 정리된 이전 실행) 은 새로 셈
+                self._conn.execute("DELETE FROM extraction_entities WHERE book_id = ?", (book_id,))
+
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO extraction_jobs (
+                    book_id, status, progress, total, model, fingerprint, structure,
+                    resumed_chunks, persons_count, locations_count, events_count, start_time
+                ) VALUES (?, 'running', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (book_id, len(done), total, model, fingerprint, json.dumps(structure, ensure_ascii=False),
+                 len(done), counts["persons"], counts["locations"], counts["events"], time.time())
+            )
+        return done
+
+    def fail_extraction(self, book_id: str, error: str) -> None:
+        """시작 전 실패 (ZIM 읽기 등)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO extraction_jobs (book_id, status, error, start_time, finished_at)
+                VALUES (?, 'error', ?, ?, ?)
+                ON CONFLICT (book_id) DO UPDATE SET
+                    status = 'error', error = excluded.error, finished_at = excluded.finished_at
+                """,
+                (book_id, error, time.time(), time.time())
+            )
+
+    def add_chunk_result(self, book_id: str, chunk_result: dict, progress: Optional[int] = None) -> None:
+        """완료된 청크 1개 기록 + 새 이름만 추가하고 개수 누적 (트랜잭션 하나)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extraction_chunks (book_id, chunk_id, result) VALUES (?, ?, ?)",
+                (book_id, chunk_result["chunk_id"], json.dumps(chunk_result, ensure_ascii=False))
+            )
+            added = {}
+            for key in ENTITY_KEYS:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO extraction_entities (book_id, entity_type, name) VALUES (?, ?, ?)",
+                    [(book_id, key, name) for name in chunk_result.get(key, ())]
+                )
+                added[key] = self._conn.total_changes - before
+            self._conn.execute(
+                """
+                UPDATE extraction_jobs SET
+                    progress = COALESCE(?, progress),
+                    persons_count = persons_count + ?,
+                    locations_count = locations_count + ?,
+                    events_count = events_count + ?
+                WHERE book_id = ?
+                """,
+                (progress, added["persons"], added["locations"], added["events"], book_id)
+            )
+
+    def update_extraction(self, book_id: str, **fields) -> None:
+        self._update("extraction_jobs", EXTRACTION_FIELDS, book_id, fields)
+
+    def get_extraction(self, book_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM extraction_jobs WHERE book_id = ?", (book_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["structure"] = json.loads(job["structure"]) if job["structure"] else None
+        job["skipped_chunks"] = json.loads(job["skipped_chunks"])
+        return job
+
+    def extraction_state(self, book_id: str) -> Optional[str]:
+        """작업 상태만 (청크마다 취소 확인용)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM extraction_jobs WHERE book_id = ?", (book_id,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def extraction_status(self) -> Dict[str, dict]:
+        """모든 작업의 {book_id: {status, progress, total}} (책 목록 표시용)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT book_id, status, progress, total FROM extraction_jobs"
+            ).fetchall()
+        return {r["book_id"]: {"status": r["status"], "progress": r["progress"], "total": r["total"]}
+                for r in rows}
+
+    def chunk_results(self, book_id: str) -> List[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT result FROM extraction_chunks WHERE book_id = ? ORDER BY chunk_id", (book_id,)
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def entity_names(self, book_id: str) -> Dict[str, List[str]]:
+        names = {key: [] for key in ENTITY_KEYS}
+        with self._lock:
+            for entity_type, name in self._conn.execute(
+                "SELECT entity_type, name FROM extraction_entities WHERE book_id = ?", (book_id,)
+            ):
+                names[entity_type].append(name)
+        return names
+
+    def clear_chunks(self, book_id: str) -> None:
+        """전체 완료 후 청크/이름 행 정리 (결과는 _extraction.json 에 있음, 개수는 유지)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM extraction_chunks WHERE book_id = ?", (book_id,))
+            self._conn.execute("DELETE FROM extraction_entities WHERE book_id = ?", (book_id,))
+
+    # ─── 매칭 작업 ────────────────────────────────────────
+
+    def start_matching(self, book_id: str, total: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM match_results WHERE book_id = ?", (book_id,))
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO matching_jobs (book_id, status, progress, total, start_time)
+                VALUES (?, 'running', 0, ?, ?)
+                """,
+                (book_id, total, time.time())
+            )
+
+    def fail_matching(self, book_id: str, error: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO matching_jobs (book_id, status, error, start_time) VALUES (?, 'error', ?, ?)
+                ON CONFLICT (book_id) DO UPDATE SET status = 'error', error = excluded.error
+                """,
+                (book_id, error, time.time())
+            )
+
+    def add_match_results(self, book_id: str, entries: List[Tuple[str, dict]], progress: int) -> None:
+        """(bucket, entry) 묶음 추가 + 진행률/버킷별 개수 갱신"""
+        counts = dict.fromkeys(MATCH_BUCKETS, 0)
+        for bucket, _ in entries:
+            counts[bucket] += 1
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO match_results (book_id, bucket, entry) VALUES (?, ?, ?)",
+                [(book_id, bucket, json.dumps(entry, ensure_ascii=False)) for bucket, entry in entries]
+            )
+            self._conn.execute(
+                """
+                UPDATE matching_jobs SET
+                    progress = ?,
+                    matched_count = matched_count + ?,
+                    new_count = new_count + ?,
+                    merged_count = merged_count + ?
+                WHERE book_id = ?
+                """,
+                (progress, counts["matched"], counts["new"], counts["merged"], book_id)
+            )
+
+    def update_matching(self, book_id: str, **fields) -> None:
+        self._update("matching_jobs", MATCHING_FIELDS, book_id, fields)
+
+    def get_matching(self, book_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM matching_jobs WHERE book_id = ?", (book_id,)
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def matching_state(self, book_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM matching_jobs WHERE book_id = ?", (book_id,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def match_results(self, book_id: str) -> Dict[str, List[dict]]:
+        results = {bucket: [] for bucket in MATCH_BUCKETS}
+        with self._lock:
+            for bucket, entry in self._conn.execute(
+                "SELECT bucket, entry FROM match_results WHERE book_id = ? ORDER BY id", (book_id,)
+            ):
+                results[bucket].append(json.loads(entry))
+        return results
+
+    # ─── 공통 ─────────────────────────────────────────────
+
+    def _update(self, table: str, allowed: set, book_id: str, fields: dict) -> None:
+        unknown = set(fields) - allowed
+        if unknown:
+            raise ValueError(f"Unknown {table} fields: {sorted(unknown)}")
+        if not fields:
+            return
+        values = [json.dumps(v) if isinstance(v, list) else v for v in fields.values()]
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE {table} SET {assignments} WHERE book_id = ?", (*values, book_id)
+            )
+
+    def stats(self) -> dict:
+        with self._lock:
+            extraction = dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM extraction_jobs GROUP BY status"
+            ).fetchall())
+            pending_chunks = self._conn.execute("SELECT COUNT(*) FROM extraction_chunks").fetchone()[0]
+        return {
+            "queue": self.queue_counts(),
+            "extraction_jobs": extraction,
+            "stored_chunks": pending_chunks,
+        }
+
+
+_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    global _store
+    if _store is None:
+        _store = JobStore()
+    return _store
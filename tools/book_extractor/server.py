@@ -10,9 +10,11 @@ Usage:
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import re
+import sys
 import time
 from pathlib import Path
 from typing import Optional, List
@@ -21,12 +23,25 @@ from datetime import datetime
 
 import httpx
 from fastapi import FastAPI, BackgroundTasks
+from psycopg2.extras import RealDictCursor
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 # Import entity matcher
 from entity_matcher import EntityMatcher, MatchResult
+from chunk_scheduler import (
+    RateLimitedError, content_fingerprint, get_limiter, get_backend_stats
+)
+from chunk_cache import get_chunk_cache, content_hash, chunk_hash
+from job_store import JobStore
+import db_pool
+from db_pool import run_query, run_matcher
+
+# Shared HTML → text extractor (poc/app/core/html_text.py, stdlib only)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "poc" / "app" / "core"))
+from html_text import extract_text_stream, iter_chunks
+from zim_pool import get_archive
 
 # Paths
 BASE_DIR = Path(__file__).parent
@@ -36,7 +51,8 @@ RESULTS_DIR = BOOKS_DIR / "extraction_results"
 ZIM_PATH = PROJECT_ROOT / "data" / "kiwix" / "gutenberg_en_all.zim"
 ZIM_RESULTS_PATH = BASE_DIR / "zim_search_results.json"
 PRIORITY_PATH = BASE_DIR / "extraction_priority.json"
-QUEUE_STATE_PATH = BASE_DIR / "queue_state.json"
+QUEUE_STATE_PATH = BASE_DIR / "queue_state.json"  # Legacy (imported once into the job store)
+JOB_STORE_PATH = BASE_DIR / "job_store.sqlite3"
 
 def safe_filename(name: str) -> str:
     """Remove/replace characters that are invalid in Windows filenames"""
@@ -52,49 +68,61 @@ OLLAMA_MODEL = "llama3.1:8b-instruct-q4_0"
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 
 # Available models (prices per 1M tokens)
+# max_concurrency: upper bound for concurrent chunk requests (ollama: set by speed mode)
 MODELS = {
     "ollama": {"name": "Ollama (llama3.1:8b)", "type": "ollama", "input_price": 0, "output_price": 0},
-    "gpt-5-mini": {"name": "GPT-5-mini (~$38)", "type": "openai", "model_id": "gpt-5-mini", "input_price": 0.25, "output_price": 2.00},
-    "gpt-5.1-chat-latest": {"name": "GPT-5.1 (~$190)", "type": "openai", "model_id": "gpt-5.1-chat-latest", "input_price": 1.25, "output_price": 10.00},
+    "gpt-5-mini": {"name": "GPT-5-mini (~$38)", "type": "openai", "model_id": "gpt-5-mini", "input_price": 0.25, "output_price": 2.00, "max_concurrency": 8},
+    "gpt-5.1-chat-latest": {"name": "GPT-5.1 (~$190)", "type": "openai", "model_id": "gpt-5.1-chat-latest", "input_price": 1.25, "output_price": 10.00, "max_concurrency": 8},
 }
 
 # Create dirs
 RESULTS_DIR.mkdir(exist_ok=True)
 
-# ZIM Archive (lazy loaded)
-_zim_archive = None
+# ZIM Archive (lazy loaded, shared handle from poc/app/core/zim_pool.py)
+_zim_loaded = False
 
 def get_zim_archive():
     """Get ZIM archive (lazy loading)"""
-    global _zim_archive
-    if _zim_archive is None:
-        try:
-            from libzim.reader import Archive
-            if ZIM_PATH.exists():
-                _zim_archive = Archive(str(ZIM_PATH))
-                print(f"ZIM loaded: {_zim_archive.entry_count:,} entries")
-        except Exception as e:
-            print(f"Failed to load ZIM: {e}")
-    return _zim_archive
+    global _zim_loaded
+    if not ZIM_PATH.exists():
+        return None
+    try:
+        zim = get_archive(ZIM_PATH)
+    except Exception as e:
+        print(f"Failed to load ZIM: {e}")
+        return None
+    if not _zim_loaded:
+        _zim_loaded = True
+        print(f"ZIM loaded: {zim.entry_count:,} entries")
+    return zim
 
 
 app = FastAPI(title="Book Extractor", version="2.0")
 
 # Speed modes: high/medium/low/quiet - num_gpu controls how many layers on GPU
+# max_concurrency: upper bound for concurrent Ollama requests (needs OLLAMA_NUM_PARALLEL >= this)
 SPEED_MODES = {
-    "turbo": {"chunk_delay": 0.1, "num_gpu": 50, "num_ctx": 4096, "description": "Turbo (50 layers)"},
-    "high": {"chunk_delay": 0.2, "num_gpu": 30, "num_ctx": 4096, "description": "High (30 layers)"},
-    "medium": {"chunk_delay": 0.3, "num_gpu": 20, "num_ctx": 4096, "description": "Medium (20 layers)"},
-    "low": {"chunk_delay": 1.0, "num_gpu": 10, "num_ctx": 4096, "description": "Low (10 layers)"},
-    "quiet": {"chunk_delay": 2.0, "num_gpu": 0, "num_ctx": 4096, "description": "Quiet (CPU only)"},
+    "turbo": {"chunk_delay": 0.1, "num_gpu": 50, "num_ctx": 4096, "max_concurrency": 4, "description": "Turbo (50 layers)"},
+    "high": {"chunk_delay": 0.2, "num_gpu": 30, "num_ctx": 4096, "max_concurrency": 3, "description": "High (30 layers)"},
+    "medium": {"chunk_delay": 0.3, "num_gpu": 20, "num_ctx": 4096, "max_concurrency": 2, "description": "Medium (20 layers)"},
+    "low": {"chunk_delay": 1.0, "num_gpu": 10, "num_ctx": 4096, "max_concurrency": 1, "description": "Low (10 layers)"},
+    "quiet": {"chunk_delay": 2.0, "num_gpu": 0, "num_ctx": 4096, "max_concurrency": 1, "description": "Quiet (CPU only)"},
 }
 
 # Chunk extraction settings
 CHUNK_TIMEOUT = 300  # 5 minutes max per chunk
 MAX_CHUNK_RETRIES = 3  # Max retries per chunk before skipping
+MAX_RATE_LIMIT_RETRIES = 10  # 429/503 retries (not counted as failed attempts)
+CHUNK_SIZE = 2500
+CHUNK_OVERLAP = 200
+
+# Entity matching: names per EntityMatcher.match_many() call (progress/cancel granularity)
+MATCH_BATCH_SIZE = 500
 
 # State
-extraction_tasks = {}
+# Queue books, extraction/matching jobs and their per-chunk results live in the
+# SQLite job store; queue_state only holds scalars (persisted to the store)
+job_store = JobStore(JOB_STORE_PATH)
 queue_state = {
     "running": False,
     "paused": False,
@@ -103,9 +131,7 @@ queue_state = {
     "completed": 0,
     "total": 0,
     "start_time": None,
-    "books_queue": [],
     "total_cost": 0.0,
-    "errors": [],
     "speed_mode": "high",
     # Chunk progress tracking
     "current_chunk": 0,
@@ -122,8 +148,7 @@ extraction_stats = {
     "total_chars_processed": 0,
 }
 
-# Matching state
-matching_tasks = {}  # book_id -> {status, progress, results, ...}
+# Matching settings
 matching_settings = {
     "auto_match": False,  # Auto-start matching after extraction
     "auto_confirm_threshold": 0.95,  # Auto-confirm matches above this confidence
@@ -175,22 +200,32 @@ MODEL_INFO = {
 
 
 def save_queue_state():
-    """Save queue state to file for persistence"""
-    state = {**queue_state, "books_queue": queue_state["books_queue"][:100]}  # Limit saved queue
-    with open(QUEUE_STATE_PATH, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2)
+    """Save queue scalars to the job store (books/errors are stored as rows)"""
+    job_store.save_state(queue_state)
 
 
 def load_queue_state():
-    """Load queue state from file"""
-    global queue_state
-    if QUEUE_STATE_PATH.exists():
+    """Restore queue state from the job store (or the legacy queue_state.json once)"""
+    saved = job_store.load_state()
+    if not saved and QUEUE_STATE_PATH.exists():
         try:
             with open(QUEUE_STATE_PATH, 'r', encoding='utf-8') as f:
                 saved = json.load(f)
-                queue_state.update(saved)
-        except:
-            pass
+            if saved.get("books_queue"):
+                job_store.replace_queue(saved["books_queue"])
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[Queue] Failed to import {QUEUE_STATE_PATH.name}: {e}")
+            saved = {}
+
+    queue_state.update({k: v for k, v in saved.items() if k in queue_state})
+    # The background task did not survive the restart: books it was working on go back to the queue
+    queue_state["running"] = False
+    queue_state["current_book"] = None
+    requeued = job_store.requeue_running()
+    job_store.interrupt_running_jobs()
+    if requeued:
+        print(f"[Queue] Requeued {requeued} interrupted book(s)")
+    save_queue_state()
 
 
 def load_zim_books():
@@ -227,25 +262,15 @@ def get_book_content_from_zim(path: str) -> Optional[str]:
     try:
         entry = zim.get_entry_by_path(path)
         item = entry.get_item()
-        content = bytes(item.content).decode('utf-8', errors='replace')
-
-        # Clean HTML while preserving structure
-        if '<html' in content.lower() or '<body' in content.lower():
-            # Remove script and style
-            content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-            content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
-
-            # Convert block elements to newlines (preserves structure)
-            content = re.sub(r'</?(h[1-6]|p|div|br|tr|li)[^>]*>', '\n', content, flags=re.IGNORECASE)
+        data = item.content
 
-            # Remove remaining HTML tags
-            content = re.sub(r'<[^>]+>', '', content)
+        head = bytes(data[:4096]).decode('utf-8', errors='replace').lower()
+        if '<html' in head or '<body' in head:
+            # Single streaming pass over the raw bytes: headings/paragraphs become
+            # blank-line separated blocks, <br> a newline (preserves structure)
+            return extract_text_stream(iter_chunks(data)).text
 
-            # Normalize whitespace while preserving newlines
-            content = re.sub(r'[ \t]+', ' ', content)  # Collapse spaces/tabs only
-            content = re.sub(r'\n\s*\n+', '\n\n', content)  # Normalize multiple newlines
-
-        return content.strip()
+        return bytes(data).decode('utf-8', errors='replace').strip()
     except Exception as e:
         print(f"Error reading ZIM entry {path}: {e}")
         return None
@@ -401,7 +426,10 @@ def get_hierarchical_chunks(content: str, chunk_size: int = 2500, overlap: int =
             end_idx = idx
             break
 
-    text = content[start_idx:end_idx].strip()
+    raw_text = content[start_idx:end_idx]
+    text = raw_text.strip()
+    # Offset of `text` inside `content` (global_char_start ignores the strip, kept for old results)
+    text_offset = start_idx + len(raw_text) - len(raw_text.lstrip())
 
     # Detect book structure
     structure = detect_book_structure(text)
@@ -421,13 +449,17 @@ def get_hierarchical_chunks(content: str, chunk_size: int = 2500, overlap: int =
         while pos < len(section_text):
             chunk_text = section_text[pos:pos + chunk_size]
             if chunk_text.strip():
+                content_start = text_offset + section["start"] + pos
                 chunks.append({
                     "text": chunk_text,
                     "section": section_name,
                     "section_type": structure["type"],
                     "chunk_in_section": chunk_in_section,
                     "global_char_start": section["start"] + pos + start_idx,
-                    "section_char_start": pos
+                    "section_char_start": pos,
+                    "content_start": content_start,
+                    "content_end": content_start + len(chunk_text),
+                    "chunk_hash": chunk_hash(chunk_text),
                 })
                 chunk_in_section += 1
             pos += chunk_size - overlap
@@ -441,6 +473,44 @@ def get_chunks(content: str, chunk_size: int = 2500, overlap: int = 200) -> list
     return [c["text"] for c in hierarchical]
 
 
+def get_book_chunks(zim_path: str, content: str) -> tuple[list, dict]:
+    """Hierarchical chunks + structure for a book, reusing the persisted chunk manifest
+
+    The manifest (chunk_cache.py) is keyed by ZIM path and only reused while the
+    content hash and chunking settings match, so structure detection and
+    chunking run once per book instead of on every (re)queue.
+    """
+    cache = get_chunk_cache()
+    digest = content_hash(content)
+    params = {"chunk_size": CHUNK_SIZE, "overlap": CHUNK_OVERLAP}
+
+    manifest = cache.load_manifest(zim_path, digest, params)
+    if manifest:
+        return cache.chunks_from_manifest(manifest, content), manifest["structure"]
+
+    chunks = get_hierarchical_chunks(content, CHUNK_SIZE, CHUNK_OVERLAP)
+    structure = detect_book_structure(content)
+    cache.save_manifest(zim_path, digest, params, structure, chunks)
+    return chunks, structure
+
+
+# Bump when the prompt's intent changes; template edits are also caught by the hash
+PROMPT_VERSION = "v1"
+
+
+def get_prompt_version(book_title: str) -> str:
+    """Result cache key for the prompt (version + template/title hash)"""
+    template = get_extraction_prompt("{text}", book_title)
+    return f"{PROMPT_VERSION}:{hashlib.sha1(template.encode('utf-8')).hexdigest()[:12]}"
+
+
+def get_model_id(model: str) -> str:
+    """Concrete model behind a model key (result cache key)"""
+    if model == "ollama":
+        return f"ollama:{OLLAMA_MODEL}"
+    return MODELS.get(model, {}).get("model_id", model)
+
+
 def get_extraction_prompt(text: str, book_title: str) -> str:
     """Generate extraction prompt"""
     return f"""Extract named entities from this text about {book_title}.
@@ -483,9 +553,12 @@ async def extract_with_ollama(client: httpx.AsyncClient, text: str, book_title:
             },
             timeout=180.0
         )
+        _raise_for_rate_limit(response)
 
         content = response.json().get('response', '')
         return parse_json_response(content)
+    except (RateLimitedError, httpx.TimeoutException):
+        raise
     except Exception as e:
         print(f"Ollama error: {e}")
         return None
@@ -521,6 +594,7 @@ async def extract_with_openai(client: httpx.AsyncClient, text: str, book_title:
             },
             timeout=60.0
         )
+        _raise_for_rate_limit(response)
 
         data = response.json()
         if 'error' in data:
@@ -528,11 +602,24 @@ async def extract_with_openai(client: httpx.AsyncClient, text: str, book_title:
             return None
         content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
         return parse_json_response(content)
+    except (RateLimitedError, httpx.TimeoutException):
+        raise
     except Exception as e:
         print(f"OpenAI error: {e}")
         return None
 
 
+def _raise_for_rate_limit(response: httpx.Response):
+    """429 (rate limit) / 503 (Ollama queue full) → RateLimitedError"""
+    if response.status_code in (429, 503):
+        retry_after = response.headers.get("retry-after")
+        try:
+            retry_after = float(retry_after) if retry_after else None
+        except ValueError:
+            retry_after = None
+        raise RateLimitedError(f"HTTP {response.status_code}", retry_after=retry_after)
+
+
 def parse_json_response(content: str) -> Optional[dict]:
     """Parse JSON from model response"""
     m = re.search(r'\{[\s\S]*\}', content)
@@ -552,120 +639,183 @@ async def extract_chunk(client: httpx.AsyncClient, text: str, book_title: str, m
         return await extract_with_openai(client, text, book_title, model)
 
 
+def get_backend_limiter(model: str):
+    """Adaptive concurrency limiter for the model's backend"""
+    if model == "ollama":
+        mode = SPEED_MODES.get(queue_state["speed_mode"], SPEED_MODES["high"])
+        return get_limiter("ollama", mode["max_concurrency"])
+    return get_limiter(model, MODELS.get(model, {}).get("max_concurrency", 4))
+
+
 async def extract_chunk_with_retry(client: httpx.AsyncClient, text: str, book_title: str, model: str, chunk_num: int) -> tuple[Optional[dict], str]:
     """Extract chunk with timeout and retry logic
+    Each attempt holds a slot of the backend's adaptive limiter.
     Returns: (result, status) where status is 'success', 'skipped', or 'failed'
     """
-    for attempt in range(MAX_CHUNK_RETRIES):
+    limiter = get_backend_limiter(model)
+    attempt = 0
+    rate_limited = 0
+
+    while attempt < MAX_CHUNK_RETRIES:
+        await limiter.acquire()
+        started = time.monotonic()
+        outcome, retry_after = "error", None
         try:
             result = await asyncio.wait_for(
                 extract_chunk(client, text, book_title, model),
                 timeout=CHUNK_TIMEOUT
             )
             if result:
+                outcome = "success"
                 return result, "success"
             # Empty result, retry
+            outcome = "empty"
             print(f"[Chunk {chunk_num}] Empty response, attempt {attempt + 1}/{MAX_CHUNK_RETRIES}")
-        except asyncio.TimeoutError:
-            print(f"[Chunk {chunk_num}] Timeout after {CHUNK_TIMEOUT}s, attempt {attempt + 1}/{MAX_CHUNK_RETRIES}")
+        except RateLimitedError as e:
+            outcome, retry_after = "rate_limited", e.retry_after
+            print(f"[Chunk {chunk_num}] Rate limited ({e}), backing off")
+        except (asyncio.TimeoutError, httpx.TimeoutException):
+            outcome = "timeout"
+            print(f"[Chunk {chunk_num}] Timeout, attempt {attempt + 1}/{MAX_CHUNK_RETRIES}")
         except Exception as e:
             print(f"[Chunk {chunk_num}] Error: {e}, attempt {attempt + 1}/{MAX_CHUNK_RETRIES}")
+        finally:
+            limiter.release(time.monotonic() - started, len(text), outcome, retry_after=retry_after)
+
+        # Rate limits don't count as failed attempts (the limiter cools down first)
+        if outcome == "rate_limited":
+            rate_limited += 1
+            if rate_limited <= MAX_RATE_LIMIT_RETRIES:
+                continue
+        attempt += 1
 
         # Wait before retry
-        if attempt < MAX_CHUNK_RETRIES - 1:
+        if attempt < MAX_CHUNK_RETRIES:
             await asyncio.sleep(5)
 
     print(f"[Chunk {chunk_num}] Skipped after {MAX_CHUNK_RETRIES} failed attempts")
     return None, "skipped"
 
 
+def _extract_name(item):
+    """Handle both strings and dicts (LLM sometimes returns dicts like {"name": "Zeus"})"""
+    if isinstance(item, str):
+        return item
+    elif isinstance(item, dict):
+        return item.get('name') or item.get('title') or item.get('location') or next(iter(item.values()), None)
+    return None
+
+
+def _build_chunk_result(i: int, chunk_info: dict, data: dict) -> dict:
+    """Chunk-level result with hierarchical structure (source attribution)"""
+    chunk_text = chunk_info["text"]
+    return {
+        "chunk_id": i,
+        "section": chunk_info["section"],
+        "section_type": chunk_info["section_type"],
+        "chunk_in_section": chunk_info["chunk_in_section"],
+        "global_char_start": chunk_info["global_char_start"],
+        "section_char_start": chunk_info["section_char_start"],
+        "text_preview": chunk_text[:200] + "..." if len(chunk_text) > 200 else chunk_text,
+        "persons": [n for n in (_extract_name(p) for p in data.get('persons', [])) if n],
+        "locations": [n for n in (_extract_name(l) for l in data.get('locations', [])) if n],
+        "events": [n for n in (_extract_name(e) for e in data.get('events', [])) if n]
+    }
+
+
 async def run_extraction(book_id: str, zim_path: str, title: str, model: str = "ollama"):
-    """Background task to extract entities from a ZIM book"""
-    global extraction_tasks, queue_state, extraction_stats
+    """Background task to extract entities from a ZIM book
+
+    Chunks are extracted concurrently (bounded by the backend's adaptive
+    limiter) and appended to the job store as they finish, so a restart
+    after a crash only extracts the remaining chunks.
+    """
+    global queue_state, extraction_stats
 
     # Get content from ZIM
     content = get_book_content_from_zim(zim_path)
     if not content:
-        extraction_tasks[book_id] = {"status": "error", "error": f"Failed to read from ZIM: {zim_path}"}
+        job_store.fail_extraction(book_id, f"Failed to read from ZIM: {zim_path}")
         return
 
-    # Use hierarchical chunking
-    hierarchical_chunks = get_hierarchical_chunks(content)
+    # Hierarchical chunking + structure metadata (manifest cached per ZIM path)
+    hierarchical_chunks, structure = get_book_chunks(zim_path, content)
     total_chunks = len(hierarchical_chunks)
     content_size = len(content)
 
-    # Detect structure for metadata
-    structure = detect_book_structure(content)
+    # Resume: chunks stored by an earlier run of the same content/chunking
+    done = set(job_store.start_extraction(
+        book_id, content_fingerprint(content, total_chunks), total_chunks, model, structure
+    ))
+    if done:
+        print(f"[Extract] Resuming {title[:50]}: {len(done)}/{total_chunks} chunks from job store")
 
     # Update queue state with chunk info
     queue_state["total_chunks"] = total_chunks
-    queue_state["current_chunk"] = 0
+    queue_state["current_chunk"] = len(done)
     queue_state["book_start_time"] = time.time()
 
-    extraction_tasks[book_id] = {
-        "status": "running",
-        "progress": 0,
-        "total": total_chunks,
-        "start_time": time.time(),
-        "model": model,
-        "structure": structure,
-        "persons": set(),
-        "locations": set(),
-        "events": set(),
-        "chunk_results": []  # Track per-chunk results for source attribution
-    }
+    start_time = time.time()
+    progress = len(done)
+    skipped_chunks = []
+
+    # Reuse LLM results for unchanged chunks (same text + model + prompt)
+    result_cache = get_chunk_cache()
+    model_id = get_model_id(model)
+    prompt_version = get_prompt_version(title)
+    cached = result_cache.get_results(
+        (c["chunk_hash"] for i, c in enumerate(hierarchical_chunks) if i not in done),
+        model_id, prompt_version
+    )
 
-    async with httpx.AsyncClient() as client:
-        for i, chunk_info in enumerate(hierarchical_chunks):
-            # Update current chunk in queue state
-            queue_state["current_chunk"] = i + 1
-            if extraction_tasks[book_id]["status"] == "cancelled":
-                break
+    pending = asyncio.Queue()
+    for i, chunk_info in enumerate(hierarchical_chunks):
+        if i in done:
+            continue
+        data = cached.get(chunk_info["chunk_hash"])
+        if data is not None:
+            progress += 1
+            job_store.add_chunk_result(book_id, _build_chunk_result(i, chunk_info, data), progress)
+        else:
+            pending.put_nowait((i, chunk_info))
+
+    cached_chunks = progress - len(done)
+    job_store.update_extraction(book_id, cached_chunks=cached_chunks)
+    queue_state["current_chunk"] = progress
+    if cached_chunks:
+        print(f"[Extract] {title[:50]}: {cached_chunks}/{total_chunks} chunks from result cache")
+
+    async def worker(client: httpx.AsyncClient):
+        nonlocal progress
+        while not pending.empty():
+            if job_store.extraction_state(book_id) == "cancelled":
+                return
 
             # Check if queue is paused
             if queue_state["paused"] and queue_state["running"]:
                 while queue_state["paused"]:
                     await asyncio.sleep(1)
 
+            try:
+                i, chunk_info = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
             chunk_text = chunk_info["text"]
             data, chunk_status = await extract_chunk_with_retry(client, chunk_text, title, model, i + 1)
 
-            # Track skipped chunks
+            progress += 1
+            # Track skipped chunks (not stored → retried on resume)
             if chunk_status == "skipped":
-                extraction_tasks[book_id].setdefault("skipped_chunks", []).append(i + 1)
+                skipped_chunks.append(i + 1)
+                job_store.update_extraction(book_id, progress=progress, skipped_chunks=skipped_chunks)
 
             if data:
-                # Handle both strings and dicts (LLM sometimes returns dicts like {"name": "Zeus"})
-                def extract_name(item):
-                    if isinstance(item, str):
-                        return item
-                    elif isinstance(item, dict):
-                        return item.get('name') or item.get('title') or item.get('location') or next(iter(item.values()), None)
-                    return None
-
-                persons = [n for n in (extract_name(p) for p in data.get('persons', [])) if n]
-                locations = [n for n in (extract_name(l) for l in data.get('locations', [])) if n]
-                events = [n for n in (extract_name(e) for e in data.get('events', [])) if n]
-
-                extraction_tasks[book_id]["persons"].update(persons)
-                extraction_tasks[book_id]["locations"].update(locations)
-                extraction_tasks[book_id]["events"].update(events)
-
-                # Save chunk-level results with hierarchical structure
-                extraction_tasks[book_id]["chunk_results"].append({
-                    "chunk_id": i,
-                    "section": chunk_info["section"],
-                    "section_type": chunk_info["section_type"],
-                    "chunk_in_section": chunk_info["chunk_in_section"],
-                    "global_char_start": chunk_info["global_char_start"],
-                    "section_char_start": chunk_info["section_char_start"],
-                    "text_preview": chunk_text[:200] + "..." if len(chunk_text) > 200 else chunk_text,
-                    "persons": persons,
-                    "locations": locations,
-                    "events": events
-                })
+                job_store.add_chunk_result(book_id, _build_chunk_result(i, chunk_info, data), progress)
+                result_cache.put_result(chunk_info["chunk_hash"], model_id, prompt_version, data)
+            elif chunk_status != "skipped":
+                job_store.update_extraction(book_id, progress=progress)
 
-            extraction_tasks[book_id]["progress"] = i + 1
+            queue_state["current_chunk"] = progress
 
             # Delay based on speed mode
             delay = SPEED_MODES.get(queue_state["speed_mode"], SPEED_MODES["high"])["chunk_delay"]
@@ -673,8 +823,16 @@ async def run_extraction(book_id: str, zim_path: str, title: str, model: str = "
                 delay = max(delay, 0.2)  # Rate limit for OpenAI
             await asyncio.sleep(delay)
 
-    # Save results
-    elapsed = time.time() - extraction_tasks[book_id]["start_time"]
+    # Workers up to the backend's ceiling; the limiter decides how many run at once
+    workers = min(get_backend_limiter(model).max_concurrency, max(1, pending.qsize()))
+    async with httpx.AsyncClient() as client:
+        await asyncio.gather(*(worker(client) for _ in range(workers)))
+
+    completed_all = job_store.extraction_state(book_id) != "cancelled" and not skipped_chunks
+
+    # Save results (assembled from the job store rows)
+    elapsed = time.time() - start_time
+    names = job_store.entity_names(book_id)
     results = {
         "book_id": book_id,
         "zim_path": zim_path,
@@ -685,13 +843,15 @@ async def run_extraction(book_id: str, zim_path: str, title: str, model: str = "
             "section_count": structure["count"],
             "sections": structure["sections"][:50]  # Limit to 50 section names
         },
-        "persons": list(extraction_tasks[book_id]["persons"]),
-        "locations": list(extraction_tasks[book_id]["locations"]),
-        "events": list(extraction_tasks[book_id]["events"]),
-        "chunk_results": extraction_tasks[book_id]["chunk_results"],  # Include chunk-level data with hierarchy
-        "chunks_processed": extraction_tasks[book_id]["progress"],
+        "persons": names["persons"],
+        "locations": names["locations"],
+        "events": names["events"],
+        "chunk_results": job_store.chunk_results(book_id),  # Include chunk-level data with hierarchy
+        "chunks_processed": progress,
         "total_chunks": total_chunks,
-        "skipped_chunks": extraction_tasks[book_id].get("skipped_chunks", []),
+        "skipped_chunks": sorted(skipped_chunks),
+        "resumed_chunks": len(done),
+        "cached_chunks": cached_chunks,
         "elapsed_seconds": elapsed,
         "source": "gutenberg_zim"
     }
@@ -702,8 +862,11 @@ async def run_extraction(book_id: str, zim_path: str, title: str, model: str = "
         json.dump(results, f, indent=2, ensure_ascii=False)
         result_size = f.tell()
 
-    extraction_tasks[book_id]["status"] = "completed"
-    extraction_tasks[book_id]["results"] = results
+    # Keep chunk rows for cancelled/partial runs (restarting the book resumes)
+    if completed_all:
+        job_store.clear_chunks(book_id)
+
+    job_store.update_extraction(book_id, status="completed", progress=progress, finished_at=time.time())
 
     # Update statistics
     book_duration = time.time() - queue_state.get("book_start_time", time.time())
@@ -718,7 +881,7 @@ async def run_extraction(book_id: str, zim_path: str, title: str, model: str = "
         "content_chars": content_size,
         "completed_at": datetime.now().isoformat()
     })
-    extraction_stats["total_chunks_processed"] += total_chunks
+    extraction_stats["total_chunks_processed"] += total_chunks - len(done) - cached_chunks
     extraction_stats["total_chars_processed"] += content_size
     # Keep only last 100 books in stats
     if len(extraction_stats["completed_books"]) > 100:
@@ -727,75 +890,71 @@ async def run_extraction(book_id: str, zim_path: str, title: str, model: str = "
 
 async def run_post_processing(book_id: str, title: str):
     """Run post-processing: context extraction + DB matching"""
-    global post_process_stats
-
     if not post_process_settings["auto_context"] and not post_process_settings["auto_db_match"]:
         return
 
     print(f"[PostProcess] Starting for: {title[:50]}...")
 
     try:
-        # Import post-processing modules
-        import sys
-        cleanup_path = PROJECT_ROOT / "poc" / "scripts" / "cleanup"
-        sys.path.insert(0, str(cleanup_path))
-
-        from extract_book_contexts import extract_contexts_from_book
-        from match_books_local import match_book_entities, get_wiki_archive
-        import psycopg2
-        from psycopg2.extras import RealDictCursor
-
-        # 1. Extract context from extraction result
-        if post_process_settings["auto_context"]:
-            extraction_file = RESULTS_DIR / f"{safe_filename(book_id)}_extraction.json"
-            if extraction_file.exists():
-                context_result = extract_contexts_from_book(extraction_file)
-
-                # Save context file
-                contexts_dir = PROJECT_ROOT / "poc" / "data" / "book_contexts"
-                contexts_dir.mkdir(parents=True, exist_ok=True)
-                context_file = contexts_dir / f"{safe_filename(book_id)}_contexts.json"
-
-                with open(context_file, 'w', encoding='utf-8') as f:
-                    json.dump(context_result, f, ensure_ascii=False, indent=2)
-
-                post_process_stats["contexts_created"] += 1
-                print(f"[PostProcess] Context extracted: {context_result['stats']['persons']} persons")
-
-        # 2. Match to DB
-        if post_process_settings["auto_db_match"]:
-            context_file = PROJECT_ROOT / "poc" / "data" / "book_contexts" / f"{safe_filename(book_id)}_contexts.json"
-            if context_file.exists():
-                # Initialize Wikipedia ZIM
-                get_wiki_archive()
-
-                conn = psycopg2.connect(
-                    host='localhost', port=5432, dbname='chaldeas',
-                    user='chaldeas', password='chaldeas_dev'
-                )
-
-                stats = {
-                    'db_match': 0,
-                    'wiki_to_db': 0,
-                    'wiki_new': 0,
-                    'not_found': 0,
-                    'mentions_created': 0
-                }
-
-                match_book_entities(context_file, conn, stats, dry_run=False)
-                conn.close()
-
-                post_process_stats["mentions_created"] += stats["mentions_created"]
-                print(f"[PostProcess] DB matched: {stats['db_match']} DB, {stats['wiki_to_db']} Wiki, {stats['mentions_created']} mentions")
-
-        post_process_stats["last_processed"] = title
-
+        # Context extraction + DB matching are synchronous (files, ZIM, DB): keep them off the event loop
+        await run_matcher(_post_process_book, book_id, title)
     except Exception as e:
         print(f"[PostProcess] Error: {e}")
         import traceback
         traceback.print_exc()
 
 
+def _post_process_book(book_id: str, title: str):
+    """Post-processing body (runs in the matcher executor)"""
+    # Import post-processing modules
+    cleanup_path = str(PROJECT_ROOT / "poc" / "scripts" / "cleanup")
+    if cleanup_path not in sys.path:
+        sys.path.insert(0, cleanup_path)
+
+    from extract_book_contexts import extract_contexts_from_book
+    from match_books_local import match_book_entities, get_wiki_archive
+
+    # 1. Extract context from extraction result
+    if post_process_settings["auto_context"]:
+        extraction_file = RESULTS_DIR / f"{safe_filename(book_id)}_extraction.json"
+        if extraction_file.exists():
+            context_result = extract_contexts_from_book(extraction_file)
+
+            # Save context file
+            contexts_dir = PROJECT_ROOT / "poc" / "data" / "book_contexts"
+            contexts_dir.mkdir(parents=True, exist_ok=True)
+            context_file = contexts_dir / f"{safe_filename(book_id)}_contexts.json"
+
+            with open(context_file, 'w', encoding='utf-8') as f:
+                json.dump(context_result, f, ensure_ascii=False, indent=2)
+
+            post_process_stats["contexts_created"] += 1
+            print(f"[PostProcess] Context extracted: {context_result['stats']['persons']} persons")
+
+    # 2. Match to DB
+    if post_process_settings["auto_db_match"]:
+        context_file = PROJECT_ROOT / "poc" / "data" / "book_contexts" / f"{safe_filename(book_id)}_contexts.json"
+        if context_file.exists():
+            # Initialize Wikipedia ZIM
+            get_wiki_archive()
+
+            stats = {
+                'db_match': 0,
+                'wiki_to_db': 0,
+                'wiki_new': 0,
+                'not_found': 0,
+                'mentions_created': 0
+            }
+
+            with db_pool.connection() as conn:
+                match_book_entities(context_file, conn, stats, dry_run=False)
+
+            post_process_stats["mentions_created"] += stats["mentions_created"]
+            print(f"[PostProcess] DB matched: {stats['db_match']} DB, {stats['wiki_to_db']} Wiki, {stats['mentions_created']} mentions")
+
+    post_process_stats["last_processed"] = title
+
+
 async def run_queue():
     """Process the extraction queue"""
     global queue_state
@@ -804,12 +963,14 @@ async def run_queue():
     queue_state["start_time"] = time.time()
     save_queue_state()
 
-    while queue_state["books_queue"] and queue_state["running"]:
+    while queue_state["running"]:
         if queue_state["paused"]:
             await asyncio.sleep(1)
             continue
 
-        book = queue_state["books_queue"].pop(0)
+        book = job_store.next_book()
+        if book is None:
+            break
         queue_state["current_book"] = book
 
         book_id = book["id"]
@@ -825,9 +986,11 @@ async def run_queue():
 
             # Run post-processing after successful extraction
             await run_post_processing(book_id, title)
+            job_store.finish_book(book_id)
 
         except Exception as e:
-            queue_state["errors"].append({"book": title, "error": str(e)})
+            job_store.finish_book(book_id, "error", str(e))
+            job_store.add_error(title, str(e))
             print(f"[Queue] Error: {e}")
 
         queue_state["current_book"] = None
@@ -844,6 +1007,17 @@ async def run_queue():
 
 # ============ API Endpoints ============
 
+@app.on_event("startup")
+async def restore_queue_state():
+    """Restore queue scalars and requeue books interrupted by a crash/restart"""
+    load_queue_state()
+
+
+@app.on_event("shutdown")
+async def close_db_pool():
+    db_pool.close()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def index():
     """Serve main page"""
@@ -857,6 +1031,7 @@ async def index():
 async def get_books():
     """Get all books from ZIM search results"""
     data = load_zim_books()
+    jobs = job_store.extraction_status()
 
     # Format for frontend - group by category
     result = {
@@ -882,11 +1057,11 @@ async def get_books():
             }
 
             # Add extraction status if running
-            if book_id in extraction_tasks:
-                task = extraction_tasks[book_id]
+            if book_id in jobs:
+                task = jobs[book_id]
                 book_entry["extraction_status"] = task["status"]
-                book_entry["extraction_progress"] = task.get("progress", 0)
-                book_entry["extraction_total"] = task.get("total", 0)
+                book_entry["extraction_progress"] = task["progress"]
+                book_entry["extraction_total"] = task["total"]
 
             book_list.append(book_entry)
 
@@ -982,8 +1157,7 @@ async def get_zim_structure(path: str):
     if not content:
         return {"error": "Not found"}
 
-    structure = detect_book_structure(content)
-    hierarchical_chunks = get_hierarchical_chunks(content)
+    hierarchical_chunks, structure = get_book_chunks(path, content)
 
     # Group chunks by section
     sections_summary = {}
@@ -1015,7 +1189,7 @@ class ExtractRequest(BaseModel):
 @app.post("/api/extract/start")
 async def start_extraction(req: ExtractRequest, background_tasks: BackgroundTasks):
     """Start extraction for a book"""
-    if req.book_id in extraction_tasks and extraction_tasks[req.book_id]["status"] == "running":
+    if job_store.extraction_state(req.book_id) == "running":
         return {"error": "Already running", "book_id": req.book_id}
 
     background_tasks.add_task(run_extraction, req.book_id, req.zim_path, req.title)
@@ -1025,8 +1199,8 @@ async def start_extraction(req: ExtractRequest, background_tasks: BackgroundTask
 @app.post("/api/extract/cancel/{book_id}")
 async def cancel_extraction(book_id: str):
     """Cancel running extraction"""
-    if book_id in extraction_tasks:
-        extraction_tasks[book_id]["status"] = "cancelled"
+    if job_store.extraction_state(book_id) is not None:
+        job_store.update_extraction(book_id, status="cancelled")
         return {"status": "cancelled", "book_id": book_id}
     return {"error": "Not found"}
 
@@ -1034,16 +1208,16 @@ async def cancel_extraction(book_id: str):
 @app.get("/api/extract/status/{book_id}")
 async def extraction_status(book_id: str):
     """Get extraction status"""
-    if book_id in extraction_tasks:
-        task = extraction_tasks[book_id]
+    task = job_store.get_extraction(book_id)
+    if task is not None:
         return {
             "book_id": book_id,
             "status": task["status"],
-            "progress": task.get("progress", 0),
-            "total": task.get("total", 0),
-            "persons_count": len(task.get("persons", [])),
-            "locations_count": len(task.get("locations", [])),
-            "events_count": len(task.get("events", []))
+            "progress": task["progress"],
+            "total": task["total"],
+            "persons_count": task["persons_count"],
+            "locations_count": task["locations_count"],
+            "events_count": task["events_count"]
         }
     return {"error": "Not found"}
 
@@ -1100,10 +1274,10 @@ async def get_queue_status():
         "model": queue_state["current_model"],
         "current_book": queue_state["current_book"],
         "completed": queue_state["completed"],
-        "remaining": len(queue_state["books_queue"]),
+        "remaining": job_store.queue_counts()["queued"],
         "total": queue_state["total"],
         "elapsed_seconds": elapsed,
-        "errors_count": len(queue_state["errors"]),
+        "errors_count": job_store.error_count(),
         # Chunk progress
         "current_chunk": queue_state.get("current_chunk", 0),
         "total_chunks": queue_state.get("total_chunks", 0),
@@ -1145,11 +1319,11 @@ async def start_queue(req: QueueStartRequest, background_tasks: BackgroundTasks)
         return {"error": "No books to process", "message": "All books already extracted"}
 
     # Initialize queue
-    queue_state["books_queue"] = books_to_process
+    job_store.replace_queue(books_to_process)
+    job_store.clear_errors()
     queue_state["total"] = len(books_to_process)
     queue_state["completed"] = 0
     queue_state["current_model"] = req.model
-    queue_state["errors"] = []
     queue_state["paused"] = False
 
     background_tasks.add_task(run_queue)
@@ -1187,8 +1361,8 @@ async def stop_queue():
     # Cancel current extraction if any
     if queue_state["current_book"]:
         book_id = queue_state["current_book"]["id"]
-        if book_id in extraction_tasks:
-            extraction_tasks[book_id]["status"] = "cancelled"
+        if job_store.extraction_state(book_id) == "running":
+            job_store.update_extraction(book_id, status="cancelled")
 
     save_queue_state()
     return {"status": "stopped"}
@@ -1277,7 +1451,10 @@ async def get_stats():
             "chunks_per_book": round(avg_chunks, 0)
         },
         "speed_trend": speed_trend,
-        "recent_books": completed_books[-30:][::-1]  # Latest first
+        "recent_books": completed_books[-30:][::-1],  # Latest first
+        "backends": get_backend_stats(),  # Per-backend throughput / concurrency
+        "chunk_cache": get_chunk_cache().stats(),  # Manifest / LLM result reuse
+        "job_store": job_store.stats()  # Queue / extraction job counts
     }
 
 
@@ -1354,18 +1531,15 @@ async def add_additional_books():
             continue
 
         # Skip if already in queue
-        if any(b["id"] == book_id for b in queue_state["books_queue"]):
-            continue
-
-        queue_state["books_queue"].append({
+        if job_store.enqueue({
             "id": book_id,
             "path": book["path"],
             "title": book["title"],
             "category": book.get("category", "Additional")
-        })
-        added += 1
+        }):
+            added += 1
 
-    queue_state["total"] = queue_state["completed"] + len(queue_state["books_queue"])
+    queue_state["total"] = queue_state["completed"] + job_store.queue_counts()["queued"]
     save_queue_state()
 
     return {"status": "ok", "added": added, "new_total": queue_state["total"]}
@@ -1385,12 +1559,10 @@ class MatchDecisions(BaseModel):
 
 async def run_matching(book_id: str):
     """Background task to match extracted entities with DB"""
-    global matching_tasks
-
     # Load extraction results
     result_path = RESULTS_DIR / f"{safe_filename(book_id)}_extraction.json"
     if not result_path.exists():
-        matching_tasks[book_id] = {"status": "error", "error": "Extraction not found"}
+        job_store.fail_matching(book_id, "Extraction not found")
         return
 
     with open(result_path, 'r', encoding='utf-8') as f:
@@ -1403,67 +1575,44 @@ async def run_matching(book_id: str):
         len(extraction.get("events", []))
     )
 
-    matching_tasks[book_id] = {
-        "status": "running",
-        "progress": 0,
-        "total": total_entities,
-        "start_time": time.time(),
-        "results": {
-            "matched": [],
-            "new": [],
-            "merged": []
-        }
-    }
-
-    matcher = EntityMatcher()
+    job_store.start_matching(book_id, total_entities)
+    start_time = time.time()
 
     try:
         processed = 0
 
-        # Match persons
-        for name in extraction.get("persons", []):
-            if matching_tasks[book_id]["status"] == "cancelled":
-                break
-            result = matcher.match_person(name)
-            _add_match_result(book_id, "person", name, result)
-            processed += 1
-            matching_tasks[book_id]["progress"] = processed
-
-        # Match locations
-        for name in extraction.get("locations", []):
-            if matching_tasks[book_id]["status"] == "cancelled":
-                break
-            result = matcher.match_location(name)
-            _add_match_result(book_id, "location", name, result)
-            processed += 1
-            matching_tasks[book_id]["progress"] = processed
-
-        # Match events
-        for name in extraction.get("events", []):
-            if matching_tasks[book_id]["status"] == "cancelled":
-                break
-            result = matcher.match_event(name)
-            _add_match_result(book_id, "event", name, result)
-            processed += 1
-            matching_tasks[book_id]["progress"] = processed
-
-        matching_tasks[book_id]["status"] = "completed"
-        matching_tasks[book_id]["elapsed_seconds"] = time.time() - matching_tasks[book_id]["start_time"]
+        # Staged bulk matching: each stage runs once per batch, only unresolved names go on
+        for entity_type, key in (("person", "persons"), ("location", "locations"), ("event", "events")):
+            names = extraction.get(key, [])
+            for start in range(0, len(names), MATCH_BATCH_SIZE):
+                if job_store.matching_state(book_id) == "cancelled":
+                    break
+                batch = names[start:start + MATCH_BATCH_SIZE]
+                # Matcher runs in the worker pool: the event loop keeps serving status/progress
+                matched = await run_matcher(_match_batch, entity_type, batch)
+                entries = [_match_entry(entity_type, name, result) for name, result in matched.items()]
+                processed += len(batch)
+                job_store.add_match_results(book_id, entries, processed)
+
+        job_store.update_matching(book_id, status="completed", elapsed_seconds=time.time() - start_time)
 
         # Save matching results
         match_result_path = RESULTS_DIR / f"{safe_filename(book_id)}_matching.json"
         with open(match_result_path, 'w', encoding='utf-8') as f:
-            json.dump(matching_tasks[book_id]["results"], f, indent=2, ensure_ascii=False)
+            json.dump(job_store.match_results(book_id), f, indent=2, ensure_ascii=False)
 
     except Exception as e:
-        matching_tasks[book_id]["status"] = "error"
-        matching_tasks[book_id]["error"] = str(e)
-    finally:
-        matcher.close()
+        job_store.update_matching(book_id, status="error", error=str(e))
+
+
+def _match_batch(entity_type: str, names: List[str]) -> dict:
+    """Match one batch (runs in the matcher executor, pooled connection)"""
+    with db_pool.connection() as conn:
+        return EntityMatcher(conn=conn).match_many(entity_type, names)
 
 
-def _add_match_result(book_id: str, entity_type: str, name: str, result: MatchResult):
-    """Add match result to task results"""
+def _match_entry(entity_type: str, name: str, result: MatchResult) -> tuple:
+    """Match result → (bucket, entry) for the job store"""
     entry = {
         "entity_type": entity_type,
         "name": name,
@@ -1474,13 +1623,9 @@ def _add_match_result(book_id: str, entity_type: str, name: str, result: MatchRe
     }
 
     if result.matched:
-        if result.merged:
-            matching_tasks[book_id]["results"]["merged"].append(entry)
-        else:
-            matching_tasks[book_id]["results"]["matched"].append(entry)
-    else:
-        entry["wikidata_qid"] = result.details.get("wikidata_qid") if result.details else None
-        matching_tasks[book_id]["results"]["new"].append(entry)
+        return ("merged" if result.merged else "matched"), entry
+    entry["wikidata_qid"] = result.details.get("wikidata_qid") if result.details else None
+    return "new", entry
 
 
 @app.post("/api/match/start/{book_id}")
@@ -1492,7 +1637,7 @@ async def start_matching(book_id: str, background_tasks: BackgroundTasks):
         return {"error": "Extraction not found", "book_id": book_id}
 
     # Check if already running
-    if book_id in matching_tasks and matching_tasks[book_id]["status"] == "running":
+    if job_store.matching_state(book_id) == "running":
         return {"error": "Matching already running", "book_id": book_id}
 
     background_tasks.add_task(run_matching, book_id)
@@ -1502,16 +1647,16 @@ async def start_matching(book_id: str, background_tasks: BackgroundTasks):
 @app.get("/api/match/status/{book_id}")
 async def get_match_status(book_id: str):
     """Get matching progress"""
-    if book_id in matching_tasks:
-        task = matching_tasks[book_id]
+    task = job_store.get_matching(book_id)
+    if task is not None:
         return {
             "book_id": book_id,
             "status": task["status"],
-            "progress": task.get("progress", 0),
-            "total": task.get("total", 0),
-            "matched_count": len(task.get("results", {}).get("matched", [])),
-            "new_count": len(task.get("results", {}).get("new", [])),
-            "merged_count": len(task.get("results", {}).get("merged", []))
+            "progress": task["progress"],
+            "total": task["total"],
+            "matched_count": task["matched_count"],
+            "new_count": task["new_count"],
+            "merged_count": task["merged_count"]
         }
 
     # Check for saved results
@@ -1533,9 +1678,9 @@ async def get_match_status(book_id: str):
 @app.get("/api/match/results/{book_id}")
 async def get_match_results(book_id: str):
     """Get matching results for review"""
-    # Try in-memory first
-    if book_id in matching_tasks:
-        return matching_tasks[book_id].get("results", {})
+    # Try job store first (includes partial results of a running job)
+    if job_store.matching_state(book_id) is not None:
+        return job_store.match_results(book_id)
 
     # Try saved file
     match_result_path = RESULTS_DIR / f"{safe_filename(book_id)}_matching.json"
@@ -1549,14 +1694,18 @@ async def get_match_results(book_id: str):
 @app.post("/api/match/confirm/{book_id}")
 async def confirm_matches(book_id: str, body: MatchDecisions):
     """Confirm or reject matches"""
-    matcher = EntityMatcher(auto_create=True)
+    return await run_matcher(_confirm_matches, body.decisions)
+
 
+def _confirm_matches(decisions: List[MatchDecision]) -> dict:
+    """Apply match decisions (runs in the matcher executor, pooled connection)"""
     confirmed = 0
     created = 0
     rejected = 0
 
-    try:
-        for decision in body.decisions:
+    with db_pool.connection() as conn:
+        matcher = EntityMatcher(auto_create=True, conn=conn)
+        for decision in decisions:
             if decision.decision == "accept":
                 # Alias already saved during matching, just count
                 confirmed += 1
@@ -1568,21 +1717,19 @@ async def confirm_matches(book_id: str, body: MatchDecisions):
             elif decision.decision == "reject":
                 rejected += 1
 
-        return {
-            "status": "ok",
-            "confirmed": confirmed,
-            "created": created,
-            "rejected": rejected
-        }
-    finally:
-        matcher.close()
+    return {
+        "status": "ok",
+        "confirmed": confirmed,
+        "created": created,
+        "rejected": rejected
+    }
 
 
 @app.post("/api/match/cancel/{book_id}")
 async def cancel_matching(book_id: str):
     """Cancel running matching"""
-    if book_id in matching_tasks:
-        matching_tasks[book_id]["status"] = "cancelled"
+    if job_store.matching_state(book_id) is not None:
+        job_store.update_matching(book_id, status="cancelled")
         return {"status": "cancelled", "book_id": book_id}
     return {"error": "Not found"}
 
@@ -1592,86 +1739,58 @@ async def cancel_matching(book_id: str):
 @app.get("/api/duplicates/status")
 async def get_duplicate_status():
     """Get DB duplicate status"""
-    import psycopg2
-    from psycopg2.extras import RealDictCursor
-
     try:
-        conn = psycopg2.connect(
-            host='localhost', port=5432, dbname='chaldeas',
-            user='chaldeas', password='chaldeas_dev'
-        )
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        # Count duplicates by QID
-        cur.execute("""
-            SELECT COUNT(*) as dup_qid_count FROM (
-                SELECT wikidata_id FROM persons
-                WHERE wikidata_id IS NOT NULL
-                GROUP BY wikidata_id
-                HAVING COUNT(*) > 1
-            ) t
-        """)
-        dup_qids = cur.fetchone()["dup_qid_count"]
-
-        # Count merged aliases
-        cur.execute("SELECT COUNT(*) as merged_count FROM entity_aliases WHERE alias_type = 'merged'")
-        merged = cur.fetchone()["merged_count"]
-
-        # Total persons
-        cur.execute("SELECT COUNT(*) as total FROM persons")
-        total = cur.fetchone()["total"]
-
-        # Recent merges (top entities with most merged aliases)
-        cur.execute("""
-            SELECT ea.entity_id, p.name, COUNT(*) as alias_count
-            FROM entity_aliases ea
-            JOIN persons p ON ea.entity_id = p.id AND ea.entity_type = 'person'
-            WHERE ea.alias_type = 'merged'
-            GROUP BY ea.entity_id, p.name
-            ORDER BY alias_count DESC
-            LIMIT 10
-        """)
-        recent_merges = cur.fetchall()
-
-        conn.close()
-
-        return {
-            "total_persons": total,
-            "duplicate_qids": dup_qids,
-            "merged_aliases": merged,
-            "recent_merges": [dict(r) for r in recent_merges]
-        }
-
+        return await run_query(_duplicate_status)
     except Exception as e:
         return {"error": str(e)}
 
 
-@app.get("/api/duplicates/top")
-async def get_top_duplicates():
-    """Get top duplicate entries"""
-    import psycopg2
-    from psycopg2.extras import RealDictCursor
-
-    try:
-        conn = psycopg2.connect(
-            host='localhost', port=5432, dbname='chaldeas',
-            user='chaldeas', password='chaldeas_dev'
-        )
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        cur.execute("""
-            SELECT wikidata_id, COUNT(*) as cnt, array_agg(name) as names
-            FROM persons
+def _duplicate_status(cur) -> dict:
+    """Duplicate / merge counts (runs in the DB executor)"""
+    # Count duplicates by QID
+    cur.execute("""
+        SELECT COUNT(*) as dup_qid_count FROM (
+            SELECT wikidata_id FROM persons
             WHERE wikidata_id IS NOT NULL
             GROUP BY wikidata_id
             HAVING COUNT(*) > 1
-            ORDER BY cnt DESC
-            LIMIT 20
-        """)
-        duplicates = cur.fetchall()
+        ) t
+    """)
+    dup_qids = cur.fetchone()["dup_qid_count"]
+
+    # Count merged aliases
+    cur.execute("SELECT COUNT(*) as merged_count FROM entity_aliases WHERE alias_type = 'merged'")
+    merged = cur.fetchone()["merged_count"]
+
+    # Total persons
+    cur.execute("SELECT COUNT(*) as total FROM persons")
+    total = cur.fetchone()["total"]
+
+    # Recent merges (top entities with most merged aliases)
+    cur.execute("""
+        SELECT ea.entity_id, p.name, COUNT(*) as alias_count
+        FROM entity_aliases ea
+        JOIN persons p ON ea.entity_id = p.id AND ea.entity_type = 'person'
+        WHERE ea.alias_type = 'merged'
+        GROUP BY ea.entity_id, p.name
+        ORDER BY alias_count DESC
+        LIMIT 10
+    """)
+    recent_merges = cur.fetchall()
 
-        conn.close()
+    return {
+        "total_persons": total,
+        "duplicate_qids": dup_qids,
+        "merged_aliases": merged,
+        "recent_merges": [dict(r) for r in recent_merges]
+    }
 
+
+@app.get("/api/duplicates/top")
+async def get_top_duplicates():
+    """Get top duplicate entries"""
+    try:
+        duplicates = await run_query(_fetch_duplicate_qids, 20)
         return {
             "duplicates": [dict(d) for d in duplicates]
         }
@@ -1680,42 +1799,54 @@ async def get_top_duplicates():
         return {"error": str(e)}
 
 
-@app.post("/api/duplicates/merge/{qid}")
-async def merge_duplicate_qid(qid: str):
-    """Manually trigger merge for a specific QID"""
-    import psycopg2
-    from psycopg2.extras import RealDictCursor
+def _fetch_duplicate_qids(cur, limit: Optional[int] = None) -> list:
+    """Person QIDs held by more than one row (most rows first)"""
+    cur.execute("""
+        SELECT wikidata_id, COUNT(*) as cnt, array_agg(name) as names
+        FROM persons
+        WHERE wikidata_id IS NOT NULL
+        GROUP BY wikidata_id
+        HAVING COUNT(*) > 1
+        ORDER BY cnt DESC
+        LIMIT %s
+    """, (limit,))
+    return cur.fetchall()
 
-    try:
-        conn = psycopg2.connect(
-            host='localhost', port=5432, dbname='chaldeas',
-            user='chaldeas', password='chaldeas_dev'
-        )
-        cur = conn.cursor(cursor_factory=RealDictCursor)
 
-        # Find all persons with this QID
-        cur.execute("""
-            SELECT id, name, wikidata_id
-            FROM persons
-            WHERE wikidata_id = %s
-        """, (qid,))
-        entities = cur.fetchall()
-        conn.close()
+def _merge_qid(qid: str) -> Optional[dict]:
+    """Merge all persons sharing a QID (runs in the matcher executor, pooled connection)
+
+    Returns {"primary", "merged_count"}, or None when there is nothing to merge.
+    """
+    with db_pool.connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT id, name, wikidata_id
+                FROM persons
+                WHERE wikidata_id = %s
+            """, (qid,))
+            entities = cur.fetchall()
 
         if len(entities) <= 1:
-            return {"error": "No duplicates found", "qid": qid}
+            return None
+        primary = EntityMatcher(conn=conn)._merge_duplicates("person", [dict(e) for e in entities])
+        return {"primary": primary, "merged_count": len(entities)}
 
-        # Use EntityMatcher to merge
-        matcher = EntityMatcher()
-        primary = matcher._merge_duplicates("person", [dict(e) for e in entities])
-        matcher.close()
+
+@app.post("/api/duplicates/merge/{qid}")
+async def merge_duplicate_qid(qid: str):
+    """Manually trigger merge for a specific QID"""
+    try:
+        merged = await run_matcher(_merge_qid, qid)
+        if merged is None:
+            return {"error": "No duplicates found", "qid": qid}
 
         return {
             "status": "merged",
             "qid": qid,
-            "merged_count": len(entities),
-            "primary_id": primary["id"],
-            "primary_name": primary["name"]
+            "merged_count": merged["merged_count"],
+            "primary_id": merged["primary"]["id"],
+            "primary_name": merged["primary"]["name"]
         }
 
     except Exception as e:
@@ -1845,27 +1976,10 @@ async def run_auto_matching():
 async def run_auto_duplicates():
     """Auto-merge all duplicate QIDs"""
     global auto_state
-    import psycopg2
-    from psycopg2.extras import RealDictCursor
 
     try:
-        conn = psycopg2.connect(
-            host='localhost', port=5432, dbname='chaldeas',
-            user='chaldeas', password='chaldeas_dev'
-        )
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
         # Get all duplicate QIDs
-        cur.execute("""
-            SELECT wikidata_id, COUNT(*) as cnt
-            FROM persons
-            WHERE wikidata_id IS NOT NULL
-            GROUP BY wikidata_id
-            HAVING COUNT(*) > 1
-            ORDER BY cnt DESC
-        """)
-        duplicates = cur.fetchall()
-        conn.close()
+        duplicates = await run_query(_fetch_duplicate_qids)
 
         if not duplicates:
             auto_state["running"] = False
@@ -1875,8 +1989,6 @@ async def run_auto_duplicates():
         auto_state["mode"] = "duplicates"
         auto_state["start_time"] = time.time()
 
-        matcher = EntityMatcher()
-
         for i, dup in enumerate(duplicates):
             if not auto_state["running"]:
                 break
@@ -1889,22 +2001,8 @@ async def run_auto_duplicates():
             auto_state["progress"] = i
 
             try:
-                # Get all persons with this QID
-                conn = psycopg2.connect(
-                    host='localhost', port=5432, dbname='chaldeas',
-                    user='chaldeas', password='chaldeas_dev'
-                )
-                cur = conn.cursor(cursor_factory=RealDictCursor)
-                cur.execute("""
-                    SELECT id, name, wikidata_id
-                    FROM persons
-                    WHERE wikidata_id = %s
-                """, (qid,))
-                entities = cur.fetchall()
-                conn.close()
-
-                if len(entities) > 1:
-                    matcher._merge_duplicates("person", [dict(e) for e in entities])
+                # Merge all persons with this QID
+                if await run_matcher(_merge_qid, qid) is not None:
                     auto_state["completed"] += 1
 
             except Exception as e:
@@ -1912,8 +2010,6 @@ async def run_auto_duplicates():
 
             await asyncio.sleep(0.1)  # Brief pause
 
-        matcher.close()
-
     except Exception as e:
         auto_state["errors"].append({"error": str(e)})
 